@@ -8,6 +8,7 @@ Deploy to RunPod as a custom serverless endpoint.
 
 import base64
 import os
+import subprocess
 import tempfile
 from pathlib import Path
 from urllib.request import urlretrieve
@@ -17,6 +18,10 @@ import runpod
 # GPU device selection
 DEVICE = os.getenv("DEVICE", "cuda")
 
+# Same filter as podx.core.transcode.DIARIZE_AUDIO_FILTER (clients upload the
+# original audio, shared with transcription, and ask for denoising here)
+DIARIZE_AUDIO_FILTER = "highpass=f=100,afftdn=nf=-20"
+
 # Lazy-loaded models (persist across requests)
 _align_model = None
 _align_metadata = None
@@ -85,6 +90,22 @@ def sanitize_segments(segments: list) -> list:
     return sanitized
 
 
+def denoise_audio(source: Path) -> Path:
+    """Write a denoised 16 kHz mono WAV next to the downloaded audio."""
+    output = source.with_name(source.stem + "_denoised.wav")
+    subprocess.run(
+        [
+            "ffmpeg", "-hide_banner", "-loglevel", "error", "-y",
+            "-i", str(source),
+            "-af", DIARIZE_AUDIO_FILTER,
+            "-ac", "1", "-ar", "16000", "-vn",
+            str(output),
+        ],
+        check=True,
+    )
+    return output
+
+
 def handler(job: dict) -> dict:
     """RunPod handler for diarization jobs.
 
@@ -96,6 +117,7 @@ def handler(job: dict) -> dict:
         min_speakers: Optional minimum speakers
         max_speakers: Optional maximum speakers
         language: Language code (default: "en")
+        denoise: Apply the highpass + FFT denoise filter before diarizing
 
     Output:
         segments: List of segments with speaker labels and word timing
@@ -113,6 +135,7 @@ def handler(job: dict) -> dict:
     min_speakers = job_input.get("min_speakers")
     max_speakers = job_input.get("max_speakers")
     language = job_input.get("language", "en")
+    denoise = job_input.get("denoise", False)
 
     if not audio_url and not audio_base64:
         return {"error": "Missing audio_url or audio_base64"}
@@ -131,7 +154,16 @@ def handler(job: dict) -> dict:
             audio_path = Path(f.name)
             f.write(base64.b64decode(audio_base64))
 
+    denoised_path = None
     try:
+        if denoise:
+            print("Denoising audio...")
+            try:
+                denoised_path = denoise_audio(audio_path)
+            except (OSError, subprocess.CalledProcessError) as e:
+                print(f"Denoise failed, using original audio: {e}")
+        diarize_path = denoised_path or audio_path
+
         # Sanitize segments
         clean_segments = sanitize_segments(transcript_segments)
         if not clean_segments:
@@ -141,7 +173,7 @@ def handler(job: dict) -> dict:
 
         # Step 1: Load audio
         print("Loading audio...")
-        audio_data = whisperx.load_audio(str(audio_path))
+        audio_data = whisperx.load_audio(str(diarize_path))
 
         # Step 2: Alignment
         print("Running alignment...")
@@ -159,7 +191,7 @@ def handler(job: dict) -> dict:
         print("Running diarization...")
         diarize_pipeline = get_diarize_pipeline()
         diarized = diarize_pipeline(
-            str(audio_path),
+            str(diarize_path),
             num_speakers=num_speakers,
             min_speakers=min_speakers,
             max_speakers=max_speakers,
@@ -186,9 +218,10 @@ def handler(job: dict) -> dict:
         }
 
     finally:
-        # Cleanup temp file
-        if audio_path.exists():
-            audio_path.unlink()
+        # Cleanup temp files
+        for path in (audio_path, denoised_path):
+            if path and path.exists():
+                path.unlink()
 
 
 # Start the serverless worker
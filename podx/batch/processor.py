@@ -17,6 +17,7 @@ from rich.progress import (
 
 from podx.domain.exit_codes import ExitCode
 from podx.logging import get_logger
+from podx.performance import model_cache
 
 logger = get_logger(__name__)
 console = Console()
@@ -35,7 +36,12 @@ class BatchResult:
 
 
 class BatchProcessor:
-    """Process multiple episodes in parallel."""
+    """Process multiple episodes in parallel.
+
+    Workers run as threads in this process, so they share the process-wide
+    model pool (``podx.performance.model_cache``): an ASR model is loaded once
+    for the whole batch instead of once per episode.
+    """
 
     def __init__(
         self,
@@ -81,6 +87,7 @@ class BatchProcessor:
         console.print(f"[dim]Workers: {self.parallel_workers}[/dim]\n")
 
         results: List[BatchResult] = []
+        cache_before = model_cache.stats()
 
         # Create progress bar
         with Progress(
@@ -129,6 +136,7 @@ class BatchProcessor:
 
         # Print summary
         self._print_summary(results, operation_name)
+        self._report_model_cache(cache_before)
 
         return results
 
@@ -216,6 +224,33 @@ class BatchProcessor:
 
         console.print(f"[bold]{'=' * 60}[/bold]\n")
 
+    def _report_model_cache(self, before: Dict[str, Any]) -> None:
+        """Log and print model pool usage for this batch.
+
+        Args:
+            before: ``model_cache.stats()`` snapshot taken when the batch started
+        """
+        after = model_cache.stats()
+        hits = after["hits"] - before["hits"]
+        loads = after["misses"] - before["misses"]
+        if not hits and not loads:
+            return
+
+        load_time = after["total_load_time"] - before["total_load_time"]
+        time_saved = hits * (load_time / loads if loads else after["avg_load_time"])
+
+        logger.info(
+            "Batch model cache usage",
+            model_loads=loads,
+            model_cache_hits=hits,
+            load_time=round(load_time, 2),
+            time_saved=round(time_saved, 2),
+        )
+        console.print(
+            f"[dim]Model cache: {loads} loads ({load_time:.1f}s), {hits} hits "
+            f"(~{time_saved:.1f}s saved)[/dim]\n"
+        )
+
     def get_exit_code(self, results: List[BatchResult]) -> ExitCode:
         """Get appropriate exit code from results.
 
@@ -333,7 +333,7 @@ def main(
             model=model_name,
             provider_name=provider_name,
             temperature=0.2,
-            max_chars_per_chunk=24000,
+            map_cache_dir=episode_dir,
         )
 
         # Build transcript text for template
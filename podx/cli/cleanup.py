@@ -13,7 +13,7 @@ from rich.console import Console
 
 from podx.core.history import record_processing_event
 from podx.core.preprocess import PreprocessError, TranscriptPreprocessor
-from podx.core.speakers import load_speaker_map, save_speaker_map
+from podx.core.speakers import identify_speaker_map, load_speaker_map, save_speaker_map
 from podx.domain.exit_codes import ExitCode
 from podx.logging import get_logger
 from podx.ui import (
@@ -173,7 +173,9 @@ def main(path: Optional[Path], no_restore: bool, no_skip_ads: bool):
     # First check for saved speaker-map.json, then prompt interactively
     speaker_map: dict = {}
     if has_generic_speaker_ids(transcript["segments"]):
-        existing_map = load_speaker_map(episode_dir)
+        existing_map = load_speaker_map(episode_dir) or identify_speaker_map(
+            episode_dir, transcript["segments"]
+        )
         if existing_map:
             # Auto-apply saved speaker map
             transcript["segments"] = apply_speaker_names(transcript["segments"], existing_map)
@@ -196,7 +196,8 @@ def _run_diarize_step(episode_dir: Path, use_cloud: bool = False) -> bool:
     from podx.cloud import CloudConfig
     from podx.cloud.exceptions import CloudError
     from podx.core.diarization import DiarizationProviderError, get_diarization_provider
-    from podx.core.diarize import DiarizationEngine, DiarizationError
+    from podx.core.diarize import DiarizationEngine, DiarizationError, load_diarization_audio
+    from podx.core.voiceprints import save_speaker_embeddings
     from podx.ui import LiveTimer
 
     console.print("\n[bold cyan]── Diarize ────────────────────────────────────────[/bold cyan]")
@@ -219,18 +220,6 @@ def _run_diarize_step(episode_dir: Path, use_cloud: bool = False) -> bool:
 
     language = transcript.get("language", "en")
 
-    # Audio preprocessing: create denoised audio for diarization
-    diarize_audio = audio_file
-    diarize_audio_path = None
-    try:
-        from podx.core.transcode import create_diarize_audio
-
-        diarize_audio_path = episode_dir / "audio_diarize.wav"
-        create_diarize_audio(audio_file, diarize_audio_path)
-        diarize_audio = diarize_audio_path
-    except Exception:
-        diarize_audio_path = None
-
     # Check if cloud diarization is configured
     cloud_diarize_available = False
     if use_cloud:
@@ -243,6 +232,8 @@ def _run_diarize_step(episode_dir: Path, use_cloud: bool = False) -> bool:
             console.print("[dim]Cloud diarization not configured, using local...[/dim]")
 
     if use_cloud and cloud_diarize_available:
+        # Upload the original audio (already in R2 from cloud transcription);
+        # the worker applies the denoise filter
         console.print("[dim]Diarizing on cloud GPU...[/dim]")
         timer = LiveTimer("Diarizing")
         timer.start()
@@ -260,13 +251,11 @@ def _run_diarize_step(episode_dir: Path, use_cloud: bool = False) -> bool:
             provider = get_diarization_provider(
                 "runpod", language=language, progress_callback=cloud_progress
             )
-            result = provider.diarize(diarize_audio, transcript["segments"])
+            result = provider.diarize(audio_file, transcript["segments"])
             segments = result.segments
             speakers_count = result.speakers_count
         except (DiarizationProviderError, CloudError) as e:
             timer.stop()
-            if diarize_audio_path and diarize_audio_path.exists():
-                diarize_audio_path.unlink()
             console.print(f"[red]Error:[/red] {e}")
             return False
         elapsed = timer.stop()
@@ -291,19 +280,21 @@ def _run_diarize_step(episode_dir: Path, use_cloud: bool = False) -> bool:
                 redirect_stdout(open(os.devnull, "w")),
                 redirect_stderr(open(os.devnull, "w")),
             ):
+                # One in-process decode (with denoising) feeds alignment and diarization
+                audio_data = load_diarization_audio(audio_file)
                 engine = DiarizationEngine(
                     language=language, hf_token=os.getenv("HUGGINGFACE_TOKEN")
                 )
-                result = engine.diarize(diarize_audio, transcript["segments"])
+                result = engine.diarize(audio_file, transcript["segments"], audio_data=audio_data)
                 segments = result["segments"]
                 speakers = set(s.get("speaker") for s in segments if s.get("speaker"))
                 speakers_count = len(speakers)
+            if engine.speaker_embeddings:
+                save_speaker_embeddings(episode_dir, engine.speaker_embeddings)
         except DiarizationError as e:
             timer.stop()
             for name, level in saved_levels.items():
                 logging.getLogger(name).setLevel(level)
-            if diarize_audio_path and diarize_audio_path.exists():
-                diarize_audio_path.unlink()
             console.print(f"[red]Error:[/red] {e}")
             return False
 
@@ -311,9 +302,6 @@ def _run_diarize_step(episode_dir: Path, use_cloud: bool = False) -> bool:
             logging.getLogger(name).setLevel(level)
         elapsed = timer.stop()
 
-    if diarize_audio_path and diarize_audio_path.exists():
-        diarize_audio_path.unlink()
-
     minutes = int(elapsed // 60)
     seconds = int(elapsed % 60)
 
@@ -331,7 +319,7 @@ def _run_diarize_step(episode_dir: Path, use_cloud: bool = False) -> bool:
 def _run_cleanup_step(episode_dir: Path) -> bool:
     """Run cleanup step. Returns True on success."""
     from podx.core.preprocess import PreprocessError, TranscriptPreprocessor
-    from podx.core.speakers import load_speaker_map, save_speaker_map
+    from podx.core.speakers import identify_speaker_map, load_speaker_map, save_speaker_map
     from podx.ui import (
         LiveTimer,
         apply_speaker_names,
@@ -356,7 +344,9 @@ def _run_cleanup_step(episode_dir: Path) -> bool:
     # Speaker identification
     if transcript.get("diarized") and has_generic_speaker_ids(transcript["segments"]):
         # Check for saved speaker map first
-        existing_map = load_speaker_map(episode_dir)
+        existing_map = load_speaker_map(episode_dir) or identify_speaker_map(
+            episode_dir, transcript["segments"]
+        )
         if existing_map:
             transcript["segments"] = apply_speaker_names(transcript["segments"], existing_map)
             console.print(
@@ -791,7 +781,9 @@ def _run_analyze_step(
         if ":" in model:
             provider_name, model_name = model.split(":", 1)
 
-        engine = AnalyzeEngine(model=model_name, provider_name=provider_name)
+        engine = AnalyzeEngine(
+            model=model_name, provider_name=provider_name, map_cache_dir=episode_dir
+        )
 
         # Build transcript text from (possibly filtered) segments
         transcript_text = "\n".join(
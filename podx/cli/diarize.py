@@ -16,15 +16,22 @@ from rich.console import Console
 
 from podx.core.diarization import DiarizationProviderError, get_diarization_provider
 from podx.core.diarize import (
+    DEFAULT_MEMORY_MODEL,
+    DIARIZATION_SAMPLE_RATE,
     DiarizationEngine,
     DiarizationError,
     calculate_chunk_duration,
     calculate_embedding_batch_size,
+    calibrate_memory_model,
     estimate_memory_required,
     get_audio_duration,
     get_memory_info,
+    load_diarization_audio,
 )
+from podx.core.diarize_memory import MemoryProfile
 from podx.core.history import record_processing_event
+from podx.core.voiceprints import save_speaker_embeddings
+from podx.device import detect_device_for_pytorch
 from podx.domain.exit_codes import ExitCode
 from podx.logging import get_logger
 from podx.ui import (
@@ -53,6 +60,26 @@ def _find_audio_file(directory: Path) -> Optional[Path]:
     return None
 
 
+def _run_calibration() -> None:
+    """Seed the local diarization memory profile and report the fitted model."""
+    device = detect_device_for_pytorch()
+    console.print(f"[cyan]Calibrating diarization memory on:[/cyan] {device}")
+    try:
+        model = calibrate_memory_model(
+            device=device,
+            hf_token=os.getenv("HUGGINGFACE_TOKEN"),
+            progress_callback=lambda msg: console.print(f"[dim]{msg}...[/dim]"),
+        )
+    except DiarizationError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(ExitCode.PROCESSING_ERROR)
+
+    console.print(
+        f"[green]✓[/green] Memory model: {model.base_gb:.2f} GB base "
+        f"+ {model.per_minute_gb:.3f} GB/min ({model.samples} samples)"
+    )
+
+
 @click.command(context_settings={"max_content_width": 120})
 @click.argument(
     "path",
@@ -89,6 +116,12 @@ def _find_audio_file(directory: Path) -> Optional[Path]:
     default=False,
     help="Skip audio preprocessing (highpass + FFT denoise) before diarization",
 )
+@click.option(
+    "--calibrate",
+    is_flag=True,
+    default=False,
+    help="Measure local diarization memory use on synthetic audio, then exit",
+)
 def main(
     path: Optional[Path],
     speakers: Optional[int],
@@ -96,6 +129,7 @@ def main(
     reset: bool,
     provider: str,
     no_denoise: bool,
+    calibrate: bool,
 ):
     """Add speaker labels to a transcript.
 
@@ -123,7 +157,12 @@ def main(
       podx diarize . --reset --verify           # Reset and verify speakers
       podx diarize . --provider runpod          # Use cloud GPU for diarization
       podx diarize . --no-denoise               # Skip audio denoising
+      podx diarize --calibrate                  # Tune chunk sizing to this machine
     """
+    if calibrate:
+        _run_calibration()
+        sys.exit(0)
+
     # Track if we're in interactive mode (for verification prompt)
     interactive_mode = path is None
 
@@ -229,13 +268,29 @@ def main(
     available_gb, total_gb = get_memory_info()
     batch_size = calculate_embedding_batch_size(available_gb)
 
-    try:
-        audio_duration_minutes = get_audio_duration(audio_file)
-    except DiarizationError:
-        audio_duration_minutes = 0  # Will proceed without duration info
-
-    estimated_memory = estimate_memory_required(audio_duration_minutes)
-    chunk_duration, needs_chunking = calculate_chunk_duration(available_gb, audio_duration_minutes)
+    # The local engine diarizes from an in-process decode, so take the duration
+    # from that buffer; the cloud provider uploads the original file instead
+    audio_data = None
+    if provider == "runpod":
+        try:
+            audio_duration_minutes = get_audio_duration(audio_file)
+        except DiarizationError:
+            audio_duration_minutes = 0  # Will proceed without duration info
+    else:
+        if not no_denoise:
+            console.print("[dim]Preprocessing audio for diarization...[/dim]")
+        try:
+            audio_data = load_diarization_audio(audio_file, denoise=not no_denoise)
+        except DiarizationError as e:
+            console.print(f"[red]Diarization Error:[/red] {e}")
+            sys.exit(ExitCode.PROCESSING_ERROR)
+        audio_duration_minutes = len(audio_data) / DIARIZATION_SAMPLE_RATE / 60
+
+    memory_model = MemoryProfile().model(detect_device_for_pytorch(), DEFAULT_MEMORY_MODEL)
+    estimated_memory = estimate_memory_required(audio_duration_minutes, memory_model)
+    chunk_duration, needs_chunking = calculate_chunk_duration(
+        available_gb, audio_duration_minutes, memory_model
+    )
 
     # Display info
     console.print(f"[cyan]Diarizing:[/cyan] {audio_file.name}")
@@ -324,21 +379,9 @@ def main(
     diarization_result = None
     chunk_info = None
 
-    # Audio preprocessing: create denoised audio for diarization
-    diarize_audio = audio_file
-    diarize_audio_path: Optional[Path] = None
-    if not no_denoise:
-        from podx.core.transcode import TranscodeError, create_diarize_audio
-
-        diarize_audio_path = episode_dir / "audio_diarize.wav"
-        try:
-            progress_callback("Preprocessing audio for diarization...")
-            create_diarize_audio(audio_file, diarize_audio_path)
-            diarize_audio = diarize_audio_path
-        except (TranscodeError, FileNotFoundError) as e:
-            logger.warning("Audio preprocessing failed, using original", error=str(e))
-            diarize_audio_path = None
-
+    # Audio preprocessing: the cloud provider uploads the original audio (shared
+    # with cloud transcription) and the worker denoises; the local engine
+    # diarizes from the denoised decode loaded above
     try:
         if provider == "runpod":
             # Use cloud diarization provider
@@ -350,9 +393,10 @@ def main(
                     language=language,
                     num_speakers=speakers,
                     progress_callback=cloud_progress,
+                    denoise=not no_denoise,
                 )
                 diarization_result = diarization_provider.diarize(
-                    diarize_audio, transcript["segments"]
+                    audio_file, transcript["segments"]
                 )
                 result = {"segments": diarization_result.segments}
 
@@ -368,7 +412,7 @@ def main(
                 console.print(f"[red]Diarization Error:[/red] {e}")
                 sys.exit(ExitCode.PROCESSING_ERROR)
         else:
-            # Use local diarization engine (original behavior)
+            # Use local diarization engine
             engine = DiarizationEngine(
                 language=language,
                 device=None,  # Auto-detect
@@ -381,7 +425,9 @@ def main(
                 redirect_stdout(open(os.devnull, "w")),
                 redirect_stderr(open(os.devnull, "w")),
             ):
-                result = engine.diarize(diarize_audio, transcript["segments"])
+                result = engine.diarize(audio_file, transcript["segments"], audio_data=audio_data)
+            if engine.speaker_embeddings:
+                save_speaker_embeddings(episode_dir, engine.speaker_embeddings)
 
     except DiarizationError as e:
         timer.stop()
@@ -392,10 +438,6 @@ def main(
         console.print(f"[red]File Not Found:[/red] {e}")
         sys.exit(ExitCode.USER_ERROR)
 
-    # Clean up preprocessed audio
-    if diarize_audio_path and diarize_audio_path.exists():
-        diarize_audio_path.unlink()
-
     # Stop timer
     elapsed = timer.stop()
     minutes = int(elapsed // 60)
@@ -12,6 +12,7 @@ import click
 from rich.console import Console
 
 from podx.config import get_config
+from podx.core.checkpoint import partial_transcript_path
 from podx.core.history import record_processing_event
 from podx.core.transcribe import TranscriptionEngine, TranscriptionError
 from podx.domain.exit_codes import ExitCode
@@ -89,7 +90,25 @@ def _get_default_language() -> str:
     default=None,
     help=f"Language code (default: {_get_default_language()})",
 )
-def main(path: Optional[Path], model: Optional[str], language: Optional[str]):
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Parallel CPU worker processes for local models (splits audio at silence)",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Resume an interrupted local transcription from transcript.partial.jsonl",
+)
+def main(
+    path: Optional[Path],
+    model: Optional[str],
+    language: Optional[str],
+    workers: int,
+    resume: bool,
+):
     """Transcribe audio to text.
 
     \b
@@ -135,6 +154,11 @@ def main(path: Optional[Path], model: Optional[str], language: Optional[str]):
       podx transcribe ./Show/2024-11-24-ep/          # Direct path
       podx transcribe . --model local:medium         # Current dir, medium model
       podx transcribe ./ep/ --language es            # Spanish transcription
+      podx transcribe ./ep/ --workers 8              # Parallel decode on 8 CPU cores
+      podx transcribe ./ep/ --resume                 # Continue after a crash
+
+    Local models append each segment to transcript.partial.jsonl as it is
+    decoded; the file is removed once transcript.json is written.
     """
     # Get defaults
     default_model = _get_default_model()
@@ -220,6 +244,7 @@ def main(path: Optional[Path], model: Optional[str], language: Optional[str]):
 
     # Output path
     transcript_path = episode_dir / "transcript.json"
+    checkpoint_path = partial_transcript_path(transcript_path)
 
     # Show what we're doing
     console.print(f"\n[cyan]Transcribing:[/cyan] {audio_file.name}")
@@ -244,6 +269,9 @@ def main(path: Optional[Path], model: Optional[str], language: Optional[str]):
             provider=provider,
             compute_type=None,  # Auto-detect
             device=None,  # Auto-detect
+            parallel_workers=workers,
+            checkpoint_path=checkpoint_path,
+            resume=resume,
             progress=progress,
         )
 
@@ -273,6 +301,7 @@ def main(path: Optional[Path], model: Optional[str], language: Optional[str]):
 
     # Save transcript
     transcript_path.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+    checkpoint_path.unlink(missing_ok=True)
 
     # Record history event
     episode_meta = {}
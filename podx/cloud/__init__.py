@@ -8,6 +8,7 @@ Usage:
     podx transcribe --model runpod:large-v3-turbo ./episode/
 """
 
+from .async_client import AsyncRunPodClient
 from .config import CloudConfig
 from .exceptions import (
     CloudAuthError,
@@ -19,6 +20,7 @@ from .exceptions import (
 )
 from .runpod_client import RunPodClient
 from .storage import CloudStorage
+from .upload_cache import UploadIndex
 
 __all__ = [
     "CloudConfig",
@@ -29,5 +31,7 @@ __all__ = [
     "JobFailedError",
     "UploadError",
     "RunPodClient",
+    "AsyncRunPodClient",
     "CloudStorage",
+    "UploadIndex",
 ]
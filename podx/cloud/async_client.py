@@ -0,0 +1,300 @@
+"""Asyncio RunPod client for many jobs in flight.
+
+One shared ``httpx.AsyncClient`` and one poller task serve every outstanding
+job, across both the transcription and diarization endpoints. Each poll
+round checks all due jobs concurrently (capped by ``max_concurrent_requests``)
+and every job backs off independently while its status is unchanged, so a
+backfill can keep dozens of cloud jobs running without a thread per job.
+
+Usage:
+    async with AsyncRunPodClient(config) as runpod:
+        job_ids = [await runpod.submit(transcription_payload(url, model, "auto"))
+                   for url in urls]
+        results = await asyncio.gather(*(runpod.wait(j) for j in job_ids))
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+from ..logging import get_logger
+from .config import CloudConfig
+from .exceptions import CloudError, CloudTimeoutError, JobFailedError, UploadError
+from .runpod_client import (
+    MAX_SUBMIT_RETRIES,
+    RETRY_DELAY_SECONDS,
+    STATUS_COMPLETED,
+    STATUS_FAILED,
+    PollBackoff,
+    format_status_message,
+    parse_status_response,
+    parse_submit_response,
+)
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 16
+
+
+@dataclass
+class _Watch:
+    """A job the poller is waiting on."""
+
+    job_id: str
+    task: str
+    future: "asyncio.Future[Dict[str, Any]]"
+    started: float
+    next_poll: float
+    backoff: PollBackoff
+    progress_callback: Optional[Callable[[str], None]] = None
+
+
+class AsyncRunPodClient:
+    """Asyncio client for RunPod serverless endpoints.
+
+    Attributes:
+        config: Cloud configuration with credentials and settings
+    """
+
+    def __init__(
+        self,
+        config: CloudConfig,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        """Initialize async RunPod client.
+
+        Args:
+            config: Cloud configuration (must be validated)
+            max_concurrent_requests: Cap on simultaneous HTTP requests
+            http_client: Optional preconfigured client (e.g. for tests)
+        """
+        self.config = config
+        self.max_concurrent_requests = max_concurrent_requests
+        self._client = http_client
+        self._watches: Dict[str, _Watch] = {}
+        self._poller: Optional["asyncio.Task[None]"] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get or create the shared HTTP client."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(60.0, read=300.0),
+                headers=self.config.headers,
+                limits=httpx.Limits(max_connections=self.max_concurrent_requests),
+            )
+        return self._client
+
+    @property
+    def in_flight(self) -> int:
+        """Number of jobs currently being waited on."""
+        return len(self._watches)
+
+    async def aclose(self) -> None:
+        """Stop polling and close the HTTP client."""
+        if self._poller is not None:
+            self._poller.cancel()
+            try:
+                await self._poller
+            except asyncio.CancelledError:
+                pass
+            self._poller = None
+        for watch in self._watches.values():
+            if not watch.future.done():
+                watch.future.cancel()
+        self._watches.clear()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncRunPodClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    def _base_url(self, task: str) -> str:
+        return self.config.diarize_base_url if task == "diarization" else self.config.base_url
+
+    def _endpoint_id(self, task: str) -> Optional[str]:
+        return self.config.diarize_endpoint_id if task == "diarization" else self.config.endpoint_id
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        async with self._semaphore:
+            return await self.client.request(method, url, **kwargs)
+
+    async def submit(self, payload: Dict[str, Any], task: str = "transcription") -> str:
+        """Submit a job payload, retrying network errors.
+
+        Args:
+            payload: Request body (see transcription_payload/diarization_payload)
+            task: "transcription" or "diarization" (selects the endpoint)
+
+        Returns:
+            Job ID for tracking
+
+        Raises:
+            UploadError: If submission fails
+            CloudAuthError: If API key is invalid
+            EndpointNotFoundError: If endpoint doesn't exist
+        """
+        for attempt in range(MAX_SUBMIT_RETRIES):
+            try:
+                response = await self._request("POST", f"{self._base_url(task)}/run", json=payload)
+                break
+            except httpx.RequestError as e:
+                if attempt == MAX_SUBMIT_RETRIES - 1:
+                    raise UploadError(
+                        f"Network error after {MAX_SUBMIT_RETRIES} attempts: {e}", cause=e
+                    )
+                logger.warning("Job submission failed, retrying", attempt=attempt + 1, error=str(e))
+                await asyncio.sleep(RETRY_DELAY_SECONDS * (attempt + 1))
+
+        job_id = parse_submit_response(response, self._endpoint_id(task))
+        logger.info("Job submitted", job_id=job_id, task=task)
+        return job_id
+
+    async def get_status(self, job_id: str, task: str = "transcription") -> Dict[str, Any]:
+        """Get job status.
+
+        Returns:
+            Status dict with 'status' and optionally 'output' or 'error'
+
+        Raises:
+            CloudAuthError: If API key is invalid
+            EndpointNotFoundError: If endpoint doesn't exist
+        """
+        try:
+            response = await self._request("GET", f"{self._base_url(task)}/status/{job_id}")
+        except httpx.RequestError as e:
+            logger.warning("Status check failed", job_id=job_id, error=str(e))
+            return {"status": "UNKNOWN", "error": str(e)}
+        return parse_status_response(response, self._endpoint_id(task))
+
+    async def wait(
+        self,
+        job_id: str,
+        task: str = "transcription",
+        progress_callback: Optional[Callable[[str], None]] = None,
+    ) -> Dict[str, Any]:
+        """Wait for a job to finish.
+
+        The job is handed to the shared poller; any number of ``wait`` calls
+        can be outstanding at once.
+
+        Returns:
+            Result from the job output
+
+        Raises:
+            CloudTimeoutError: If job exceeds timeout
+            JobFailedError: If job fails on the server
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        backoff = PollBackoff(
+            self.config.poll_interval_seconds, self.config.max_poll_interval_seconds
+        )
+        watch = _Watch(
+            job_id=job_id,
+            task=task,
+            future=loop.create_future(),
+            started=now,
+            next_poll=now + backoff.initial,
+            backoff=backoff,
+            progress_callback=progress_callback,
+        )
+        self._watches[job_id] = watch
+        self._ensure_poller()
+        try:
+            return await watch.future
+        finally:
+            self._watches.pop(job_id, None)
+
+    def _ensure_poller(self) -> None:
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self._poller is None or self._poller.done():
+            self._poller = asyncio.get_running_loop().create_task(self._poll_loop())
+        self._wakeup.set()
+
+    async def _poll_loop(self) -> None:
+        """Poll every due job in one concurrent round, then sleep until the next is due."""
+        loop = asyncio.get_running_loop()
+        assert self._wakeup is not None
+        while self._watches:
+            now = loop.time()
+            due = [w for w in self._watches.values() if w.next_poll <= now]
+            if due:
+                await asyncio.gather(*(self._poll_one(w) for w in due))
+                continue
+
+            delay = min(w.next_poll for w in self._watches.values()) - now
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll_one(self, watch: _Watch) -> None:
+        loop = asyncio.get_running_loop()
+        if watch.future.done():  # Caller gave up
+            self._watches.pop(watch.job_id, None)
+            return
+
+        elapsed = loop.time() - watch.started
+        if elapsed > self.config.timeout_seconds:
+            self._finish(watch, error=CloudTimeoutError(watch.job_id, self.config.timeout_seconds))
+            return
+
+        try:
+            status_data = await self.get_status(watch.job_id, watch.task)
+        except CloudError as e:
+            self._finish(watch, error=e)
+            return
+        except Exception as e:  # Never let one job kill the shared poller
+            self._finish(watch, error=CloudError(f"Status check failed: {e}"))
+            return
+
+        status = status_data.get("status", "UNKNOWN")
+        if status != watch.backoff.last_status:
+            logger.debug(
+                "Job status update",
+                job_id=watch.job_id,
+                status=status,
+                elapsed=round(elapsed, 1),
+            )
+        if watch.progress_callback:
+            try:
+                watch.progress_callback(format_status_message(status, elapsed, watch.task))
+            except Exception as e:  # A UI error must not stall the shared poller
+                logger.warning("Progress callback failed", job_id=watch.job_id, error=str(e))
+
+        if status == STATUS_COMPLETED:
+            logger.info("Job completed", job_id=watch.job_id, elapsed=round(elapsed, 1))
+            self._finish(watch, result=status_data.get("output", {}))
+        elif status == STATUS_FAILED:
+            error = status_data.get("error", "Unknown error")
+            self._finish(watch, error=JobFailedError(watch.job_id, error))
+        else:
+            watch.next_poll = loop.time() + watch.backoff.next_delay(status)
+
+    def _finish(
+        self,
+        watch: _Watch,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self._watches.pop(watch.job_id, None)
+        if watch.future.done():
+            return
+        if error is not None:
+            watch.future.set_exception(error)
+        else:
+            watch.future.set_result(result or {})
@@ -24,8 +24,11 @@ class CloudConfig:
         r2_secret_access_key: R2 API token secret access key
         r2_bucket_name: R2 bucket name for audio uploads
         timeout_seconds: Maximum time to wait for job completion (default: 1800s/30min)
-        poll_interval_seconds: How often to check job status (default: 2.0s)
+        poll_interval_seconds: Initial delay between job status checks (default: 2.0s)
+        max_poll_interval_seconds: Backoff ceiling for status checks (default: 30.0s)
         enable_fallback: Whether to fall back to local on failure (default: True)
+        upload_retention_seconds: How long uploaded audio stays in R2 for reuse
+            by later stages and retries (default: 86400s/24h; 0 deletes after each job)
     """
 
     # RunPod
@@ -42,7 +45,9 @@ class CloudConfig:
     # Settings
     timeout_seconds: int = 1800  # 30 minutes max (long podcasts can take 20+ min)
     poll_interval_seconds: float = 2.0
+    max_poll_interval_seconds: float = 30.0
     enable_fallback: bool = True
+    upload_retention_seconds: int = 86400
 
     # Internal tracking
     _validated: bool = field(default=False, repr=False)
@@ -60,15 +65,19 @@ class CloudConfig:
             R2_SECRET_ACCESS_KEY: R2 API token secret
             R2_BUCKET_NAME: R2 bucket name
             RUNPOD_TIMEOUT: Optional timeout in seconds (default: 1800)
-            RUNPOD_POLL_INTERVAL: Optional poll interval (default: 2.0)
+            RUNPOD_POLL_INTERVAL: Optional initial poll interval (default: 2.0)
+            RUNPOD_MAX_POLL_INTERVAL: Optional poll backoff ceiling (default: 30.0)
             RUNPOD_ENABLE_FALLBACK: Optional fallback flag (default: true)
+            R2_UPLOAD_RETENTION: Optional upload retention in seconds (default: 86400)
 
         Returns:
             CloudConfig populated from environment
         """
         timeout_str = os.getenv("RUNPOD_TIMEOUT", "1800")
         poll_str = os.getenv("RUNPOD_POLL_INTERVAL", "2.0")
+        max_poll_str = os.getenv("RUNPOD_MAX_POLL_INTERVAL", "30.0")
         fallback_str = os.getenv("RUNPOD_ENABLE_FALLBACK", "true").lower()
+        retention_str = os.getenv("R2_UPLOAD_RETENTION", "86400")
 
         return cls(
             api_key=os.getenv("RUNPOD_API_KEY"),
@@ -80,7 +89,9 @@ class CloudConfig:
             r2_bucket_name=os.getenv("R2_BUCKET_NAME"),
             timeout_seconds=int(timeout_str),
             poll_interval_seconds=float(poll_str),
+            max_poll_interval_seconds=float(max_poll_str),
             enable_fallback=fallback_str in ("true", "1", "yes"),
+            upload_retention_seconds=int(retention_str),
         )
 
     @classmethod
@@ -102,10 +113,12 @@ class CloudConfig:
         r2_secret_access_key = _get_value("r2-secret-access-key")
         r2_bucket_name = _get_value("r2-bucket-name")
 
-        # Fall back to env vars for timeout/poll/fallback (not in podx config)
+        # Fall back to env vars for timeout/poll/fallback/retention (not in podx config)
         timeout_str = os.getenv("RUNPOD_TIMEOUT", "1800")
         poll_str = os.getenv("RUNPOD_POLL_INTERVAL", "2.0")
+        max_poll_str = os.getenv("RUNPOD_MAX_POLL_INTERVAL", "30.0")
         fallback_str = os.getenv("RUNPOD_ENABLE_FALLBACK", "true").lower()
+        retention_str = os.getenv("R2_UPLOAD_RETENTION", "86400")
 
         return cls(
             api_key=api_key or None,
@@ -117,7 +130,9 @@ class CloudConfig:
             r2_bucket_name=r2_bucket_name or None,
             timeout_seconds=int(timeout_str),
             poll_interval_seconds=float(poll_str),
+            max_poll_interval_seconds=float(max_poll_str),
             enable_fallback=fallback_str in ("true", "1", "yes"),
+            upload_retention_seconds=int(retention_str),
         )
 
     def validate(self) -> None:
@@ -6,7 +6,8 @@ Audio is passed as a URL (hosted on R2) rather than inline.
 """
 
 import time
-from typing import Any, Callable, Optional
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
 
 import httpx
 
@@ -26,34 +27,189 @@ RETRY_DELAY_SECONDS = 5
 
 logger = get_logger(__name__)
 
+# Job status constants
+STATUS_QUEUED = "IN_QUEUE"
+STATUS_IN_PROGRESS = "IN_PROGRESS"
+STATUS_COMPLETED = "COMPLETED"
+STATUS_FAILED = "FAILED"
+
+# Wording for status messages per job kind
+_TASK_WORDS = {
+    "transcription": ("Transcribing", "Transcription"),
+    "diarization": ("Diarizing", "Diarization"),
+}
+
+
+@dataclass
+class PollBackoff:
+    """Adaptive poll interval for one job.
+
+    Starts at ``initial`` and grows by ``factor`` (up to ``maximum``) while
+    the job status stays the same; any status change resets it so state
+    transitions are picked up promptly.
+    """
+
+    initial: float
+    maximum: float = 30.0
+    factor: float = 1.5
+    interval: float = field(init=False)
+    last_status: Optional[str] = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        self.interval = self.initial
+
+    def next_delay(self, status: str) -> float:
+        """Get the delay before the next poll after observing ``status``."""
+        if status != self.last_status:
+            self.last_status = status
+            self.interval = self.initial
+        else:
+            self.interval = min(self.maximum, self.interval * self.factor)
+        return self.interval
+
+
+def transcription_payload(audio_url: str, model: str, language: str) -> Dict[str, Any]:
+    """Build the request body for a transcription job."""
+    payload: Dict[str, Any] = {
+        "input": {
+            "audio": audio_url,
+            "model": model,
+            "word_timestamps": True,
+        }
+    }
+    # Only set language if not auto-detect
+    if language != "auto":
+        payload["input"]["language"] = language
+    return payload
+
+
+def diarization_payload(
+    audio_url: str,
+    transcript_segments: List[Dict[str, Any]],
+    num_speakers: Optional[int] = None,
+    min_speakers: Optional[int] = None,
+    max_speakers: Optional[int] = None,
+    language: str = "en",
+    denoise: bool = False,
+) -> Dict[str, Any]:
+    """Build the request body for a diarization job.
+
+    ``denoise`` asks the worker to apply the diarization filter (highpass +
+    FFT denoise) itself, so the original upload can be shared with
+    transcription instead of uploading a second, denoised WAV.
+    """
+    return {
+        "input": {
+            "audio_url": audio_url,
+            "transcript_segments": transcript_segments,
+            "num_speakers": num_speakers,
+            "min_speakers": min_speakers,
+            "max_speakers": max_speakers,
+            "language": language,
+            "denoise": denoise,
+        }
+    }
+
+
+def parse_submit_response(response: httpx.Response, endpoint_id: Optional[str]) -> str:
+    """Extract the job ID from a /run response.
+
+    Raises:
+        CloudAuthError: If API key is invalid
+        EndpointNotFoundError: If endpoint doesn't exist
+        UploadError: On any other API error
+    """
+    if response.status_code == 401:
+        raise CloudAuthError("Invalid RunPod API key")
+    if response.status_code == 404:
+        raise EndpointNotFoundError(endpoint_id or "unknown")
+    if response.status_code >= 400:
+        raise UploadError(f"API error {response.status_code}: {response.text}")
+
+    data = response.json()
+    job_id = data.get("id")
+    if not job_id:
+        raise UploadError(f"No job ID in response: {data}")
+    return job_id
+
+
+def parse_status_response(response: httpx.Response, endpoint_id: Optional[str]) -> Dict[str, Any]:
+    """Decode a /status response.
+
+    Raises:
+        CloudAuthError: If API key is invalid
+        EndpointNotFoundError: If endpoint doesn't exist
+    """
+    if response.status_code == 401:
+        raise CloudAuthError("Invalid RunPod API key")
+    if response.status_code == 404:
+        raise EndpointNotFoundError(endpoint_id or "unknown")
+    return response.json()
+
+
+def format_status_message(status: str, elapsed: float, task: str = "transcription") -> str:
+    """Format a human-readable status message."""
+    doing, noun = _TASK_WORDS.get(task, _TASK_WORDS["transcription"])
+    elapsed_str = f"{int(elapsed)}s"
+
+    if status == STATUS_QUEUED:
+        return f"Waiting for GPU worker... ({elapsed_str})"
+    if status == STATUS_IN_PROGRESS:
+        return f"{doing} on cloud GPU... ({elapsed_str})"
+    if status == STATUS_COMPLETED:
+        return f"{noun} complete ({elapsed_str})"
+    if status == STATUS_FAILED:
+        return f"{noun} failed"
+
+    return f"Status: {status} ({elapsed_str})"
+
 
 class RunPodClient:
     """Client for interacting with RunPod serverless API.
 
-    Handles the full lifecycle of a cloud transcription job:
+    Handles the full lifecycle of a cloud job:
     1. Submit job with audio URL (hosted on R2)
-    2. Poll for completion
+    2. Poll for completion (adaptive backoff)
     3. Return results
 
+    Targets the transcription endpoint by default; pass ``task="diarization"``
+    to talk to the diarization endpoint instead.
+
     Attributes:
         config: Cloud configuration with credentials and settings
     """
 
     # Job status constants
-    STATUS_QUEUED = "IN_QUEUE"
-    STATUS_IN_PROGRESS = "IN_PROGRESS"
-    STATUS_COMPLETED = "COMPLETED"
-    STATUS_FAILED = "FAILED"
+    STATUS_QUEUED = STATUS_QUEUED
+    STATUS_IN_PROGRESS = STATUS_IN_PROGRESS
+    STATUS_COMPLETED = STATUS_COMPLETED
+    STATUS_FAILED = STATUS_FAILED
 
-    def __init__(self, config: CloudConfig):
+    def __init__(self, config: CloudConfig, task: str = "transcription"):
         """Initialize RunPod client.
 
         Args:
             config: Cloud configuration (must be validated)
+            task: "transcription" or "diarization" (selects the endpoint)
         """
         self.config = config
+        self.task = task
         self._client: Optional[httpx.Client] = None
 
+    @property
+    def base_url(self) -> str:
+        """Base URL of the endpoint this client talks to."""
+        if self.task == "diarization":
+            return self.config.diarize_base_url
+        return self.config.base_url
+
+    @property
+    def endpoint_id(self) -> Optional[str]:
+        """ID of the endpoint this client talks to."""
+        if self.task == "diarization":
+            return self.config.diarize_endpoint_id
+        return self.config.endpoint_id
+
     @property
     def client(self) -> httpx.Client:
         """Get or create HTTP client."""
@@ -105,25 +261,28 @@ class RunPodClient:
             language=language,
         )
 
-        # Build request payload
-        payload = {
-            "input": {
-                "audio": audio_url,
-                "model": model,
-                "word_timestamps": True,
-            }
-        }
+        return self.submit(transcription_payload(audio_url, model, language))
 
-        # Only set language if not auto-detect
-        if language != "auto":
-            payload["input"]["language"] = language
+    def submit(self, payload: Dict[str, Any]) -> str:
+        """Submit a job payload to the endpoint, retrying network errors.
 
+        Args:
+            payload: Request body (see transcription_payload/diarization_payload)
+
+        Returns:
+            Job ID for tracking
+
+        Raises:
+            UploadError: If submission fails
+            CloudAuthError: If API key is invalid
+            EndpointNotFoundError: If endpoint doesn't exist
+        """
         # Submit job with retry logic
         last_error: Optional[Exception] = None
         for attempt in range(MAX_SUBMIT_RETRIES):
             try:
                 response = self.client.post(
-                    f"{self.config.base_url}/run",
+                    f"{self.base_url}/run",
                     json=payload,
                 )
                 break  # Success
@@ -144,20 +303,8 @@ class RunPodClient:
         else:
             raise UploadError(f"Network error: {last_error}", cause=last_error)
 
-        # Handle response
-        if response.status_code == 401:
-            raise CloudAuthError("Invalid RunPod API key")
-        if response.status_code == 404:
-            raise EndpointNotFoundError(self.config.endpoint_id or "unknown")
-        if response.status_code >= 400:
-            raise UploadError(f"API error {response.status_code}: {response.text}")
-
-        data = response.json()
-        job_id = data.get("id")
-        if not job_id:
-            raise UploadError(f"No job ID in response: {data}")
-
-        logger.info("Job submitted", job_id=job_id)
+        job_id = parse_submit_response(response, self.endpoint_id)
+        logger.info("Job submitted", job_id=job_id, task=self.task)
         return job_id
 
     def get_status(self, job_id: str) -> dict[str, Any]:
@@ -174,17 +321,12 @@ class RunPodClient:
             EndpointNotFoundError: If endpoint doesn't exist
         """
         try:
-            response = self.client.get(f"{self.config.base_url}/status/{job_id}")
+            response = self.client.get(f"{self.base_url}/status/{job_id}")
         except httpx.RequestError as e:
             logger.warning("Status check failed", job_id=job_id, error=str(e))
             return {"status": "UNKNOWN", "error": str(e)}
 
-        if response.status_code == 401:
-            raise CloudAuthError("Invalid RunPod API key")
-        if response.status_code == 404:
-            raise EndpointNotFoundError(self.config.endpoint_id or "unknown")
-
-        return response.json()
+        return parse_status_response(response, self.endpoint_id)
 
     def wait_for_completion(
         self,
@@ -193,12 +335,15 @@ class RunPodClient:
     ) -> dict[str, Any]:
         """Poll until job completes or times out.
 
+        The poll interval starts at ``poll_interval_seconds`` and backs off
+        (up to ``max_poll_interval_seconds``) while the status is unchanged.
+
         Args:
             job_id: Job ID from submit_job
             progress_callback: Optional callback for status updates
 
         Returns:
-            Transcription result from the job output
+            Result from the job output
 
         Raises:
             CloudTimeoutError: If job exceeds timeout
@@ -206,7 +351,9 @@ class RunPodClient:
         """
         start_time = time.time()
         last_status = ""
-        poll_count = 0
+        backoff = PollBackoff(
+            self.config.poll_interval_seconds, self.config.max_poll_interval_seconds
+        )
 
         while True:
             elapsed = time.time() - start_time
@@ -246,23 +393,11 @@ class RunPodClient:
                 raise JobFailedError(job_id, error)
 
             # Wait before next poll
-            poll_count += 1
-            time.sleep(self.config.poll_interval_seconds)
+            time.sleep(backoff.next_delay(status))
 
     def _format_status_message(self, status: str, elapsed: float) -> str:
         """Format a human-readable status message."""
-        elapsed_str = f"{int(elapsed)}s"
-
-        if status == self.STATUS_QUEUED:
-            return f"Waiting for GPU worker... ({elapsed_str})"
-        if status == self.STATUS_IN_PROGRESS:
-            return f"Transcribing on cloud GPU... ({elapsed_str})"
-        if status == self.STATUS_COMPLETED:
-            return f"Transcription complete ({elapsed_str})"
-        if status == self.STATUS_FAILED:
-            return "Transcription failed"
-
-        return f"Status: {status} ({elapsed_str})"
+        return format_status_message(status, elapsed, self.task)
 
     def test_connection(self) -> bool:
         """Test that the endpoint is accessible.
@@ -271,7 +406,7 @@ class RunPodClient:
             True if endpoint responds, False otherwise
         """
         try:
-            response = self.client.get(f"{self.config.base_url}/health")
+            response = self.client.get(f"{self.base_url}/health")
             return response.status_code == 200
         except Exception as e:
             logger.debug("Health check failed", error=str(e))
@@ -4,13 +4,15 @@ Uploads audio files to R2 and generates presigned URLs
 for RunPod workers to download.
 """
 
-import uuid
+import time
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Dict, Optional, Tuple
 
 from ..logging import get_logger
+from ..storage.transfer import MultipartTransfer, TransferConfig
 from .config import CloudConfig
 from .exceptions import UploadError
+from .upload_cache import UploadIndex, content_key
 
 logger = get_logger(__name__)
 
@@ -19,12 +21,21 @@ class CloudStorage:
     """Upload audio to Cloudflare R2 and generate presigned URLs.
 
     Uses boto3's S3-compatible client to interact with R2.
-    Files are uploaded with a unique key and a presigned GET URL
-    is generated for the RunPod worker to download.
+    Files are uploaded under a content-addressed key (SHA-256) and a
+    presigned GET URL is generated for the RunPod worker to download.
+    A local UploadIndex tracks live keys, so transcription, diarization
+    and retries of the same audio share a single upload.
     """
 
-    def __init__(self, config: CloudConfig):
+    def __init__(
+        self,
+        config: CloudConfig,
+        index: Optional[UploadIndex] = None,
+        transfer_config: Optional[TransferConfig] = None,
+    ):
         self.config = config
+        self.index = index or UploadIndex()
+        self.transfer_config = transfer_config
         self._client = None
 
     @property
@@ -64,24 +75,47 @@ class CloudStorage:
         Raises:
             UploadError: If upload fails
         """
+        bucket = self._bucket()
         if not audio_path.exists():
             raise UploadError(f"Audio file not found: {audio_path}")
 
-        key = f"podx/{uuid.uuid4().hex}/{audio_path.name}"
-        bucket = self.config.r2_bucket_name
-        file_size_mb = audio_path.stat().st_size / (1024 * 1024)
-
-        logger.info(
-            "Uploading to R2",
-            bucket=bucket,
-            key=key,
-            size_mb=round(file_size_mb, 2),
-        )
+        retention = self.config.upload_retention_seconds
+        self._prune_expired(bucket)
+
+        digest = self.index.digest(audio_path)
+        key = content_key(digest, audio_path)
+        now = time.time()
+
+        entry = self.index.get(bucket, digest, now=now)
+        if entry is not None and self._object_exists(bucket, entry["key"]):
+            # Reuse the previous URL while it has at least half its lifetime left
+            if entry.get("url") and entry.get("url_expires_at", 0) - now >= expires_in / 2:
+                logger.info("Reusing R2 upload", key=entry["key"])
+                expires_at = self._retain_until(entry, now + retention, entry["url_expires_at"])
+                self.index.put(bucket, digest, {**entry, "expires_at": expires_at})
+                return entry["url"], entry["key"]
+            key = entry["key"]
+            logger.info("Reusing R2 upload with new presigned URL", key=key)
+        elif self._object_exists(bucket, key):
+            # Uploaded earlier from another machine or with a lost index
+            logger.info("R2 object already present, skipping upload", key=key)
+            entry = None
+        else:
+            entry = None
+            file_size_mb = audio_path.stat().st_size / (1024 * 1024)
+            logger.info(
+                "Uploading to R2",
+                bucket=bucket,
+                key=key,
+                size_mb=round(file_size_mb, 2),
+            )
 
-        try:
-            self.client.upload_file(str(audio_path), bucket, key)
-        except Exception as e:
-            raise UploadError(f"R2 upload failed: {e}", cause=e)
+            if self.transfer_config is None:
+                self.transfer_config = TransferConfig.from_podx_config()
+            try:
+                MultipartTransfer(self.client, self.transfer_config).upload(audio_path, bucket, key)
+            except Exception as e:
+                raise UploadError(f"R2 upload failed: {e}", cause=e)
 
         try:
             url = self.client.generate_presigned_url(
@@ -92,18 +126,92 @@ class CloudStorage:
         except Exception as e:
             # Clean up the uploaded file if presign fails
             self._try_delete(bucket, key)
+            self.index.remove(bucket, key)
             raise UploadError(f"Failed to generate presigned URL: {e}", cause=e)
 
+        self.index.put(
+            bucket,
+            digest,
+            {
+                "key": key,
+                "size": audio_path.stat().st_size,
+                "uploaded_at": entry["uploaded_at"] if entry else now,
+                "expires_at": self._retain_until(entry, now + retention, now + expires_in),
+                "url": url,
+                "url_expires_at": now + expires_in,
+            },
+        )
+
         logger.info("Upload complete, presigned URL generated", expires_in=expires_in)
         return url, key
 
+    def release(self, key: str) -> None:
+        """Signal that a job no longer needs an uploaded object.
+
+        The object is kept for reuse by later stages until its retention
+        expires; with ``upload_retention_seconds=0`` it is deleted now. Other
+        objects whose retention has passed are deleted here as well, so the
+        bucket is cleaned up without waiting for the next upload.
+
+        Args:
+            key: Object key returned from upload_and_presign
+        """
+        bucket = self._bucket()
+        if self.config.upload_retention_seconds <= 0:
+            self.delete(key)
+        self._prune_expired(bucket)
+
     def delete(self, key: str) -> None:
         """Delete an uploaded file from R2.
 
         Args:
             key: Object key returned from upload_and_presign
         """
-        self._try_delete(self.config.r2_bucket_name, key)
+        bucket = self._bucket()
+        self._try_delete(bucket, key)
+        self.index.remove(bucket, key)
+
+    def _bucket(self) -> str:
+        """Configured bucket name.
+
+        Raises:
+            UploadError: If no bucket is configured
+        """
+        if not self.config.r2_bucket_name:
+            raise UploadError("R2 bucket not configured. Run 'podx cloud setup' to configure.")
+        return self.config.r2_bucket_name
+
+    @staticmethod
+    def _retain_until(
+        entry: Optional[Dict[str, Any]], retention_end: float, url_expires_at: float
+    ) -> float:
+        """Retention deadline for an object handed out again.
+
+        Extended on every use, never shortened, so an expiry prune cannot
+        delete the object while a job is still downloading it or before the
+        presigned URL just issued for it has expired.
+        """
+        previous = entry["expires_at"] if entry else 0.0
+        return max(previous, retention_end, url_expires_at)
+
+    def _object_exists(self, bucket: str, key: str) -> bool:
+        """Check whether an object is still present in the bucket."""
+        try:
+            self.client.head_object(Bucket=bucket, Key=key)
+            return True
+        except Exception:
+            return False
+
+    def _prune_expired(self, bucket: str) -> None:
+        """Delete uploads whose retention has passed.
+
+        Skipped with zero retention: every entry is "expired" then, including
+        objects other in-flight jobs still use, and release() deletes each one.
+        """
+        if self.config.upload_retention_seconds <= 0:
+            return
+        for key in self.index.pop_expired(bucket):
+            self._try_delete(bucket, key)
 
     def _try_delete(self, bucket: str, key: str) -> None:
         """Attempt to delete an object, logging but not raising on failure."""
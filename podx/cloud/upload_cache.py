@@ -0,0 +1,145 @@
+"""Local index of content-addressed R2 uploads.
+
+Audio is uploaded under a key derived from its SHA-256, so the same episode
+is only sent once no matter how many cloud stages (transcription,
+diarization, retries) need it. The index remembers which keys are live, when
+they expire, and the last presigned URL, so later stages can skip both the
+upload and the re-hash.
+
+Index file (``~/.podx/cache/r2-uploads.json``)::
+
+    {
+      "objects": {"<bucket>/<sha256>": {"key": ..., "size": ..., "uploaded_at": ...,
+                                        "expires_at": ..., "url": ..., "url_expires_at": ...}},
+      "files": {"/abs/audio.mp3": {"size": ..., "mtime_ns": ..., "sha256": ...}}
+    }
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_INDEX_PATH = Path.home() / ".podx" / "cache" / "r2-uploads.json"
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def file_digest(path: Path) -> str:
+    """Compute the SHA-256 hex digest of a file, streaming it in chunks."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def content_key(digest: str, audio_path: Path) -> str:
+    """Object key for content with the given digest."""
+    return f"podx/sha256/{digest}{audio_path.suffix.lower()}"
+
+
+class UploadIndex:
+    """JSON-backed index of live R2 objects and local file digests.
+
+    Writes are atomic (temp file + rename) so concurrent podx processes never
+    see a torn index; the last writer wins, which at worst causes one extra
+    upload.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize the index.
+
+        Args:
+            path: Index file (defaults to ~/.podx/cache/r2-uploads.json)
+        """
+        self.path = path or DEFAULT_INDEX_PATH
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            data = {}
+        data.setdefault("objects", {})
+        data.setdefault("files", {})
+        return data
+
+    def _save(self, data: Dict[str, Any]) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError as e:
+            logger.warning("Failed to save upload index", path=str(self.path), error=str(e))
+
+    def digest(self, audio_path: Path) -> str:
+        """Get the file's SHA-256, reusing the stored digest if size and mtime match."""
+        resolved = str(audio_path.resolve())
+        stat = audio_path.stat()
+        with self._lock:
+            cached = self._load()["files"].get(resolved)
+        if cached and cached["size"] == stat.st_size and cached["mtime_ns"] == stat.st_mtime_ns:
+            return cached["sha256"]
+
+        digest = file_digest(audio_path)
+        with self._lock:
+            data = self._load()
+            data["files"][resolved] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": digest,
+            }
+            self._save(data)
+        return digest
+
+    def get(
+        self, bucket: str, digest: str, now: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get the live entry for a digest, or None if unknown or expired."""
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._load()["objects"].get(f"{bucket}/{digest}")
+        if entry is None or entry["expires_at"] <= now:
+            return None
+        return entry
+
+    def put(self, bucket: str, digest: str, entry: Dict[str, Any]) -> None:
+        """Record (or update) an uploaded object."""
+        with self._lock:
+            data = self._load()
+            data["objects"][f"{bucket}/{digest}"] = entry
+            self._save(data)
+
+    def remove(self, bucket: str, key: str) -> None:
+        """Forget an object by its key."""
+        with self._lock:
+            data = self._load()
+            data["objects"] = {
+                k: v
+                for k, v in data["objects"].items()
+                if not (k.startswith(f"{bucket}/") and v["key"] == key)
+            }
+            self._save(data)
+
+    def pop_expired(self, bucket: str, now: Optional[float] = None) -> List[str]:
+        """Remove expired entries for a bucket and return their keys."""
+        now = time.time() if now is None else now
+        with self._lock:
+            data = self._load()
+            expired = [
+                k
+                for k, v in data["objects"].items()
+                if k.startswith(f"{bucket}/") and v["expires_at"] <= now
+            ]
+            keys = [data["objects"].pop(k)["key"] for k in expired]
+            if keys:
+                self._save(data)
+        return keys
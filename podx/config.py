@@ -46,6 +46,51 @@ class PodxConfig(BaseSettings):
     retry_delay: float = Field(default=1.0, validation_alias="PODX_RETRY_DELAY")
     chunk_chars: int = Field(default=24000, validation_alias="PODX_CHUNK_CHARS")
 
+    # Model Cache Configuration (in-process pool of loaded ASR models)
+    model_cache_size: int = Field(default=3, validation_alias="PODX_MODEL_CACHE_SIZE")
+    model_cache_max_memory_mb: Optional[float] = Field(
+        default=None, validation_alias="PODX_MODEL_CACHE_MAX_MEMORY_MB"
+    )
+    model_cache_memory_pressure_percent: Optional[float] = Field(
+        default=90.0, validation_alias="PODX_MODEL_CACHE_MEMORY_PRESSURE_PERCENT"
+    )
+
+    # Object Storage Transfers (S3/R2 multipart engine)
+    transfer_part_size_mb: float = Field(
+        default=16.0, validation_alias="PODX_TRANSFER_PART_SIZE_MB"
+    )
+    transfer_multipart_threshold_mb: float = Field(
+        default=32.0, validation_alias="PODX_TRANSFER_MULTIPART_THRESHOLD_MB"
+    )
+    transfer_max_concurrency: int = Field(
+        default=8, validation_alias="PODX_TRANSFER_MAX_CONCURRENCY"
+    )
+    transfer_verify_checksum: bool = Field(
+        default=True, validation_alias="PODX_TRANSFER_VERIFY_CHECKSUM"
+    )
+
+    # LLM Response Cache (on-disk, keyed by request content)
+    llm_cache_enabled: bool = Field(default=True, validation_alias="PODX_LLM_CACHE")
+    llm_cache_max_mb: float = Field(default=256.0, validation_alias="PODX_LLM_CACHE_MAX_MB")
+
+    # LLM rate limiting (shared by every engine in the process, per provider and model;
+    # 0 disables a limit). Quotas depend on the provider and account tier, so both are
+    # off until set
+    llm_requests_per_minute: int = Field(default=0, validation_alias="PODX_LLM_REQUESTS_PER_MINUTE")
+    llm_tokens_per_minute: int = Field(default=0, validation_alias="PODX_LLM_TOKENS_PER_MINUTE")
+
+    # Map-phase requests in flight per analysis
+    analyze_max_concurrency: int = Field(default=3, validation_alias="PODX_ANALYZE_MAX_CONCURRENCY")
+
+    # Ad filtering (local pre-filter escalates only likely sponsor reads to the LLM;
+    # opt-in until its recall is measured against classifying every segment)
+    ad_prefilter_enabled: bool = Field(default=False, validation_alias="PODX_AD_PREFILTER")
+
+    # Local Diarization
+    diarize_chunk_workers: int = Field(
+        default=1, validation_alias="PODX_DIARIZE_CHUNK_WORKERS"
+    )  # 1 = sequential chunks, 0 = size pool from available memory, N = at most N
+
     # Pipeline Defaults (can be overridden by podcast-specific configs)
     default_align: bool = Field(default=False, validation_alias="PODX_DEFAULT_ALIGN")
     default_diarize: bool = Field(default=False, validation_alias="PODX_DEFAULT_DIARIZE")
@@ -0,0 +1,204 @@
+"""Local ad pre-filter for transcript cleanup.
+
+Sponsor reads are a small, lexically distinctive part of most transcripts.
+Each segment is scored locally with compiled sponsor-read patterns plus a
+naive Bayes bag-of-words model learned from earlier LLM classifications.
+Segments away from any likely ad are content without an LLM call, segments
+with overwhelming evidence are ads, and only the windows around the remaining
+hits are escalated to the LLM. Weak evidence inside a window (a URL, "free
+trial") extends it, and the caller widens it again around every segment the
+LLM confirms as an ad (:meth:`AdScorer.widen`) until the LLM answers content,
+so long sponsor reads are not cut off at the first window's edge.
+
+Model file (``~/.podx/cache/ad-classifier.json``)::
+
+    {"segments": {"ad": n, "content": n},
+     "words": {"ad": {word: count}, "content": {word: count}}}
+"""
+
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MODEL_PATH = Path.home() / ".podx" / "cache" / "ad-classifier.json"
+DEFAULT_WINDOW = 2  # Neighbouring segments escalated with each hit (sponsor reads span several)
+ESCALATE_THRESHOLD = 0.5  # Ad probability that makes a segment a hit
+EXTEND_THRESHOLD = 0.15  # Ad probability (one weak pattern) that extends an open window
+LOCAL_AD_THRESHOLD = 0.99  # Ad probability trusted without asking the LLM
+PRIOR_LOGIT = -4.0  # Most segments are content
+MIN_TRAINING_SEGMENTS = 20  # Per class, before learned word weights are used
+LEARNED_LOGIT_LIMIT = 6.0  # Bound on the bag-of-words contribution
+MAX_VOCABULARY = 5000  # Words kept per class when saving
+
+_STRONG = 5.0
+_WEAK = 2.5
+
+AD_PATTERNS = [
+    (re.compile(p, re.IGNORECASE), weight)
+    for p, weight in [
+        (r"\b(brought to you by|sponsored by|today'?s sponsor|our sponsors?)\b", _STRONG),
+        (r"\bsupport for (this|the) (show|podcast|episode) comes from\b", _STRONG),
+        (r"\b(promo|discount|coupon|offer) code\b", _STRONG),
+        (r"\b(use|enter) (the )?code\b", _STRONG),
+        (r"\b(this|the) (episode|show|podcast) is (also )?(sponsored|supported)\b", _STRONG),
+        (r"\b\d+ ?(%|percent) off\b", _WEAK),
+        (r"\bfree (trial|shipping)\b", _WEAK),
+        (r"\b(first (month|order)|limited time|risk[- ]free)\b", _WEAK),
+        (r"\b((go|head) (to|over to)|visit) [a-z0-9-]+ ?(\.|dot) ?(com|co|io|org|net)\b", _WEAK),
+        (r"\b[a-z0-9-]+ ?(\.|dot) ?(com|co|io|org|net)\b", _WEAK),
+        (r"\b(sign up|subscribe) (today|now)\b", _WEAK),
+    ]
+]
+
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+
+def _words(text: str) -> List[str]:
+    return _WORD_RE.findall(text.lower())
+
+
+class AdScorer:
+    """Regex + naive Bayes ad scorer with an on-disk learned vocabulary.
+
+    Writes are atomic (temp file + rename); concurrent podx processes may drop
+    each other's latest update, which only slows learning.
+    """
+
+    def __init__(self, path: Optional[Path] = None, window: int = DEFAULT_WINDOW):
+        """Initialize the scorer.
+
+        Args:
+            path: Model file (defaults to ~/.podx/cache/ad-classifier.json)
+            window: Segments on each side of a hit that are escalated with it
+        """
+        self.path = path or DEFAULT_MODEL_PATH
+        self.window = window
+        self._lock = threading.Lock()
+        self._data = self._load()
+        self._cached_totals: Optional[Tuple[int, int]] = None
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            data = {}
+        segments = data.get("segments", {})
+        words = data.get("words", {})
+        return {
+            "segments": {label: int(segments.get(label, 0)) for label in ("ad", "content")},
+            "words": {label: Counter(words.get(label, {})) for label in ("ad", "content")},
+        }
+
+    def save(self) -> None:
+        """Persist the learned vocabulary (most frequent words per class)."""
+        with self._lock:
+            data = {
+                "segments": dict(self._data["segments"]),
+                "words": {
+                    label: dict(counts.most_common(MAX_VOCABULARY))
+                    for label, counts in self._data["words"].items()
+                },
+            }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError as e:
+            logger.warning("Failed to save ad classifier", path=str(self.path), error=str(e))
+
+    @property
+    def trained(self) -> bool:
+        """Whether enough labelled segments exist to use learned word weights."""
+        return min(self._data["segments"].values()) >= MIN_TRAINING_SEGMENTS
+
+    def _totals(self) -> Tuple[int, int]:
+        if self._cached_totals is None:
+            ad_words = self._data["words"]["ad"]
+            content_words = self._data["words"]["content"]
+            vocabulary = len(ad_words.keys() | content_words.keys()) or 1
+            self._cached_totals = (
+                sum(ad_words.values()) + vocabulary,
+                sum(content_words.values()) + vocabulary,
+            )
+        return self._cached_totals
+
+    def _learned_logit(self, words: Sequence[str]) -> float:
+        ad_words = self._data["words"]["ad"]
+        content_words = self._data["words"]["content"]
+        ad_total, content_total = self._totals()
+        logit = sum(
+            math.log((ad_words[w] + 1) / ad_total)
+            - math.log((content_words[w] + 1) / content_total)
+            for w in set(words)
+        )
+        return max(-LEARNED_LOGIT_LIMIT, min(LEARNED_LOGIT_LIMIT, logit))
+
+    def score(self, text: str) -> float:
+        """Probability that a segment is an ad."""
+        logit = PRIOR_LOGIT
+        logit += sum(weight for pattern, weight in AD_PATTERNS if pattern.search(text))
+        if self.trained:
+            logit += self._learned_logit(_words(text))
+        return 1.0 / (1.0 + math.exp(-logit))
+
+    def prefilter(self, segments: Sequence[Dict[str, Any]]) -> List[Optional[bool]]:
+        """Label the obvious segments locally.
+
+        Args:
+            segments: Transcript segments
+
+        Returns:
+            Per segment: True (ad), False (content), or None when the segment
+            sits in a window around a hit and needs the LLM
+        """
+        scores = [self.score(s.get("text", "")) for s in segments]
+        labels: List[Optional[bool]] = [False] * len(segments)
+        # Hits open a window; weak evidence inside an open window opens another
+        seeds = [i for i, p in enumerate(scores) if p >= ESCALATE_THRESHOLD]
+        while seeds:
+            i = seeds.pop()
+            lo, hi = max(0, i - self.window), min(len(segments), i + self.window + 1)
+            for j in range(lo, hi):
+                if labels[j] is False:
+                    labels[j] = None
+                    if scores[j] >= EXTEND_THRESHOLD:
+                        seeds.append(j)
+        for i, p in enumerate(scores):
+            if p >= LOCAL_AD_THRESHOLD:
+                labels[i] = True
+        return labels
+
+    def widen(self, ads: Sequence[int], count: int, asked: Set[int]) -> List[int]:
+        """Segments to escalate next around LLM-confirmed ads.
+
+        Args:
+            ads: Indices the LLM just labelled as ads
+            count: Number of segments in the transcript
+            asked: Indices already sent to the LLM
+
+        Returns:
+            Sorted indices within the window of a confirmed ad not yet asked
+        """
+        nearby = {
+            j for i in ads for j in range(max(0, i - self.window), min(count, i + self.window + 1))
+        }
+        return sorted(nearby - asked)
+
+    def learn(self, texts: Sequence[str], is_ad: Sequence[bool]) -> None:
+        """Add LLM-labelled segments to the bag-of-words model (call save() to persist)."""
+        with self._lock:
+            for text, ad in zip(texts, is_ad):
+                label = "ad" if ad else "content"
+                self._data["segments"][label] += 1
+                self._data["words"][label].update(set(_words(text)))
+            self._cached_totals = None
@@ -4,17 +4,56 @@ No UI dependencies, no CLI concerns. Just podcast transcript analysis using LLM
 Handles chunking, parallel API calls, and structured output generation.
 """
 
+import asyncio
+import hashlib
 import json
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+import time
+from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from ..llm import LLMMessage, LLMProvider, get_provider
+from ..config import get_config
+from ..llm import (
+    LLMMessage,
+    LLMProvider,
+    LLMRateLimitError,
+    LLMResponse,
+    get_provider,
+    get_provider_name,
+)
+from ..llm.loop import run_coroutine
+from ..llm.rate_limit import RateLimiter, get_rate_limiter
+from ..llm.tokens import (
+    context_window,
+    count_tokens,
+    pack_by_tokens,
+    split_text_by_tokens,
+    token_budget,
+)
 from ..logging import get_logger
 from ..progress import ProgressReporter, SilentProgressReporter
 
 logger = get_logger(__name__)
 
+MAP_OUTPUT_TOKENS = 4096  # Room left in each map request for the chunk notes
+# System prompts differ per template; reserving a fixed allowance keeps chunk
+# boundaries (and so cached map notes) identical across templates
+SYSTEM_PROMPT_TOKENS = 2048
+MAP_CACHE_FILENAME = "map-notes.json"
+REDUCE_OUTPUT_TOKENS = 16384  # Room left for the final analysis (markdown + JSON)
+NOTES_DELIMITER = "\n\n---\n\n"
+MAX_REDUCE_ROUNDS = 5
+ESTIMATED_OUTPUT_TOKENS = 1024  # Rate-limit reservation until the real usage is known
+RATE_LIMIT_PAUSE_SECONDS = 15.0  # Shared back-off after a 429
+MAX_RATE_LIMIT_RETRIES = 3
+INTERMEDIATE_REDUCE_INSTRUCTIONS = (
+    "Combine these notes from consecutive sections of one podcast transcript into a "
+    "single set of notes. Keep every distinct key point, insight and verbatim quote "
+    "with its speaker and timestamps; merge duplicates, but do not summarize away "
+    "details. A later step writes the final analysis from these notes."
+)
+
 
 class AnalyzeError(Exception):
     """Raised when analyze processing fails."""
@@ -70,6 +109,61 @@ def split_into_chunks(text: str, approx_chars: int) -> List[str]:
     return chunks
 
 
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def map_cache_key(chunk: str, map_instructions: str, model: str, temperature: float) -> str:
+    """Key for one chunk's map notes."""
+    return _sha256(json.dumps([_sha256(chunk), _sha256(map_instructions), model, temperature]))
+
+
+class MapNotesCache:
+    """Map-phase notes of one episode, stored next to its transcript.
+
+    Every analysis template with the same map instructions reuses the notes,
+    so later templates only pay for the reduce call. Writes are atomic
+    (temp file + rename).
+    """
+
+    def __init__(self, path: Path):
+        """Initialize the cache.
+
+        Args:
+            path: JSON file (usually ``<episode_dir>/map-notes.json``)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            self._notes: Dict[str, str] = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            self._notes = {}
+        self._dirty = False
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            return self._notes.get(key)
+
+    def put(self, key: str, notes: str) -> None:
+        with self._lock:
+            self._notes[key] = notes
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write new notes to disk (no-op if nothing changed)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self._notes, indent=2, ensure_ascii=False)
+            self._dirty = False
+        try:
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(data, encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError as e:
+            logger.warning("Failed to save map notes", path=str(self.path), error=str(e))
+
+
 class AnalyzeEngine:
     """Pure analyze logic with no UI dependencies.
 
@@ -86,30 +180,44 @@ class AnalyzeEngine:
         self,
         model: str = "gpt-4",
         temperature: float = 0.2,
-        max_chars_per_chunk: int = 24000,
+        max_chars_per_chunk: Optional[int] = None,
+        max_tokens_per_chunk: Optional[int] = None,
         llm_provider: Optional[LLMProvider] = None,
         provider_name: str = "openai",
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         progress: Optional[Union[ProgressReporter, Callable[[str], None]]] = None,
         progress_callback: Optional[Callable[[str], None]] = None,  # Deprecated
+        map_cache_dir: Optional[Path] = None,
+        max_concurrency: Optional[int] = None,
     ):
         """Initialize analyze engine.
 
         Args:
             model: Model name (e.g., 'gpt-4', 'claude-3-opus', 'llama2')
             temperature: Model temperature for generation
-            max_chars_per_chunk: Maximum characters per chunk for map phase
+            max_chars_per_chunk: Split map chunks by character count instead of tokens
+            max_tokens_per_chunk: Token budget per map chunk (default: as much as fits
+                the model's context window)
             llm_provider: Optional pre-configured LLM provider instance
             provider_name: Provider to use if llm_provider not provided (default: openai)
             api_key: API key (defaults to provider-specific env var)
             base_url: Optional base URL override
             progress: Optional ProgressReporter or legacy callback function
             progress_callback: Deprecated - use progress parameter instead
+            map_cache_dir: Episode directory to cache map-phase notes in
+                (map-notes.json), shared by every template run on the episode
+            max_concurrency: Map and intermediate reduce requests in flight at once
+                (default: PODX_ANALYZE_MAX_CONCURRENCY). Every engine in the
+                process also shares one rate limiter per provider and model.
         """
         self.model = model
         self.temperature = temperature
         self.max_chars_per_chunk = max_chars_per_chunk
+        self.max_tokens_per_chunk = max_tokens_per_chunk
+        self.map_cache: Optional[MapNotesCache] = (
+            MapNotesCache(Path(map_cache_dir) / MAP_CACHE_FILENAME) if map_cache_dir else None
+        )
 
         # Backward compatibility: expose api_key and base_url attributes
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
@@ -141,6 +249,14 @@ class AnalyzeEngine:
             except Exception as e:
                 raise AnalyzeError(f"Failed to initialize LLM provider: {e}") from e
 
+        config = get_config()
+        self.max_concurrency = max(1, max_concurrency or config.analyze_max_concurrency)
+        self.rate_limiter: RateLimiter = get_rate_limiter(
+            get_provider_name(self.llm_provider), model
+        )
+        self.cached_prompt_tokens = 0  # Prompt tokens providers served from their prompt cache
+        self._usage_lock = threading.Lock()
+
     def _report_progress(self, message: str):
         """Report progress via ProgressReporter or legacy callback."""
         # New API: ProgressReporter
@@ -162,21 +278,162 @@ class AnalyzeEngine:
         # For non-OpenAI providers or mocks, return the provider itself
         return self.llm_provider
 
-    def _chat_once(self, system: str, user: str) -> str:
-        """Make a single chat completion call (synchronous)."""
-        messages = [LLMMessage.system(system), LLMMessage.user(user)]
-        response = self.llm_provider.complete(
-            messages=messages, model=self.model, temperature=self.temperature
-        )
-        return response.content
-
-    async def _chat_once_async(self, system: str, user: str) -> str:
+    @staticmethod
+    def _messages(system: str, user: str, prefix: Optional[str]) -> List[LLMMessage]:
+        """Shared prefix first (system prompt, then e.g. map instructions), marked cacheable."""
+        messages = [LLMMessage.system(system, cache=True)]
+        if prefix:
+            messages.append(LLMMessage.user(prefix, cache=True))
+        messages.append(LLMMessage.user(user))
+        return messages
+
+    def _estimate_tokens(self, messages: List[LLMMessage]) -> int:
+        prompt_tokens = sum(count_tokens(msg.content, self.model) for msg in messages)
+        return prompt_tokens + ESTIMATED_OUTPUT_TOKENS
+
+    def _settle(self, reservation: List[float], response: LLMResponse) -> None:
+        usage = response.usage
+        if not isinstance(usage, dict):
+            return
+        if isinstance(usage.get("total_tokens"), int):
+            self.rate_limiter.settle(reservation, usage["total_tokens"])
+        if isinstance(usage.get("cached_tokens"), int):
+            with self._usage_lock:
+                self.cached_prompt_tokens += usage["cached_tokens"]
+
+    def _chat_once(self, system: str, user: str, prefix: Optional[str] = None) -> str:
+        """Make a single chat completion call (synchronous).
+
+        ``prefix`` is sent as its own user message ahead of ``user`` so
+        providers with prompt caching can reuse it across calls.
+        """
+        messages = self._messages(system, user, prefix)
+        tokens = self._estimate_tokens(messages)
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            reservation = self.rate_limiter.acquire_sync(tokens)
+            try:
+                response = self.llm_provider.complete(
+                    messages=messages, model=self.model, temperature=self.temperature
+                )
+            except LLMRateLimitError:
+                if attempt == MAX_RATE_LIMIT_RETRIES:
+                    raise
+                self.rate_limiter.pause(RATE_LIMIT_PAUSE_SECONDS)
+                continue
+            self._settle(reservation, response)
+            return response.content
+        raise AssertionError("unreachable")
+
+    async def _chat_once_async(self, system: str, user: str, prefix: Optional[str] = None) -> str:
         """Make a single chat completion call (asynchronous)."""
-        messages = [LLMMessage.system(system), LLMMessage.user(user)]
-        response = await self.llm_provider.complete_async(
-            messages=messages, model=self.model, temperature=self.temperature
+        messages = self._messages(system, user, prefix)
+        tokens = self._estimate_tokens(messages)
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            reservation = await self.rate_limiter.acquire(tokens)
+            try:
+                response = await self.llm_provider.complete_async(
+                    messages=messages, model=self.model, temperature=self.temperature
+                )
+            except LLMRateLimitError:
+                if attempt == MAX_RATE_LIMIT_RETRIES:
+                    raise
+                self.rate_limiter.pause(RATE_LIMIT_PAUSE_SECONDS)
+                continue
+            self._settle(reservation, response)
+            return response.content
+        raise AssertionError("unreachable")
+
+    async def _gather_limited(self, coros: List[Any]) -> List[Any]:
+        """Await coroutines with at most max_concurrency running; results in order."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(coro: Any) -> Any:
+            async with semaphore:
+                return await coro
+
+        tasks = [asyncio.ensure_future(run(coro)) for coro in coros]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    def _chunk_token_budget(self, system_prompt: str, map_instructions: str) -> int:
+        """Transcript tokens per map chunk that fit the model's context window."""
+        system_tokens = max(count_tokens(system_prompt, self.model), SYSTEM_PROMPT_TOKENS)
+        prompt_tokens = system_tokens + count_tokens(map_instructions, self.model)
+        return token_budget(self.model, reserved_tokens=prompt_tokens + MAP_OUTPUT_TOKENS)
+
+    def _tree_reduce(self, notes: List[str], system_prompt: str, reduce_prompt: str) -> List[str]:
+        """Consolidate notes in parallel rounds until they fit the final reduce prompt.
+
+        Each round packs consecutive notes into groups sized to the model's
+        context window (so fan-in grows with the window) and condenses every
+        group with one intermediate reduce call.
+
+        Args:
+            notes: Map-phase notes in transcript order
+            system_prompt: System prompt for intermediate calls
+            reduce_prompt: Final reduce prompt without the notes
+
+        Returns:
+            Notes that fit the final reduce prompt (unchanged if they already fit)
+        """
+        system_tokens = count_tokens(system_prompt, self.model)
+        # Small-context models can't leave the full allowance for the output
+        output_tokens = min(REDUCE_OUTPUT_TOKENS, context_window(self.model) // 4)
+        final_budget = token_budget(
+            self.model,
+            reserved_tokens=system_tokens + count_tokens(reduce_prompt, self.model) + output_tokens,
         )
-        return response.content
+        group_budget = token_budget(
+            self.model,
+            reserved_tokens=system_tokens
+            + count_tokens(INTERMEDIATE_REDUCE_INSTRUCTIONS, self.model)
+            + MAP_OUTPUT_TOKENS,
+        )
+        delimiter_tokens = count_tokens(NOTES_DELIMITER, self.model)
+
+        for round_num in range(1, MAX_REDUCE_ROUNDS + 1):
+            if count_tokens(NOTES_DELIMITER.join(notes), self.model) <= final_budget:
+                break
+            groups = pack_by_tokens(notes, group_budget, self.model, item_overhead=delimiter_tokens)
+            if len(groups) == len(notes):
+                break  # No two notes fit one request; send what we have
+            self._report_progress(
+                f"Consolidating {len(notes)} notes into {len(groups)} (round {round_num})"
+            )
+            logger.info(
+                "Intermediate reduce", round=round_num, notes=len(notes), groups=len(groups)
+            )
+
+            async def condense(group: List[str]) -> str:
+                if len(group) == 1:
+                    return group[0]
+                joined = NOTES_DELIMITER.join(group)
+                key = map_cache_key(
+                    joined, INTERMEDIATE_REDUCE_INSTRUCTIONS, self.model, self.temperature
+                )
+                if self.map_cache is not None:
+                    cached = self.map_cache.get(key)
+                    if cached is not None:
+                        return cached
+                prompt = f"{INTERMEDIATE_REDUCE_INSTRUCTIONS}\n\nNotes:\n\n{joined}"
+                condensed = await self._chat_once_async(system_prompt, prompt)
+                if self.map_cache is not None:
+                    self.map_cache.put(key, condensed)
+                return condensed
+
+            try:
+                notes = run_coroutine(self._gather_limited([condense(g) for g in groups]))
+            except Exception as e:
+                raise AnalyzeError(f"Intermediate reduce failed: {e}") from e
+            finally:
+                if self.map_cache is not None:
+                    self.map_cache.save()
+
+        return notes
 
     def analyze(
         self,
@@ -222,51 +479,79 @@ class AnalyzeEngine:
         if not text.strip():
             raise AnalyzeError("No transcript text found in input")
 
-        logger.info(
-            "Starting analysis",
-            model=self.model,
-            text_length=len(text),
-            max_chunk_chars=self.max_chars_per_chunk,
-        )
-
         # Split into chunks for map phase
-        chunks = split_into_chunks(text, self.max_chars_per_chunk)
+        if self.max_chars_per_chunk is not None:
+            logger.info(
+                "Starting analysis",
+                model=self.model,
+                text_length=len(text),
+                max_chunk_chars=self.max_chars_per_chunk,
+            )
+            chunks = split_into_chunks(text, self.max_chars_per_chunk)
+        else:
+            budget = self.max_tokens_per_chunk or self._chunk_token_budget(
+                system_prompt, map_instructions
+            )
+            logger.info(
+                "Starting analysis",
+                model=self.model,
+                text_length=len(text),
+                max_chunk_tokens=budget,
+            )
+            chunks = split_text_by_tokens(text, budget, self.model)
         logger.info("Split transcript into chunks", chunk_count=len(chunks))
 
-        # Map phase: process chunks in parallel using threads.
-        # Uses ThreadPoolExecutor instead of asyncio to avoid "Event loop is closed"
-        # errors from httpx client cleanup when called repeatedly (e.g., backfill).
+        # Map phase: process chunks concurrently on the shared LLM event loop
+        # (a long-lived loop, so async clients survive repeated calls, e.g. backfill)
         self._report_progress(f"Processing {len(chunks)} chunks")
 
-        def process_chunk(i: int, chunk: str) -> str:
-            prompt = f"{map_instructions}\n\nChunk {i+1}/{len(chunks)}:\n\n{chunk}"
+        cached_chunks: List[int] = []
+
+        async def process_chunk(i: int, chunk: str) -> str:
+            key = map_cache_key(chunk, map_instructions, self.model, self.temperature)
+            if self.map_cache is not None:
+                cached = self.map_cache.get(key)
+                if cached is not None:
+                    cached_chunks.append(i)
+                    return cached
+            # Map instructions are identical for every chunk: send them as a cacheable prefix
+            prompt = f"Chunk {i+1}/{len(chunks)}:\n\n{chunk}"
             self._report_progress(f"Processing chunk {i+1}/{len(chunks)}")
-            return self._chat_once(system_prompt, prompt)
+            notes = await self._chat_once_async(system_prompt, prompt, prefix=map_instructions)
+            if self.map_cache is not None:
+                self.map_cache.put(key, notes)
+            return notes
 
+        started = time.monotonic()
         try:
-            map_notes = [None] * len(chunks)
-            with ThreadPoolExecutor(max_workers=3) as executor:
-                futures = {
-                    executor.submit(process_chunk, i, chunk): i for i, chunk in enumerate(chunks)
-                }
-                for future in as_completed(futures):
-                    idx = futures[future]
-                    map_notes[idx] = future.result()
+            map_notes: List[str] = run_coroutine(
+                self._gather_limited([process_chunk(i, c) for i, c in enumerate(chunks)])
+            )
         except Exception as e:
             raise AnalyzeError(f"Map phase failed: {e}") from e
+        finally:
+            # Keep the chunks that did finish, even if another one failed
+            if self.map_cache is not None:
+                self.map_cache.save()
 
-        logger.info("Map phase completed", notes_count=len(map_notes))
+        logger.info(
+            "Map phase completed",
+            notes_count=len(map_notes),
+            cached_chunks=len(cached_chunks),
+            seconds=round(time.monotonic() - started, 1),
+            rate_limit_waits=self.rate_limiter.waits,
+            cached_prompt_tokens=self.cached_prompt_tokens,
+        )
 
         # Reduce phase: synthesize results
-        self._report_progress("Synthesizing results")
-
-        reduce_prompt = f"{reduce_instructions}\n\nChunk notes:\n\n" + "\n\n---\n\n".join(map_notes)
+        reduce_header = f"{reduce_instructions}\n\nChunk notes:\n\n"
+        reduce_extras = ""
         if want_json and json_schema:
-            reduce_prompt += f"\n\n{json_schema}"
+            reduce_extras += f"\n\n{json_schema}"
 
         # Inject user's follow-up question into the reduce prompt
         if question:
-            reduce_prompt += (
+            reduce_extras += (
                 "\n\n---\n\nAdditional Analysis Requested:\n"
                 "Please also include a section at the END of your markdown output "
                 "under the heading '## Additional Analysis' that addresses the "
@@ -285,7 +570,7 @@ class AnalyzeEngine:
                 else:
                     moment_lines.append(f"- [{m['time']}]")
 
-            reduce_prompt += (
+            reduce_extras += (
                 "\n\n---\n\nFlagged Moments:\n"
                 "The listener flagged these timestamps as personally significant "
                 "while listening. For each one:\n"
@@ -304,7 +589,7 @@ class AnalyzeEngine:
         # Inject listener questions (multi-question support)
         if questions:
             q_lines = "\n".join(f"- {q}" for q in questions)
-            reduce_prompt += (
+            reduce_extras += (
                 "\n\n---\n\nListener Questions:\n"
                 "Answer each of these questions using the transcript as evidence. "
                 "Be specific, cite speakers and timestamps when relevant.\n\n"
@@ -313,6 +598,12 @@ class AnalyzeEngine:
                 "for each question."
             )
 
+        # Very long episodes: consolidate notes until they fit one reduce prompt
+        map_notes = self._tree_reduce(map_notes, system_prompt, reduce_header + reduce_extras)
+
+        self._report_progress("Synthesizing results")
+        reduce_prompt = reduce_header + NOTES_DELIMITER.join(map_notes) + reduce_extras
+
         try:
             final = self._chat_once(system_prompt, reduce_prompt)
         except Exception as e:
@@ -353,7 +644,7 @@ def analyze_transcript(
     reduce_instructions: str,
     model: str = "gpt-4.1",
     temperature: float = 0.2,
-    max_chars_per_chunk: int = 24000,
+    max_chars_per_chunk: Optional[int] = None,
     want_json: bool = False,
     json_schema: Optional[str] = None,
     api_key: Optional[str] = None,
@@ -368,7 +659,7 @@ def analyze_transcript(
         reduce_instructions: Reduce phase instructions
         model: OpenAI model name
         temperature: Model temperature
-        max_chars_per_chunk: Max characters per chunk
+        max_chars_per_chunk: Split by characters instead of the model's token budget
         want_json: Request JSON output
         json_schema: Optional JSON schema hint
         api_key: OpenAI API key (optional)
@@ -73,7 +73,9 @@ def ask_transcript(
 
     context_header = "\n".join(context_parts) + "\n\n" if context_parts else ""
 
-    user_prompt = f"{context_header}" f"TRANSCRIPT:\n{transcript_text}\n\n" f"QUESTION: {question}"
+    # The transcript is the shared prefix for every question about this episode,
+    # so it goes ahead of the question in its own cacheable message
+    transcript_prompt = f"{context_header}TRANSCRIPT:\n{transcript_text}"
 
     # Parse model string
     provider_name = "openai"
@@ -83,8 +85,9 @@ def ask_transcript(
 
     provider = get_provider(provider_name)
     messages = [
-        LLMMessage.system(SYSTEM_PROMPT),
-        LLMMessage.user(user_prompt),
+        LLMMessage.system(SYSTEM_PROMPT, cache=True),
+        LLMMessage.user(transcript_prompt, cache=True),
+        LLMMessage.user(f"QUESTION: {question}"),
     ]
 
     response = provider.complete(messages=messages, model=model_name, temperature=0.3)
@@ -18,7 +18,12 @@ from typing import Any, Callable, Dict, List, Optional, Tuple
 from ..core.analyze import AnalyzeEngine
 from ..core.classify import classify_episode
 from ..core.notion import md_to_blocks
-from ..core.speakers import apply_speaker_map_to_transcript, has_generic_speakers, load_speaker_map
+from ..core.speakers import (
+    apply_speaker_map_to_transcript,
+    has_generic_speakers,
+    identify_speaker_map,
+    load_speaker_map,
+)
 from ..logging import get_logger
 from ..templates.manager import DeepcastTemplate, TemplateManager
 
@@ -468,7 +473,7 @@ def run_analysis(
         model=model_name,
         provider_name=provider_name,
         temperature=0.2,
-        max_chars_per_chunk=24000,
+        map_cache_dir=episode_dir,
     )
 
     md, json_data = engine.analyze(
@@ -579,7 +584,9 @@ def backfill_episode(
 
     # 2. Apply speaker map if needed
     if has_generic_speakers(episode_dir):
-        speaker_map = load_speaker_map(episode_dir)
+        speaker_map = load_speaker_map(episode_dir) or identify_speaker_map(
+            episode_dir, transcript["segments"], require_all=False
+        )
         if speaker_map:
             apply_speaker_map_to_transcript(episode_dir, speaker_map)
             # Reload transcript with applied names
@@ -0,0 +1,196 @@
+"""Streaming transcript checkpoints (JSONL).
+
+Transcription appends each decoded segment to a ``*.partial.jsonl`` file as
+soon as it is produced, so an interrupted run keeps everything decoded so far
+and can resume from the last segment. Other processes (e.g. the server SSE
+stream) can follow the file while it grows.
+
+File format, one JSON object per line:
+
+    {"type": "header", "audio_path": ..., "asr_model": ..., "asr_provider": ...}
+    {"type": "segment", "start": 0.0, "end": 4.2, "text": "..."}
+    ...
+    {"type": "complete", "language": "en", "segments_count": 123}
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, BinaryIO, Dict, List, Optional
+
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+PARTIAL_SUFFIX = ".partial.jsonl"
+
+
+def partial_transcript_path(transcript_path: Path) -> Path:
+    """Get the checkpoint path for a transcript file.
+
+    ``transcript.json`` -> ``transcript.partial.jsonl``
+    """
+    return transcript_path.with_suffix(PARTIAL_SUFFIX)
+
+
+@dataclass
+class PartialTranscript:
+    """Contents of a checkpoint file."""
+
+    header: Dict[str, Any]
+    segments: List[Dict[str, Any]] = field(default_factory=list)
+    complete: Optional[Dict[str, Any]] = None
+    valid_bytes: int = 0  # Length of the file up to the last intact line
+
+    @property
+    def resume_offset(self) -> float:
+        """Audio position (seconds) where transcription should resume."""
+        return float(self.segments[-1]["end"]) if self.segments else 0.0
+
+    def matches(self, audio_path: str, asr_model: str) -> bool:
+        """Check the checkpoint was written for the same audio and model."""
+        return (
+            self.header.get("audio_path") == audio_path
+            and self.header.get("asr_model") == asr_model
+        )
+
+
+def read_partial_transcript(path: Path) -> Optional[PartialTranscript]:
+    """Read a checkpoint file, tolerating a torn final line.
+
+    Args:
+        path: Checkpoint file path
+
+    Returns:
+        PartialTranscript, or None if the file is missing or has no header
+    """
+    if not path.exists():
+        return None
+
+    partial: Optional[PartialTranscript] = None
+    offset = 0
+    with open(path, "rb") as f:
+        for raw in f:
+            if not raw.endswith(b"\n"):
+                break  # Crash mid-write
+            try:
+                record = json.loads(raw)
+            except json.JSONDecodeError:
+                break
+            offset += len(raw)
+
+            kind = record.pop("type", None)
+            if kind == "header":
+                partial = PartialTranscript(header=record)
+            elif partial is None:
+                return None
+            elif kind == "segment":
+                partial.segments.append(record)
+            elif kind == "complete":
+                partial.complete = record
+            partial.valid_bytes = offset
+
+    return partial
+
+
+class PartialTranscriptWriter:
+    """Append-only checkpoint writer.
+
+    Every record is flushed immediately so readers (and a resumed run) see
+    each segment as soon as it is decoded.
+    """
+
+    def __init__(self, path: Path, header: Optional[Dict[str, Any]] = None, truncate_to: int = 0):
+        """Open a checkpoint for writing.
+
+        Args:
+            path: Checkpoint file path
+            header: Header for a new file; None to append to an existing checkpoint
+            truncate_to: When appending, drop anything after this byte offset
+                (e.g. a torn final line)
+        """
+        self.path = path
+        self._file: BinaryIO
+        if header is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(path, "wb")
+            self._write({"type": "header", **header})
+        else:
+            self._file = open(path, "r+b")
+            self._file.truncate(truncate_to)
+            self._file.seek(truncate_to)
+
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._file.write((json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8"))
+        self._file.flush()
+
+    def write_segment(self, segment: Dict[str, Any]) -> None:
+        """Append one decoded segment."""
+        self._write({"type": "segment", **segment})
+
+    def write_complete(self, **info: Any) -> None:
+        """Mark the transcript as finished."""
+        self._write({"type": "complete", **info})
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "PartialTranscriptWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+async def follow_partial_transcript(
+    path: Path,
+    poll_interval: float = 0.5,
+    idle_timeout: float = 300.0,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield checkpoint records as they are appended.
+
+    Waits for the file to appear, then tails it. Stops after the ``complete``
+    record or when nothing new has arrived for ``idle_timeout`` seconds.
+
+    Args:
+        path: Checkpoint file path
+        poll_interval: Seconds between polls
+        idle_timeout: Give up after this many seconds without new data
+
+    Yields:
+        Records including their ``type`` key
+    """
+    idle = 0.0
+    while not path.exists():
+        if idle >= idle_timeout:
+            return
+        await asyncio.sleep(poll_interval)
+        idle += poll_interval
+
+    buffer = b""
+    with open(path, "rb") as f:
+        idle = 0.0
+        while True:
+            chunk = f.read()
+            if chunk:
+                idle = 0.0
+                buffer += chunk
+                *lines, buffer = buffer.split(b"\n")
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        logger.debug("Skipping malformed checkpoint line", path=str(path))
+                        continue
+                    kind = record.get("type")
+                    yield record
+                    if kind == "complete":
+                        return
+            else:
+                if idle >= idle_timeout:
+                    return
+                await asyncio.sleep(poll_interval)
+                idle += poll_interval
@@ -25,6 +25,8 @@ class LocalDiarizationProvider(DiarizationProvider):
     - Memory-aware chunking for long audio
     - Speaker re-identification across chunks
     - GPU acceleration on CUDA/MPS devices
+    - Alignment model and diarization pipeline kept in the process-wide
+      model pool, so repeated calls skip model warm-up
     """
 
     @property
@@ -6,20 +6,11 @@ with optional fallback to local processing on failure.
 
 from __future__ import annotations
 
-import time
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import httpx
-
 from ...cloud import CloudConfig, CloudError
-from ...cloud.exceptions import (
-    CloudAuthError,
-    CloudTimeoutError,
-    EndpointNotFoundError,
-    JobFailedError,
-    UploadError,
-)
+from ...cloud.runpod_client import RunPodClient, diarization_payload
 from ...cloud.storage import CloudStorage
 from ...logging import get_logger
 from .base import (
@@ -44,8 +35,13 @@ class RunPodDiarizationProvider(DiarizationProvider):
 
     The cloud endpoint is expected to:
     1. Receive audio URL (presigned R2 URL) and transcript segments
-    2. Run pyannote diarization
-    3. Return speaker-labeled segments
+    2. Denoise the audio when asked (``denoise`` input)
+    3. Run pyannote diarization
+    4. Return speaker-labeled segments
+
+    The original audio is uploaded, so transcription and diarization of an
+    episode share one content-addressed R2 object. Pass ``denoise=False``
+    (``extra_options``) to skip the worker-side filter.
 
     Features:
     - Cloud-accelerated pyannote diarization
@@ -89,8 +85,8 @@ class RunPodDiarizationProvider(DiarizationProvider):
         # Validate configuration for diarization (raises CloudError if missing)
         self.cloud_config.validate_for_diarization()
 
-        # Create HTTP client
-        self._client: Optional[httpx.Client] = None
+        # RunPod API client (diarization endpoint)
+        self._client: Optional[RunPodClient] = None
 
         # R2 storage for audio upload
         self._storage: Optional[CloudStorage] = None
@@ -104,13 +100,10 @@ class RunPodDiarizationProvider(DiarizationProvider):
         return "runpod"
 
     @property
-    def client(self) -> httpx.Client:
-        """Get or create HTTP client."""
+    def client(self) -> RunPodClient:
+        """Get or create RunPod client for the diarization endpoint."""
         if self._client is None:
-            self._client = httpx.Client(
-                timeout=httpx.Timeout(60.0, read=300.0),
-                headers=self.cloud_config.headers,
-            )
+            self._client = RunPodClient(self.cloud_config, task="diarization")
         return self._client
 
     @property
@@ -191,10 +184,12 @@ class RunPodDiarizationProvider(DiarizationProvider):
 
             # Step 3: Wait for completion
             self._report_progress("Diarizing on cloud GPU...")
-            result = self._wait_for_completion(job_id)
+            result = self.client.wait_for_completion(
+                job_id, progress_callback=self._report_progress
+            )
         finally:
-            # Step 4: Clean up R2 object
-            self.storage.delete(r2_key)
+            # Step 4: Release R2 object (kept for reuse until retention expires)
+            self.storage.release(r2_key)
 
         # Convert result to DiarizationResult
         return self._convert_result(result, audio_path)
@@ -223,138 +218,20 @@ class RunPodDiarizationProvider(DiarizationProvider):
             segments_count=len(transcript_segments),
         )
 
-        # Build request payload
-        payload = {
-            "input": {
-                "audio_url": audio_url,
-                "transcript_segments": transcript_segments,
-                "num_speakers": self.config.num_speakers,
-                "min_speakers": self.config.min_speakers,
-                "max_speakers": self.config.max_speakers,
-                "language": self.config.language,
-            }
-        }
-
-        # Submit job
-        try:
-            response = self.client.post(
-                f"{self.cloud_config.diarize_base_url}/run",
-                json=payload,
+        job_id = self.client.submit(
+            diarization_payload(
+                audio_url,
+                transcript_segments,
+                num_speakers=self.config.num_speakers,
+                min_speakers=self.config.min_speakers,
+                max_speakers=self.config.max_speakers,
+                language=self.config.language,
+                denoise=self.config.extra_options.get("denoise", True),
             )
-        except httpx.RequestError as e:
-            raise UploadError(f"Network error: {e}", cause=e)
-
-        # Handle response
-        if response.status_code == 401:
-            raise CloudAuthError("Invalid RunPod API key")
-        if response.status_code == 404:
-            raise EndpointNotFoundError(self.cloud_config.diarize_endpoint_id or "unknown")
-        if response.status_code >= 400:
-            raise UploadError(f"API error {response.status_code}: {response.text}")
-
-        data = response.json()
-        job_id = data.get("id")
-        if not job_id:
-            raise UploadError(f"No job ID in response: {data}")
-
+        )
         logger.info("Diarization job submitted", job_id=job_id)
         return job_id
 
-    def _get_status(self, job_id: str) -> Dict[str, Any]:
-        """Get job status.
-
-        Args:
-            job_id: Job ID from submit_job
-
-        Returns:
-            Status dict with 'status' and optionally 'output' or 'error'
-        """
-        try:
-            response = self.client.get(f"{self.cloud_config.diarize_base_url}/status/{job_id}")
-        except httpx.RequestError as e:
-            logger.warning("Status check failed", job_id=job_id, error=str(e))
-            return {"status": "UNKNOWN", "error": str(e)}
-
-        if response.status_code == 401:
-            raise CloudAuthError("Invalid RunPod API key")
-        if response.status_code == 404:
-            raise EndpointNotFoundError(self.cloud_config.diarize_endpoint_id or "unknown")
-
-        return response.json()
-
-    def _wait_for_completion(
-        self,
-        job_id: str,
-    ) -> Dict[str, Any]:
-        """Poll until job completes or times out.
-
-        Args:
-            job_id: Job ID from submit_job
-
-        Returns:
-            Diarization result from the job output
-
-        Raises:
-            CloudTimeoutError: If job exceeds timeout
-            JobFailedError: If job fails on the server
-        """
-        start_time = time.time()
-        last_status = ""
-
-        while True:
-            elapsed = time.time() - start_time
-            if elapsed > self.cloud_config.timeout_seconds:
-                raise CloudTimeoutError(job_id, self.cloud_config.timeout_seconds)
-
-            status_data = self._get_status(job_id)
-            status = status_data.get("status", "UNKNOWN")
-
-            # Log on status change
-            if status != last_status:
-                last_status = status
-                logger.debug(
-                    "Job status update",
-                    job_id=job_id,
-                    status=status,
-                    elapsed=round(elapsed, 1),
-                )
-
-            # Report progress on every poll so the UI stays fresh
-            message = self._format_status_message(status, elapsed)
-            self._report_progress(message)
-
-            # Check terminal states
-            if status == self.STATUS_COMPLETED:
-                output = status_data.get("output", {})
-                logger.info(
-                    "Diarization job completed",
-                    job_id=job_id,
-                    elapsed=round(elapsed, 1),
-                )
-                return output
-
-            if status == self.STATUS_FAILED:
-                error = status_data.get("error", "Unknown error")
-                raise JobFailedError(job_id, error)
-
-            # Wait before next poll
-            time.sleep(self.cloud_config.poll_interval_seconds)
-
-    def _format_status_message(self, status: str, elapsed: float) -> str:
-        """Format a human-readable status message."""
-        elapsed_str = f"{int(elapsed)}s"
-
-        if status == self.STATUS_QUEUED:
-            return f"Waiting for GPU worker... ({elapsed_str})"
-        if status == self.STATUS_IN_PROGRESS:
-            return f"Diarizing on cloud GPU... ({elapsed_str})"
-        if status == self.STATUS_COMPLETED:
-            return f"Diarization complete ({elapsed_str})"
-        if status == self.STATUS_FAILED:
-            return "Diarization failed"
-
-        return f"Status: {status} ({elapsed_str})"
-
     def _convert_result(
         self,
         cloud_result: Dict[str, Any],
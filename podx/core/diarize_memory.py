@@ -0,0 +1,242 @@
+"""Self-calibrating memory model for local diarization.
+
+The chunk sizing in :mod:`podx.core.diarize` predicts peak memory as
+``base_gb + minutes * per_minute_gb``. The built-in coefficients are rough;
+this module samples how far RSS grows above its starting point during each
+diarization run, fits the coefficients per device and keeps them in a local
+profile so later runs chunk only when they have to.
+
+Growth rather than absolute RSS is recorded because chunk sizing compares
+the model against *available* memory, which already excludes whatever the
+process (pooled models, decoded audio) holds before the run starts.
+
+Profile file (``~/.podx/cache/diarization-memory.json``)::
+
+    {"version": 2, "devices": {"cpu": {"samples": [[minutes, peak_gb], ...]}}}
+
+Files from older versions recorded absolute RSS and are discarded.
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import psutil
+
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_PROFILE_PATH = Path.home() / ".podx" / "cache" / "diarization-memory.json"
+MAX_SAMPLES_PER_DEVICE = 20  # Oldest samples are dropped first
+MIN_PER_MINUTE_GB = 0.01  # Floor so chunk sizing never divides by ~0
+SAMPLE_INTERVAL_SECONDS = 0.25
+PROFILE_VERSION = 2  # Bumped when the meaning of recorded samples changes
+
+
+@dataclass(frozen=True)
+class MemoryModel:
+    """Peak-memory model for one diarization pipeline run.
+
+    Linear (``base_gb + minutes * per_minute_gb``) up to ``fitted_minutes``,
+    the longest duration it was fitted on. Beyond that, growth continues at
+    ``tail_per_minute_gb`` when that is steeper, since clustering is O(n²)
+    and a line fitted to short runs under-estimates long ones.
+    """
+
+    base_gb: float
+    per_minute_gb: float
+    samples: int = 0
+    fitted_minutes: float = 0.0
+    tail_per_minute_gb: float = 0.0
+
+    def estimate(self, duration_minutes: float) -> float:
+        """Estimated peak GB for diarizing ``duration_minutes`` of audio."""
+        linear = self.base_gb + duration_minutes * self.per_minute_gb
+        extra = duration_minutes - self.fitted_minutes
+        if self.fitted_minutes <= 0 or extra <= 0:
+            return linear
+        return linear + extra * max(0.0, self.tail_per_minute_gb - self.per_minute_gb)
+
+    def minutes_within(self, budget_gb: float) -> float:
+        """Longest duration whose estimated peak fits in ``budget_gb``."""
+        minutes = (budget_gb - self.base_gb) / self.per_minute_gb
+        tail = max(self.tail_per_minute_gb, self.per_minute_gb)
+        if self.fitted_minutes <= 0 or minutes <= self.fitted_minutes:
+            return minutes
+        return self.fitted_minutes + (budget_gb - self.estimate(self.fitted_minutes)) / tail
+
+
+def fit_memory_model(samples: Sequence[Tuple[float, float]], default: MemoryModel) -> MemoryModel:
+    """Fit a memory model to (minutes, peak_gb) samples.
+
+    With two or more distinct durations the slope is a least-squares fit;
+    with one, the default slope is kept. The base is then set to the upper
+    envelope of the samples, so no observed run would have been
+    under-estimated. Past the longest sample the model never grows slower
+    than ``default``.
+
+    Args:
+        samples: Observed (audio minutes, peak GB) pairs
+        default: Model to fall back on (and take the slope from) when data is thin
+
+    Returns:
+        Fitted model (``default`` if there are no usable samples)
+    """
+    usable = [(m, p) for m, p in samples if m > 0 and p > 0]
+    if not usable:
+        return default
+
+    minutes = [m for m, _ in usable]
+    if len(set(minutes)) >= 2:
+        mean_m = sum(minutes) / len(usable)
+        mean_p = sum(p for _, p in usable) / len(usable)
+        var = sum((m - mean_m) ** 2 for m in minutes)
+        cov = sum((m - mean_m) * (p - mean_p) for m, p in usable)
+        per_minute = max(cov / var, MIN_PER_MINUTE_GB)
+    else:
+        per_minute = default.per_minute_gb
+
+    base = max(0.0, max(p - per_minute * m for m, p in usable))
+    return MemoryModel(
+        base_gb=base,
+        per_minute_gb=per_minute,
+        samples=len(usable),
+        fitted_minutes=max(minutes),
+        tail_per_minute_gb=default.per_minute_gb,
+    )
+
+
+class MemoryProfile:
+    """JSON-backed per-device memory samples and fitted models.
+
+    Writes are atomic (temp file + rename); concurrent podx processes may
+    drop each other's latest sample, which only delays calibration.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """Initialize the profile.
+
+        Args:
+            path: Profile file (defaults to ~/.podx/cache/diarization-memory.json)
+        """
+        self.path = path or DEFAULT_PROFILE_PATH
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            data = {}
+        if not isinstance(data, dict) or data.get("version") != PROFILE_VERSION:
+            data = {"version": PROFILE_VERSION}
+        data.setdefault("devices", {})
+        return data
+
+    def _save(self, data: Dict[str, Any]) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            tmp.replace(self.path)
+        except OSError as e:
+            logger.warning("Failed to save memory profile", path=str(self.path), error=str(e))
+
+    def samples(self, device: str) -> List[Tuple[float, float]]:
+        """Recorded (minutes, peak_gb) samples for a device."""
+        with self._lock:
+            entry = self._load()["devices"].get(device, {})
+        return [(float(m), float(p)) for m, p in entry.get("samples", [])]
+
+    def model(self, device: str, default: MemoryModel) -> MemoryModel:
+        """Fitted model for a device, or ``default`` if it has no samples."""
+        return fit_memory_model(self.samples(device), default)
+
+    def record(
+        self, device: str, duration_minutes: float, peak_gb: float, default: MemoryModel
+    ) -> MemoryModel:
+        """Add a sample for a device and return the refitted model."""
+        with self._lock:
+            data = self._load()
+            entry = data["devices"].setdefault(device, {})
+            samples = entry.get("samples", []) + [[round(duration_minutes, 2), round(peak_gb, 3)]]
+            entry["samples"] = samples[-MAX_SAMPLES_PER_DEVICE:]
+            self._save(data)
+
+        model = fit_memory_model([(m, p) for m, p in entry["samples"]], default)
+        logger.info(
+            "Updated diarization memory model",
+            device=device,
+            duration_minutes=round(duration_minutes, 1),
+            peak_gb=round(peak_gb, 2),
+            base_gb=round(model.base_gb, 2),
+            per_minute_gb=round(model.per_minute_gb, 4),
+            samples=model.samples,
+        )
+        return model
+
+    def reset(self, device: str) -> None:
+        """Forget all samples for a device."""
+        with self._lock:
+            data = self._load()
+            if data["devices"].pop(device, None) is not None:
+                self._save(data)
+
+
+def _tree_rss_bytes(process: psutil.Process) -> int:
+    """RSS of a process plus its children (parallel chunk workers)."""
+    total = process.memory_info().rss
+    for child in process.children(recursive=True):
+        try:
+            total += child.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    return total
+
+
+class PeakMemorySampler:
+    """Context manager that tracks peak RSS of this process and its children.
+
+    Sampling runs on a daemon thread; ``peak_gb`` and ``growth_gb`` are valid
+    after exit.
+    """
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL_SECONDS):
+        self.interval = interval
+        self.baseline_bytes = 0
+        self.peak_bytes = 0
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def peak_gb(self) -> float:
+        return self.peak_bytes / (1024**3)
+
+    @property
+    def growth_gb(self) -> float:
+        """Peak RSS above the RSS at entry."""
+        return max(0, self.peak_bytes - self.baseline_bytes) / (1024**3)
+
+    def _sample(self) -> None:
+        self.peak_bytes = max(self.peak_bytes, _tree_rss_bytes(self._process))
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> "PeakMemorySampler":
+        self.baseline_bytes = _tree_rss_bytes(self._process)
+        self.peak_bytes = self.baseline_bytes
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._sample()
@@ -28,6 +28,7 @@ TIER1_PATTERNS = [
     "deepcast-*.json",
     "deepcast-*.md",
     "episode-classification.json",
+    "map-notes.json",
     "transcript.md",
     "transcript.txt",
     "*.srt",
@@ -3,15 +3,31 @@
 No UI dependencies, no CLI concerns. Just transcript text processing.
 """
 
+import asyncio
 import re
 from typing import Any, Dict, List, Optional
 
-from ..llm import LLMMessage, LLMProvider, get_provider
+from ..config import get_config
+from ..llm import CachedLLMProvider, LLMMessage, LLMProvider, get_provider
+from ..llm.loop import run_coroutine
+from ..llm.tokens import count_tokens, pack_by_tokens, token_budget
 from ..logging import get_logger
 from ..progress import ProgressReporter, SilentProgressReporter
+from .ad_filter import AdScorer
 
 logger = get_logger(__name__)
 
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4  # LLM batches in flight per preprocess step
+AD_SEGMENT_CHARS = 500  # Segment text sent for ad classification
+AD_OUTPUT_TOKENS_PER_SEGMENT = 3  # "CONTENT" plus newline
+# Past a few dozen lines the per-line AD/CONTENT labels start to drift out of
+# step with the input, so classification batches stay small even when the
+# context window could hold hundreds of segments
+DEFAULT_AD_BATCH_SIZE = 40
+# Restore has the same drift, and a batch whose segment count comes back wrong
+# falls back to the original text for every segment in it
+DEFAULT_RESTORE_BATCH_SIZE = 20
+
 
 class PreprocessError(Exception):
     """Raised when preprocessing fails."""
@@ -34,11 +50,14 @@ class TranscriptPreprocessor:
         max_gap: float = 1.0,
         max_len: int = 800,
         restore_model: str = "gpt-4o-mini",
-        ad_batch_size: int = 30,
-        restore_batch_size: int = 20,
+        ad_batch_size: Optional[int] = DEFAULT_AD_BATCH_SIZE,
+        restore_batch_size: Optional[int] = DEFAULT_RESTORE_BATCH_SIZE,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
         llm_provider: Optional[LLMProvider] = None,
         provider_name: str = "openai",
         progress: Optional[ProgressReporter] = None,
+        cache_responses: Optional[bool] = None,
+        ad_prefilter: Optional[bool] = None,
     ):
         """Initialize transcript preprocessor.
 
@@ -50,11 +69,20 @@ class TranscriptPreprocessor:
             max_gap: Maximum gap (seconds) between segments to merge
             max_len: Maximum merged text length (characters)
             restore_model: Model for LLM operations (restore and ad classification)
-            ad_batch_size: Segments per LLM request for ad classification
-            restore_batch_size: Segments per LLM request for restore
+            ad_batch_size: Cap on segments per ad classification request
+                (default: 40; None packs as many as fit the model's token budget)
+            restore_batch_size: Cap on segments per restore request
+                (default: 20; None packs as many as fit the model's token budget)
+            max_concurrent_requests: LLM batch requests in flight at once
             llm_provider: Optional pre-configured LLM provider instance
             provider_name: Provider to use if llm_provider not provided (default: openai)
             progress: Optional progress reporter for status updates
+            cache_responses: Answer repeated LLM batches from the on-disk response
+                cache (default: PODX_LLM_CACHE, enabled)
+            ad_prefilter: Label obvious segments with the local ad scorer and send
+                only the windows around likely ads to the LLM (default:
+                PODX_AD_PREFILTER, disabled until its recall is measured
+                against classifying every segment)
         """
         self.merge = merge
         self.normalize = normalize
@@ -65,6 +93,7 @@ class TranscriptPreprocessor:
         self.restore_model = restore_model
         self.ad_batch_size = ad_batch_size
         self.restore_batch_size = restore_batch_size
+        self.max_concurrent_requests = max_concurrent_requests
         self.progress = progress or SilentProgressReporter()
 
         # Use provided provider or create one
@@ -78,6 +107,16 @@ class TranscriptPreprocessor:
             except Exception as e:
                 raise PreprocessError(f"Failed to initialize LLM provider: {e}") from e
 
+        if cache_responses is None:
+            cache_responses = get_config().llm_cache_enabled
+        if self.llm_provider and cache_responses:
+            # Re-runs after a crash or for backfill re-send identical batches
+            self.llm_provider = CachedLLMProvider(self.llm_provider)
+
+        if ad_prefilter is None:
+            ad_prefilter = get_config().ad_prefilter_enabled
+        self.ad_scorer: Optional[AdScorer] = AdScorer() if skip_ads and ad_prefilter else None
+
     def merge_segments(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Merge adjacent segments based on timing gaps, length, and speaker.
 
@@ -154,11 +193,76 @@ class TranscriptPreprocessor:
             s["text"] = self.normalize_text(s.get("text", ""))
         return segments
 
-    def classify_ad_segments(self, segments: List[Dict[str, Any]]) -> List[bool]:
-        """Classify segments as advertisement or content using LLM.
+    def _request_slots(self) -> asyncio.Semaphore:
+        return asyncio.Semaphore(max(1, self.max_concurrent_requests))
+
+    async def _complete_batches(
+        self,
+        system_prompt: str,
+        user_prompts: List[str],
+        label: str,
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> List[str]:
+        """Send one LLM request per prompt, at most max_concurrent_requests at a time.
+
+        Args:
+            system_prompt: System prompt shared by every request
+            user_prompts: One user prompt per batch
+            label: Progress message prefix (e.g. "Restoring batch")
+            semaphore: Request slots shared with other steps running at the
+                same time (default: a fresh max_concurrent_requests semaphore)
+
+        Returns:
+            Response texts in the same order as user_prompts
+
+        Raises:
+            Exception: The first request failure (remaining requests are cancelled)
+        """
+        assert self.llm_provider is not None
+        provider = self.llm_provider
+        if semaphore is None:
+            semaphore = self._request_slots()
+        total = len(user_prompts)
+        done = 0
+
+        async def send(batch_num: int, user_prompt: str) -> str:
+            nonlocal done
+            messages = [LLMMessage.system(system_prompt, cache=True), LLMMessage.user(user_prompt)]
+            async with semaphore:
+                try:
+                    response = await provider.complete_async(
+                        messages=messages, model=self.restore_model
+                    )
+                except Exception as e:
+                    logger.error(f"LLM API request failed for {label.lower()} {batch_num}: {e}")
+                    raise
+            done += 1
+            self.progress.update_step(f"{label} {done}/{total}", step=done, progress=done / total)
+            return response.content
+
+        tasks = [
+            asyncio.ensure_future(send(i + 1, prompt)) for i, prompt in enumerate(user_prompts)
+        ]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def classify_ad_segments_async(
+        self, segments: List[Dict[str, Any]], semaphore: Optional[asyncio.Semaphore] = None
+    ) -> List[bool]:
+        """Classify segments as advertisement or content with concurrent LLM batches.
+
+        With the ad pre-filter enabled, segments the local scorer is sure about
+        are labelled without the LLM, and the LLM's answers for the rest train
+        the scorer. Escalated windows keep widening around every segment the
+        LLM confirms as an ad, one round per widening, until it answers content.
 
         Args:
             segments: List of transcript segments
+            semaphore: Request slots shared with concurrently running steps
 
         Returns:
             List of booleans - True if segment is an ad, False if content
@@ -169,6 +273,38 @@ class TranscriptPreprocessor:
         if not self.llm_provider:
             raise PreprocessError("LLM provider not configured. Enable skip_ads in constructor.")
 
+        if self.ad_scorer is None:
+            return await self._classify_ads_with_llm(segments, semaphore)
+
+        labels = self.ad_scorer.prefilter(segments)
+        pending = [i for i, label in enumerate(labels) if label is None]
+        asked = {i for i, label in enumerate(labels) if label}
+        logger.debug(
+            "Ad pre-filter",
+            segments=len(segments),
+            local_ads=len(asked),
+            escalated=len(pending),
+        )
+        rounds = 0
+        while pending:
+            escalated = [segments[i] for i in pending]
+            results = await self._classify_ads_with_llm(escalated, semaphore)
+            for i, is_ad in zip(pending, results):
+                labels[i] = is_ad
+            self.ad_scorer.learn([s.get("text", "") for s in escalated], results)
+            asked.update(pending)
+            rounds += 1
+            confirmed = [i for i, is_ad in zip(pending, results) if is_ad]
+            pending = self.ad_scorer.widen(confirmed, len(segments), asked)
+        if rounds:
+            self.ad_scorer.save()
+            logger.debug("Ad classification escalated", segments=len(asked), rounds=rounds)
+        return [bool(label) for label in labels]
+
+    async def _classify_ads_with_llm(
+        self, segments: List[Dict[str, Any]], semaphore: Optional[asyncio.Semaphore] = None
+    ) -> List[bool]:
+        assert self.llm_provider is not None
         system_prompt = (
             "You are classifying podcast transcript segments as ADVERTISEMENT or CONTENT.\n\n"
             "ADVERTISEMENT includes:\n"
@@ -186,48 +322,42 @@ class TranscriptPreprocessor:
             "Output one classification per line, in the same order as the input segments."
         )
 
-        is_ad: List[bool] = []
-        total_batches = (len(segments) + self.ad_batch_size - 1) // self.ad_batch_size
-
-        for i in range(0, len(segments), self.ad_batch_size):
-            batch_num = i // self.ad_batch_size + 1
-            batch = segments[i : i + self.ad_batch_size]
-
-            # Report progress
-            self.progress.update_step(
-                f"Classifying ads batch {batch_num}/{total_batches}",
-                step=batch_num,
-                progress=batch_num / total_batches,
-            )
-
-            # Format segments for classification
-            delimiter = "\n---SEGMENT---\n"
-            batch_text = delimiter.join([s.get("text", "")[:500] for s in batch])
-            user_prompt = (
-                f"Classify these {len(batch)} transcript segments.\n"
-                f"Segments are separated by '---SEGMENT---'.\n\n"
-                f"{batch_text}"
+        # Format segments for classification
+        delimiter = "\n---SEGMENT---\n"
+        header = (
+            "Classify these {n} transcript segments.\n"
+            "Segments are separated by '---SEGMENT---'.\n\n"
+        )
+        model = self.restore_model
+        budget = token_budget(model, reserved_tokens=count_tokens(system_prompt + header, model))
+        batches = pack_by_tokens(
+            segments,
+            budget,
+            model,
+            text=lambda s: s.get("text", "")[:AD_SEGMENT_CHARS],
+            item_overhead=count_tokens(delimiter, model) + AD_OUTPUT_TOKENS_PER_SEGMENT,
+            max_items=self.ad_batch_size,
+        )
+        user_prompts = [
+            header.format(n=len(batch))
+            + delimiter.join([s.get("text", "")[:AD_SEGMENT_CHARS] for s in batch])
+            for batch in batches
+        ]
+
+        try:
+            results = await self._complete_batches(
+                system_prompt, user_prompts, "Classifying ads batch", semaphore
             )
+        except Exception as e:
+            raise PreprocessError(f"Ad classification failed: {e}") from e
 
-            try:
-                messages = [
-                    LLMMessage.system(system_prompt),
-                    LLMMessage.user(user_prompt),
-                ]
-                response = self.llm_provider.complete(messages=messages, model=self.restore_model)
-                result = response.content.strip()
-            except Exception as e:
-                logger.error(f"LLM API request failed for ad classification batch {batch_num}: {e}")
-                raise PreprocessError(f"Ad classification failed: {e}") from e
-
+        is_ad: List[bool] = []
+        for batch, result in zip(batches, results):
             # Parse response - each line should be AD or CONTENT
-            lines = [line.strip().upper() for line in result.split("\n") if line.strip()]
+            lines = [line.strip().upper() for line in result.strip().split("\n") if line.strip()]
 
-            # Map to booleans
-            batch_results = []
-            for j, line in enumerate(lines[: len(batch)]):
-                # Conservative: only mark as ad if explicitly "AD"
-                batch_results.append(line == "AD")
+            # Conservative: only mark as ad if explicitly "AD"
+            batch_results = [line == "AD" for line in lines[: len(batch)]]
 
             # If LLM returned fewer results, assume remaining are content
             if len(batch_results) < len(batch):
@@ -235,13 +365,26 @@ class TranscriptPreprocessor:
                     f"Ad classification returned {len(lines)} results for {len(batch)} segments. "
                     "Assuming remaining are content."
                 )
-                while len(batch_results) < len(batch):
-                    batch_results.append(False)
+                batch_results.extend([False] * (len(batch) - len(batch_results)))
 
             is_ad.extend(batch_results)
 
         return is_ad
 
+    def classify_ad_segments(self, segments: List[Dict[str, Any]]) -> List[bool]:
+        """Classify segments as advertisement or content using LLM.
+
+        Args:
+            segments: List of transcript segments
+
+        Returns:
+            List of booleans - True if segment is an ad, False if content
+
+        Raises:
+            PreprocessError: If LLM API fails
+        """
+        return run_coroutine(self.classify_ad_segments_async(segments))
+
     def filter_ad_segments(
         self, segments: List[Dict[str, Any]]
     ) -> tuple[List[Dict[str, Any]], int]:
@@ -258,8 +401,11 @@ class TranscriptPreprocessor:
 
         # Classify all segments
         is_ad = self.classify_ad_segments(segments)
+        return self._drop_ads(segments, is_ad)
 
-        # Filter out ads
+    def _drop_ads(
+        self, segments: List[Dict[str, Any]], is_ad: List[bool]
+    ) -> tuple[List[Dict[str, Any]], int]:
         filtered = [seg for seg, ad in zip(segments, is_ad) if not ad]
         ads_removed = len(segments) - len(filtered)
 
@@ -268,14 +414,17 @@ class TranscriptPreprocessor:
 
         return filtered, ads_removed
 
-    def semantic_restore(self, texts: List[str]) -> List[str]:
-        """Use LLM to restore punctuation and grammar.
+    async def semantic_restore_async(
+        self, texts: List[str], semaphore: Optional[asyncio.Semaphore] = None
+    ) -> List[str]:
+        """Restore punctuation and grammar with concurrent LLM batches.
 
         Args:
             texts: List of text segments to restore
+            semaphore: Request slots shared with concurrently running steps
 
         Returns:
-            List of restored text segments
+            List of restored text segments, in input order
 
         Raises:
             PreprocessError: If LLM API fails
@@ -291,40 +440,37 @@ class TranscriptPreprocessor:
             "Return only the cleaned text."
         )
 
-        out: List[str] = []
-        total_batches = (len(texts) + self.restore_batch_size - 1) // self.restore_batch_size
-
-        for i in range(0, len(texts), self.restore_batch_size):
-            batch_num = i // self.restore_batch_size + 1
-            chunk = texts[i : i + self.restore_batch_size]
-
-            # Report progress
-            self.progress.update_step(
-                f"Restoring batch {batch_num}/{total_batches}",
-                step=batch_num,
-                progress=batch_num / total_batches,
-            )
+        # Batch processing: join texts with delimiter
+        delimiter = "\n---SEGMENT---\n"
+        header = (
+            "Clean up these {n} transcript segments. "
+            f"Return them in the same order, separated by '{delimiter.strip()}'.\n\n"
+        )
+        model = self.restore_model
+        # The response repeats every segment and delimiter, so output ~= input
+        budget = token_budget(
+            model,
+            reserved_tokens=count_tokens(prompt + header, model),
+            output_ratio=1.0,
+        )
+        chunks = pack_by_tokens(
+            texts,
+            budget,
+            model,
+            item_overhead=count_tokens(delimiter, model),
+            max_items=self.restore_batch_size,
+        )
+        batch_prompts = [header.format(n=len(chunk)) + delimiter.join(chunk) for chunk in chunks]
 
-            # Batch processing: join texts with delimiter
-            delimiter = "\n---SEGMENT---\n"
-            batch_text = delimiter.join(chunk)
-            batch_prompt = (
-                f"Clean up these {len(chunk)} transcript segments. "
-                f"Return them in the same order, separated by '{delimiter.strip()}'.\n\n"
-                f"{batch_text}"
+        try:
+            results = await self._complete_batches(
+                prompt, batch_prompts, "Restoring batch", semaphore
             )
+        except Exception as e:
+            raise PreprocessError(f"Semantic restore failed: {e}") from e
 
-            try:
-                messages = [
-                    LLMMessage.system(prompt),
-                    LLMMessage.user(batch_prompt),
-                ]
-                response = self.llm_provider.complete(messages=messages, model=self.restore_model)
-                batch_result = response.content
-            except Exception as e:
-                logger.error(f"LLM API request failed for batch {batch_num}: {e}")
-                raise PreprocessError(f"Semantic restore failed: {e}") from e
-
+        out: List[str] = []
+        for chunk, batch_result in zip(chunks, results):
             # Split response back into individual segments.
             # Try exact delimiter first, then stripped version (LLMs often
             # omit the surrounding newlines).
@@ -345,6 +491,76 @@ class TranscriptPreprocessor:
 
         return out
 
+    def semantic_restore(self, texts: List[str]) -> List[str]:
+        """Use LLM to restore punctuation and grammar.
+
+        Args:
+            texts: List of text segments to restore
+
+        Returns:
+            List of restored text segments
+
+        Raises:
+            PreprocessError: If LLM API fails
+        """
+        return run_coroutine(self.semantic_restore_async(texts))
+
+    def _merge_and_normalize(self, segs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if self.merge:
+            logger.debug(f"Merging segments (max_gap={self.max_gap}s, max_len={self.max_len})")
+            segs = self.merge_segments(segs)
+
+        if self.normalize:
+            logger.debug("Normalizing text")
+            segs = self.normalize_segments(segs)
+        return segs
+
+    async def _filter_and_restore_async(
+        self, segs: List[Dict[str, Any]]
+    ) -> tuple[List[Dict[str, Any]], int]:
+        """Classify ads and restore text concurrently.
+
+        Restore needs the merged, ad-free segments, which are only known once
+        classification finishes. To overlap the two, the merged segments of
+        the unfiltered transcript are restored speculatively; afterwards every
+        final segment identical to a speculative one reuses its restored text
+        and only the few that differ (merges next to a removed ad) are sent in
+        a follow-up round.
+
+        This is not identical to running the steps in sequence: restore
+        batches are packed from the unfiltered segments, so the model sees ad
+        text and different neighbours, and segments changed by ad removal
+        cost extra requests. Both steps draw on one set of
+        max_concurrent_requests slots.
+        """
+        speculative = self._merge_and_normalize([dict(s) for s in segs])
+        semaphore = self._request_slots()
+
+        def key(seg: Dict[str, Any]) -> tuple:
+            return (seg.get("start"), seg.get("end"), seg.get("text", ""))
+
+        is_ad, restored = await asyncio.gather(
+            self.classify_ad_segments_async(segs, semaphore),
+            self.semantic_restore_async([s.get("text", "") for s in speculative], semaphore),
+        )
+        restored_by_key = {key(s): txt for s, txt in zip(speculative, restored)}
+
+        filtered, ads_removed = self._drop_ads(segs, is_ad)
+        final = self._merge_and_normalize(filtered)
+
+        missing = [i for i, s in enumerate(final) if key(s) not in restored_by_key]
+        if missing:
+            logger.debug(f"Restoring {len(missing)} segment(s) changed by ad removal")
+            extra = await self.semantic_restore_async(
+                [final[i].get("text", "") for i in missing], semaphore
+            )
+            for i, txt in zip(missing, extra):
+                restored_by_key[key(final[i])] = txt
+
+        for seg in final:
+            seg["text"] = restored_by_key[key(seg)]
+        return final, ads_removed
+
     def preprocess(self, transcript: Dict[str, Any]) -> Dict[str, Any]:
         """Preprocess transcript with configured options.
 
@@ -374,32 +590,44 @@ class TranscriptPreprocessor:
         segs = transcript.get("segments", [])
         ads_removed = 0
 
-        # Ad filtering first (before other processing)
-        if self.skip_ads and segs:
-            logger.debug(f"Filtering ads with {self.restore_model}")
-            try:
-                segs, ads_removed = self.filter_ad_segments(segs)
-            except PreprocessError as e:
-                logger.warning(f"Ad filtering failed: {e}")
-                raise
-
-        if self.merge:
-            logger.debug(f"Merging segments (max_gap={self.max_gap}s, max_len={self.max_len})")
-            segs = self.merge_segments(segs)
-
-        if self.normalize:
-            logger.debug("Normalizing text")
-            segs = self.normalize_segments(segs)
-
-        if self.restore and segs:
-            logger.debug(f"Semantic restore with {self.restore_model}")
+        if self.skip_ads and self.restore and segs:
+            # Both LLM steps: run them concurrently
+            logger.debug(f"Filtering ads and restoring with {self.restore_model}")
             try:
-                restored_texts = self.semantic_restore([s.get("text", "") for s in segs])
-                for i, txt in enumerate(restored_texts):
-                    segs[i]["text"] = txt
+                segs, ads_removed = run_coroutine(self._filter_and_restore_async(segs))
             except PreprocessError as e:
-                logger.warning(f"Semantic restore failed: {e}")
+                logger.warning(f"Ad filtering/restore failed: {e}")
                 raise
+        else:
+            # Ad filtering first (before other processing)
+            if self.skip_ads and segs:
+                logger.debug(f"Filtering ads with {self.restore_model}")
+                try:
+                    segs, ads_removed = self.filter_ad_segments(segs)
+                except PreprocessError as e:
+                    logger.warning(f"Ad filtering failed: {e}")
+                    raise
+
+            segs = self._merge_and_normalize(segs)
+
+            if self.restore and segs:
+                logger.debug(f"Semantic restore with {self.restore_model}")
+                try:
+                    restored_texts = self.semantic_restore([s.get("text", "") for s in segs])
+                    for i, txt in enumerate(restored_texts):
+                        segs[i]["text"] = txt
+                except PreprocessError as e:
+                    logger.warning(f"Semantic restore failed: {e}")
+                    raise
+
+        if isinstance(self.llm_provider, CachedLLMProvider) and (self.skip_ads or self.restore):
+            cache_stats = self.llm_provider.cache.stats()
+            logger.info(
+                "LLM response cache",
+                hits=cache_stats["hits"],
+                misses=cache_stats["misses"],
+                entries=cache_stats["entries"],
+            )
 
         out["segments"] = segs
         out["text"] = "\n".join([s.get("text", "") for s in segs]).strip()
@@ -460,7 +688,7 @@ def preprocess_transcript(
     max_gap: float = 1.0,
     max_len: int = 800,
     restore_model: str = "gpt-4.1-mini",
-    restore_batch_size: int = 20,
+    restore_batch_size: Optional[int] = DEFAULT_RESTORE_BATCH_SIZE,
 ) -> Dict[str, Any]:
     """Preprocess a transcript with specified options.
 
@@ -472,7 +700,7 @@ def preprocess_transcript(
         max_gap: Maximum gap for merging
         max_len: Maximum merged length
         restore_model: LLM model for restore
-        restore_batch_size: Batch size for restore
+        restore_batch_size: Cap on segments per restore request (None: token budget only)
 
     Returns:
         Processed transcript dictionary
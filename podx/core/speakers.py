@@ -18,12 +18,18 @@ SPEAKER_MAP_FILENAME = "speaker-map.json"
 GENERIC_SPEAKER_PATTERN = re.compile(r"^SPEAKER_\d+$")
 
 
-def save_speaker_map(episode_dir: Path, speaker_map: Dict[str, str]) -> Path:
+def save_speaker_map(
+    episode_dir: Path, speaker_map: Dict[str, str], enroll_voiceprints: bool = True
+) -> Path:
     """Save speaker mapping to speaker-map.json.
 
+    Confirmed names are also enrolled in the show's voiceprint store when the
+    episode has diarization embeddings, so later episodes can be auto-labeled.
+
     Args:
         episode_dir: Episode directory
         speaker_map: Mapping of SPEAKER_XX -> real name
+        enroll_voiceprints: Whether to enroll the named speakers' voiceprints
 
     Returns:
         Path to saved file
@@ -31,6 +37,14 @@ def save_speaker_map(episode_dir: Path, speaker_map: Dict[str, str]) -> Path:
     path = episode_dir / SPEAKER_MAP_FILENAME
     path.write_text(json.dumps(speaker_map, indent=2, ensure_ascii=False), encoding="utf-8")
     logger.info("Saved speaker map", path=str(path), speakers=len(speaker_map))
+
+    if enroll_voiceprints:
+        try:
+            from .voiceprints import enroll_episode_speakers
+
+            enroll_episode_speakers(episode_dir, speaker_map)
+        except Exception as e:
+            logger.warning("Failed to enroll voiceprints", path=str(episode_dir), error=str(e))
     return path
 
 
@@ -57,6 +71,48 @@ def load_speaker_map(episode_dir: Path) -> Optional[Dict[str, str]]:
         return None
 
 
+def identify_speaker_map(
+    episode_dir: Path,
+    segments: List[Dict[str, Any]],
+    require_all: bool = True,
+) -> Optional[Dict[str, str]]:
+    """Name an episode's speakers from its show's voiceprints.
+
+    A complete match is saved to speaker-map.json (without re-enrolling it)
+    so later stages treat it like a confirmed map. Partial matches are only
+    returned: saving them would stop the prompts that name the rest.
+
+    Args:
+        episode_dir: Episode directory with speaker-embeddings.json
+        segments: Diarized transcript segments
+        require_all: Only return a map if every generic speaker was recognized
+
+    Returns:
+        Speaker map dict or None if no (or, with require_all, not every)
+        speaker was recognized
+    """
+    try:
+        from .voiceprints import identify_known_speakers
+
+        speaker_map = identify_known_speakers(episode_dir)
+    except Exception as e:
+        logger.warning("Voiceprint lookup failed", path=str(episode_dir), error=str(e))
+        return None
+
+    if not speaker_map:
+        return None
+    generic = {
+        seg["speaker"]
+        for seg in segments
+        if seg.get("speaker") and GENERIC_SPEAKER_PATTERN.match(seg["speaker"])
+    }
+    if not generic <= speaker_map.keys():
+        return None if require_all else speaker_map
+
+    save_speaker_map(episode_dir, speaker_map, enroll_voiceprints=False)
+    return speaker_map
+
+
 def apply_speaker_map_to_transcript(
     episode_dir: Path,
     speaker_map: Dict[str, str],
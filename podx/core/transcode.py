@@ -14,6 +14,9 @@ logger = get_logger(__name__)
 # Type aliases
 AudioFormat = Literal["wav16", "mp3", "aac"]
 
+# Highpass + FFT denoise: reduces echo/reverb that confuses speaker embeddings
+DIARIZE_AUDIO_FILTER = "highpass=f=100,afftdn=nf=-20"
+
 
 class TranscodeError(Exception):
     """Raised when transcoding fails."""
@@ -297,7 +300,7 @@ def create_diarize_audio(source: Path, output: Path) -> Path:
                 "-i",
                 str(source),
                 "-af",
-                "highpass=f=100,afftdn=nf=-20",
+                DIARIZE_AUDIO_FILTER,
                 "-ac",
                 "1",
                 "-ar",
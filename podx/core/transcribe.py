@@ -3,12 +3,16 @@
 No UI dependencies, no CLI concerns. Just audio transcription across multiple backends.
 """
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from ..device import detect_device_for_ctranslate2, get_optimal_compute_type, log_device_usage
 from ..logging import get_logger
 from ..progress import ProgressReporter, SilentProgressReporter
+from .checkpoint import PartialTranscript, PartialTranscriptWriter, read_partial_transcript
 
 logger = get_logger(__name__)
 
@@ -48,6 +52,15 @@ RUNPOD_MODEL_ALIASES: Dict[str, str] = {
 }
 
 
+# Parallel (VAD-split) local transcription
+SAMPLE_RATE = 16000
+PARALLEL_WINDOWS_PER_WORKER = 4  # Extra windows keep workers busy when lengths vary
+PARALLEL_MIN_WINDOW_SECONDS = 60.0
+PARALLEL_MAX_WINDOW_SECONDS = 600.0
+PARALLEL_WINDOW_PAD_SECONDS = 0.2
+LANGUAGE_DETECTION_SECONDS = 30.0  # Whisper detects language from one 30 s frame
+
+
 class TranscriptionError(Exception):
     """Raised when transcription fails."""
 
@@ -104,6 +117,89 @@ def parse_model_and_provider(model_arg: str, provider_arg: Optional[str] = None)
     return ("local", normalized)
 
 
+def plan_vad_windows(
+    speech_regions: List[Tuple[float, float]],
+    total_duration: float,
+    target_window_seconds: float,
+) -> List[Tuple[float, float]]:
+    """Group VAD speech regions into transcription windows cut at silence.
+
+    Consecutive speech regions are packed into a window until it spans at
+    least ``target_window_seconds``; the window is then closed in the middle
+    of the following silence gap, so no window boundary falls inside speech.
+    Leading and trailing silence is dropped.
+
+    Args:
+        speech_regions: Sorted (start, end) speech regions in seconds
+        total_duration: Total audio duration in seconds
+        target_window_seconds: Desired minimum window length in seconds
+
+    Returns:
+        List of (start, end) windows in seconds, in order
+    """
+    if not speech_regions:
+        return []
+
+    windows: List[Tuple[float, float]] = []
+    window_start = max(0.0, speech_regions[0][0] - PARALLEL_WINDOW_PAD_SECONDS)
+
+    for i, (_, end) in enumerate(speech_regions):
+        is_last = i == len(speech_regions) - 1
+        if is_last:
+            windows.append((window_start, min(total_duration, end + PARALLEL_WINDOW_PAD_SECONDS)))
+        elif end - window_start >= target_window_seconds:
+            cut = (end + speech_regions[i + 1][0]) / 2
+            windows.append((window_start, cut))
+            window_start = cut
+
+    return windows
+
+
+# Per-process state for parallel transcription workers
+_worker_model_args: Optional[Tuple[str, str, str, int]] = None
+
+
+def _init_parallel_worker(model: str, device: str, compute_type: str, cpu_threads: int) -> None:
+    """Record the model configuration for this worker process.
+
+    The model itself is loaded by the first window and then stays resident in
+    the worker's model pool; loading here would turn load errors into opaque
+    "process terminated abruptly" failures.
+    """
+    global _worker_model_args
+    _worker_model_args = (model, device, compute_type, cpu_threads)
+
+
+def _detect_language_in_worker(audio: Any) -> Optional[str]:
+    """Detect the spoken language of an audio clip in a worker process.
+
+    faster-whisper detects the language before decoding anything; the
+    segment generator is never consumed, so no text is decoded.
+    """
+    from .transcription.local_provider import load_whisper_model
+
+    assert _worker_model_args is not None, "Worker not initialized"
+    asr = load_whisper_model(*_worker_model_args)
+    _, info = asr.transcribe(audio)
+    return getattr(info, "language", None)
+
+
+def _transcribe_window(
+    audio: Any, offset: float, transcribe_kwargs: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Transcribe one audio window in a worker process.
+
+    Returns:
+        Segments with absolute timestamps
+    """
+    from .transcription.local_provider import load_whisper_model
+
+    assert _worker_model_args is not None, "Worker not initialized"
+    asr = load_whisper_model(*_worker_model_args)
+    seg_iter, _ = asr.transcribe(audio, **transcribe_kwargs)
+    return [{"start": s.start + offset, "end": s.end + offset, "text": s.text} for s in seg_iter]
+
+
 class TranscriptionEngine:
     """Pure transcription logic with no UI dependencies.
 
@@ -120,6 +216,9 @@ class TranscriptionEngine:
         vad_filter: bool = True,
         condition_on_previous_text: bool = True,
         extra_decode_options: Optional[Dict[str, Any]] = None,
+        parallel_workers: int = 1,
+        checkpoint_path: Optional[Path] = None,
+        resume: bool = False,
         progress: Optional[Union[ProgressReporter, Callable[[str], None]]] = None,
         progress_callback: Optional[Callable[[str], None]] = None,  # Deprecated
     ):
@@ -133,6 +232,12 @@ class TranscriptionEngine:
             vad_filter: Enable voice activity detection filtering
             condition_on_previous_text: Enable conditioning on previous text
             extra_decode_options: Additional decoder options
+            parallel_workers: Worker processes for local CPU transcription. Values > 1
+                split the audio at VAD silence boundaries and decode windows in parallel
+            checkpoint_path: JSONL file that local transcription appends each decoded
+                segment to (see ``podx.core.checkpoint``)
+            resume: Continue from an existing checkpoint for the same audio and model,
+                skipping audio that is already transcribed
             progress: Optional ProgressReporter or legacy callback function
             progress_callback: Deprecated - use progress parameter instead
         """
@@ -149,6 +254,9 @@ class TranscriptionEngine:
         self.vad_filter = vad_filter
         self.condition_on_previous_text = condition_on_previous_text
         self.extra_decode_options = extra_decode_options or {}
+        self.parallel_workers = max(1, parallel_workers)
+        self.checkpoint_path = checkpoint_path
+        self.resume = resume
 
         # Handle progress reporting (support both new and legacy APIs)
         self.progress: Optional[ProgressReporter] = None
@@ -214,65 +322,289 @@ class TranscriptionEngine:
     def _transcribe_local(self, audio_path: Path) -> Dict[str, Any]:
         """Transcribe using local faster-whisper model."""
         try:
-            from faster_whisper import WhisperModel
+            import faster_whisper  # noqa: F401
         except ImportError:
             raise TranscriptionError(
                 "faster-whisper not installed. Install with: pip install faster-whisper"
             )
 
-        self._report_progress(f"Loading model: {self.normalized_model}")
+        from .transcription.local_provider import load_whisper_model
+
+        partial, writer = self._open_checkpoint(audio_path)
+        if partial is not None and partial.complete is not None:
+            self._report_progress("Transcript already complete in checkpoint")
+            return self._local_result(
+                audio_path, partial.segments, partial.complete.get("language", "en")
+            )
 
-        # Log device usage for transparency
-        log_device_usage(self.device, self.compute_type, "transcription")
+        prior_segments = partial.segments if partial else []
+        resume_offset = partial.resume_offset if partial else 0.0
 
         try:
-            asr = WhisperModel(
-                self.normalized_model,
-                device=self.device,
-                compute_type=self.compute_type,
-            )
-        except Exception as e:
-            raise TranscriptionError(f"Failed to initialize Whisper model: {e}") from e
+            if self.parallel_workers > 1:
+                if self.device == "cpu":
+                    return self._transcribe_local_parallel(
+                        audio_path, prior_segments, resume_offset, writer
+                    )
+                logger.warning(
+                    "Parallel transcription is CPU-only, using sequential decode",
+                    device=self.device,
+                )
+
+            self._report_progress(f"Loading model: {self.normalized_model}")
+
+            # Log device usage for transparency
+            log_device_usage(self.device, self.compute_type, "transcription")
+
+            try:
+                asr = load_whisper_model(self.normalized_model, self.device, self.compute_type)
+            except Exception as e:
+                raise TranscriptionError(f"Failed to initialize Whisper model: {e}") from e
+
+            self._report_progress("Transcribing audio")
+
+            audio_input: Any = str(audio_path)
+            if resume_offset > 0:
+                # Seek by decoding once and dropping the already transcribed samples
+                from faster_whisper.audio import decode_audio
+
+                audio_input = decode_audio(str(audio_path), sampling_rate=SAMPLE_RATE)[
+                    int(resume_offset * SAMPLE_RATE) :
+                ]
+
+            try:
+                seg_iter, info = asr.transcribe(audio_input, **self._local_transcribe_kwargs())
+            except Exception as e:
+                raise TranscriptionError(f"Transcription failed: {e}") from e
 
-        self._report_progress("Transcribing audio")
+            # Collect segments, checkpointing each one as it is decoded
+            segments = list(prior_segments)
+            for s in seg_iter:
+                segment = {
+                    "start": s.start + resume_offset,
+                    "end": s.end + resume_offset,
+                    "text": s.text,
+                }
+                segments.append(segment)
+                if writer:
+                    writer.write_segment(segment)
+
+            detected_language = getattr(info, "language", "en")
+            if writer:
+                writer.write_complete(language=detected_language, segments_count=len(segments))
+        finally:
+            if writer:
+                writer.close()
+
+        logger.info(
+            "Transcription completed",
+            segments_count=len(segments),
+            language=detected_language,
+        )
 
-        # Build transcription kwargs
+        return self._local_result(audio_path, segments, detected_language)
+
+    def _local_transcribe_kwargs(self) -> Dict[str, Any]:
+        """Build faster-whisper transcribe() options."""
         transcribe_kwargs: Dict[str, Any] = {
             "vad_filter": self.vad_filter,
             "vad_parameters": {"min_silence_duration_ms": 500},
             "condition_on_previous_text": self.condition_on_previous_text,
         }
         transcribe_kwargs.update(self.extra_decode_options)
+        return transcribe_kwargs
+
+    def _local_result(
+        self,
+        audio_path: Path,
+        segments: List[Dict[str, Any]],
+        language: str,
+        **decoder_options: Any,
+    ) -> Dict[str, Any]:
+        """Build the transcript dict for the local provider."""
+        return {
+            "audio_path": str(audio_path.resolve()),
+            "language": language,
+            "asr_model": self.normalized_model,
+            "asr_provider": "local",
+            "decoder_options": {"vad_filter": self.vad_filter, **decoder_options},
+            "segments": segments,
+            "text": "\n".join(s["text"] for s in segments).strip(),
+        }
 
+    def _open_checkpoint(
+        self, audio_path: Path
+    ) -> Tuple[Optional[PartialTranscript], Optional[PartialTranscriptWriter]]:
+        """Open the JSONL checkpoint, reusing an existing one when resuming.
+
+        Returns:
+            Tuple of (checkpoint being resumed or None, writer or None). No
+            writer is opened for a checkpoint that is already complete.
+        """
+        if self.checkpoint_path is None:
+            return None, None
+
+        resolved_audio = str(audio_path.resolve())
+        if self.resume:
+            partial = read_partial_transcript(self.checkpoint_path)
+            if partial is not None and partial.matches(resolved_audio, self.normalized_model):
+                logger.info(
+                    "Resuming transcription from checkpoint",
+                    checkpoint=str(self.checkpoint_path),
+                    segments=len(partial.segments),
+                    resume_offset=round(partial.resume_offset, 2),
+                )
+                if partial.complete is not None:
+                    return partial, None
+                if partial.segments:
+                    self._report_progress(
+                        f"Resuming at {partial.resume_offset:.0f}s "
+                        f"({len(partial.segments)} segments already transcribed)"
+                    )
+                writer = PartialTranscriptWriter(
+                    self.checkpoint_path, truncate_to=partial.valid_bytes
+                )
+                return partial, writer
+            if partial is not None:
+                logger.warning(
+                    "Checkpoint is for different audio or model, starting over",
+                    checkpoint=str(self.checkpoint_path),
+                )
+
+        writer = PartialTranscriptWriter(
+            self.checkpoint_path,
+            header={
+                "audio_path": resolved_audio,
+                "asr_model": self.normalized_model,
+                "asr_provider": "local",
+            },
+        )
+        return None, writer
+
+    def _transcribe_local_parallel(
+        self,
+        audio_path: Path,
+        prior_segments: List[Dict[str, Any]],
+        resume_offset: float,
+        writer: Optional[PartialTranscriptWriter],
+    ) -> Dict[str, Any]:
+        """Transcribe with faster-whisper across CPU worker processes.
+
+        Decodes the audio once, finds speech with Silero VAD, cuts it into
+        windows at silence boundaries and decodes the windows in a process
+        pool with one warm model per worker. The language is detected once,
+        from the first speech, and passed to every window so short or noisy
+        windows cannot switch language mid-transcript. Segments are shifted
+        back to absolute time and stitched in order. Windows are checkpointed
+        as soon as every earlier window has finished, so the checkpoint is
+        always a contiguous prefix of the transcript.
+        """
+        from faster_whisper.audio import decode_audio
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        log_device_usage(self.device, self.compute_type, "parallel transcription")
+
+        self._report_progress("Detecting speech regions")
         try:
-            seg_iter, info = asr.transcribe(str(audio_path), **transcribe_kwargs)
+            audio = decode_audio(str(audio_path), sampling_rate=SAMPLE_RATE)
         except Exception as e:
-            raise TranscriptionError(f"Transcription failed: {e}") from e
+            raise TranscriptionError(f"Failed to decode audio: {e}") from e
 
-        # Collect segments
-        segments = []
-        text_lines = []
-        for s in seg_iter:
-            segments.append({"start": s.start, "end": s.end, "text": s.text})
-            text_lines.append(s.text)
+        if resume_offset > 0:
+            audio = audio[int(resume_offset * SAMPLE_RATE) :]
 
-        detected_language = getattr(info, "language", "en")
+        total_duration = len(audio) / SAMPLE_RATE
+        vad_options = VadOptions(
+            min_silence_duration_ms=500, max_speech_duration_s=PARALLEL_MAX_WINDOW_SECONDS
+        )
+        speech_regions = [
+            (ts["start"] / SAMPLE_RATE, ts["end"] / SAMPLE_RATE)
+            for ts in get_speech_timestamps(audio, vad_options, sampling_rate=SAMPLE_RATE)
+        ]
+        speech_seconds = sum(end - start for start, end in speech_regions)
+        target_window = min(
+            PARALLEL_MAX_WINDOW_SECONDS,
+            max(
+                PARALLEL_MIN_WINDOW_SECONDS,
+                speech_seconds / (self.parallel_workers * PARALLEL_WINDOWS_PER_WORKER),
+            ),
+        )
+        windows = plan_vad_windows(speech_regions, total_duration, target_window)
+        workers = min(self.parallel_workers, len(windows)) or 1
+        cpu_threads = max(1, (os.cpu_count() or 1) // workers)
 
         logger.info(
-            "Transcription completed",
+            "Starting parallel transcription",
+            duration=round(total_duration, 1),
+            speech_seconds=round(speech_seconds, 1),
+            windows=len(windows),
+            workers=workers,
+            cpu_threads=cpu_threads,
+            resume_offset=round(resume_offset, 2),
+        )
+
+        transcribe_kwargs = self._local_transcribe_kwargs()
+
+        self._report_progress(
+            f"Transcribing {len(windows)} windows with {workers} workers "
+            f"(model: {self.normalized_model})"
+        )
+
+        window_results: Dict[int, List[Dict[str, Any]]] = {}
+        next_to_checkpoint = 0
+        detected_language = transcribe_kwargs.get("language")
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_parallel_worker,
+                initargs=(self.normalized_model, self.device, self.compute_type, cpu_threads),
+            ) as executor:
+                if not detected_language and speech_regions:
+                    first_speech = int(speech_regions[0][0] * SAMPLE_RATE)
+                    clip = audio[
+                        first_speech : first_speech + int(LANGUAGE_DETECTION_SECONDS * SAMPLE_RATE)
+                    ]
+                    detected_language = executor.submit(_detect_language_in_worker, clip).result()
+                    if detected_language:
+                        transcribe_kwargs["language"] = detected_language
+
+                future_to_index = {
+                    executor.submit(
+                        _transcribe_window,
+                        audio[int(start * SAMPLE_RATE) : int(end * SAMPLE_RATE)],
+                        start + resume_offset,
+                        transcribe_kwargs,
+                    ): i
+                    for i, (start, end) in enumerate(windows)
+                }
+                for future in as_completed(future_to_index):
+                    window_results[future_to_index[future]] = future.result()
+
+                    while writer and next_to_checkpoint in window_results:
+                        for segment in window_results[next_to_checkpoint]:
+                            writer.write_segment(segment)
+                        next_to_checkpoint += 1
+
+                    self._report_progress(
+                        f"Transcribed window {len(window_results)}/{len(windows)}"
+                    )
+        except Exception as e:
+            raise TranscriptionError(f"Parallel transcription failed: {e}") from e
+
+        segments = list(prior_segments)
+        segments.extend(seg for i in range(len(windows)) for seg in window_results[i])
+        detected_language = detected_language or "en"
+        if writer:
+            writer.write_complete(language=detected_language, segments_count=len(segments))
+
+        logger.info(
+            "Parallel transcription completed",
             segments_count=len(segments),
             language=detected_language,
         )
 
-        return {
-            "audio_path": str(audio_path.resolve()),
-            "language": detected_language,
-            "asr_model": self.normalized_model,
-            "asr_provider": "local",
-            "decoder_options": {"vad_filter": self.vad_filter},
-            "segments": segments,
-            "text": "\n".join(text_lines).strip(),
-        }
+        return self._local_result(audio_path, segments, detected_language, parallel_workers=workers)
 
     def _transcribe_openai(self, audio_path: Path) -> Dict[str, Any]:
         """Transcribe using OpenAI Whisper API."""
@@ -281,51 +613,49 @@ class TranscriptionEngine:
         try:
             from openai import OpenAI
 
+            from .transcription.openai_provider import (
+                parse_verbose_language,
+                parse_verbose_segments,
+                should_chunk,
+                transcribe_chunked,
+            )
+
             client = OpenAI()
 
-            with open(str(audio_path), "rb") as f:
-                resp = client.audio.transcriptions.create(
-                    model=self.normalized_model,
-                    file=f,
-                    response_format="verbose_json",
-                )
-                text = getattr(resp, "text", None) or (
-                    resp.get("text") if isinstance(resp, dict) else None
+            if should_chunk(audio_path):
+                # Long or oversized file: concurrent silence-split pieces
+                segments, _, language = transcribe_chunked(
+                    client,
+                    audio_path,
+                    self.normalized_model,
+                    progress_callback=self._report_progress,
                 )
-                segs_raw = getattr(resp, "segments", None) or (
-                    resp.get("segments") if isinstance(resp, dict) else None
-                )
-
-            # Parse segments
-            segments: List[Dict[str, Any]] = []
-            if segs_raw:
-                for s in segs_raw:
-                    start = s.get("start")
-                    end = s.get("end")
-                    txt = s.get("text", "")
-                    # Handle timestamp format variations
-                    if start is None or end is None:
-                        ts = s.get("timestamp")
-                        if isinstance(ts, (list, tuple)) and len(ts) == 2:
-                            start, end = ts[0], ts[1]
-                    if start is None:
-                        start = 0.0
-                    if end is None:
-                        end = 0.0
-                    segments.append({"start": float(start), "end": float(end), "text": txt})
+                decoder_options: Optional[Dict[str, Any]] = {"chunked": True}
             else:
-                # Fallback: single segment
-                txt = text or ""
-                segments = [{"start": 0.0, "end": 0.0, "text": txt}]
-
-            logger.info("OpenAI transcription completed", segments_count=len(segments))
+                with open(str(audio_path), "rb") as f:
+                    resp = client.audio.transcriptions.create(
+                        model=self.normalized_model,
+                        file=f,
+                        response_format="verbose_json",
+                    )
+                segments, text = parse_verbose_segments(resp)
+                language = parse_verbose_language(resp)
+                decoder_options = None
+                if not segments:
+                    # Fallback: single segment
+                    segments = [{"start": 0.0, "end": 0.0, "text": text}]
+
+            language = language or "en"
+            logger.info(
+                "OpenAI transcription completed", segments_count=len(segments), language=language
+            )
 
             return {
                 "audio_path": str(audio_path.resolve()),
-                "language": "en",
+                "language": language,
                 "asr_model": self.normalized_model,
                 "asr_provider": "openai",
-                "decoder_options": None,
+                "decoder_options": decoder_options,
                 "segments": segments,
                 "text": "\n".join([s["text"] for s in segments]).strip(),
             }
@@ -479,9 +809,9 @@ class TranscriptionEngine:
             raise TranscriptionError(f"RunPod transcription failed: {e}") from e
 
         finally:
-            # Always clean up R2 upload
+            # Release R2 upload (kept for diarization/retries until retention expires)
             if r2_key:
-                storage.delete(r2_key)
+                storage.release(r2_key)
             client.close()
 
 
@@ -493,6 +823,7 @@ def transcribe_audio(
     compute_type: Optional[str] = None,
     device: Optional[str] = None,
     vad_filter: bool = True,
+    parallel_workers: int = 1,
     progress_callback: Optional[Callable[[str], None]] = None,
 ) -> Dict[str, Any]:
     """Transcribe audio file with specified model.
@@ -504,6 +835,7 @@ def transcribe_audio(
         compute_type: Compute type for local models (auto-detect if None)
         device: Device to use (auto-detect if None)
         vad_filter: Enable VAD filtering
+        parallel_workers: Worker processes for VAD-split local CPU transcription
         progress_callback: Optional progress callback
 
     Returns:
@@ -515,6 +847,7 @@ def transcribe_audio(
         compute_type=compute_type,
         device=device,
         vad_filter=vad_filter,
+        parallel_workers=parallel_workers,
         progress_callback=progress_callback,
     )
     return engine.transcribe(audio_path)
@@ -14,7 +14,7 @@ from .base import ASRProvider, ProviderConfig, TranscriptionResult
 from .factory import get_provider, list_providers, register_provider
 from .local_provider import LocalProvider
 from .openai_provider import OpenAIProvider
-from .runpod_provider import RunPodProvider
+from .runpod_provider import BatchTranscription, RunPodProvider
 
 __all__ = [
     # Base classes
@@ -25,6 +25,7 @@ __all__ = [
     "LocalProvider",
     "OpenAIProvider",
     "RunPodProvider",
+    "BatchTranscription",
     # Factory
     "get_provider",
     "register_provider",
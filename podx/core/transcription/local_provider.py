@@ -5,6 +5,7 @@ from typing import Any, Dict, List
 
 from ...device import detect_device_for_ctranslate2, get_optimal_compute_type, log_device_usage
 from ...logging import get_logger
+from ...performance import model_cache
 from .base import ASRProvider, ProviderConfig, TranscriptionError, TranscriptionResult
 
 logger = get_logger(__name__)
@@ -23,6 +24,33 @@ LOCAL_MODEL_ALIASES: Dict[str, str] = {
 }
 
 
+def load_whisper_model(model: str, device: str, compute_type: str, cpu_threads: int = 0) -> Any:
+    """Get a faster-whisper model from the process-wide model pool.
+
+    The first call for a (model, device, compute_type) combination pays the
+    load; later calls in the same process reuse the resident model.
+
+    Args:
+        model: Normalized faster-whisper model identifier
+        device: CTranslate2 device ("cuda" or "cpu")
+        compute_type: CTranslate2 compute type
+        cpu_threads: CPU threads per model (0 lets CTranslate2 decide)
+
+    Returns:
+        A ``faster_whisper.WhisperModel`` instance
+    """
+    from faster_whisper import WhisperModel
+
+    kwargs: Dict[str, Any] = {"device": device, "compute_type": compute_type}
+    if cpu_threads:
+        kwargs["cpu_threads"] = cpu_threads
+
+    return model_cache.get(
+        ("faster-whisper", model, device, compute_type, cpu_threads),
+        lambda: WhisperModel(model, **kwargs),
+    )
+
+
 class LocalProvider(ASRProvider):
     """ASR provider using local faster-whisper models.
 
@@ -88,7 +116,7 @@ class LocalProvider(ASRProvider):
         )
 
         try:
-            from faster_whisper import WhisperModel
+            import faster_whisper  # noqa: F401
         except ImportError:
             raise TranscriptionError(
                 "faster-whisper not installed. Install with: pip install faster-whisper"
@@ -104,10 +132,10 @@ class LocalProvider(ASRProvider):
         )
 
         try:
-            asr = WhisperModel(
+            asr = load_whisper_model(
                 self.normalized_model,
-                device=self.config.device,
-                compute_type=self.config.compute_type,
+                self.config.device or "cpu",
+                self.config.compute_type or "int8",
             )
         except Exception as e:
             raise TranscriptionError(f"Failed to initialize Whisper model: {e}") from e
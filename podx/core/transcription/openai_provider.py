@@ -1,7 +1,13 @@
 """OpenAI Whisper API ASR provider."""
 
+import re
+import subprocess
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from ...logging import get_logger
 from .base import ASRProvider, TranscriptionError, TranscriptionResult
@@ -16,12 +22,424 @@ OPENAI_MODEL_ALIASES: Dict[str, str] = {
     "whisper-1": "whisper-1",
 }
 
+# Chunked upload settings
+OPENAI_MAX_UPLOAD_BYTES = 25 * 1024 * 1024  # API request size limit
+CHUNK_SECONDS = 600.0  # Target piece length
+CHUNK_BITRATE_KBPS = 32  # Mono Opus; ~14 MB per hour of audio
+SILENCE_SEARCH_SECONDS = 30.0  # Look this far either side of a target cut for silence
+SILENCE_NOISE_DB = -35
+SILENCE_MIN_SECONDS = 0.4
+DEFAULT_MAX_CONCURRENCY = 4
+
+# verbose_json reports the detected language by name; map it to the ISO code
+# used everywhere else (alignment models are keyed by code)
+WHISPER_LANGUAGE_CODES: Dict[str, str] = {
+    "afrikaans": "af",
+    "albanian": "sq",
+    "amharic": "am",
+    "arabic": "ar",
+    "armenian": "hy",
+    "assamese": "as",
+    "azerbaijani": "az",
+    "bashkir": "ba",
+    "basque": "eu",
+    "belarusian": "be",
+    "bengali": "bn",
+    "bosnian": "bs",
+    "breton": "br",
+    "bulgarian": "bg",
+    "cantonese": "yue",
+    "catalan": "ca",
+    "chinese": "zh",
+    "croatian": "hr",
+    "czech": "cs",
+    "danish": "da",
+    "dutch": "nl",
+    "english": "en",
+    "estonian": "et",
+    "faroese": "fo",
+    "finnish": "fi",
+    "french": "fr",
+    "galician": "gl",
+    "georgian": "ka",
+    "german": "de",
+    "greek": "el",
+    "gujarati": "gu",
+    "haitian creole": "ht",
+    "hausa": "ha",
+    "hawaiian": "haw",
+    "hebrew": "he",
+    "hindi": "hi",
+    "hungarian": "hu",
+    "icelandic": "is",
+    "indonesian": "id",
+    "italian": "it",
+    "japanese": "ja",
+    "javanese": "jw",
+    "kannada": "kn",
+    "kazakh": "kk",
+    "khmer": "km",
+    "korean": "ko",
+    "lao": "lo",
+    "latin": "la",
+    "latvian": "lv",
+    "lingala": "ln",
+    "lithuanian": "lt",
+    "luxembourgish": "lb",
+    "macedonian": "mk",
+    "malagasy": "mg",
+    "malay": "ms",
+    "malayalam": "ml",
+    "maltese": "mt",
+    "maori": "mi",
+    "marathi": "mr",
+    "mongolian": "mn",
+    "myanmar": "my",
+    "nepali": "ne",
+    "norwegian": "no",
+    "nynorsk": "nn",
+    "occitan": "oc",
+    "pashto": "ps",
+    "persian": "fa",
+    "polish": "pl",
+    "portuguese": "pt",
+    "punjabi": "pa",
+    "romanian": "ro",
+    "russian": "ru",
+    "sanskrit": "sa",
+    "serbian": "sr",
+    "shona": "sn",
+    "sindhi": "sd",
+    "sinhala": "si",
+    "slovak": "sk",
+    "slovenian": "sl",
+    "somali": "so",
+    "spanish": "es",
+    "sundanese": "su",
+    "swahili": "sw",
+    "swedish": "sv",
+    "tagalog": "tl",
+    "tajik": "tg",
+    "tamil": "ta",
+    "tatar": "tt",
+    "telugu": "te",
+    "thai": "th",
+    "tibetan": "bo",
+    "turkish": "tr",
+    "turkmen": "tk",
+    "ukrainian": "uk",
+    "urdu": "ur",
+    "uzbek": "uz",
+    "vietnamese": "vi",
+    "welsh": "cy",
+    "yiddish": "yi",
+    "yoruba": "yo",
+}
+
+_SILENCE_START_RE = re.compile(r"silence_start:\s*(-?[\d.]+)")
+_SILENCE_END_RE = re.compile(r"silence_end:\s*(-?[\d.]+)")
+
+
+def probe_duration(audio_path: Path) -> float:
+    """Get audio duration in seconds with ffprobe.
+
+    Raises:
+        TranscriptionError: If the duration cannot be determined
+    """
+    try:
+        result = subprocess.run(
+            [
+                "ffprobe",
+                "-v",
+                "error",
+                "-show_entries",
+                "format=duration",
+                "-of",
+                "default=noprint_wrappers=1:nokey=1",
+                str(audio_path),
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return float(result.stdout.strip())
+    except (subprocess.CalledProcessError, ValueError, FileNotFoundError) as e:
+        raise TranscriptionError(f"Failed to get audio duration for {audio_path.name}: {e}") from e
+
+
+def detect_silences(audio_path: Path) -> List[Tuple[float, float]]:
+    """Find silent stretches with ffmpeg's silencedetect filter.
+
+    Returns:
+        List of (start, end) silences in seconds; empty if detection fails
+    """
+    try:
+        result = subprocess.run(
+            [
+                "ffmpeg",
+                "-hide_banner",
+                "-nostats",
+                "-i",
+                str(audio_path),
+                "-vn",
+                "-af",
+                f"silencedetect=noise={SILENCE_NOISE_DB}dB:d={SILENCE_MIN_SECONDS}",
+                "-f",
+                "null",
+                "-",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        logger.warning("Silence detection failed, cutting at fixed intervals", error=str(e))
+        return []
+
+    starts = [float(m) for m in _SILENCE_START_RE.findall(result.stderr)]
+    ends = [float(m) for m in _SILENCE_END_RE.findall(result.stderr)]
+    return [(max(0.0, start), end) for start, end in zip(starts, ends)]
+
+
+def plan_upload_chunks(
+    duration: float,
+    silences: List[Tuple[float, float]],
+    chunk_seconds: float = CHUNK_SECONDS,
+    search_seconds: float = SILENCE_SEARCH_SECONDS,
+) -> List[Tuple[float, float]]:
+    """Choose piece boundaries, preferring the middle of a silence.
+
+    Each cut is placed at the midpoint of the silence closest to the target
+    position (``previous cut + chunk_seconds``) within ``search_seconds``;
+    when there is none, the piece is cut at the target position.
+
+    Args:
+        duration: Total audio duration in seconds
+        silences: Detected (start, end) silences in seconds
+        chunk_seconds: Target piece length in seconds
+        search_seconds: Maximum distance from the target to look for silence
+
+    Returns:
+        Contiguous (start, end) pieces covering the whole audio
+    """
+    midpoints = sorted((start + end) / 2 for start, end in silences)
+    pieces: List[Tuple[float, float]] = []
+    start = 0.0
+
+    while duration - start > chunk_seconds + search_seconds:
+        target = start + chunk_seconds
+        candidates = [m for m in midpoints if abs(m - target) <= search_seconds and m > start]
+        cut = min(candidates, key=lambda m: abs(m - target)) if candidates else target
+        pieces.append((start, cut))
+        start = cut
+
+    pieces.append((start, duration))
+    return pieces
+
+
+def encode_chunk(audio_path: Path, start: float, end: float, output_path: Path) -> Path:
+    """Extract [start, end) as compact mono Opus for upload.
+
+    Raises:
+        TranscriptionError: If ffmpeg fails
+    """
+    try:
+        subprocess.run(
+            [
+                "ffmpeg",
+                "-y",
+                "-ss",
+                f"{start:.3f}",
+                "-t",
+                f"{end - start:.3f}",
+                "-i",
+                str(audio_path),
+                "-vn",
+                "-ac",
+                "1",
+                "-ar",
+                "16000",
+                "-c:a",
+                "libopus",
+                "-b:a",
+                f"{CHUNK_BITRATE_KBPS}k",
+                str(output_path),
+            ],
+            capture_output=True,
+            check=True,
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        raise TranscriptionError(f"Failed to encode audio piece at {start:.1f}s: {e}") from e
+    return output_path
+
+
+def parse_verbose_segments(resp: Any, offset: float = 0.0) -> Tuple[List[Dict[str, Any]], str]:
+    """Extract segments and text from a ``verbose_json`` response.
+
+    Args:
+        resp: Response object or dict from ``audio.transcriptions.create``
+        offset: Seconds added to every timestamp (start of the uploaded piece)
+
+    Returns:
+        Tuple of (segments, text)
+    """
+    text = getattr(resp, "text", None) or (resp.get("text") if isinstance(resp, dict) else None)
+    segs_raw = getattr(resp, "segments", None) or (
+        resp.get("segments") if isinstance(resp, dict) else None
+    )
+
+    segments: List[Dict[str, Any]] = []
+    for s in segs_raw or []:
+        if not isinstance(s, dict):
+            s = s.model_dump() if hasattr(s, "model_dump") else vars(s)
+        start = s.get("start")
+        end = s.get("end")
+        txt = s.get("text", "")
+        # Handle timestamp format variations
+        if start is None or end is None:
+            ts = s.get("timestamp")
+            if isinstance(ts, (list, tuple)) and len(ts) == 2:
+                start, end = ts[0], ts[1]
+        if start is None:
+            start = 0.0
+        if end is None:
+            end = 0.0
+        segments.append({"start": float(start) + offset, "end": float(end) + offset, "text": txt})
+
+    return segments, text or ""
+
+
+def parse_verbose_language(resp: Any) -> Optional[str]:
+    """Extract the detected language from a ``verbose_json`` response.
+
+    Returns:
+        ISO language code (e.g. "en"), or None if the response has no
+        recognizable language
+    """
+    language = getattr(resp, "language", None)
+    if isinstance(resp, dict):
+        language = resp.get("language")
+    if not isinstance(language, str):
+        return None
+    language = language.strip().lower()
+    if language in WHISPER_LANGUAGE_CODES.values():
+        return language
+    return WHISPER_LANGUAGE_CODES.get(language)
+
+
+def should_chunk(audio_path: Path, chunk_seconds: float = CHUNK_SECONDS) -> bool:
+    """Decide whether a file should be uploaded as concurrent pieces.
+
+    True when the file exceeds the upload limit, or is long enough that
+    splitting it saves time. Unreadable files and probe failures return
+    False so the single-upload path reports the real error.
+    """
+    try:
+        if audio_path.stat().st_size > OPENAI_MAX_UPLOAD_BYTES:
+            return True
+        return probe_duration(audio_path) > chunk_seconds * 1.5
+    except (OSError, TranscriptionError):
+        return False
+
+
+def transcribe_chunked(
+    client: Any,
+    audio_path: Path,
+    model: str,
+    chunk_seconds: float = CHUNK_SECONDS,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    progress_callback: Optional[Any] = None,
+) -> Tuple[List[Dict[str, Any]], str, Optional[str]]:
+    """Transcribe a long file as concurrently uploaded Opus pieces.
+
+    The audio is split at silences into pieces of about ``chunk_seconds``
+    (capped so each stays under the API size limit), each piece is encoded
+    and uploaded by a bounded thread pool, and the ``verbose_json`` segments
+    are merged with their piece offsets added. The language is the one
+    detected in most pieces.
+
+    Args:
+        client: OpenAI client
+        audio_path: Source audio file
+        model: OpenAI transcription model
+        chunk_seconds: Target piece length in seconds
+        max_concurrency: Maximum pieces encoding/uploading at once
+        progress_callback: Optional callable receiving progress messages
+
+    Returns:
+        Tuple of (segments, text, language); language is None if no piece
+        reported one
+    """
+    # Keep every piece comfortably below the upload limit at the Opus bitrate
+    max_piece_seconds = OPENAI_MAX_UPLOAD_BYTES * 0.9 / (CHUNK_BITRATE_KBPS * 1000 / 8)
+    chunk_seconds = min(chunk_seconds, max_piece_seconds)
+
+    duration = probe_duration(audio_path)
+    pieces = plan_upload_chunks(duration, detect_silences(audio_path), chunk_seconds)
+
+    logger.info(
+        "Starting chunked OpenAI transcription",
+        duration=round(duration, 1),
+        pieces=len(pieces),
+        max_concurrency=max_concurrency,
+    )
+    if progress_callback:
+        progress_callback(f"Uploading {len(pieces)} pieces ({max_concurrency} at a time)")
+
+    def transcribe_piece(index: int, tmp_dir: Path) -> Any:
+        start, end = pieces[index]
+        piece_path = encode_chunk(audio_path, start, end, tmp_dir / f"piece_{index:03d}.ogg")
+        piece_start = time.time()
+        with open(piece_path, "rb") as f:
+            resp = client.audio.transcriptions.create(
+                model=model,
+                file=f,
+                response_format="verbose_json",
+            )
+        logger.debug(
+            "Transcribed piece",
+            index=index,
+            bytes=piece_path.stat().st_size,
+            seconds=round(time.time() - piece_start, 2),
+        )
+        return resp
+
+    responses: Dict[int, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="podx-openai-") as tmp:
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            futures = {
+                executor.submit(transcribe_piece, i, Path(tmp)): i for i in range(len(pieces))
+            }
+            for future in as_completed(futures):
+                responses[futures[future]] = future.result()
+                if progress_callback:
+                    progress_callback(f"Transcribed piece {len(responses)}/{len(pieces)}")
+
+    segments: List[Dict[str, Any]] = []
+    texts: List[str] = []
+    languages: Counter = Counter()
+    for index, (start, _) in enumerate(pieces):
+        piece_segments, piece_text = parse_verbose_segments(responses[index], offset=start)
+        segments.extend(piece_segments)
+        if piece_text.strip():
+            texts.append(piece_text.strip())
+        language = parse_verbose_language(responses[index])
+        if language:
+            languages[language] += 1
+
+    language = languages.most_common(1)[0][0] if languages else None
+    return segments, " ".join(texts), language
+
 
 class OpenAIProvider(ASRProvider):
     """ASR provider using OpenAI Whisper API.
 
     This provider uses OpenAI's cloud-based Whisper API for transcription.
     Requires OPENAI_API_KEY environment variable to be set.
+
+    Long files are split at silences into compact Opus pieces that are
+    uploaded concurrently. Tune with ``extra_options``: ``chunked``
+    (True/False, default auto), ``chunk_seconds`` and ``max_concurrency``.
     """
 
     @property
@@ -68,55 +486,52 @@ class OpenAIProvider(ASRProvider):
 
         self._report_progress(f"Using OpenAI API: {normalized_model}")
 
+        options = self.config.extra_options
+        chunk_seconds = float(options.get("chunk_seconds", CHUNK_SECONDS))
+        max_concurrency = int(options.get("max_concurrency", DEFAULT_MAX_CONCURRENCY))
+
         try:
             from openai import OpenAI
 
             client = OpenAI()
 
-            with open(str(audio_path), "rb") as f:
-                resp = client.audio.transcriptions.create(
-                    model=normalized_model,
-                    file=f,
-                    response_format="verbose_json",
-                )
-                text = getattr(resp, "text", None) or (
-                    resp.get("text") if isinstance(resp, dict) else None
-                )
-                segs_raw = getattr(resp, "segments", None) or (
-                    resp.get("segments") if isinstance(resp, dict) else None
-                )
+            chunked = options.get("chunked")
+            if chunked is None:
+                chunked = should_chunk(audio_path, chunk_seconds)
 
-            # Parse segments
-            segments: List[Dict[str, Any]] = []
-            if segs_raw:
-                for s in segs_raw:
-                    start = s.get("start")
-                    end = s.get("end")
-                    txt = s.get("text", "")
-                    # Handle timestamp format variations
-                    if start is None or end is None:
-                        ts = s.get("timestamp")
-                        if isinstance(ts, (list, tuple)) and len(ts) == 2:
-                            start, end = ts[0], ts[1]
-                    if start is None:
-                        start = 0.0
-                    if end is None:
-                        end = 0.0
-                    segments.append({"start": start, "end": end, "text": txt})
+            if chunked:
+                segments, text, language = transcribe_chunked(
+                    client,
+                    audio_path,
+                    normalized_model,
+                    chunk_seconds=chunk_seconds,
+                    max_concurrency=max_concurrency,
+                    progress_callback=self._report_progress,
+                )
+            else:
+                with open(str(audio_path), "rb") as f:
+                    resp = client.audio.transcriptions.create(
+                        model=normalized_model,
+                        file=f,
+                        response_format="verbose_json",
+                    )
+                segments, text = parse_verbose_segments(resp)
+                language = parse_verbose_language(resp)
 
             logger.info(
                 "OpenAI transcription completed",
                 segments_count=len(segments),
+                chunked=bool(chunked),
             )
 
             return TranscriptionResult(
                 audio_path=str(audio_path.resolve()),
-                language=self.config.language,  # OpenAI doesn't return detected language
+                language=language or self.config.language,
                 asr_model=normalized_model,
                 asr_provider=self.name,
                 segments=segments,
                 text=text or "",
-                decoder_options={},
+                decoder_options={"chunked": bool(chunked)} if chunked else {},
             )
 
         except ImportError as e:
@@ -5,10 +5,15 @@ with Cloudflare R2 storage for audio uploads and optional fallback
 to local processing on failure.
 """
 
+import asyncio
+import queue
+import threading
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
 
-from ...cloud import CloudConfig, CloudError, CloudStorage, RunPodClient
+from ...cloud import AsyncRunPodClient, CloudConfig, CloudError, CloudStorage, RunPodClient
+from ...cloud.runpod_client import transcription_payload
 from ...logging import get_logger
 from .base import ASRProvider, ProviderConfig, TranscriptionError, TranscriptionResult
 from .local_provider import LocalProvider
@@ -29,6 +34,24 @@ RUNPOD_MODEL_ALIASES: Dict[str, str] = {
     "tiny": "tiny",
 }
 
+# Batch submission limits
+DEFAULT_BATCH_UPLOADS = 4  # Concurrent R2 uploads
+DEFAULT_BATCH_JOBS_IN_FLIGHT = 32  # Cloud jobs submitted but not finished
+
+
+@dataclass
+class BatchTranscription:
+    """Outcome of one file in RunPodProvider.transcribe_batch."""
+
+    audio_path: Path
+    result: Optional[TranscriptionResult] = None
+    error: Optional[Exception] = None
+    used_fallback: bool = False
+
+    @property
+    def success(self) -> bool:
+        return self.result is not None
+
 
 class RunPodProvider(ASRProvider):
     """ASR provider using RunPod serverless GPUs.
@@ -189,9 +212,138 @@ class RunPodProvider(ASRProvider):
             return self._convert_result(result, audio_path)
 
         finally:
-            # Always clean up R2 upload
+            # Release R2 upload (kept for diarization/retries until retention expires)
             if r2_key:
-                self.storage.delete(r2_key)
+                self.storage.release(r2_key)
+
+    def transcribe_batch(
+        self,
+        audio_paths: Sequence[Path],
+        max_concurrent_uploads: int = DEFAULT_BATCH_UPLOADS,
+        max_jobs_in_flight: int = DEFAULT_BATCH_JOBS_IN_FLIGHT,
+    ) -> Iterator[BatchTranscription]:
+        """Transcribe many files on RunPod, yielding results as they complete.
+
+        Uploads run in parallel (``max_concurrent_uploads``) and each job is
+        submitted as soon as its upload finishes, keeping up to
+        ``max_jobs_in_flight`` cloud jobs running at once. All jobs are
+        polled by a single asyncio client on a background thread. Items that
+        fail in the cloud fall back to local transcription (when enabled) in
+        the caller's thread while the remaining cloud jobs keep running.
+
+        Args:
+            audio_paths: Audio files to transcribe
+            max_concurrent_uploads: Cap on simultaneous R2 uploads
+            max_jobs_in_flight: Cap on submitted, unfinished cloud jobs
+
+        Yields:
+            BatchTranscription per file, in completion order
+
+        Raises:
+            FileNotFoundError: If any audio file doesn't exist
+            TranscriptionError: If the batch itself cannot run
+        """
+        paths = [Path(p) for p in audio_paths]
+        for path in paths:
+            if not path.exists():
+                raise FileNotFoundError(f"Audio file not found: {path}")
+
+        logger.info(
+            "Starting RunPod batch transcription",
+            files=len(paths),
+            model=self.normalized_model,
+            max_concurrent_uploads=max_concurrent_uploads,
+            max_jobs_in_flight=max_jobs_in_flight,
+        )
+
+        # (audio_path, cloud output, error) per finished job; None ends the batch
+        finished: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        crashed: List[BaseException] = []
+
+        def run() -> None:
+            try:
+                asyncio.run(
+                    self._run_batch(paths, finished.put, max_concurrent_uploads, max_jobs_in_flight)
+                )
+            except BaseException as e:
+                crashed.append(e)
+            finally:
+                finished.put(None)
+
+        worker = threading.Thread(target=run, name="podx-runpod-batch", daemon=True)
+        worker.start()
+
+        done = 0
+        while True:
+            entry = finished.get()
+            if entry is None:
+                break
+            audio_path, output, error = entry
+            done += 1
+            if error is None:
+                item = BatchTranscription(
+                    audio_path, result=self._convert_result(output, audio_path)
+                )
+            else:
+                item = self._batch_fallback(audio_path, error)
+            self._report_progress(f"Batch: {done}/{len(paths)} complete")
+            yield item
+
+        worker.join()
+        if crashed:
+            raise TranscriptionError(f"Batch transcription failed: {crashed[0]}") from crashed[0]
+
+    async def _run_batch(
+        self,
+        audio_paths: Sequence[Path],
+        emit: Callable[[tuple], None],
+        max_concurrent_uploads: int,
+        max_jobs_in_flight: int,
+    ) -> None:
+        """Upload, submit and await every file on one event loop."""
+        uploads = asyncio.Semaphore(max(1, max_concurrent_uploads))
+        jobs = asyncio.Semaphore(max(1, max_jobs_in_flight))
+        language = self.config.language if self.config.language != "en" else "auto"
+
+        async with AsyncRunPodClient(self.cloud_config) as runpod:
+
+            async def transcribe_one(audio_path: Path) -> None:
+                async with jobs:
+                    try:
+                        async with uploads:
+                            audio_url, r2_key = await asyncio.to_thread(
+                                self.storage.upload_and_presign, audio_path
+                            )
+                        try:
+                            job_id = await runpod.submit(
+                                transcription_payload(audio_url, self.normalized_model, language)
+                            )
+                            output = await runpod.wait(job_id)
+                        finally:
+                            await asyncio.to_thread(self.storage.release, r2_key)
+                    except Exception as e:
+                        logger.warning(
+                            "Batch item failed in cloud", audio=str(audio_path), error=str(e)
+                        )
+                        emit((audio_path, None, e))
+                    else:
+                        emit((audio_path, output, None))
+
+            await asyncio.gather(*(transcribe_one(p) for p in audio_paths))
+
+    def _batch_fallback(self, audio_path: Path, error: Exception) -> BatchTranscription:
+        """Transcribe a failed batch item locally when fallback applies."""
+        if isinstance(error, CloudError) and not error.recoverable:
+            return BatchTranscription(audio_path, error=error)
+        if self.fallback_provider is None:
+            return BatchTranscription(audio_path, error=error)
+
+        self._report_progress(f"Cloud failed for {audio_path.name}, transcribing locally...")
+        try:
+            result = self.fallback_provider.transcribe(audio_path)
+        except Exception as e:
+            return BatchTranscription(audio_path, error=e)
+        return BatchTranscription(audio_path, result=result, used_fallback=True)
 
     def _convert_result(
         self, cloud_result: Dict[str, Any], audio_path: Path
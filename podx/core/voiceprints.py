@@ -0,0 +1,274 @@
+"""Cross-episode speaker voiceprints.
+
+Diarization labels speakers anonymously (SPEAKER_00, ...). This module keeps
+the per-speaker embeddings diarization already computes, enrolls them under
+the names confirmed in speaker-map.json, and matches new episodes of the same
+show against them so recurring speakers are labeled without prompting.
+
+Each show gets one small JSON store in ~/.podx/voiceprints/ holding a running
+mean embedding per known speaker.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ..logging import get_logger
+from .speakers import GENERIC_SPEAKER_PATTERN
+
+logger = get_logger(__name__)
+
+SPEAKER_EMBEDDINGS_FILENAME = "speaker-embeddings.json"
+DEFAULT_VOICEPRINT_DIR = Path.home() / ".podx" / "voiceprints"
+DEFAULT_MATCH_THRESHOLD = 0.4  # Max cosine distance, same scale as chunk matching
+
+
+def save_speaker_embeddings(episode_dir: Path, embeddings: Dict[str, np.ndarray]) -> Path:
+    """Save per-speaker diarization embeddings to speaker-embeddings.json.
+
+    Args:
+        episode_dir: Episode directory
+        embeddings: Mapping of SPEAKER_XX -> embedding vector
+
+    Returns:
+        Path to saved file
+    """
+    path = episode_dir / SPEAKER_EMBEDDINGS_FILENAME
+    data = {spk: np.asarray(emb, dtype=float).tolist() for spk, emb in embeddings.items()}
+    path.write_text(json.dumps(data), encoding="utf-8")
+    logger.info("Saved speaker embeddings", path=str(path), speakers=len(data))
+    return path
+
+
+def load_speaker_embeddings(episode_dir: Path) -> Optional[Dict[str, np.ndarray]]:
+    """Load per-speaker embeddings from speaker-embeddings.json if it exists.
+
+    Args:
+        episode_dir: Episode directory
+
+    Returns:
+        Mapping of SPEAKER_XX -> embedding vector, or None if unavailable
+    """
+    path = episode_dir / SPEAKER_EMBEDDINGS_FILENAME
+    if not path.exists():
+        return None
+
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return {spk: np.asarray(emb, dtype=float) for spk, emb in data.items()}
+    except (json.JSONDecodeError, OSError, AttributeError, ValueError) as e:
+        logger.warning("Failed to load speaker embeddings", path=str(path), error=str(e))
+        return None
+
+
+def _normalize(vector: np.ndarray) -> np.ndarray:
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
+def _show_filename(show: str) -> str:
+    """Convert show name to a safe store filename."""
+    safe = re.sub(r"[^\w\s-]", "", show)
+    safe = re.sub(r"[-\s]+", "_", safe).strip("_")
+    return f"{safe.lower() or 'unknown'}.json"
+
+
+class VoiceprintStore:
+    """Known-speaker embeddings for one show.
+
+    Stores a normalized running-mean embedding per speaker name, so repeated
+    enrollment across episodes sharpens the voiceprint without storing every
+    embedding. Each speaker also lists the episodes folded in, so saving the
+    same episode's map again does not count it twice.
+    """
+
+    def __init__(self, show: str, store_dir: Optional[Path] = None):
+        self.show = show
+        self.path = (store_dir or DEFAULT_VOICEPRINT_DIR) / _show_filename(show)
+        self.speakers: Dict[str, Dict] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self.speakers = data.get("speakers", {})
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning("Failed to load voiceprints", path=str(self.path), error=str(e))
+
+    def save(self) -> Path:
+        """Write the store to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"show": self.show, "speakers": self.speakers}
+        self.path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        return self.path
+
+    def enroll(self, name: str, embedding: np.ndarray, episode: Optional[str] = None) -> bool:
+        """Fold an embedding into a speaker's voiceprint.
+
+        Args:
+            name: Speaker name
+            embedding: Embedding vector from one episode
+            episode: Episode identifier; an episode already enrolled for this
+                speaker is skipped
+
+        Returns:
+            True if the voiceprint was updated
+        """
+        vector = _normalize(np.asarray(embedding, dtype=float))
+        entry = self.speakers.get(name)
+        episode_ids = [episode] if episode else []
+        if entry is None:
+            self.speakers[name] = {
+                "embedding": vector.tolist(),
+                "episodes": 1,
+                "episode_ids": episode_ids,
+            }
+            return True
+
+        enrolled = entry.get("episode_ids", [])
+        if episode and episode in enrolled:
+            return False
+
+        count = entry["episodes"]
+        mean = (np.asarray(entry["embedding"]) * count + vector) / (count + 1)
+        self.speakers[name] = {
+            "embedding": _normalize(mean).tolist(),
+            "episodes": count + 1,
+            "episode_ids": enrolled + episode_ids,
+        }
+        return True
+
+    def match(
+        self,
+        embeddings: Dict[str, np.ndarray],
+        threshold: float = DEFAULT_MATCH_THRESHOLD,
+    ) -> Dict[str, str]:
+        """Label episode speakers with known names by nearest neighbour.
+
+        All distances are computed in one matrix product; pairs are then taken
+        closest-first so each known name labels at most one episode speaker.
+
+        Args:
+            embeddings: Mapping of SPEAKER_XX -> embedding vector
+            threshold: Maximum cosine distance to accept a match
+
+        Returns:
+            Mapping of SPEAKER_XX -> name for matched speakers only
+        """
+        if not embeddings or not self.speakers:
+            return {}
+
+        names = list(self.speakers)
+        speaker_ids = list(embeddings)
+        known = np.stack([np.asarray(self.speakers[n]["embedding"]) for n in names])
+        current = np.stack(
+            [_normalize(np.asarray(embeddings[spk], dtype=float)) for spk in speaker_ids]
+        )
+        distances = 1.0 - current @ known.T
+
+        mapping: Dict[str, str] = {}
+        used_names: set = set()
+        for flat in np.argsort(distances, axis=None):
+            row, col = np.unravel_index(flat, distances.shape)
+            if distances[row, col] >= threshold:
+                break
+            speaker_id, name = speaker_ids[row], names[col]
+            if speaker_id in mapping or name in used_names:
+                continue
+            mapping[speaker_id] = name
+            used_names.add(name)
+            logger.debug(
+                "Voiceprint matched",
+                speaker=speaker_id,
+                name=name,
+                distance=f"{distances[row, col]:.3f}",
+            )
+        return mapping
+
+
+def _episode_show(episode_dir: Path) -> Optional[str]:
+    meta_path = episode_dir / "episode-meta.json"
+    if not meta_path.exists():
+        return None
+    try:
+        return json.loads(meta_path.read_text(encoding="utf-8")).get("show") or None
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def enroll_episode_speakers(
+    episode_dir: Path,
+    speaker_map: Dict[str, str],
+    store_dir: Optional[Path] = None,
+) -> List[str]:
+    """Add an episode's named speakers to its show's voiceprint store.
+
+    Speakers already enrolled from this episode (keyed by its directory
+    name) are skipped, so re-saving a speaker map is safe.
+
+    Args:
+        episode_dir: Episode directory with speaker-embeddings.json
+        speaker_map: Confirmed mapping of SPEAKER_XX -> real name
+        store_dir: Voiceprint directory (default: ~/.podx/voiceprints)
+
+    Returns:
+        Names newly enrolled (empty if the episode has no embeddings or show)
+    """
+    embeddings = load_speaker_embeddings(episode_dir)
+    if not embeddings:
+        return []
+    show = _episode_show(episode_dir)
+    if not show:
+        return []
+
+    store = VoiceprintStore(show, store_dir)
+    enrolled = []
+    for speaker_id, name in speaker_map.items():
+        name = name.strip()
+        if speaker_id not in embeddings or not name or GENERIC_SPEAKER_PATTERN.match(name):
+            continue
+        if store.enroll(name, embeddings[speaker_id], episode=episode_dir.name):
+            enrolled.append(name)
+
+    if enrolled:
+        store.save()
+        logger.info("Enrolled voiceprints", show=show, speakers=len(enrolled))
+    return enrolled
+
+
+def identify_known_speakers(
+    episode_dir: Path,
+    threshold: float = DEFAULT_MATCH_THRESHOLD,
+    store_dir: Optional[Path] = None,
+) -> Dict[str, str]:
+    """Match an episode's speakers against its show's voiceprint store.
+
+    Args:
+        episode_dir: Episode directory with speaker-embeddings.json
+        threshold: Maximum cosine distance to accept a match
+        store_dir: Voiceprint directory (default: ~/.podx/voiceprints)
+
+    Returns:
+        Mapping of SPEAKER_XX -> name for recognized speakers (may be partial)
+    """
+    embeddings = load_speaker_embeddings(episode_dir)
+    if not embeddings:
+        return {}
+    show = _episode_show(episode_dir)
+    if not show:
+        return {}
+
+    mapping = VoiceprintStore(show, store_dir).match(embeddings, threshold)
+    if mapping:
+        logger.info(
+            "Identified known speakers",
+            show=show,
+            matched=len(mapping),
+            speakers=len(embeddings),
+        )
+    return mapping
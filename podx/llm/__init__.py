@@ -25,7 +25,8 @@ from .base import (
     LLMRateLimitError,
     LLMResponse,
 )
-from .factory import get_provider, register_provider
+from .cache import CachedLLMProvider, LLMResponseCache
+from .factory import get_provider, get_provider_name, register_provider
 from .mock import MockLLMProvider
 from .openai_provider import OpenAIProvider
 
@@ -39,8 +40,12 @@ __all__ = [
     "LLMAuthenticationError",
     "LLMRateLimitError",
     "LLMAPIError",
+    # Response cache
+    "CachedLLMProvider",
+    "LLMResponseCache",
     # Factory
     "get_provider",
+    "get_provider_name",
     "register_provider",
     # Providers
     "OpenAIProvider",
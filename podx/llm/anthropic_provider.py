@@ -1,7 +1,7 @@
 """Anthropic LLM provider implementation."""
 
 import os
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from ..logging import get_logger
 from .base import (
@@ -16,12 +16,21 @@ from .base import (
 
 logger = get_logger(__name__)
 
+MAX_CACHE_BREAKPOINTS = 4  # Messages API limit on cache_control blocks per request
+
+
+def _token_count(usage: Any, field: str) -> int:
+    """Optional usage counter (absent from older SDKs and uncached requests)."""
+    value = getattr(usage, field, None)
+    return value if isinstance(value, int) else 0
+
 
 class AnthropicProvider(LLMProvider):
     """Anthropic API provider for Claude models.
 
     Supports Claude 3 (Opus, Sonnet, Haiku) and Claude 2.x models.
-    Uses the official Anthropic Python library.
+    Uses the official Anthropic Python library. Messages marked ``cache=True``
+    become prompt-cache breakpoints.
     """
 
     def __init__(
@@ -89,16 +98,6 @@ class AnthropicProvider(LLMProvider):
             LLMRateLimitError: If rate limit exceeded
             LLMAPIError: If API returns an error
         """
-        # Extract system message if present
-        system_message = None
-        chat_messages = []
-
-        for msg in messages:
-            if msg.role == "system":
-                system_message = msg.content
-            else:
-                chat_messages.append(msg.to_dict())
-
         # Claude requires max_tokens — 16384 allows full analysis + JSON output
         if max_tokens is None:
             max_tokens = 16384
@@ -106,37 +105,15 @@ class AnthropicProvider(LLMProvider):
         try:
             create_kwargs = {
                 "model": model,
-                "messages": chat_messages,
                 "temperature": temperature,
                 "max_tokens": max_tokens,
+                **self._build_messages(messages),
                 **kwargs,
             }
 
-            if system_message:
-                create_kwargs["system"] = system_message
-
             response = self._sync_client.messages.create(**create_kwargs)
 
-            # Extract text content from response
-            content = ""
-            for block in response.content:
-                if hasattr(block, "text"):
-                    content += block.text
-
-            return LLMResponse(
-                content=content,
-                model=response.model,
-                usage=(
-                    {
-                        "prompt_tokens": response.usage.input_tokens,
-                        "completion_tokens": response.usage.output_tokens,
-                        "total_tokens": response.usage.input_tokens + response.usage.output_tokens,
-                    }
-                    if response.usage
-                    else None
-                ),
-                raw_response=response,
-            )
+            return self._parse_response(response)
 
         except Exception as e:
             return self._handle_error(e)
@@ -166,16 +143,6 @@ class AnthropicProvider(LLMProvider):
             LLMRateLimitError: If rate limit exceeded
             LLMAPIError: If API returns an error
         """
-        # Extract system message if present
-        system_message = None
-        chat_messages = []
-
-        for msg in messages:
-            if msg.role == "system":
-                system_message = msg.content
-            else:
-                chat_messages.append(msg.to_dict())
-
         # Claude requires max_tokens — 16384 allows full analysis + JSON output
         if max_tokens is None:
             max_tokens = 16384
@@ -183,41 +150,85 @@ class AnthropicProvider(LLMProvider):
         try:
             create_kwargs = {
                 "model": model,
-                "messages": chat_messages,
                 "temperature": temperature,
                 "max_tokens": max_tokens,
+                **self._build_messages(messages),
                 **kwargs,
             }
 
-            if system_message:
-                create_kwargs["system"] = system_message
-
             response = await self._async_client.messages.create(**create_kwargs)
 
-            # Extract text content from response
-            content = ""
-            for block in response.content:
-                if hasattr(block, "text"):
-                    content += block.text
-
-            return LLMResponse(
-                content=content,
-                model=response.model,
-                usage=(
-                    {
-                        "prompt_tokens": response.usage.input_tokens,
-                        "completion_tokens": response.usage.output_tokens,
-                        "total_tokens": response.usage.input_tokens + response.usage.output_tokens,
-                    }
-                    if response.usage
-                    else None
-                ),
-                raw_response=response,
-            )
+            return self._parse_response(response)
 
         except Exception as e:
             return self._handle_error(e)
 
+    def _build_messages(self, messages: List[LLMMessage]) -> Dict[str, Any]:
+        """Convert messages to ``system``/``messages`` request fields.
+
+        Messages marked ``cache=True`` end a cacheable prefix and get a
+        ``cache_control`` breakpoint (at most MAX_CACHE_BREAKPOINTS, the last
+        ones win). Consecutive messages with the same role are merged into one
+        turn of several text blocks, so a cached transcript and the question
+        after it can be sent as separate messages.
+        """
+        breakpoints = [i for i, msg in enumerate(messages) if msg.cache][-MAX_CACHE_BREAKPOINTS:]
+        system_blocks: List[Dict[str, Any]] = []
+        chat_messages: List[Dict[str, Any]] = []
+
+        for i, msg in enumerate(messages):
+            block: Dict[str, Any] = {"type": "text", "text": msg.content}
+            if i in breakpoints:
+                block["cache_control"] = {"type": "ephemeral"}
+            if msg.role == "system":
+                system_blocks.append(block)
+            elif chat_messages and chat_messages[-1]["role"] == msg.role:
+                chat_messages[-1]["content"].append(block)
+            else:
+                chat_messages.append({"role": msg.role, "content": [block]})
+
+        # Plain strings unless a breakpoint needs block form
+        for chat_message in chat_messages:
+            blocks = chat_message["content"]
+            if len(blocks) == 1 and "cache_control" not in blocks[0]:
+                chat_message["content"] = blocks[0]["text"]
+
+        request: Dict[str, Any] = {"messages": chat_messages}
+        if any("cache_control" in block for block in system_blocks):
+            request["system"] = system_blocks
+        elif system_blocks:
+            request["system"] = "\n\n".join(block["text"] for block in system_blocks)
+        return request
+
+    def _parse_response(self, response: Any) -> LLMResponse:
+        """Convert a Messages API response, counting cached prompt tokens."""
+        # Extract text content from response
+        content = ""
+        for block in response.content:
+            if hasattr(block, "text"):
+                content += block.text
+
+        usage = None
+        if response.usage:
+            # input_tokens excludes prompt tokens read from or written to the cache
+            cache_read = _token_count(response.usage, "cache_read_input_tokens")
+            cache_write = _token_count(response.usage, "cache_creation_input_tokens")
+            prompt_tokens = response.usage.input_tokens + cache_read + cache_write
+            usage = {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": response.usage.output_tokens,
+                "total_tokens": prompt_tokens + response.usage.output_tokens,
+                "cached_tokens": cache_read,
+                "cache_creation_tokens": cache_write,
+            }
+
+        return LLMResponse(
+            content=content,
+            model=response.model,
+            usage=usage,
+            raw_response=response,
+        )
+
     def supports_streaming(self) -> bool:
         """Check if provider supports streaming responses."""
         return True
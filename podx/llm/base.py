@@ -12,24 +12,28 @@ class LLMMessage:
     Attributes:
         role: Message role (system, user, assistant)
         content: Message content/text
+        cache: Cache hint - the conversation up to and including this message
+            is a prefix shared with other requests (providers with prompt
+            caching place a cache breakpoint here; others ignore it)
     """
 
     role: str
     content: str
+    cache: bool = False
 
     def to_dict(self) -> Dict[str, str]:
         """Convert to dictionary format for API calls."""
         return {"role": self.role, "content": self.content}
 
     @classmethod
-    def system(cls, content: str) -> "LLMMessage":
+    def system(cls, content: str, cache: bool = False) -> "LLMMessage":
         """Create a system message."""
-        return cls(role="system", content=content)
+        return cls(role="system", content=content, cache=cache)
 
     @classmethod
-    def user(cls, content: str) -> "LLMMessage":
+    def user(cls, content: str, cache: bool = False) -> "LLMMessage":
         """Create a user message."""
-        return cls(role="user", content=content)
+        return cls(role="user", content=content, cache=cache)
 
     @classmethod
     def assistant(cls, content: str) -> "LLMMessage":
@@ -44,7 +48,9 @@ class LLMResponse:
     Attributes:
         content: Generated text content
         model: Model that generated the response
-        usage: Token usage information (if available)
+        usage: Token usage information (if available): prompt_tokens,
+            completion_tokens, total_tokens and, from providers with prompt
+            caching, cached_tokens (prompt tokens read from the cache)
         raw_response: Raw provider-specific response object
     """
 
@@ -59,6 +65,9 @@ class LLMProvider(ABC):
 
     All LLM providers must implement this interface to ensure
     consistent behavior across different backends.
+
+    Callers that repeat a long prompt prefix (system prompt, transcript) put it
+    first and mark its last message with ``cache=True``; see :class:`LLMMessage`.
     """
 
     def __init__(
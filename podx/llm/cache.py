@@ -0,0 +1,293 @@
+"""On-disk LLM response cache.
+
+Responses are keyed by a SHA-256 of everything that determines them
+(provider, model, messages, temperature, max_tokens and extra parameters),
+so re-running a step on unchanged input is answered locally without tokens.
+
+Entries live in one SQLite database (``~/.podx/cache/llm-responses.sqlite3``)
+and are evicted least-recently-used first once their total size exceeds
+``max_mb`` (``PODX_LLM_CACHE_MAX_MB``).
+
+Usage:
+    from podx.llm import get_provider
+    from podx.llm.cache import CachedLLMProvider
+
+    provider = CachedLLMProvider(get_provider("openai"))
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..config import get_config
+from ..logging import get_logger
+from .base import LLMMessage, LLMProvider, LLMResponse
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".podx" / "cache" / "llm-responses.sqlite3"
+
+
+def cache_key(
+    provider: str,
+    model: str,
+    messages: List[LLMMessage],
+    temperature: float,
+    max_tokens: Optional[int] = None,
+    **kwargs: Any,
+) -> str:
+    """Hash the inputs that determine an LLM response."""
+    payload = {
+        "provider": provider,
+        "model": model,
+        "messages": [msg.to_dict() for msg in messages],
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "kwargs": kwargs,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """SQLite-backed response store with size-based LRU eviction.
+
+    Safe to share between threads; each process opens its own connection and
+    SQLite serializes writers, so concurrent podx processes can share the file.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_mb: Optional[float] = None):
+        """Initialize the cache.
+
+        Args:
+            path: Database file (default: ~/.podx/cache/llm-responses.sqlite3)
+            max_mb: Size limit for stored responses (default: PODX_LLM_CACHE_MAX_MB)
+        """
+        self.path = path or DEFAULT_CACHE_PATH
+        self._max_mb = max_mb
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_mb(self) -> float:
+        if self._max_mb is not None:
+            return self._max_mb
+        return get_config().llm_cache_max_mb
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " content TEXT NOT NULL,"
+                " model TEXT NOT NULL,"
+                " usage TEXT,"
+                " size INTEGER NOT NULL,"
+                " last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses (last_used)")
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """Look up a cached response (and mark it recently used)."""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT content, model, usage FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            with conn:
+                conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+        content, model, usage = row
+        return LLMResponse(content=content, model=model, usage=json.loads(usage) if usage else None)
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """Store a response, evicting least recently used entries over the size limit."""
+        if not isinstance(response.content, str):
+            return
+        size = len(response.content.encode("utf-8"))
+        usage = json.dumps(response.usage) if isinstance(response.usage, dict) else None
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, response.content, str(response.model), usage, size, time.time()),
+                )
+                self._evict(conn, keep=key)
+
+    def _evict(self, conn: sqlite3.Connection, keep: str) -> None:
+        max_bytes = int(self.max_mb * 1024 * 1024)
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= max_bytes:
+            return
+        rows = conn.execute(
+            "SELECT key, size FROM responses WHERE key != ? ORDER BY last_used", (keep,)
+        )
+        evicted = []
+        for key, size in rows:
+            if total <= max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        self.evictions += len(evicted)
+        logger.debug("Evicted LLM cache entries", count=len(evicted))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the stored size."""
+        with self._lock:
+            conn = self._connect()
+            count, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "entries": count,
+                "size_mb": round(size / (1024 * 1024), 2),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        """Delete every cached response and reset the counters."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM responses")
+            self.hits = self.misses = self.evictions = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_default_cache: Optional[LLMResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> LLMResponseCache:
+    """Process-wide cache at the default path, so counters cover every caller."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None or _default_cache.path != DEFAULT_CACHE_PATH:
+            _default_cache = LLMResponseCache()
+        return _default_cache
+
+
+class CachedLLMProvider(LLMProvider):
+    """Wrap any provider so identical requests are answered from the cache.
+
+    Cache hits return the stored content with ``usage`` of zero tokens; only
+    successful responses are stored.
+    """
+
+    def __init__(self, provider: LLMProvider, cache: Optional[LLMResponseCache] = None):
+        """Initialize the wrapper.
+
+        Args:
+            provider: Provider that handles cache misses
+            cache: Response cache (default: the process-wide cache)
+        """
+        self.provider = provider
+        self.cache = cache or get_response_cache()
+
+    def _key(
+        self,
+        messages: List[LLMMessage],
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int],
+        kwargs: Dict[str, Any],
+    ) -> str:
+        provider_id = type(self.provider).__name__
+        base_url = getattr(self.provider, "base_url", None)
+        if isinstance(base_url, str) and base_url:
+            provider_id += f"@{base_url}"
+        return cache_key(provider_id, model, messages, temperature, max_tokens, **kwargs)
+
+    def _cached(self, key: str) -> Optional[LLMResponse]:
+        try:
+            response = self.cache.get(key)
+        except sqlite3.Error as e:
+            logger.warning("LLM cache lookup failed", error=str(e))
+            return None
+        if response is not None:
+            response.usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        return response
+
+    def _store(self, key: str, response: LLMResponse) -> None:
+        try:
+            self.cache.put(key, response)
+        except sqlite3.Error as e:
+            logger.warning("LLM cache write failed", error=str(e))
+
+    def complete(
+        self,
+        messages: List[LLMMessage],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Return a cached response or call the wrapped provider."""
+        key = self._key(messages, model, temperature, max_tokens, kwargs)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        response = self.provider.complete(
+            messages=messages,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        self._store(key, response)
+        return response
+
+    async def complete_async(
+        self,
+        messages: List[LLMMessage],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Return a cached response or call the wrapped provider (asynchronous)."""
+        key = self._key(messages, model, temperature, max_tokens, kwargs)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        response = await self.provider.complete_async(
+            messages=messages,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        self._store(key, response)
+        return response
+
+    def supports_streaming(self) -> bool:
+        return self.provider.supports_streaming()
+
+    def get_available_models(self) -> List[str]:
+        return self.provider.get_available_models()
@@ -74,6 +74,24 @@ def get_provider(
         raise LLMProviderError(f"Failed to initialize provider '{name}': {e}") from e
 
 
+def get_provider_name(provider: LLMProvider) -> str:
+    """Registered name of a provider instance (e.g. ``OpenAIProvider`` -> "openai").
+
+    Wrappers such as ``CachedLLMProvider`` report the provider they wrap.
+    Unregistered classes fall back to the lowercased class name without a
+    ``Provider`` suffix.
+    """
+    while hasattr(provider, "provider") and isinstance(provider.provider, LLMProvider):
+        provider = provider.provider
+    for name, provider_class in _PROVIDER_REGISTRY.items():
+        if type(provider) is provider_class:
+            return name
+    class_name = type(provider).__name__
+    if class_name.endswith("Provider"):
+        class_name = class_name[: -len("Provider")]
+    return class_name.lower()
+
+
 def _get_api_key_for_provider(name: str) -> Optional[str]:
     """Get API key from environment variables for a provider.
 
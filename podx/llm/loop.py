@@ -0,0 +1,43 @@
+"""Process-wide event loop for async LLM calls from synchronous code.
+
+``asyncio.run`` creates and closes a loop per call, but async provider clients
+(httpx connection pools) stay bound to the loop they first ran on; reusing them
+from the next loop fails with "Event loop is closed". Running every call on
+one long-lived loop thread keeps the pools valid across engines and episodes.
+"""
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_thread: Optional[threading.Thread] = None
+_lock = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _thread
+    with _lock:
+        if _loop is None or _thread is None or not _thread.is_alive():
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(target=_loop.run_forever, name="podx-llm-loop", daemon=True)
+            _thread.start()
+        return _loop
+
+
+def run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the shared LLM loop and block until it finishes.
+
+    Safe to call from any thread, including from inside another running loop
+    (the caller's thread blocks, not the shared loop).
+
+    Raises:
+        RuntimeError: If called from a coroutine already on the shared loop
+    """
+    loop = _get_loop()
+    if threading.current_thread() is _thread:
+        coro.close()
+        raise RuntimeError("run_coroutine() called from the shared LLM loop; await instead")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
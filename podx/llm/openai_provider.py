@@ -1,7 +1,9 @@
 """OpenAI LLM provider implementation."""
 
+import hashlib
+import json
 import os
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from ..logging import get_logger
 from .base import (
@@ -21,7 +23,8 @@ class OpenAIProvider(LLMProvider):
     """OpenAI API provider for GPT models.
 
     Supports GPT-4, GPT-3.5, and other OpenAI models.
-    Uses the official OpenAI Python library.
+    Uses the official OpenAI Python library. Prompt prefixes are cached by the
+    API automatically; messages marked ``cache=True`` set a prompt cache key.
     """
 
     def __init__(
@@ -100,6 +103,7 @@ class OpenAIProvider(LLMProvider):
                 "model": model,
                 "messages": [msg.to_dict() for msg in messages],
                 "temperature": temperature,
+                **self._cache_params(messages),
                 **kwargs,
             }
             if max_tokens is not None:
@@ -110,15 +114,7 @@ class OpenAIProvider(LLMProvider):
             return LLMResponse(
                 content=response.choices[0].message.content or "",
                 model=response.model,
-                usage=(
-                    {
-                        "prompt_tokens": response.usage.prompt_tokens,
-                        "completion_tokens": response.usage.completion_tokens,
-                        "total_tokens": response.usage.total_tokens,
-                    }
-                    if response.usage
-                    else None
-                ),
+                usage=self._usage(response),
                 raw_response=response,
             )
 
@@ -156,6 +152,7 @@ class OpenAIProvider(LLMProvider):
                 "model": model,
                 "messages": [msg.to_dict() for msg in messages],
                 "temperature": temperature,
+                **self._cache_params(messages),
                 **kwargs,
             }
             if max_tokens is not None:
@@ -166,21 +163,43 @@ class OpenAIProvider(LLMProvider):
             return LLMResponse(
                 content=response.choices[0].message.content or "",
                 model=response.model,
-                usage=(
-                    {
-                        "prompt_tokens": response.usage.prompt_tokens,
-                        "completion_tokens": response.usage.completion_tokens,
-                        "total_tokens": response.usage.total_tokens,
-                    }
-                    if response.usage
-                    else None
-                ),
+                usage=self._usage(response),
                 raw_response=response,
             )
 
         except Exception as e:
             return self._handle_error(e)
 
+    def _cache_params(self, messages: List[LLMMessage]) -> Dict[str, Any]:
+        """Route requests sharing a cached prefix together.
+
+        OpenAI caches prompt prefixes automatically; ``prompt_cache_key`` (a
+        hash of the messages up to the last one marked ``cache=True``) keeps
+        requests with the same prefix on the same cache. Only sent to the
+        official API, since compatible servers may reject the parameter.
+        """
+        if self.base_url:
+            return {}
+        ends = [i for i, msg in enumerate(messages) if msg.cache]
+        if not ends:
+            return {}
+        prefix = json.dumps([msg.to_dict() for msg in messages[: ends[-1] + 1]])
+        return {"prompt_cache_key": hashlib.sha256(prefix.encode("utf-8")).hexdigest()[:32]}
+
+    @staticmethod
+    def _usage(response: Any) -> Optional[Dict[str, int]]:
+        """Token usage, including prompt tokens served from the prompt cache."""
+        if not response.usage:
+            return None
+        details = getattr(response.usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", None)
+        return {
+            "prompt_tokens": response.usage.prompt_tokens,
+            "completion_tokens": response.usage.completion_tokens,
+            "total_tokens": response.usage.total_tokens,
+            "cached_tokens": cached if isinstance(cached, int) else 0,
+        }
+
     def supports_streaming(self) -> bool:
         """Check if provider supports streaming responses."""
         return True
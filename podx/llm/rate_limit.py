@@ -0,0 +1,144 @@
+"""Process-wide LLM rate limiting.
+
+One :class:`RateLimiter` per (provider, model) is shared by every engine in the
+process, so parallel episodes (``podx backfill``, ``BatchProcessor``) draw on
+one requests-per-minute and tokens-per-minute budget instead of each engine
+hammering the provider until it answers 429. Limits come from ``PodxConfig``
+(``PODX_LLM_REQUESTS_PER_MINUTE``, ``PODX_LLM_TOKENS_PER_MINUTE``; 0 disables a
+limit).
+
+The limiter is usable from threads and from any event loop: state is guarded
+by a thread lock and callers wait with ``time.sleep`` or ``asyncio.sleep``.
+
+Usage:
+    limiter = get_rate_limiter("openai", "gpt-4.1")
+    reservation = await limiter.acquire(estimated_tokens)
+    response = await provider.complete_async(...)
+    limiter.settle(reservation, response.usage["total_tokens"])
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from ..config import get_config
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+WINDOW_SECONDS = 60.0
+UTILIZATION = 0.95  # Stay just under the configured quota
+MIN_WAIT_SECONDS = 0.05
+
+
+class RateLimiter:
+    """Sliding-window limiter for requests and tokens per minute."""
+
+    def __init__(
+        self,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Request quota (0 = unlimited)
+            tokens_per_minute: Token quota, prompt plus completion (0 = unlimited)
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.requests_per_minute = int(requests_per_minute * UTILIZATION)
+        self.tokens_per_minute = int(tokens_per_minute * UTILIZATION)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # [timestamp, tokens] per request in the window; lists so settle() can correct tokens
+        self._window: Deque[List[float]] = deque()
+        self._paused_until = 0.0
+        self.waits = 0
+
+    def _prune(self, now: float) -> None:
+        while self._window and now - self._window[0][0] >= WINDOW_SECONDS:
+            self._window.popleft()
+
+    def _reserve(self, tokens: int) -> Tuple[Optional[List[float]], float]:
+        """Reserve capacity now, or return how long to wait before trying again."""
+        with self._lock:
+            now = self._clock()
+            if now < self._paused_until:
+                return None, self._paused_until - now
+            self._prune(now)
+
+            if self.requests_per_minute and len(self._window) >= self.requests_per_minute:
+                return None, self._window[0][0] + WINDOW_SECONDS - now
+
+            if self.tokens_per_minute and self._window:
+                used = sum(entry[1] for entry in self._window)
+                if used + tokens > self.tokens_per_minute:
+                    # Wait until enough of the window expires (an oversized
+                    # request goes alone once the window is empty)
+                    excess = used + tokens - self.tokens_per_minute
+                    for timestamp, entry_tokens in self._window:
+                        excess -= entry_tokens
+                        if excess <= 0:
+                            return None, timestamp + WINDOW_SECONDS - now
+                    return None, self._window[-1][0] + WINDOW_SECONDS - now
+
+            entry = [now, float(tokens)]
+            self._window.append(entry)
+            return entry, 0.0
+
+    async def acquire(self, tokens: int = 0) -> List[float]:
+        """Wait (asynchronously) until a request of ``tokens`` fits the quota."""
+        while True:
+            reservation, wait = self._reserve(tokens)
+            if reservation is not None:
+                return reservation
+            self.waits += 1
+            await asyncio.sleep(max(wait, MIN_WAIT_SECONDS))
+
+    def acquire_sync(self, tokens: int = 0) -> List[float]:
+        """Blocking variant of :meth:`acquire` for synchronous callers."""
+        while True:
+            reservation, wait = self._reserve(tokens)
+            if reservation is not None:
+                return reservation
+            self.waits += 1
+            time.sleep(max(wait, MIN_WAIT_SECONDS))
+
+    def settle(self, reservation: List[float], tokens: Optional[int]) -> None:
+        """Replace a reservation's estimated tokens with the provider-reported usage."""
+        if tokens is None:
+            return
+        with self._lock:
+            reservation[1] = float(tokens)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request after a rate-limit error so callers back off together."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+        logger.warning("LLM rate limit hit, pausing requests", seconds=seconds)
+
+
+_limiters: Dict[Tuple[str, str, int, int], RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, model: str) -> RateLimiter:
+    """Process-wide limiter for a (provider, model) pair, sized from PodxConfig."""
+    config = get_config()
+    rpm = config.llm_requests_per_minute
+    tpm = config.llm_tokens_per_minute
+    key = (provider, model, rpm, tpm)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = RateLimiter(rpm, tpm)
+        return limiter
+
+
+def reset_rate_limiters() -> None:
+    """Forget every shared limiter (tests, config reloads)."""
+    with _limiters_lock:
+        _limiters.clear()
@@ -0,0 +1,208 @@
+"""Token counting and token-budget batching for LLM prompts.
+
+Prompts are packed by real token counts (tiktoken) up to a budget derived from
+the model's context window in the model catalog, instead of fixed segment or
+character counts. Without tiktoken (or its encoding files) counts fall back to
+an estimate of four characters per token.
+
+Usage:
+    from podx.llm.tokens import pack_by_tokens, token_budget
+
+    budget = token_budget("gpt-4o-mini", output_ratio=1.0)
+    batches = pack_by_tokens(texts, budget, "gpt-4o-mini")
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Sequence, TypeVar
+
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+CHARS_PER_TOKEN = 4  # Estimate when no tokenizer is available
+DEFAULT_CONTEXT_WINDOW = 8192  # Models missing from the catalog (e.g. local Ollama models)
+DEFAULT_MAX_OUTPUT_TOKENS = 8192  # Completion limit shared by every supported provider
+CONTEXT_SAFETY_RATIO = 0.9  # Headroom for tokenizer differences between providers
+MESSAGE_OVERHEAD_TOKENS = 16  # Chat formatting around the system and user messages
+FALLBACK_ENCODING = "o200k_base"
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model: str) -> Optional[Any]:
+    """Return the tiktoken encoding for a model (cached), or None if unavailable.
+
+    Models tiktoken doesn't know (Claude, Gemini, ...) use o200k_base, which is
+    close enough for budgeting.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        pass
+    except Exception as e:
+        logger.debug("tiktoken encoding unavailable", model=model, error=str(e))
+        return None
+
+    try:
+        return tiktoken.get_encoding(FALLBACK_ENCODING)
+    except Exception as e:
+        # Encoding files are downloaded on first use; offline installs can't
+        logger.debug("tiktoken encoding unavailable", model=model, error=str(e))
+        return None
+
+
+def count_tokens(text: str, model: str) -> int:
+    """Count the tokens of text for a model."""
+    encoding = get_encoding(model)
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN)
+    return len(encoding.encode_ordinary(text))
+
+
+def _model_name_variants(name: str) -> List[str]:
+    """Spellings of a model id to try in the catalog.
+
+    Providers write versions as ``4-5`` or ``4.5`` and may append a release
+    date (``claude-sonnet-4-5-20250929``); the catalog uses one spelling.
+    """
+    undated = re.sub(r"-\d{8}$", "", name)
+    variants = []
+    for base in (name, undated):
+        variants += [
+            base,
+            re.sub(r"(?<=\d)-(?=\d)", ".", base),
+            re.sub(r"(?<=\d)\.(?=\d)", "-", base),
+        ]
+    return variants
+
+
+@lru_cache(maxsize=None)
+def context_window(model: str) -> int:
+    """Context window of a model from the catalog (DEFAULT_CONTEXT_WINDOW if unknown).
+
+    Provider prefixes such as ``openrouter/`` or ``anthropic:`` are ignored, as
+    are ``-``/``.`` version separators and release-date suffixes. Unknown models
+    log a warning once, since their batches are sized for a small window.
+    """
+    from ..models import get_model
+
+    candidates = [model, model.rsplit("/", 1)[-1], model.rsplit(":", 1)[-1]]
+    for candidate in dict.fromkeys(candidates):
+        for name in dict.fromkeys(_model_name_variants(candidate)):
+            try:
+                window = get_model(name).context_window
+            except KeyError:
+                continue
+            if window:
+                return int(window)
+
+    logger.warning(
+        "Model not in catalog; assuming a small context window",
+        model=model,
+        context_window=DEFAULT_CONTEXT_WINDOW,
+    )
+    return DEFAULT_CONTEXT_WINDOW
+
+
+def token_budget(
+    model: str,
+    reserved_tokens: int = 0,
+    output_ratio: float = 0.0,
+    max_output_tokens: int = DEFAULT_MAX_OUTPUT_TOKENS,
+) -> int:
+    """Input tokens one request can carry for a model.
+
+    Args:
+        model: Model name or alias
+        reserved_tokens: Tokens the request needs besides the packed items
+            (system prompt, instructions, fixed output allowance)
+        output_ratio: Expected output tokens per packed input token (1.0 when
+            the model rewrites its input, e.g. restore)
+        max_output_tokens: Completion limit that output_ratio must respect
+
+    Returns:
+        Token budget for the packed items (at least 1)
+    """
+    window = int(context_window(model) * CONTEXT_SAFETY_RATIO)
+    available = window - reserved_tokens - MESSAGE_OVERHEAD_TOKENS
+    budget = int(available / (1.0 + output_ratio))
+    if output_ratio > 0:
+        budget = min(budget, int(max_output_tokens / output_ratio))
+    return max(1, budget)
+
+
+def pack_by_tokens(
+    items: Sequence[T],
+    budget: int,
+    model: str,
+    text: Callable[[T], str] = str,
+    item_overhead: int = 0,
+    max_items: Optional[int] = None,
+) -> List[List[T]]:
+    """Pack consecutive items into batches that fit a token budget.
+
+    Order is preserved. An item larger than the budget on its own gets a batch
+    of its own.
+
+    Args:
+        items: Items to pack
+        budget: Token budget per batch
+        model: Model whose tokenizer counts the tokens
+        text: Returns the prompt text of an item
+        item_overhead: Extra tokens per item (delimiters, expected output)
+        max_items: Optional cap on items per batch
+
+    Returns:
+        List of batches
+    """
+    batches: List[List[T]] = []
+    current: List[T] = []
+    used = 0
+
+    for item in items:
+        cost = count_tokens(text(item), model) + item_overhead
+        full = max_items is not None and len(current) >= max_items
+        if current and (used + cost > budget or full):
+            batches.append(current)
+            current = []
+            used = 0
+        current.append(item)
+        used += cost
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def split_text_by_tokens(text: str, budget: int, model: str) -> List[str]:
+    """Split text into chunks of at most budget tokens, keeping lines together.
+
+    Lines longer than the budget are cut on token boundaries (or character
+    boundaries without a tokenizer).
+    """
+    if count_tokens(text, model) <= budget:
+        return [text]
+
+    encoding = get_encoding(model)
+    lines: List[str] = []
+    for line in text.split("\n"):
+        if count_tokens(line, model) <= budget:
+            lines.append(line)
+        elif encoding is None:
+            step = budget * CHARS_PER_TOKEN
+            lines.extend(line[i : i + step] for i in range(0, len(line), step))
+        else:
+            tokens = encoding.encode_ordinary(line)
+            lines.extend(
+                encoding.decode(tokens[i : i + budget]) for i in range(0, len(tokens), budget)
+            )
+
+    # +1 token per line for the newline that joins it to the next
+    return ["\n".join(batch) for batch in pack_by_tokens(lines, budget, model, item_overhead=1)]
@@ -6,9 +6,11 @@ Performance optimization utilities for podx.
 import asyncio
 import concurrent.futures
 import functools
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+from typing import Any, Callable, Dict, Hashable, List, Optional, TypeVar
 
 import psutil
 
@@ -21,61 +23,212 @@ F = TypeVar("F", bound=Callable[..., Any])
 
 
 class ModelCache:
-    """Cache for expensive model loading operations."""
-
-    def __init__(self) -> None:
-        self._cache: Dict[str, Any] = {}
-        self._access_times: Dict[str, float] = {}
-        self._max_cache_size = 3  # Keep max 3 models in memory
-
-    def get(self, key: str, loader_func: Callable[[], Any]) -> Any:
-        """Get model from cache or load it."""
-        if key in self._cache:
-            self._access_times[key] = time.time()
-            logger.debug("Model cache hit", model_key=key)
-            return self._cache[key]
-
-        logger.info("Loading model", model_key=key)
-        start_time = time.time()
-        model = loader_func()
-        load_time = time.time() - start_time
-
-        # Evict least recently used models if cache is full
-        if len(self._cache) >= self._max_cache_size:
-            lru_key = min(self._access_times.keys(), key=lambda k: self._access_times[k])
-            del self._cache[lru_key]
-            del self._access_times[lru_key]
-            logger.debug("Evicted model from cache", evicted_key=lru_key)
-
-        self._cache[key] = model
-        self._access_times[key] = time.time()
+    """Process-wide pool for expensive model loading operations.
+
+    Models are keyed by any hashable value (e.g. ``(model, device, compute_type)``)
+    and evicted least-recently-used first when the pool holds more than
+    ``max_size`` models, when the estimated resident size of the pool exceeds
+    ``max_memory_mb``, or when system memory usage crosses
+    ``memory_pressure_percent``. Concurrent requests for the same key share a
+    single load, so parallel batch workers never load a model twice.
+
+    Limits left as ``None`` are read from :func:`podx.config.get_config` on
+    every eviction check so they can be tuned via environment variables.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        max_memory_mb: Optional[float] = None,
+        memory_pressure_percent: Optional[float] = None,
+    ) -> None:
+        self._cache: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes_mb: Dict[Hashable, float] = {}
+        self._lock = threading.RLock()
+        self._load_locks: Dict[Hashable, threading.Lock] = {}
+        self._max_size = max_size
+        self._max_memory_mb = max_memory_mb
+        self._memory_pressure_percent = memory_pressure_percent
+        self._reset_stats()
+
+    def _reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.total_load_time = 0.0
+
+    @property
+    def max_size(self) -> int:
+        if self._max_size is not None:
+            return self._max_size
+        return get_config().model_cache_size
+
+    @property
+    def max_memory_mb(self) -> Optional[float]:
+        if self._max_memory_mb is not None:
+            return self._max_memory_mb
+        return get_config().model_cache_max_memory_mb
+
+    @property
+    def memory_pressure_percent(self) -> Optional[float]:
+        if self._memory_pressure_percent is not None:
+            return self._memory_pressure_percent
+        return get_config().model_cache_memory_pressure_percent
+
+    def get(self, key: Hashable, loader_func: Callable[[], Any]) -> Any:
+        """Get model from cache or load it.
+
+        Args:
+            key: Cache key identifying the model configuration
+            loader_func: Zero-argument callable that loads the model
+
+        Returns:
+            The cached or freshly loaded model
+
+        Raises:
+            Exception: Whatever ``loader_func`` raises; failed loads are not cached
+        """
+        with self._lock:
+            if key in self._cache:
+                return self._hit(key)
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        with load_lock:
+            # Another thread may have finished loading while we waited
+            with self._lock:
+                if key in self._cache:
+                    return self._hit(key)
+                self.misses += 1
+
+            logger.info("Loading model", model_key=str(key))
+            rss_before = _process_rss_mb()
+            start_time = time.time()
+            model = loader_func()
+            load_time = time.time() - start_time
+            size_mb = max(0.0, _process_rss_mb() - rss_before)
+
+            with self._lock:
+                self.total_load_time += load_time
+                self._cache[key] = model
+                self._sizes_mb[key] = size_mb
+                self._evict_if_needed(keep=key)
+                self._load_locks.pop(key, None)
+                cache_size = len(self._cache)
 
         logger.info(
             "Model loaded and cached",
-            model_key=key,
+            model_key=str(key),
             load_time=round(load_time, 2),
-            cache_size=len(self._cache),
+            size_mb=round(size_mb, 1),
+            cache_size=cache_size,
         )
         return model
 
+    def _hit(self, key: Hashable) -> Any:
+        self.hits += 1
+        self._cache.move_to_end(key)
+        logger.debug("Model cache hit", model_key=str(key))
+        return self._cache[key]
+
+    def _evict_if_needed(self, keep: Hashable) -> None:
+        """Evict least recently used models (never ``keep``) until within limits.
+
+        Memory pressure evicts at most one model per load: the freed memory
+        only shows in system-wide figures once the model is garbage collected,
+        so re-checking straight away would empty the whole cache.
+        """
+        max_memory_mb = self.max_memory_mb
+        pressure_percent = self.memory_pressure_percent
+
+        while len(self._cache) > 1:
+            if len(self._cache) > self.max_size:
+                self._evict_lru(keep, "size")
+            elif max_memory_mb is not None and sum(self._sizes_mb.values()) > max_memory_mb:
+                self._evict_lru(keep, "memory_limit")
+            else:
+                break
+
+        if (
+            len(self._cache) > 1
+            and pressure_percent is not None
+            and psutil.virtual_memory().percent >= pressure_percent
+        ):
+            self._evict_lru(keep, "memory_pressure")
+
+    def _evict_lru(self, keep: Hashable, reason: str) -> None:
+        lru_key = next(k for k in self._cache if k != keep)
+        del self._cache[lru_key]
+        self._sizes_mb.pop(lru_key, None)
+        self.evictions += 1
+        logger.debug("Evicted model from cache", evicted_key=str(lru_key), reason=reason)
+
+    def evict(self, key: Hashable) -> bool:
+        """Drop a single model from the cache.
+
+        Returns:
+            True if the key was cached
+        """
+        with self._lock:
+            if key not in self._cache:
+                return False
+            del self._cache[key]
+            self._sizes_mb.pop(key, None)
+            self.evictions += 1
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and load-time totals.
+
+        ``time_saved`` estimates the seconds avoided by cache hits, using the
+        mean observed load time.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            avg_load_time = self.total_load_time / self.misses if self.misses else 0.0
+            return {
+                "size": len(self._cache),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "total_load_time": round(self.total_load_time, 2),
+                "avg_load_time": round(avg_load_time, 2),
+                "time_saved": round(self.hits * avg_load_time, 2),
+                "memory_mb": round(sum(self._sizes_mb.values()), 1),
+            }
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._cache
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
     def clear(self) -> None:
-        """Clear the model cache."""
-        self._cache.clear()
-        self._access_times.clear()
+        """Clear the model cache and reset its counters."""
+        with self._lock:
+            self._cache.clear()
+            self._sizes_mb.clear()
+            self._reset_stats()
         logger.info("Model cache cleared")
 
 
+def _process_rss_mb() -> float:
+    return psutil.Process().memory_info().rss / (1024 * 1024)
+
+
 # Global model cache instance
 model_cache = ModelCache()
 
 
-def with_model_cache(cache_key_func: Callable[..., str]) -> Callable[[F], F]:
+def with_model_cache(cache_key_func: Callable[..., Hashable]) -> Callable[[F], F]:
     """
     Decorator to cache expensive model loading operations.
 
     Args:
         cache_key_func: Function that takes the same args as the decorated function
-                       and returns a cache key string
+                       and returns a hashable cache key
     """
 
     def decorator(func: F) -> F:
@@ -10,10 +10,11 @@ from fastapi import APIRouter, Depends
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from podx.core.checkpoint import follow_partial_transcript, partial_transcript_path
 from podx.logging import get_logger
 from podx.server.database import get_session
-from podx.server.exceptions import JobNotFoundException
-from podx.server.services import JobManager
+from podx.server.exceptions import InvalidInputException, JobNotFoundException
+from podx.server.services import BackgroundWorker, JobManager
 from podx.server.services.events import get_broadcaster
 
 logger = get_logger(__name__)
@@ -120,3 +121,79 @@ async def stream_job_progress(
             "X-Accel-Buffering": "no",  # Disable nginx buffering
         },
     )
+
+
+async def generate_transcript_segment_events(
+    job_id: str, params: dict
+) -> AsyncGenerator[str, None]:
+    """Generate SSE events from a transcription job's JSONL checkpoint.
+
+    Args:
+        job_id: Job ID being followed
+        params: Job input parameters
+
+    Yields:
+        SSE formatted ``segment`` events, then a ``complete`` event
+    """
+    transcript_path = BackgroundWorker.transcript_path_for(params)
+    checkpoint_path = partial_transcript_path(transcript_path)
+
+    try:
+        # Finished jobs remove their checkpoint; replay the final transcript instead
+        if not checkpoint_path.exists() and transcript_path.exists():
+            transcript = json.loads(transcript_path.read_text(encoding="utf-8"))
+            segments = transcript.get("segments", [])
+            for segment in segments:
+                yield f"event: segment\ndata: {json.dumps(segment)}\n\n"
+            complete = {"language": transcript.get("language"), "segments_count": len(segments)}
+            yield f"event: complete\ndata: {json.dumps(complete)}\n\n"
+            return
+
+        async for record in follow_partial_transcript(checkpoint_path):
+            kind = record.pop("type", None)
+            if kind == "segment":
+                yield f"event: segment\ndata: {json.dumps(record)}\n\n"
+            elif kind == "complete":
+                yield f"event: complete\ndata: {json.dumps(record)}\n\n"
+    except Exception as e:
+        logger.error(f"Error streaming segments for job {job_id}: {e}", exc_info=True)
+        yield f"event: error\ndata: {json.dumps({'error': str(e)})}\n\n"
+
+
+@router.get("/api/v1/jobs/{job_id}/segments/stream")
+async def stream_transcript_segments(
+    job_id: str,
+    session: AsyncSession = Depends(get_session),
+) -> StreamingResponse:
+    """Stream transcript segments of a running transcription job via SSE.
+
+    Segments are read from the job's ``*.partial.jsonl`` checkpoint as they
+    are decoded, starting from the beginning of the transcript.
+
+    Args:
+        job_id: Job ID to stream segments for
+        session: Database session
+
+    Returns:
+        SSE streaming response
+
+    Raises:
+        JobNotFoundException: If job not found
+        InvalidInputException: If the job is not a transcription job
+    """
+    job_manager = JobManager(session)
+    job = await job_manager.get_job(job_id)
+    if not job:
+        raise JobNotFoundException(job_id)
+    if job.job_type != "transcribe" or not (job.input_params or {}).get("audio_url"):
+        raise InvalidInputException("Segment streaming is only available for transcribe jobs")
+
+    return StreamingResponse(
+        generate_transcript_segment_events(job_id, dict(job.input_params or {})),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        },
+    )
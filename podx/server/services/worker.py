@@ -1,8 +1,10 @@
 """Background worker for processing jobs."""
 
 import asyncio
+import json
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
 
 from podx.logging import get_logger
 
@@ -137,17 +139,112 @@ class BackgroundWorker:
                     completed_at=datetime.now(timezone.utc),
                 )
 
+    @staticmethod
+    def transcript_path_for(params: Dict[str, Any]) -> Path:
+        """Get the transcript output path for a transcription job.
+
+        Args:
+            params: Job parameters (``audio_url`` and optional ``model``)
+
+        Returns:
+            Path of the transcript JSON written next to the audio file
+        """
+        from podx.utils import sanitize_model_name
+
+        audio_path = Path(params["audio_url"])
+        model = params.get("model", "base")
+        return audio_path.parent / f"transcript-{sanitize_model_name(model)}.json"
+
     async def run_transcribe(self, job_id: str, params: Dict[str, Any]) -> None:
         """Run transcription job.
 
+        Transcription runs in-process on a worker thread, so the faster-whisper
+        model stays resident in the process-wide model pool between jobs
+        instead of being reloaded for every request.
+
         Args:
             job_id: Job ID
             params: Job parameters
         """
         from podx.server.database import async_session_factory
 
-        def progress_callback(percentage: float, message: str) -> None:
-            """Update job progress (sync callback)."""
+        progress_callback = self._thread_progress_callback(job_id, "transcribe")
+
+        try:
+            from podx.core.checkpoint import partial_transcript_path
+            from podx.core.transcribe import TranscriptionEngine
+            from podx.performance import model_cache
+
+            # Extract params
+            audio_url = params.get("audio_url")
+            model = params.get("model", "base")
+
+            if not audio_url:
+                raise ValueError("audio_url is required")
+
+            audio_path = Path(audio_url)
+            transcript_path = self.transcript_path_for(params)
+            checkpoint_path = partial_transcript_path(transcript_path)
+            engine = TranscriptionEngine(
+                model=model,
+                checkpoint_path=checkpoint_path,
+                progress=lambda message: progress_callback(None, message),
+            )
+
+            # Run transcription off the event loop
+            transcript = await asyncio.to_thread(engine.transcribe, audio_path)
+
+            transcript_path.write_text(
+                json.dumps(transcript, indent=2, ensure_ascii=False), encoding="utf-8"
+            )
+            checkpoint_path.unlink(missing_ok=True)
+            logger.info("Transcription job completed", job_id=job_id, **model_cache.stats())
+
+            # Mark as completed with new session
+            from podx.server.services.events import ProgressEvent, get_broadcaster
+
+            # Broadcast completion event
+            broadcaster = get_broadcaster()
+            await broadcaster.publish(
+                ProgressEvent(
+                    job_id=job_id,
+                    status="completed",
+                    result={"transcript_path": str(transcript_path)},
+                )
+            )
+
+            # Update database
+            async with async_session_factory() as session:
+                from podx.server.services.job_manager import JobManager
+
+                job_manager = JobManager(session)
+                await job_manager.update_job(
+                    job_id,
+                    status="completed",
+                    result={"transcript_path": str(transcript_path)},
+                    completed_at=datetime.now(timezone.utc),
+                )
+
+        except Exception as e:
+            raise RuntimeError(f"Transcription failed: {e}") from e
+
+    def _thread_progress_callback(
+        self, job_id: str, step: str
+    ) -> Callable[[Optional[float], str], None]:
+        """Build a job progress callback that is safe to call from worker threads.
+
+        Must be called on the event loop; updates are scheduled back onto it.
+
+        Args:
+            job_id: Job ID
+            step: Pipeline step reported with each progress event
+        """
+        from podx.server.database import async_session_factory
+
+        loop = asyncio.get_running_loop()
+
+        def progress_callback(percentage: Optional[float], message: str) -> None:
+            """Update job progress (sync callback, safe to call from worker threads)."""
 
             # Schedule async update with new session
             async def update():
@@ -160,7 +257,7 @@ class BackgroundWorker:
                         job_id=job_id,
                         percentage=percentage,
                         message=message,
-                        step="transcribe",
+                        step=step,
                     )
                 )
 
@@ -174,73 +271,127 @@ class BackgroundWorker:
                         progress={"percentage": percentage, "message": message},
                     )
 
-            asyncio.create_task(update())
-
-        try:
-            from podx.api import AsyncPodxClient
-
-            # Create client with progress callback
-            async with AsyncPodxClient(progress_callback=progress_callback) as client:  # type: ignore[call-arg, attr-defined]
-                # Extract params
-                audio_url = params.get("audio_url")
-                model = params.get("model", "base")
+            loop.call_soon_threadsafe(lambda: asyncio.ensure_future(update()))
 
-                if not audio_url:
-                    raise ValueError("audio_url is required")
+        return progress_callback
 
-                # Run transcription
-                result = await client.transcribe(audio_path=audio_url, model=model)
+    @staticmethod
+    def diarize_transcript_path_for(params: Dict[str, Any]) -> Path:
+        """Find the transcript a diarization job should label.
 
-                # Mark as completed with new session
-                from podx.server.services.events import ProgressEvent, get_broadcaster
+        Uses ``transcript_path`` when given, otherwise ``transcript.json`` or the
+        newest ``transcript-*.json`` written next to the audio file (diarized
+        ``*.aligned.json`` outputs are never picked up as input).
 
-                # Broadcast completion event
-                broadcaster = get_broadcaster()
-                await broadcaster.publish(
-                    ProgressEvent(
-                        job_id=job_id,
-                        status="completed",
-                        result={"transcript_path": str(result)},
-                    )
-                )
+        Args:
+            params: Job parameters (``audio_url`` and optional ``transcript_path``)
 
-                # Update database
-                async with async_session_factory() as session:
-                    from podx.server.services.job_manager import JobManager
+        Returns:
+            Path of the transcript JSON to diarize
 
-                    job_manager = JobManager(session)
-                    await job_manager.update_job(
-                        job_id,
-                        status="completed",
-                        result={"transcript_path": str(result)},
-                        completed_at=datetime.now(timezone.utc),
-                    )
-
-        except Exception as e:
-            raise RuntimeError(f"Transcription failed: {e}") from e
+        Raises:
+            ValueError: If no transcript exists for the audio
+        """
+        if params.get("transcript_path"):
+            return Path(params["transcript_path"])
+
+        audio_dir = Path(params["audio_url"]).parent
+        candidates = [audio_dir / "transcript.json"] + sorted(
+            (
+                path
+                for path in audio_dir.glob("transcript-*.json")
+                if not path.name.endswith(".aligned.json")
+            ),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        for candidate in candidates:
+            if candidate.exists():
+                return candidate
+        raise ValueError(f"No transcript found next to {params['audio_url']}; transcribe first")
+
+    @staticmethod
+    def diarized_path_for(transcript_path: Path) -> Path:
+        """Output path for a diarized transcript (``transcript-base.aligned.json``).
+
+        Like ``podx diarize``'s ``transcript.aligned.json`` snapshot, the
+        diarized result goes to its own file and the source transcript is
+        left untouched.
+        """
+        return transcript_path.with_name(f"{transcript_path.stem}.aligned.json")
 
     async def run_diarize(self, job_id: str, params: Dict[str, Any]) -> None:
         """Run diarization job.
 
+        Diarization runs in-process on a worker thread, so the alignment model
+        and diarization pipeline stay resident in the process-wide model pool
+        between jobs. The result is written next to the source transcript
+        (see ``diarized_path_for``).
+
         Args:
             job_id: Job ID
             params: Job parameters
         """
         from podx.server.database import async_session_factory
 
-        # Placeholder for diarization
-        await asyncio.sleep(0.1)
-        async with async_session_factory() as session:
-            from podx.server.services.job_manager import JobManager
+        progress_callback = self._thread_progress_callback(job_id, "diarize")
 
-            job_manager = JobManager(session)
-            await job_manager.update_job(
-                job_id,
-                status="completed",
-                result={"message": "Diarization not yet implemented"},
-                completed_at=datetime.now(timezone.utc),
+        try:
+            from podx.core.diarize import DiarizationEngine
+            from podx.performance import model_cache
+
+            audio_url = params.get("audio_url")
+            if not audio_url:
+                raise ValueError("audio_url is required")
+
+            audio_path = Path(audio_url)
+            transcript_path = self.diarize_transcript_path_for(params)
+            transcript = json.loads(transcript_path.read_text(encoding="utf-8"))
+
+            engine = DiarizationEngine(
+                language=transcript.get("language") or "en",
+                num_speakers=params.get("num_speakers"),
+                progress_callback=lambda message: progress_callback(None, message),
             )
 
+            # Run diarization off the event loop
+            result = await asyncio.to_thread(engine.diarize, audio_path, transcript["segments"])
+
+            transcript["segments"] = result["segments"]
+            transcript["diarized"] = True
+            diarized_path = self.diarized_path_for(transcript_path)
+            diarized_path.write_text(
+                json.dumps(transcript, indent=2, ensure_ascii=False), encoding="utf-8"
+            )
+            logger.info("Diarization job completed", job_id=job_id, **model_cache.stats())
+
+            from podx.server.services.events import ProgressEvent, get_broadcaster
+
+            # Broadcast completion event
+            broadcaster = get_broadcaster()
+            await broadcaster.publish(
+                ProgressEvent(
+                    job_id=job_id,
+                    status="completed",
+                    result={"transcript_path": str(diarized_path)},
+                )
+            )
+
+            # Update database
+            async with async_session_factory() as session:
+                from podx.server.services.job_manager import JobManager
+
+                job_manager = JobManager(session)
+                await job_manager.update_job(
+                    job_id,
+                    status="completed",
+                    result={"transcript_path": str(diarized_path)},
+                    completed_at=datetime.now(timezone.utc),
+                )
+
+        except Exception as e:
+            raise RuntimeError(f"Diarization failed: {e}") from e
+
     async def run_deepcast(self, job_id: str, params: Dict[str, Any]) -> None:
         """Run deepcast job.
 
@@ -1,9 +1,14 @@
 """Cloud storage integration for audio and transcript files."""
 
 from .manager import StorageBackend, StorageError, StorageManager
+from .transfer import MultipartTransfer, TransferConfig, TransferError, TransferStats
 
 __all__ = [
     "StorageBackend",
     "StorageError",
     "StorageManager",
+    "MultipartTransfer",
+    "TransferConfig",
+    "TransferError",
+    "TransferStats",
 ]
@@ -7,6 +7,8 @@ from urllib.parse import urlparse
 
 from podx.logging import get_logger
 
+from .transfer import MultipartTransfer, TransferConfig
+
 logger = get_logger(__name__)
 
 
@@ -36,6 +38,7 @@ class StorageManager:
         self,
         backend: Optional[StorageBackend] = None,
         bucket: Optional[str] = None,
+        transfer_config: Optional[TransferConfig] = None,
         **kwargs: Any,
     ) -> None:
         """Initialize storage manager.
@@ -43,10 +46,12 @@ class StorageManager:
         Args:
             backend: Storage backend (auto-detected from URL if not specified)
             bucket: Bucket/container name
+            transfer_config: S3 multipart tuning (defaults to PODX_TRANSFER_* settings)
             **kwargs: Backend-specific configuration
         """
         self.backend = backend
         self.bucket = bucket
+        self.transfer_config = transfer_config
         self.config = kwargs
         self._client = None
 
@@ -57,6 +62,7 @@ class StorageManager:
 
             return boto3.client(
                 "s3",
+                endpoint_url=self.config.get("endpoint_url"),
                 aws_access_key_id=self.config.get("aws_access_key_id"),
                 aws_secret_access_key=self.config.get("aws_secret_access_key"),
                 region_name=self.config.get("region", "us-east-1"),
@@ -64,6 +70,12 @@ class StorageManager:
         except ImportError:
             raise StorageError("boto3 not installed. Install with: pip install boto3")
 
+    def _get_s3_transfer(self) -> MultipartTransfer:
+        """Get multipart transfer engine for S3."""
+        if self.transfer_config is None:
+            self.transfer_config = TransferConfig.from_podx_config()
+        return MultipartTransfer(self._get_s3_client(), self.transfer_config)
+
     def _get_gcs_client(self) -> Any:
         """Get GCS client."""
         try:
@@ -163,21 +175,16 @@ class StorageManager:
         self, local_path: Path, remote_path: str, metadata: Optional[Dict[str, str]]
     ) -> str:
         """Upload to S3."""
-        client = self._get_s3_client()
-
-        extra_args = {}
+        extra_args: Dict[str, Any] = {}
         if metadata:
             extra_args["Metadata"] = metadata
 
-        client.upload_file(
-            str(local_path),
-            self.bucket,
-            remote_path,
-            ExtraArgs=extra_args if extra_args else None,
+        stats = self._get_s3_transfer().upload(
+            local_path, self.bucket or "", remote_path, extra_args=extra_args
         )
 
         url = f"s3://{self.bucket}/{remote_path}"
-        logger.info("Uploaded to S3", url=url, size=local_path.stat().st_size)
+        logger.info("Uploaded to S3", url=url, size=stats.size, skipped=stats.skipped)
         return url
 
     def _upload_gcs(
@@ -247,8 +254,6 @@ class StorageManager:
 
     def _download_s3(self, remote_path: str, local_path: Path) -> Path:
         """Download from S3."""
-        client = self._get_s3_client()
-
         # Extract bucket and key from s3:// URL if needed
         if remote_path.startswith("s3://"):
             parsed = urlparse(remote_path)
@@ -258,9 +263,9 @@ class StorageManager:
             bucket = self.bucket or ""
             key = remote_path
 
-        client.download_file(bucket, key, str(local_path))
+        stats = self._get_s3_transfer().download(bucket, key, local_path)
 
-        logger.info("Downloaded from S3", path=str(local_path))
+        logger.info("Downloaded from S3", path=str(local_path), skipped=stats.skipped)
         return local_path
 
     def _download_gcs(self, remote_path: str, local_path: Path) -> Path:
@@ -0,0 +1,512 @@
+"""Parallel multipart transfers for S3-compatible object storage.
+
+Used by StorageManager (S3) and CloudStorage (Cloudflare R2). Compared to a
+plain ``upload_file``/``download_file`` this engine:
+
+- uploads/downloads parts concurrently with a bounded thread pool
+- resumes interrupted multipart uploads (state in ``~/.podx/cache/transfers``)
+  and interrupted downloads (``<file>.part`` + ``<file>.part.json``)
+- sends ``Content-MD5`` for every part and verifies returned ETags (objects
+  encrypted with SSE-KMS or SSE-C have opaque ETags and are checked by size)
+- skips the transfer when the other side already has an identical ETag
+- logs per-transfer throughput
+"""
+
+import base64
+import hashlib
+import json
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..logging import get_logger
+
+logger = get_logger(__name__)
+
+MB = 1024 * 1024
+DEFAULT_STATE_DIR = Path.home() / ".podx" / "cache" / "transfers"
+BOTO_DEFAULT_PART_SIZE = 8 * MB  # For verifying objects uploaded by other tools
+
+
+class TransferError(Exception):
+    """Raised when a transfer fails or its checksum does not match."""
+
+    pass
+
+
+@dataclass
+class TransferConfig:
+    """Tuning for multipart transfers.
+
+    Attributes:
+        part_size: Part size in bytes (S3 minimum is 5 MB except the last part)
+        multipart_threshold: Files at least this large use multipart/ranged transfers
+        max_concurrency: Parts in flight at once
+        verify_checksum: Send Content-MD5 and verify ETags (or sizes, for
+            encrypted objects) after transfer
+        state_dir: Where resumable upload state is kept
+    """
+
+    part_size: int = 16 * MB
+    multipart_threshold: int = 32 * MB
+    max_concurrency: int = 8
+    verify_checksum: bool = True
+    state_dir: Optional[Path] = None
+
+    @classmethod
+    def from_podx_config(cls) -> "TransferConfig":
+        """Create configuration from PODX_TRANSFER_* settings."""
+        from ..config import get_config
+
+        config = get_config()
+        return cls(
+            part_size=int(config.transfer_part_size_mb * MB),
+            multipart_threshold=int(config.transfer_multipart_threshold_mb * MB),
+            max_concurrency=config.transfer_max_concurrency,
+            verify_checksum=config.transfer_verify_checksum,
+        )
+
+
+@dataclass
+class TransferStats:
+    """Outcome of a single transfer."""
+
+    key: str
+    size: int
+    seconds: float
+    parts: int = 1
+    resumed_parts: int = 0
+    skipped: bool = False
+
+    @property
+    def mb_per_second(self) -> float:
+        """Throughput of the bytes actually moved."""
+        return (self.size / MB) / self.seconds if self.seconds > 0 and not self.skipped else 0.0
+
+
+def _part_ranges(size: int, part_size: int) -> List[Tuple[int, int]]:
+    """(offset, length) for each part, in order."""
+    return [(offset, min(part_size, size - offset)) for offset in range(0, size, part_size)] or [
+        (0, 0)
+    ]
+
+
+def part_digests(path: Path, part_size: int) -> List[bytes]:
+    """MD5 digest of each ``part_size`` slice of a file."""
+    digests: List[bytes] = []
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(part_size)
+            if not data and digests:
+                break
+            digests.append(hashlib.md5(data).digest())
+            if not data:
+                break
+    return digests
+
+
+def multipart_etag(digests: List[bytes]) -> str:
+    """S3 ETag of a multipart object from its part MD5s."""
+    return f"{hashlib.md5(b''.join(digests)).hexdigest()}-{len(digests)}"
+
+
+def etag_is_md5(response: Dict[str, Any]) -> bool:
+    """Whether an S3 response's ETag is derived from the object's MD5.
+
+    With SSE-KMS or SSE-C the ETag is opaque and can never match a local
+    digest; S3 still validates ``Content-MD5`` on upload.
+    """
+    if str(response.get("ServerSideEncryption", "")).startswith("aws:kms"):
+        return False
+    return "SSECustomerAlgorithm" not in response
+
+
+def _etag_for_remote(path: Path, remote_etag: str, part_size: int) -> Optional[str]:
+    """Compute the local ETag in the same form as ``remote_etag``.
+
+    Returns None when the remote part size cannot be inferred.
+    """
+    size = path.stat().st_size
+    if "-" not in remote_etag:
+        with open(path, "rb") as f:
+            return hashlib.md5(f.read()).hexdigest()
+    parts = int(remote_etag.rsplit("-", 1)[1])
+    for candidate in (part_size, BOTO_DEFAULT_PART_SIZE):
+        if max(1, math.ceil(size / candidate)) == parts:
+            return multipart_etag(part_digests(path, candidate))
+    return None
+
+
+class MultipartTransfer:
+    """Concurrent, resumable, checksummed transfers through a boto3 S3 client."""
+
+    def __init__(self, client: Any, config: Optional[TransferConfig] = None):
+        """Initialize transfer engine.
+
+        Args:
+            client: boto3 S3 client (or compatible)
+            config: Transfer tuning (defaults to TransferConfig())
+        """
+        self.client = client
+        self.config = config or TransferConfig()
+        self.state_dir = self.config.state_dir or DEFAULT_STATE_DIR
+
+    # ------------------------------------------------------------------ upload
+
+    def upload(
+        self,
+        local_path: Path,
+        bucket: str,
+        key: str,
+        extra_args: Optional[Dict[str, Any]] = None,
+        progress_callback: Optional[Callable[[int], None]] = None,
+    ) -> TransferStats:
+        """Upload a file, skipping it if the object already has the same ETag.
+
+        Args:
+            local_path: File to upload
+            bucket: Destination bucket
+            key: Destination key
+            extra_args: Extra put/create arguments (e.g. ``{"Metadata": {...}}``)
+            progress_callback: Called with the byte count of each finished part
+
+        Returns:
+            TransferStats
+
+        Raises:
+            TransferError: If the upload fails or a checksum does not match
+        """
+        start = time.time()
+        size = local_path.stat().st_size
+        extra_args = extra_args or {}
+        multipart = size >= self.config.multipart_threshold
+        digests = (
+            part_digests(local_path, self.config.part_size)
+            if multipart
+            else [hashlib.md5(local_path.read_bytes()).digest()]
+        )
+        expected = multipart_etag(digests) if multipart else digests[0].hex()
+
+        remote = self._remote_etag(bucket, key)
+        if remote == expected:
+            stats = TransferStats(key=key, size=size, seconds=time.time() - start, skipped=True)
+            self._log("upload", stats)
+            return stats
+
+        try:
+            if multipart:
+                resp, parts, resumed = self._upload_multipart(
+                    local_path, bucket, key, digests, extra_args, progress_callback
+                )
+            else:
+                resp = self._put(local_path, bucket, key, digests[0], extra_args)
+                parts, resumed = 1, 0
+                if progress_callback:
+                    progress_callback(size)
+        except TransferError:
+            raise
+        except Exception as e:
+            raise TransferError(f"Upload of {key} failed: {e}") from e
+
+        if self.config.verify_checksum:
+            if etag_is_md5(resp):
+                etag = resp["ETag"].strip('"')
+                if etag != expected:
+                    raise TransferError(
+                        f"Checksum mismatch for {key}: expected {expected}, got {etag}"
+                    )
+            else:
+                self._verify_remote_size(bucket, key, size)
+
+        stats = TransferStats(
+            key=key, size=size, seconds=time.time() - start, parts=parts, resumed_parts=resumed
+        )
+        self._log("upload", stats)
+        return stats
+
+    def _put(
+        self, local_path: Path, bucket: str, key: str, digest: bytes, extra_args: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        kwargs = dict(extra_args)
+        if self.config.verify_checksum:
+            kwargs["ContentMD5"] = base64.b64encode(digest).decode("ascii")
+        return self.client.put_object(
+            Bucket=bucket, Key=key, Body=local_path.read_bytes(), **kwargs
+        )
+
+    def _upload_multipart(
+        self,
+        local_path: Path,
+        bucket: str,
+        key: str,
+        digests: List[bytes],
+        extra_args: Dict[str, Any],
+        progress_callback: Optional[Callable[[int], None]],
+    ) -> Tuple[Dict[str, Any], int, int]:
+        size = local_path.stat().st_size
+        ranges = _part_ranges(size, self.config.part_size)
+        state_path = self._state_path(local_path, bucket, key)
+
+        upload_id, done = self._resume_state(state_path, bucket, key, digests)
+        resumed = len(done)
+        if upload_id is None:
+            resp = self.client.create_multipart_upload(Bucket=bucket, Key=key, **extra_args)
+            upload_id = resp["UploadId"]
+            done = {}
+        self._save_state(state_path, upload_id, done)
+
+        lock = threading.Lock()
+
+        def upload_part(number: int) -> None:
+            offset, length = ranges[number - 1]
+            with open(local_path, "rb") as f:
+                f.seek(offset)
+                data = f.read(length)
+            kwargs: Dict[str, Any] = {}
+            if self.config.verify_checksum:
+                kwargs["ContentMD5"] = base64.b64encode(digests[number - 1]).decode("ascii")
+            resp = self.client.upload_part(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=number,
+                Body=data,
+                **kwargs,
+            )
+            etag = resp["ETag"].strip('"')
+            if (
+                self.config.verify_checksum
+                and etag_is_md5(resp)
+                and etag != digests[number - 1].hex()
+            ):
+                raise TransferError(f"Checksum mismatch for part {number} of {key}")
+            with lock:
+                done[number] = etag
+                self._save_state(state_path, upload_id, done)
+            if progress_callback:
+                progress_callback(length)
+
+        pending = [n for n in range(1, len(ranges) + 1) if n not in done]
+        with ThreadPoolExecutor(max_workers=max(1, self.config.max_concurrency)) as executor:
+            # list() re-raises the first part failure; state is kept for resume
+            list(executor.map(upload_part, pending))
+
+        resp = self.client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": [{"ETag": done[n], "PartNumber": n} for n in sorted(done)]},
+        )
+        state_path.unlink(missing_ok=True)
+        return resp, len(ranges), resumed
+
+    def _state_path(self, local_path: Path, bucket: str, key: str) -> Path:
+        stat = local_path.stat()
+        ident = (
+            f"{bucket}/{key}:{local_path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+            f":{self.config.part_size}"
+        )
+        return self.state_dir / f"{hashlib.sha1(ident.encode()).hexdigest()}.json"
+
+    def _save_state(self, path: Path, upload_id: str, done: Dict[int, str]) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps({"upload_id": upload_id, "parts": done}))
+        except OSError as e:
+            logger.debug("Failed to save transfer state", path=str(path), error=str(e))
+
+    def _resume_state(
+        self, path: Path, bucket: str, key: str, digests: List[bytes]
+    ) -> Tuple[Optional[str], Dict[int, str]]:
+        """Load a previous upload and keep parts the server still has intact."""
+        try:
+            state = json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return None, {}
+
+        upload_id = state["upload_id"]
+        try:
+            server_parts = self._list_parts(bucket, key, upload_id)
+        except Exception as e:
+            logger.debug("Previous multipart upload is gone", key=key, error=str(e))
+            return None, {}
+
+        done = {
+            n: etag
+            for n, etag in server_parts.items()
+            if n <= len(digests) and etag == digests[n - 1].hex()
+        }
+        logger.info("Resuming multipart upload", key=key, parts_done=len(done))
+        return upload_id, done
+
+    def _list_parts(self, bucket: str, key: str, upload_id: str) -> Dict[int, str]:
+        parts: Dict[int, str] = {}
+        marker = 0
+        while True:
+            resp = self.client.list_parts(
+                Bucket=bucket, Key=key, UploadId=upload_id, PartNumberMarker=marker
+            )
+            for part in resp.get("Parts", []):
+                parts[part["PartNumber"]] = part["ETag"].strip('"')
+            if not resp.get("IsTruncated"):
+                return parts
+            marker = resp["NextPartNumberMarker"]
+
+    # ---------------------------------------------------------------- download
+
+    def download(
+        self,
+        bucket: str,
+        key: str,
+        local_path: Path,
+        progress_callback: Optional[Callable[[int], None]] = None,
+    ) -> TransferStats:
+        """Download an object with concurrent ranged GETs.
+
+        Skips the download when ``local_path`` already matches the remote
+        ETag, and resumes from ``<local_path>.part`` after an interruption.
+
+        Raises:
+            TransferError: If the download fails or a checksum does not match
+        """
+        start = time.time()
+        try:
+            head = self.client.head_object(Bucket=bucket, Key=key)
+        except Exception as e:
+            raise TransferError(f"Object {key} not found: {e}") from e
+        size = int(head["ContentLength"])
+        remote = head["ETag"].strip('"')
+        md5_etag = etag_is_md5(head)
+
+        if (
+            md5_etag
+            and local_path.exists()
+            and local_path.stat().st_size == size
+            and _etag_for_remote(local_path, remote, self.config.part_size) == remote
+        ):
+            stats = TransferStats(key=key, size=size, seconds=time.time() - start, skipped=True)
+            self._log("download", stats)
+            return stats
+
+        tmp_path = local_path.with_name(local_path.name + ".part")
+        state_path = local_path.with_name(local_path.name + ".part.json")
+        ranges = _part_ranges(size, self.config.part_size)
+
+        done = set()
+        try:
+            state = json.loads(state_path.read_text())
+            if state["etag"] == remote and state["part_size"] == self.config.part_size:
+                done = set(state["parts"])
+        except (OSError, json.JSONDecodeError, KeyError):
+            pass
+        if not done or not tmp_path.exists():
+            done = set()
+            with open(tmp_path, "wb") as f:
+                f.truncate(size)
+        resumed = len(done)
+
+        lock = threading.Lock()
+
+        def save_state() -> None:
+            state_path.write_text(
+                json.dumps(
+                    {"etag": remote, "part_size": self.config.part_size, "parts": sorted(done)}
+                )
+            )
+
+        def download_part(number: int) -> None:
+            offset, length = ranges[number - 1]
+            resp = self.client.get_object(
+                Bucket=bucket, Key=key, Range=f"bytes={offset}-{offset + length - 1}"
+            )
+            data = resp["Body"].read()
+            if len(data) != length:
+                raise TransferError(f"Short read for part {number} of {key}")
+            with open(tmp_path, "r+b") as f:
+                f.seek(offset)
+                f.write(data)
+            with lock:
+                done.add(number)
+                save_state()
+            if progress_callback:
+                progress_callback(length)
+
+        try:
+            if size < self.config.multipart_threshold:
+                data = self.client.get_object(Bucket=bucket, Key=key)["Body"].read()
+                tmp_path.write_bytes(data)
+                if progress_callback:
+                    progress_callback(len(data))
+            elif size > 0:
+                pending = [n for n in range(1, len(ranges) + 1) if n not in done]
+                with ThreadPoolExecutor(
+                    max_workers=max(1, self.config.max_concurrency)
+                ) as executor:
+                    list(executor.map(download_part, pending))
+        except TransferError:
+            raise
+        except Exception as e:
+            raise TransferError(f"Download of {key} failed: {e}") from e
+
+        if self.config.verify_checksum:
+            error = None
+            if md5_etag:
+                actual = _etag_for_remote(tmp_path, remote, self.config.part_size)
+                if actual is not None and actual != remote:
+                    error = f"Checksum mismatch for {key}: expected {remote}, got {actual}"
+            elif tmp_path.stat().st_size != size:
+                error = (
+                    f"Size mismatch for {key}: expected {size} bytes, "
+                    f"got {tmp_path.stat().st_size}"
+                )
+            if error:
+                tmp_path.unlink(missing_ok=True)
+                state_path.unlink(missing_ok=True)
+                raise TransferError(error)
+
+        tmp_path.replace(local_path)
+        state_path.unlink(missing_ok=True)
+
+        stats = TransferStats(
+            key=key,
+            size=size,
+            seconds=time.time() - start,
+            parts=len(ranges) if size >= self.config.multipart_threshold else 1,
+            resumed_parts=resumed,
+        )
+        self._log("download", stats)
+        return stats
+
+    # ----------------------------------------------------------------- helpers
+
+    def _verify_remote_size(self, bucket: str, key: str, size: int) -> None:
+        remote_size = int(self.client.head_object(Bucket=bucket, Key=key)["ContentLength"])
+        if remote_size != size:
+            raise TransferError(
+                f"Size mismatch for {key}: expected {size} bytes, got {remote_size}"
+            )
+
+    def _remote_etag(self, bucket: str, key: str) -> Optional[str]:
+        try:
+            return self.client.head_object(Bucket=bucket, Key=key)["ETag"].strip('"')
+        except Exception:
+            return None
+
+    def _log(self, direction: str, stats: TransferStats) -> None:
+        if stats.skipped:
+            logger.info(f"Skipped {direction}, ETag unchanged", key=stats.key)
+            return
+        logger.info(
+            f"Finished {direction}",
+            key=stats.key,
+            size_mb=round(stats.size / MB, 2),
+            seconds=round(stats.seconds, 2),
+            mb_per_second=round(stats.mb_per_second, 2),
+            parts=stats.parts,
+            resumed_parts=stats.resumed_parts,
+            concurrency=self.config.max_concurrency,
+        )
@@ -179,7 +179,7 @@ class TestFullPipelineExecution:
 
         # Mock LLM responses
         # Map phase is async and processes chunks in parallel
-        async def mock_async_response(system, user):
+        async def mock_async_response(system, user, prefix=None):
             return "Summary of this chunk"
 
         mock_chat_async.side_effect = mock_async_response
@@ -174,3 +174,41 @@ async def test_list_jobs_empty(client: AsyncClient):
     data = response.json()
     assert data["total"] == 0
     assert len(data["jobs"]) == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_segments_rejects_non_transcribe_job(client: AsyncClient):
+    """Test segment streaming is limited to transcription jobs."""
+    create_response = await client.post("/api/v1/jobs", params={"job_type": "diarize"}, json={})
+    job_id = create_response.json()["job_id"]
+
+    response = await client.get(f"/api/v1/jobs/{job_id}/segments/stream")
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_stream_segments_replays_checkpoint(client: AsyncClient, tmp_path):
+    """Test segment streaming follows the job's JSONL checkpoint."""
+    from podx.core.checkpoint import PartialTranscriptWriter
+
+    audio_path = tmp_path / "audio.mp3"
+    create_response = await client.post(
+        "/api/v1/jobs",
+        params={"job_type": "transcribe"},
+        json={"audio_url": str(audio_path), "model": "base"},
+    )
+    job_id = create_response.json()["job_id"]
+
+    with PartialTranscriptWriter(
+        tmp_path / "transcript-base.partial.jsonl",
+        header={"audio_path": str(audio_path), "asr_model": "base"},
+    ) as writer:
+        writer.write_segment({"start": 0.0, "end": 1.5, "text": "Hello"})
+        writer.write_complete(language="en", segments_count=1)
+
+    response = await client.get(f"/api/v1/jobs/{job_id}/segments/stream")
+
+    assert response.status_code == 200
+    assert 'event: segment\ndata: {"start": 0.0, "end": 1.5, "text": "Hello"}' in response.text
+    assert "event: complete" in response.text
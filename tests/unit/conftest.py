@@ -1,6 +1,11 @@
 """Shared fixtures for unit tests."""
 
+import base64
+import collections
+import hashlib
+import io
 import sys
+import uuid
 
 import pytest
 
@@ -35,6 +40,56 @@ def reset_server_state():
                 setattr(module, attr, value)
 
 
+@pytest.fixture(autouse=True)
+def reset_model_cache():
+    """Clear the process-wide model pool so mocked models don't leak between tests."""
+    from podx.performance import model_cache
+
+    model_cache.clear()
+    yield
+    model_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_memory_profile(tmp_path, monkeypatch):
+    """Keep diarization memory calibration out of the real ~/.podx/cache."""
+    from podx.core import diarize_memory
+
+    path = tmp_path / "diarization-memory.json"
+    monkeypatch.setattr(diarize_memory, "DEFAULT_PROFILE_PATH", path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def isolated_llm_cache(tmp_path, monkeypatch):
+    """Keep cached LLM responses out of the real ~/.podx/cache."""
+    from podx.llm import cache
+
+    path = tmp_path / "llm-responses.sqlite3"
+    monkeypatch.setattr(cache, "DEFAULT_CACHE_PATH", path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def isolated_ad_classifier(tmp_path, monkeypatch):
+    """Keep the learned ad pre-filter vocabulary out of the real ~/.podx/cache."""
+    from podx.core import ad_filter
+
+    path = tmp_path / "ad-classifier.json"
+    monkeypatch.setattr(ad_filter, "DEFAULT_MODEL_PATH", path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiters():
+    """Give each test fresh process-wide LLM rate limiters."""
+    from podx.llm import rate_limit
+
+    rate_limit.reset_rate_limiters()
+    yield
+    rate_limit.reset_rate_limiters()
+
+
 @pytest.fixture
 def temp_upload_dir(tmp_path):
     """Provide a temporary upload directory for tests.
@@ -44,3 +99,102 @@ def temp_upload_dir(tmp_path):
     upload_dir = tmp_path / "uploads"
     upload_dir.mkdir(parents=True, exist_ok=True)
     return upload_dir
+
+
+class InMemoryS3:
+    """S3-compatible stand-in implementing the boto3 client calls podx uses.
+
+    ETags follow S3 rules (MD5 for single uploads, MD5-of-part-MD5s plus
+    ``-N`` for multipart) and ``ContentMD5`` is verified like the real API.
+    """
+
+    def __init__(self):
+        self.objects = {}
+        self.uploads = {}
+        self.calls = collections.Counter()
+        self.uploaded_bytes = 0
+        self.fail_parts = set()  # Part numbers that raise once (simulated drop)
+
+    @staticmethod
+    def _check_md5(body, content_md5):
+        if content_md5 and base64.b64encode(hashlib.md5(body).digest()).decode() != content_md5:
+            raise Exception("BadDigest: Content-MD5 mismatch")
+
+    def put_object(self, Bucket, Key, Body, ContentMD5=None, Metadata=None):
+        self.calls["put_object"] += 1
+        self._check_md5(Body, ContentMD5)
+        self.uploaded_bytes += len(Body)
+        etag = hashlib.md5(Body).hexdigest()
+        self.objects[(Bucket, Key)] = {"body": Body, "etag": etag, "metadata": Metadata or {}}
+        return {"ETag": f'"{etag}"'}
+
+    def head_object(self, Bucket, Key):
+        self.calls["head_object"] += 1
+        if (Bucket, Key) not in self.objects:
+            raise Exception("404 Not Found")
+        obj = self.objects[(Bucket, Key)]
+        return {"ContentLength": len(obj["body"]), "ETag": f'"{obj["etag"]}"'}
+
+    def get_object(self, Bucket, Key, Range=None):
+        self.calls["get_object"] += 1
+        body = self.objects[(Bucket, Key)]["body"]
+        if Range:
+            start, end = Range.split("=")[1].split("-")
+            body = body[int(start) : int(end) + 1]
+        return {"Body": io.BytesIO(body)}
+
+    def delete_object(self, Bucket, Key):
+        self.calls["delete_object"] += 1
+        self.objects.pop((Bucket, Key), None)
+
+    def create_multipart_upload(self, Bucket, Key, Metadata=None):
+        self.calls["create_multipart_upload"] += 1
+        upload_id = uuid.uuid4().hex
+        self.uploads[upload_id] = {"parts": {}, "metadata": Metadata or {}}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body, ContentMD5=None):
+        self.calls["upload_part"] += 1
+        if PartNumber in self.fail_parts:
+            self.fail_parts.discard(PartNumber)
+            raise Exception("Connection reset")
+        self._check_md5(Body, ContentMD5)
+        self.uploaded_bytes += len(Body)
+        etag = hashlib.md5(Body).hexdigest()
+        self.uploads[UploadId]["parts"][PartNumber] = (Body, etag)
+        return {"ETag": f'"{etag}"'}
+
+    def list_parts(self, Bucket, Key, UploadId, PartNumberMarker=0):
+        self.calls["list_parts"] += 1
+        if UploadId not in self.uploads:
+            raise Exception("NoSuchUpload")
+        parts = self.uploads[UploadId]["parts"]
+        return {
+            "Parts": [
+                {"PartNumber": n, "ETag": f'"{parts[n][1]}"'}
+                for n in sorted(parts)
+                if n > PartNumberMarker
+            ],
+            "IsTruncated": False,
+        }
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.calls["complete_multipart_upload"] += 1
+        upload = self.uploads.pop(UploadId)
+        numbers = [p["PartNumber"] for p in MultipartUpload["Parts"]]
+        body = b"".join(upload["parts"][n][0] for n in numbers)
+        digests = b"".join(bytes.fromhex(upload["parts"][n][1]) for n in numbers)
+        etag = f"{hashlib.md5(digests).hexdigest()}-{len(numbers)}"
+        self.objects[(Bucket, Key)] = {"body": body, "etag": etag, "metadata": upload["metadata"]}
+        return {"ETag": f'"{etag}"'}
+
+    def generate_presigned_url(self, op, Params, ExpiresIn):
+        self.calls["generate_presigned_url"] += 1
+        n = self.calls["generate_presigned_url"]
+        return f"https://s3.example/{Params['Key']}?expires={ExpiresIn}&n={n}"
+
+
+@pytest.fixture
+def s3_stub():
+    """In-memory S3-compatible client."""
+    return InMemoryS3()
@@ -0,0 +1,330 @@
+"""Tests for RunPod job submission and polling (sync and asyncio clients)."""
+
+import asyncio
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from podx.cloud import AsyncRunPodClient, CloudConfig, JobFailedError, RunPodClient
+from podx.cloud.exceptions import CloudTimeoutError
+from podx.cloud.runpod_client import PollBackoff, diarization_payload, transcription_payload
+from podx.core.transcription import ProviderConfig, RunPodProvider, TranscriptionResult
+
+
+def make_config(**overrides):
+    values = dict(
+        api_key="key",
+        endpoint_id="asr",
+        diarize_endpoint_id="dia",
+        poll_interval_seconds=0.01,
+        max_poll_interval_seconds=0.05,
+        timeout_seconds=10,
+    )
+    values.update(overrides)
+    return CloudConfig(**values)
+
+
+class FakeRunPod:
+    """RunPod API stand-in: each job completes after ``polls_needed`` status checks."""
+
+    def __init__(self, polls_needed=3, fail=()):
+        self.polls_needed = polls_needed
+        self.fail = set(fail)
+        self.jobs = {}
+        self.requests = []
+        self.active = 0
+        self.peak = 0
+
+    async def handle_async(self, request):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.001)
+        self.active -= 1
+        return self.handle(request)
+
+    def handle(self, request):
+        self.requests.append((request.method, request.url.path))
+        endpoint, action = request.url.path.split("/")[2:4]
+        if action == "run":
+            job_id = f"{endpoint}-{len(self.jobs)}"
+            self.jobs[job_id] = {"polls": 0, "input": json.loads(request.content)["input"]}
+            return httpx.Response(200, json={"id": job_id, "status": "IN_QUEUE"})
+
+        job_id = request.url.path.rsplit("/", 1)[1]
+        job = self.jobs[job_id]
+        job["polls"] += 1
+        if job["polls"] < self.polls_needed:
+            status = "IN_QUEUE" if job["polls"] == 1 else "IN_PROGRESS"
+            return httpx.Response(200, json={"id": job_id, "status": status})
+        if job_id in self.fail:
+            return httpx.Response(200, json={"id": job_id, "status": "FAILED", "error": "OOM"})
+        return httpx.Response(
+            200, json={"id": job_id, "status": "COMPLETED", "output": {"job": job_id}}
+        )
+
+
+class TestPollBackoff:
+    """Test adaptive poll intervals."""
+
+    def test_grows_while_unchanged_and_resets_on_change(self):
+        backoff = PollBackoff(initial=1.0, maximum=3.0, factor=2.0)
+
+        delays = [backoff.next_delay(s) for s in ["Q", "Q", "Q", "Q", "RUN", "RUN"]]
+
+        assert delays == [1.0, 2.0, 3.0, 3.0, 1.0, 2.0]
+
+
+class TestRunPodClient:
+    """Test the synchronous client."""
+
+    def test_wait_backs_off_between_polls(self):
+        fake = FakeRunPod(polls_needed=4)
+        client = RunPodClient(make_config(poll_interval_seconds=1.0, max_poll_interval_seconds=2.0))
+        client._client = httpx.Client(transport=httpx.MockTransport(fake.handle))
+
+        job_id = client.submit_job("https://r2/audio.mp3", model="large-v3-turbo")
+        with patch("podx.cloud.runpod_client.time.sleep") as mock_sleep:
+            output = client.wait_for_completion(job_id)
+
+        assert output == {"job": job_id}
+        # IN_QUEUE, IN_PROGRESS, IN_PROGRESS (backed off)
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 1.0, 1.5]
+
+    def test_diarization_task_uses_diarize_endpoint(self):
+        fake = FakeRunPod(polls_needed=1)
+        client = RunPodClient(make_config(), task="diarization")
+        client._client = httpx.Client(transport=httpx.MockTransport(fake.handle))
+
+        job_id = client.submit(diarization_payload("https://r2/a.mp3", [], num_speakers=2))
+        client.wait_for_completion(job_id)
+
+        assert fake.requests[0] == ("POST", "/v2/dia/run")
+        assert fake.jobs[job_id]["input"]["num_speakers"] == 2
+
+
+class TestAsyncRunPodClient:
+    """Test the asyncio client with many jobs in flight."""
+
+    def _client(self, fake, **kwargs):
+        config = make_config(**kwargs.pop("config", {}))
+        http = httpx.AsyncClient(transport=httpx.MockTransport(fake.handle_async))
+        return AsyncRunPodClient(config, http_client=http, **kwargs)
+
+    def test_many_jobs_share_one_poller(self):
+        fake = FakeRunPod(polls_needed=3)
+
+        async def main():
+            async with self._client(fake, max_concurrent_requests=8) as runpod:
+                asr = [
+                    await runpod.submit(transcription_payload(f"u{i}", "turbo", "auto"))
+                    for i in range(30)
+                ]
+                dia = [
+                    await runpod.submit(diarization_payload(f"u{i}", []), task="diarization")
+                    for i in range(10)
+                ]
+                results = await asyncio.gather(
+                    *(runpod.wait(j) for j in asr),
+                    *(runpod.wait(j, task="diarization") for j in dia),
+                )
+                return results, runpod.in_flight
+
+        results, in_flight = asyncio.run(main())
+
+        assert [r["job"] for r in results[:30]] == [f"asr-{i}" for i in range(30)]
+        assert results[30]["job"].startswith("dia-")
+        assert in_flight == 0
+        assert all(job["polls"] == 3 for job in fake.jobs.values())
+        assert fake.peak <= 8
+
+    def test_failed_job_does_not_affect_others(self):
+        fake = FakeRunPod(polls_needed=2, fail={"asr-1"})
+
+        async def main():
+            async with self._client(fake) as runpod:
+                ids = [await runpod.submit(transcription_payload("u", "turbo", "auto"))]
+                ids += [await runpod.submit(transcription_payload("u", "turbo", "auto"))]
+                return await asyncio.gather(*(runpod.wait(j) for j in ids), return_exceptions=True)
+
+        ok, failed = asyncio.run(main())
+
+        assert ok == {"job": "asr-0"}
+        assert isinstance(failed, JobFailedError)
+
+    def test_timeout(self):
+        fake = FakeRunPod(polls_needed=10_000)
+
+        async def main():
+            async with self._client(fake, config={"timeout_seconds": 0.05}) as runpod:
+                job_id = await runpod.submit(transcription_payload("u", "turbo", "auto"))
+                await runpod.wait(job_id)
+
+        with pytest.raises(CloudTimeoutError):
+            asyncio.run(main())
+
+    def test_progress_callback(self):
+        fake = FakeRunPod(polls_needed=2)
+        messages = []
+
+        async def main():
+            async with self._client(fake) as runpod:
+                job_id = await runpod.submit(diarization_payload("u", []), task="diarization")
+                await runpod.wait(job_id, task="diarization", progress_callback=messages.append)
+
+        asyncio.run(main())
+
+        assert messages[0].startswith("Waiting for GPU worker")
+        assert messages[-1].startswith("Diarization complete")
+
+    def test_failing_progress_callback_does_not_stall_jobs(self):
+        fake = FakeRunPod(polls_needed=2)
+
+        def broken(message):
+            raise RuntimeError("display closed")
+
+        async def main():
+            async with self._client(fake) as runpod:
+                ids = [
+                    await runpod.submit(transcription_payload("u", "turbo", "auto"))
+                    for _ in range(2)
+                ]
+                waits = [runpod.wait(ids[0], progress_callback=broken), runpod.wait(ids[1])]
+                return await asyncio.wait_for(asyncio.gather(*waits), timeout=5)
+
+        assert asyncio.run(main()) == [{"job": "asr-0"}, {"job": "asr-1"}]
+
+
+class FakeStorage:
+    """CloudStorage stand-in that tracks concurrent uploads."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.released = []
+
+    def upload_and_presign(self, path):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        threading.Event().wait(0.005)
+        with self.lock:
+            self.active -= 1
+        return f"https://r2/{path.name}", path.name
+
+    def release(self, key):
+        with self.lock:
+            self.released.append(key)
+
+
+class TestRunPodBatch:
+    """Test RunPodProvider.transcribe_batch."""
+
+    @pytest.fixture
+    def episodes(self, tmp_path):
+        paths = []
+        for i in range(6):
+            path = tmp_path / f"ep{i}.mp3"
+            path.write_bytes(b"audio")
+            paths.append(path)
+        return paths
+
+    def _provider(self, fake, enable_fallback=False):
+        config = make_config(
+            r2_account_id="acct",
+            r2_bucket_name="bucket",
+            r2_access_key_id="id",
+            r2_secret_access_key="secret",
+            enable_fallback=enable_fallback,
+        )
+        provider = RunPodProvider(ProviderConfig(model="large-v3-turbo"), cloud_config=config)
+        provider.storage = FakeStorage()
+        return provider
+
+    def _run(self, provider, fake, paths, **kwargs):
+        def client_factory(config):
+            http = httpx.AsyncClient(transport=httpx.MockTransport(fake.handle_async))
+            return AsyncRunPodClient(config, http_client=http)
+
+        with patch(
+            "podx.core.transcription.runpod_provider.AsyncRunPodClient", side_effect=client_factory
+        ):
+            return list(provider.transcribe_batch(paths, **kwargs))
+
+    def test_all_jobs_run_and_uploads_are_capped(self, episodes):
+        fake = FakeRunPod(polls_needed=2)
+        provider = self._provider(fake)
+
+        items = self._run(provider, fake, episodes, max_concurrent_uploads=2)
+
+        assert sorted(i.audio_path for i in items) == episodes
+        assert all(i.success and not i.used_fallback for i in items)
+        assert len(fake.jobs) == 6
+        assert provider.storage.peak <= 2
+        assert sorted(provider.storage.released) == sorted(p.name for p in episodes)
+        urls = sorted(job["input"]["audio"] for job in fake.jobs.values())
+        assert urls == sorted(f"https://r2/{p.name}" for p in episodes)
+
+    def test_jobs_in_flight_cap(self, episodes):
+        fake = FakeRunPod(polls_needed=2)
+        provider = self._provider(fake)
+        submitted, peak = [0], [0]
+        original = fake.handle
+
+        def counting_handle(request):
+            response = original(request)
+            path = request.url.path
+            if path.endswith("/run"):
+                submitted[0] += 1
+            elif json.loads(response.content)["status"] == "COMPLETED":
+                submitted[0] -= 1
+            peak[0] = max(peak[0], submitted[0])
+            return response
+
+        fake.handle = counting_handle
+
+        items = self._run(provider, fake, episodes, max_jobs_in_flight=2)
+
+        assert len(items) == 6
+        assert peak[0] <= 2
+
+    def test_failed_item_falls_back_to_local(self, episodes):
+        fake = FakeRunPod(polls_needed=1, fail={"asr-0"})
+        provider = self._provider(fake, enable_fallback=True)
+        local = MagicMock()
+        local.transcribe.return_value = TranscriptionResult(
+            audio_path=str(episodes[0]),
+            language="en",
+            asr_model="large-v3-turbo",
+            asr_provider="local",
+            segments=[],
+            text="local",
+        )
+        provider._fallback_provider = local
+
+        items = self._run(provider, fake, episodes[:1])
+
+        assert items[0].used_fallback
+        assert items[0].result.text == "local"
+        local.transcribe.assert_called_once_with(episodes[0])
+
+    def test_failed_item_without_fallback_reports_error(self, episodes):
+        fake = FakeRunPod(polls_needed=1, fail={"asr-0"})
+        provider = self._provider(fake)
+
+        items = self._run(provider, fake, episodes[:2])
+
+        by_ok = {i.success: i for i in items}
+        assert isinstance(by_ok[False].error, JobFailedError)
+        assert by_ok[True].result is not None
+
+    def test_missing_file_raises_before_upload(self, episodes, tmp_path):
+        provider = self._provider(FakeRunPod())
+
+        with pytest.raises(FileNotFoundError):
+            list(provider.transcribe_batch(episodes + [tmp_path / "missing.mp3"]))
+
+        assert provider.storage.peak == 0
@@ -0,0 +1,222 @@
+"""Tests for content-addressed R2 uploads (CloudStorage + UploadIndex)."""
+
+import hashlib
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from podx.cloud import CloudConfig, CloudStorage, UploadIndex
+from podx.cloud.exceptions import UploadError
+from podx.storage import TransferConfig
+
+
+@pytest.fixture
+def audio(tmp_path):
+    path = tmp_path / "episode.mp3"
+    path.write_bytes(b"audio-bytes" * 1000)
+    return path
+
+
+def make_storage(tmp_path, s3_stub, **config):
+    storage = CloudStorage(
+        CloudConfig(r2_bucket_name="bucket", **config),
+        index=UploadIndex(tmp_path / "index.json"),
+        transfer_config=TransferConfig(state_dir=tmp_path / "transfers"),
+    )
+    storage._client = s3_stub
+    return storage
+
+
+class TestContentAddressedUpload:
+    """Test upload reuse across stages and retries."""
+
+    def test_key_is_content_hash(self, tmp_path, s3_stub, audio):
+        storage = make_storage(tmp_path, s3_stub)
+
+        _, key = storage.upload_and_presign(audio)
+
+        digest = hashlib.sha256(audio.read_bytes()).hexdigest()
+        assert key == f"podx/sha256/{digest}.mp3"
+
+    def test_second_stage_reuses_object_and_url(self, tmp_path, s3_stub, audio):
+        """Transcription then diarization of the same episode uploads once."""
+        transcribe = make_storage(tmp_path, s3_stub)
+        url1, key1 = transcribe.upload_and_presign(audio)
+        transcribe.release(key1)
+
+        diarize = make_storage(tmp_path, s3_stub)
+        url2, key2 = diarize.upload_and_presign(audio)
+
+        assert key1 == key2
+        assert url1 == url2
+        assert s3_stub.calls["put_object"] == 1
+        assert s3_stub.uploaded_bytes == audio.stat().st_size
+
+    def test_stale_url_is_represigned_without_upload(self, tmp_path, s3_stub, audio):
+        storage = make_storage(tmp_path, s3_stub)
+        url1, _ = storage.upload_and_presign(audio, expires_in=1)
+        time.sleep(0.01)
+
+        url2, _ = storage.upload_and_presign(audio, expires_in=3600)
+
+        assert url1 != url2
+        assert s3_stub.calls["put_object"] == 1
+
+    def test_missing_remote_object_is_reuploaded(self, tmp_path, s3_stub, audio):
+        storage = make_storage(tmp_path, s3_stub)
+        _, key = storage.upload_and_presign(audio)
+        s3_stub.objects.clear()  # e.g. removed by a bucket lifecycle rule
+
+        storage.upload_and_presign(audio)
+
+        assert s3_stub.calls["put_object"] == 2
+        assert ("bucket", key) in s3_stub.objects
+
+    def test_existing_remote_object_skips_upload_without_index(self, tmp_path, s3_stub, audio):
+        make_storage(tmp_path, s3_stub).upload_and_presign(audio)
+        (tmp_path / "index.json").unlink()
+
+        make_storage(tmp_path, s3_stub).upload_and_presign(audio)
+
+        assert s3_stub.calls["put_object"] == 1
+
+    def test_changed_file_gets_new_key(self, tmp_path, s3_stub, audio):
+        storage = make_storage(tmp_path, s3_stub)
+        _, key1 = storage.upload_and_presign(audio)
+        audio.write_bytes(b"different audio")
+
+        _, key2 = storage.upload_and_presign(audio)
+
+        assert key1 != key2
+        assert s3_stub.calls["put_object"] == 2
+
+
+class TestRetention:
+    """Test object lifetime handling."""
+
+    def test_zero_retention_deletes_on_release(self, tmp_path, s3_stub, audio):
+        storage = make_storage(tmp_path, s3_stub, upload_retention_seconds=0)
+        _, key = storage.upload_and_presign(audio)
+
+        storage.release(key)
+
+        assert ("bucket", key) not in s3_stub.objects
+
+    def test_expired_uploads_are_pruned(
+        self, tmp_path, s3_stub, audio, tmp_path_factory, monkeypatch
+    ):
+        storage = make_storage(tmp_path, s3_stub, upload_retention_seconds=60)
+        _, old_key = storage.upload_and_presign(audio, expires_in=30)
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 120)
+
+        other = tmp_path_factory.mktemp("other") / "other.mp3"
+        other.write_bytes(b"other audio")
+        storage.upload_and_presign(other)
+
+        assert ("bucket", old_key) not in s3_stub.objects
+
+    def test_release_prunes_expired_uploads(self, tmp_path, s3_stub, audio, monkeypatch):
+        storage = make_storage(tmp_path, s3_stub, upload_retention_seconds=60)
+        _, key = storage.upload_and_presign(audio, expires_in=30)
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 120)
+
+        storage.release(key)
+
+        assert ("bucket", key) not in s3_stub.objects
+
+    def test_reuse_extends_retention(self, tmp_path, s3_stub, audio, monkeypatch):
+        """A stage reusing an object near expiry keeps it for a full retention."""
+        storage = make_storage(tmp_path, s3_stub, upload_retention_seconds=60)
+        _, key = storage.upload_and_presign(audio, expires_in=30)
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 50)
+        storage.upload_and_presign(audio, expires_in=30)
+
+        monkeypatch.setattr(time, "time", lambda: now + 100)
+        storage.release(key)
+
+        assert ("bucket", key) in s3_stub.objects
+        assert s3_stub.calls["put_object"] == 1
+
+    def test_object_outlives_its_presigned_url(self, tmp_path, s3_stub, audio, monkeypatch):
+        storage = make_storage(tmp_path, s3_stub, upload_retention_seconds=60)
+        _, key = storage.upload_and_presign(audio, expires_in=3600)
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 120)
+
+        storage.release(key)
+
+        assert ("bucket", key) in s3_stub.objects
+
+    def test_zero_retention_keeps_other_jobs_objects(
+        self, tmp_path, s3_stub, audio, tmp_path_factory
+    ):
+        """Concurrent jobs each delete their own object; nothing else is pruned."""
+        storage = make_storage(tmp_path, s3_stub, upload_retention_seconds=0)
+        _, in_flight = storage.upload_and_presign(audio)
+
+        other = tmp_path_factory.mktemp("other") / "other.mp3"
+        other.write_bytes(b"other audio")
+        _, done = storage.upload_and_presign(other)
+        storage.release(done)
+
+        assert ("bucket", in_flight) in s3_stub.objects
+        assert ("bucket", done) not in s3_stub.objects
+
+    def test_missing_file_raises(self, tmp_path, s3_stub):
+        storage = make_storage(tmp_path, s3_stub)
+
+        with pytest.raises(UploadError):
+            storage.upload_and_presign(tmp_path / "missing.mp3")
+
+    def test_missing_bucket_raises(self, tmp_path, s3_stub, audio):
+        storage = make_storage(tmp_path, s3_stub)
+        storage.config.r2_bucket_name = None
+
+        with pytest.raises(UploadError, match="bucket not configured"):
+            storage.upload_and_presign(audio)
+        with pytest.raises(UploadError, match="bucket not configured"):
+            storage.release("podx/sha256/abc.mp3")
+
+
+class TestCloudPipelineUploads:
+    """Cloud transcription followed by cloud diarization of one episode."""
+
+    def test_transcribe_then_diarize_uploads_once(self, tmp_path, s3_stub, audio):
+        from podx.core.diarization import DiarizationConfig, RunPodDiarizationProvider
+        from podx.core.transcription import ProviderConfig, RunPodProvider
+
+        cloud_config = CloudConfig(
+            api_key="key",
+            endpoint_id="asr",
+            diarize_endpoint_id="diarize",
+            r2_account_id="account",
+            r2_access_key_id="id",
+            r2_secret_access_key="secret",
+            r2_bucket_name="bucket",
+            enable_fallback=False,
+        )
+        segments = [{"start": 0.0, "end": 1.0, "text": "Hello"}]
+
+        asr = RunPodProvider(ProviderConfig(model="large-v3"), cloud_config=cloud_config)
+        asr.storage = make_storage(tmp_path, s3_stub)
+        asr.client = MagicMock()
+        asr.client.submit_job.return_value = "job-asr"
+        asr.client.wait_for_completion.return_value = {"segments": segments, "language": "en"}
+        transcript = asr.transcribe(audio)
+
+        diarizer = RunPodDiarizationProvider(DiarizationConfig(), cloud_config=cloud_config)
+        diarizer._storage = make_storage(tmp_path, s3_stub)
+        diarizer._client = MagicMock()
+        diarizer._client.submit.return_value = "job-diarize"
+        diarizer._client.wait_for_completion.return_value = {"segments": segments}
+        diarizer.diarize(audio, transcript.segments)
+
+        assert s3_stub.calls["put_object"] + s3_stub.calls["create_multipart_upload"] == 1
+        asr_url = asr.client.submit_job.call_args.kwargs["audio_url"]
+        payload = diarizer._client.submit.call_args.args[0]["input"]
+        assert payload["audio_url"] == asr_url
+        assert payload["denoise"] is True
@@ -0,0 +1,99 @@
+"""Unit tests for podx.core.ad_filter module."""
+
+import json
+
+from podx.core.ad_filter import (
+    ESCALATE_THRESHOLD,
+    EXTEND_THRESHOLD,
+    LOCAL_AD_THRESHOLD,
+    MIN_TRAINING_SEGMENTS,
+    AdScorer,
+)
+
+
+def _segments(texts):
+    return [{"text": t} for t in texts]
+
+
+class TestScore:
+    def test_plain_conversation_is_content(self, tmp_path):
+        scorer = AdScorer(tmp_path / "model.json")
+        assert scorer.score("So what got you into machine learning?") < ESCALATE_THRESHOLD
+
+    def test_single_marker_is_a_hit(self, tmp_path):
+        scorer = AdScorer(tmp_path / "model.json")
+        p = scorer.score("Today's sponsor makes great mattresses.")
+        assert ESCALATE_THRESHOLD <= p < LOCAL_AD_THRESHOLD
+
+    def test_several_markers_are_an_ad(self, tmp_path):
+        scorer = AdScorer(tmp_path / "model.json")
+        text = "This show is brought to you by Acme. Use promo code PODX for 20% off."
+        assert scorer.score(text) >= LOCAL_AD_THRESHOLD
+
+
+class TestPrefilter:
+    def test_escalates_window_around_hit(self, tmp_path):
+        scorer = AdScorer(tmp_path / "model.json", window=1)
+        texts = ["a", "b", "our sponsor is Acme", "c", "d", "e"]
+
+        assert scorer.prefilter(_segments(texts)) == [False, None, None, None, False, False]
+
+    def test_weak_hit_inside_window_extends_it(self, tmp_path):
+        scorer = AdScorer(tmp_path / "model.json", window=1)
+        texts = ["a", "our sponsor is Acme", "b", "visit acme.com today", "c", "d", "e"]
+
+        assert scorer.prefilter(_segments(texts)) == [None] * 5 + [False, False]
+
+    def test_weak_hit_alone_is_content(self, tmp_path):
+        scorer = AdScorer(tmp_path / "model.json", window=1)
+        texts = ["a", "the docs are on python.org", "b"]
+
+        assert scorer.prefilter(_segments(texts)) == [False, False, False]
+
+    def test_directions_are_not_a_hit(self, tmp_path):
+        scorer = AdScorer(tmp_path / "model.json")
+        assert scorer.score("Then we go to the studio and head over to lunch") < EXTEND_THRESHOLD
+
+    def test_widen_around_confirmed_ads(self, tmp_path):
+        scorer = AdScorer(tmp_path / "model.json", window=2)
+
+        assert scorer.widen([5], 8, asked={3, 4, 5}) == [6, 7]
+        assert scorer.widen([], 8, asked=set()) == []
+
+    def test_confident_ads_are_decided_locally(self, tmp_path):
+        scorer = AdScorer(tmp_path / "model.json", window=1)
+        texts = ["a", "Sponsored by Acme, enter code SAVE at acme dot com", "b"]
+
+        assert scorer.prefilter(_segments(texts)) == [None, True, None]
+
+
+class TestLearning:
+    def test_learned_words_raise_scores(self, tmp_path):
+        path = tmp_path / "model.json"
+        scorer = AdScorer(path)
+        text = "Acme widgets ship worldwide"
+        before = scorer.score(text)
+
+        n = MIN_TRAINING_SEGMENTS
+        scorer.learn(["Acme widgets are the best"] * n, [True] * n)
+        scorer.learn(["we talk about neural networks"] * n, [False] * n)
+        scorer.save()
+
+        reloaded = AdScorer(path)
+        assert reloaded.trained
+        assert reloaded.score(text) > max(before, ESCALATE_THRESHOLD)
+        assert reloaded.score("neural networks are fun") < before
+
+    def test_untrained_model_ignores_words(self, tmp_path):
+        scorer = AdScorer(tmp_path / "model.json")
+        scorer.learn(["Acme widgets"], [True])
+        assert not scorer.trained
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "model.json"
+        path.write_text("{not json", encoding="utf-8")
+        scorer = AdScorer(path)
+
+        scorer.learn(["hello"], [False])
+        scorer.save()
+        assert json.loads(path.read_text())["segments"] == {"ad": 0, "content": 1}
@@ -11,14 +11,18 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from podx.core.analyze import (
+    INTERMEDIATE_REDUCE_INSTRUCTIONS,
+    MAP_CACHE_FILENAME,
     AnalyzeEngine,
     AnalyzeError,
     analyze_transcript,
     hhmmss,
+    map_cache_key,
     segments_to_plain_text,
     split_into_chunks,
 )
-from podx.llm import MockLLMProvider
+from podx.llm import MockLLMProvider, OpenAIProvider
+from podx.llm.rate_limit import get_rate_limiter
 
 
 class TestUtilityFunctions:
@@ -131,7 +135,8 @@ class TestAnalyzeEngineInit:
             engine = AnalyzeEngine()
             assert engine.model == "gpt-4"
             assert engine.temperature == 0.2
-            assert engine.max_chars_per_chunk == 24000
+            assert engine.max_chars_per_chunk is None
+            assert engine.max_tokens_per_chunk is None
             assert engine.api_key == "test_key"
 
     def test_init_custom_params(self):
@@ -517,3 +522,265 @@ class TestEdgeCases:
             )
 
             assert json_data == {"key": "value"}
+
+
+class TestTokenBudgetChunking:
+    """Test map chunks sized by the model's token budget."""
+
+    def test_fits_model_context_in_one_chunk(self):
+        segments = [{"text": f"Segment {i} " * 20} for i in range(100)]
+        mock_llm = MockLLMProvider(responses=["Notes", "Final analysis"])
+        engine = AnalyzeEngine(model="gpt-4o", llm_provider=mock_llm)
+
+        engine.analyze({"segments": segments}, "system", "map", "reduce")
+
+        # Roughly 12k tokens: one map call plus the reduce call
+        assert mock_llm.call_count == 2
+
+    def test_explicit_token_budget_splits_chunks(self):
+        segments = [{"text": f"Segment {i} " * 20} for i in range(100)]
+        mock_llm = MockLLMProvider(responses=["Notes"] * 50 + ["Final analysis"])
+        engine = AnalyzeEngine(model="gpt-4o", max_tokens_per_chunk=2000, llm_provider=mock_llm)
+
+        engine.analyze({"segments": segments}, "system", "map", "reduce")
+
+        assert mock_llm.call_count > 3
+
+
+class TestMapNotesCache:
+    """Test map-phase notes shared across templates on one episode."""
+
+    def _segments(self):
+        return [{"text": f"Segment {i} " * 20} for i in range(100)]
+
+    def test_second_template_only_pays_for_reduce(self, tmp_path):
+        first = MockLLMProvider(responses=["Notes"] * 10 + ["Format analysis"])
+        engine = AnalyzeEngine(
+            model="gpt-4o", max_tokens_per_chunk=2000, llm_provider=first, map_cache_dir=tmp_path
+        )
+        engine.analyze({"segments": self._segments()}, "format system", "map", "format reduce")
+        assert first.call_count > 2
+        assert (tmp_path / MAP_CACHE_FILENAME).exists()
+
+        second = MockLLMProvider(responses=["Other analysis"])
+        engine = AnalyzeEngine(
+            model="gpt-4o", max_tokens_per_chunk=2000, llm_provider=second, map_cache_dir=tmp_path
+        )
+        markdown, _ = engine.analyze(
+            {"segments": self._segments()}, "other system", "map", "other reduce"
+        )
+
+        assert markdown == "Other analysis"
+        assert second.call_count == 1
+
+    def test_key_includes_instructions_model_and_temperature(self):
+        key = map_cache_key("chunk", "map", "gpt-4o", 0.2)
+        assert key == map_cache_key("chunk", "map", "gpt-4o", 0.2)
+        assert key != map_cache_key("chunk", "other map", "gpt-4o", 0.2)
+        assert key != map_cache_key("chunk", "map", "gpt-4o-mini", 0.2)
+        assert key != map_cache_key("chunk", "map", "gpt-4o", 0.7)
+        assert key != map_cache_key("other chunk", "map", "gpt-4o", 0.2)
+
+    def test_different_map_instructions_rerun_map(self, tmp_path):
+        llm = MockLLMProvider(responses=["Notes"] * 20 + ["Final"])
+        for instructions in ("map", "extract quotes"):
+            AnalyzeEngine(model="gpt-4o", llm_provider=llm, map_cache_dir=tmp_path).analyze(
+                {"segments": self._segments()}, "system", instructions, "reduce"
+            )
+
+        # One map chunk plus one reduce per pass
+        assert llm.call_count == 4
+
+    def test_corrupt_cache_file_is_ignored(self, tmp_path):
+        (tmp_path / MAP_CACHE_FILENAME).write_text("{not json", encoding="utf-8")
+        llm = MockLLMProvider(responses=["Notes", "Final"])
+        engine = AnalyzeEngine(model="gpt-4o", llm_provider=llm, map_cache_dir=tmp_path)
+
+        markdown, _ = engine.analyze({"segments": self._segments()}, "system", "map", "reduce")
+
+        assert markdown == "Final"
+        assert len(json.loads((tmp_path / MAP_CACHE_FILENAME).read_text())) == 1
+
+
+class _NotesProvider:
+    """Returns long map notes, short consolidated notes and a final analysis."""
+
+    def __init__(self, note_words=600):
+        self.note_words = note_words
+        self.prompts = []
+        self.call_count = 0
+
+    def complete(self, messages, model, temperature=0.7, **kwargs):
+        prompt = messages[1].content
+        self.prompts.append(prompt)
+        self.call_count += 1
+        if prompt.startswith(INTERMEDIATE_REDUCE_INSTRUCTIONS):
+            content = f"consolidated {prompt.count('notes for chunk')} notes"
+        elif "Chunk notes:" in prompt:
+            content = "Final analysis"
+        else:
+            content = "notes for chunk " + "point " * self.note_words
+        return MagicMock(content=content, usage=None)
+
+    async def complete_async(self, messages, model, temperature=0.7, **kwargs):
+        return self.complete(messages, model, temperature, **kwargs)
+
+
+class TestTreeReduce:
+    """Test hierarchical reduce when map notes outgrow the reduce prompt."""
+
+    def _transcript(self):
+        return {"segments": [{"text": f"Segment {i} " * 20} for i in range(100)]}
+
+    def test_short_notes_use_single_reduce(self):
+        provider = _NotesProvider(note_words=10)
+        engine = AnalyzeEngine(model="local-llm", max_tokens_per_chunk=500, llm_provider=provider)
+
+        markdown, _ = engine.analyze(self._transcript(), "system", "map", "reduce")
+
+        assert markdown == "Final analysis"
+        assert not any(p.startswith(INTERMEDIATE_REDUCE_INSTRUCTIONS) for p in provider.prompts)
+
+    def test_long_notes_are_consolidated_before_final_reduce(self):
+        provider = _NotesProvider()
+        engine = AnalyzeEngine(model="local-llm", max_tokens_per_chunk=500, llm_provider=provider)
+
+        markdown, _ = engine.analyze(self._transcript(), "system", "map", "reduce")
+
+        intermediate = [
+            p for p in provider.prompts if p.startswith(INTERMEDIATE_REDUCE_INSTRUCTIONS)
+        ]
+        map_calls = sum(1 for p in provider.prompts if p.startswith("map"))
+        assert markdown == "Final analysis"
+        assert 1 < len(intermediate) < map_calls
+        # Every map note is consolidated once, or passed through when alone in its group
+        final = provider.prompts[-1]
+        consolidated = sum(p.count("notes for chunk") for p in intermediate)
+        assert consolidated + final.count("notes for chunk") == map_calls
+        assert final.count("consolidated") == len(intermediate)
+
+    def test_fan_in_grows_with_context_window(self):
+        small, large = _NotesProvider(note_words=8000), _NotesProvider(note_words=8000)
+        for provider, model in ((small, "deepseek-chat"), (large, "claude-sonnet-4.5")):
+            engine = AnalyzeEngine(model=model, max_tokens_per_chunk=200, llm_provider=provider)
+            engine.analyze(self._transcript(), "system", "map", "reduce")
+
+        def rounds(provider):
+            return [p for p in provider.prompts if p.startswith(INTERMEDIATE_REDUCE_INSTRUCTIONS)]
+
+        assert len(rounds(small)) > len(rounds(large)) > 0
+
+
+class _ConcurrencyProvider:
+    """Async provider that records how many map calls overlap."""
+
+    def __init__(self, fail_first=0):
+        self.active = 0
+        self.peak = 0
+        self.fail_first = fail_first
+        self.calls = 0
+
+    def complete(self, messages, model, temperature=0.7, **kwargs):
+        return MagicMock(content="Final analysis", usage={"total_tokens": 10})
+
+    async def complete_async(self, messages, model, temperature=0.7, **kwargs):
+        import asyncio
+
+        from podx.llm import LLMRateLimitError
+
+        self.calls += 1
+        if self.calls <= self.fail_first:
+            raise LLMRateLimitError("429")
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return MagicMock(content="notes", usage={"total_tokens": 10})
+
+
+class TestMapConcurrency:
+    """Test the async map phase and the shared rate limiter."""
+
+    def _transcript(self):
+        return {"segments": [{"text": f"Segment {i} " * 20} for i in range(100)]}
+
+    def test_concurrency_is_capped(self):
+        provider = _ConcurrencyProvider()
+        engine = AnalyzeEngine(
+            model="local-llm", max_tokens_per_chunk=200, llm_provider=provider, max_concurrency=2
+        )
+
+        markdown, _ = engine.analyze(self._transcript(), "system", "map", "reduce")
+
+        assert markdown == "Final analysis"
+        assert provider.calls > 2
+        assert provider.peak == 2
+
+    def test_default_concurrency_from_config(self):
+        engine = AnalyzeEngine(llm_provider=MockLLMProvider())
+        assert engine.max_concurrency == 3
+
+    def test_engines_share_rate_limiter(self):
+        first = AnalyzeEngine(model="gpt-4o", llm_provider=MockLLMProvider())
+        second = AnalyzeEngine(model="gpt-4o", llm_provider=MockLLMProvider())
+        other = AnalyzeEngine(model="gpt-4o-mini", llm_provider=MockLLMProvider())
+
+        assert first.rate_limiter is second.rate_limiter
+        assert other.rate_limiter is not first.rate_limiter
+
+    def test_rate_limiter_keyed_by_provider_name(self):
+        # An injected provider shares the limiter of the same provider created by name
+        engine = AnalyzeEngine(model="gpt-4o", llm_provider=OpenAIProvider(api_key="sk-test"))
+        assert engine.rate_limiter is get_rate_limiter("openai", "gpt-4o")
+
+    def test_rate_limits_disabled_by_default(self):
+        limiter = AnalyzeEngine(llm_provider=MockLLMProvider()).rate_limiter
+        assert limiter.requests_per_minute == 0
+        assert limiter.tokens_per_minute == 0
+
+    def test_rate_limit_error_pauses_and_retries(self):
+        provider = _ConcurrencyProvider(fail_first=1)
+        engine = AnalyzeEngine(model="local-llm", llm_provider=provider)
+
+        with patch("podx.core.analyze.RATE_LIMIT_PAUSE_SECONDS", 0.01):
+            markdown, _ = engine.analyze(self._transcript(), "system", "map", "reduce")
+
+        assert markdown == "Final analysis"
+        assert engine.rate_limiter.waits >= 1
+
+
+class TestPromptPrefix:
+    """Test that map calls lead with a cacheable shared prefix."""
+
+    def test_map_instructions_are_cached_prefix(self):
+        mock = MockLLMProvider(responses=["notes", "notes", "Final"])
+        engine = AnalyzeEngine(model="local-llm", max_tokens_per_chunk=200, llm_provider=mock)
+        transcript = {"segments": [{"text": f"Segment {i} " * 20} for i in range(20)]}
+
+        engine.analyze(transcript, "system", "map instructions", "reduce")
+
+        map_calls = [call[0] for call in mock.calls[:-1]]
+        assert len(map_calls) > 1
+        for messages in map_calls:
+            assert [(m.role, m.content, m.cache) for m in messages[:2]] == [
+                ("system", "system", True),
+                ("user", "map instructions", True),
+            ]
+            assert messages[2].content.startswith("Chunk ")
+        assert len({messages[2].content for messages in map_calls}) == len(map_calls)
+
+    def test_cached_tokens_are_counted(self):
+        mock = MockLLMProvider(responses=["notes"])
+        mock_complete = mock.complete
+
+        def complete_with_cache(*args, **kwargs):
+            response = mock_complete(*args, **kwargs)
+            response.usage["cached_tokens"] = 100
+            return response
+
+        mock.complete = complete_with_cache
+        engine = AnalyzeEngine(model="local-llm", llm_provider=mock)
+
+        engine.analyze({"segments": [{"text": "Hello"}]}, "system", "map", "reduce")
+
+        assert engine.cached_prompt_tokens == 200  # Map + reduce
@@ -0,0 +1,126 @@
+"""Unit tests for core.checkpoint module (streaming JSONL transcript checkpoints)."""
+
+import asyncio
+import json
+from pathlib import Path
+
+from podx.core.checkpoint import (
+    PartialTranscriptWriter,
+    follow_partial_transcript,
+    partial_transcript_path,
+    read_partial_transcript,
+)
+
+HEADER = {"audio_path": "/ep/audio.wav", "asr_model": "small", "asr_provider": "local"}
+
+
+class TestPartialTranscriptPath:
+    """Test checkpoint path naming."""
+
+    def test_replaces_json_suffix(self):
+        assert partial_transcript_path(Path("/ep/transcript.json")) == Path(
+            "/ep/transcript.partial.jsonl"
+        )
+
+    def test_model_specific_transcript(self):
+        assert partial_transcript_path(Path("/up/transcript-base.json")).name == (
+            "transcript-base.partial.jsonl"
+        )
+
+
+class TestReadWrite:
+    """Test writing and reading checkpoints."""
+
+    def test_roundtrip(self, tmp_path):
+        path = tmp_path / "transcript.partial.jsonl"
+        with PartialTranscriptWriter(path, header=HEADER) as writer:
+            writer.write_segment({"start": 0.0, "end": 2.0, "text": "one"})
+            writer.write_segment({"start": 2.0, "end": 4.5, "text": "two"})
+
+        partial = read_partial_transcript(path)
+
+        assert partial is not None
+        assert partial.header == HEADER
+        assert [s["text"] for s in partial.segments] == ["one", "two"]
+        assert partial.complete is None
+        assert partial.resume_offset == 4.5
+        assert partial.matches("/ep/audio.wav", "small")
+        assert not partial.matches("/ep/audio.wav", "large-v3")
+
+    def test_segments_visible_before_close(self, tmp_path):
+        """Each segment is flushed as soon as it is written."""
+        path = tmp_path / "transcript.partial.jsonl"
+        writer = PartialTranscriptWriter(path, header=HEADER)
+        writer.write_segment({"start": 0.0, "end": 1.0, "text": "live"})
+
+        partial = read_partial_transcript(path)
+        writer.close()
+
+        assert partial is not None
+        assert len(partial.segments) == 1
+
+    def test_torn_last_line_is_ignored_and_truncated_on_append(self, tmp_path):
+        path = tmp_path / "transcript.partial.jsonl"
+        with PartialTranscriptWriter(path, header=HEADER) as writer:
+            writer.write_segment({"start": 0.0, "end": 1.0, "text": "ok"})
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"type": "segment", "start": 1.0, "en')
+
+        partial = read_partial_transcript(path)
+        assert partial is not None
+        assert len(partial.segments) == 1
+
+        with PartialTranscriptWriter(path, truncate_to=partial.valid_bytes) as writer:
+            writer.write_segment({"start": 1.0, "end": 2.0, "text": "again"})
+            writer.write_complete(language="en", segments_count=2)
+
+        resumed = read_partial_transcript(path)
+        assert resumed is not None
+        assert [s["text"] for s in resumed.segments] == ["ok", "again"]
+        assert resumed.complete == {"language": "en", "segments_count": 2}
+
+    def test_missing_or_headerless_file(self, tmp_path):
+        assert read_partial_transcript(tmp_path / "missing.jsonl") is None
+
+        path = tmp_path / "bad.partial.jsonl"
+        path.write_text(json.dumps({"type": "segment", "start": 0, "end": 1}) + "\n")
+        assert read_partial_transcript(path) is None
+
+
+class TestFollowPartialTranscript:
+    """Test live tailing of a growing checkpoint."""
+
+    def test_follows_until_complete(self, tmp_path):
+        path = tmp_path / "transcript.partial.jsonl"
+
+        async def produce():
+            await asyncio.sleep(0.02)
+            writer = PartialTranscriptWriter(path, header=HEADER)
+            for i in range(3):
+                writer.write_segment({"start": float(i), "end": i + 1.0, "text": str(i)})
+                await asyncio.sleep(0.02)
+            writer.write_complete(language="en", segments_count=3)
+            writer.close()
+
+        async def consume():
+            return [r async for r in follow_partial_transcript(path, poll_interval=0.01)]
+
+        async def main():
+            _, records = await asyncio.gather(produce(), consume())
+            return records
+
+        records = asyncio.run(main())
+
+        types = [r["type"] for r in records]
+        assert types == ["header", "segment", "segment", "segment", "complete"]
+
+    def test_idle_timeout_when_file_never_appears(self, tmp_path):
+        async def consume():
+            return [
+                r
+                async for r in follow_partial_transcript(
+                    tmp_path / "never.jsonl", poll_interval=0.01, idle_timeout=0.05
+                )
+            ]
+
+        assert asyncio.run(consume()) == []
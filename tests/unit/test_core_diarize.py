@@ -6,6 +6,8 @@ Uses mocking to avoid actual WhisperX model loading.
 
 import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -13,15 +15,21 @@ import pytest
 
 from podx.core.diarize import (
     MIN_SEGMENT_DURATION_FOR_ALIGNMENT,
+    AlignedSegmentIndex,
     DiarizationEngine,
     DiarizationError,
+    WordTable,
+    assign_word_speakers,
     calculate_chunk_duration,
+    calculate_chunk_workers,
     calculate_match_confidence,
     diarize_transcript,
     estimate_memory_required,
+    load_diarization_audio,
     match_speakers_across_chunks,
-    merge_chunk_segments,
     sanitize_segments_for_alignment,
+    slice_audio_into_chunks,
+    speaker_overlaps,
 )
 
 
@@ -36,7 +44,10 @@ def mock_whisperx():
 
     sys.modules["whisperx"] = mock_module
     sys.modules["whisperx.diarize"] = mock_diarize
-    yield mock_module
+    # The engine's own assign_word_speakers is routed through the mock so
+    # tests can stub the merged result without building diarization turns
+    with patch("podx.core.diarize.assign_word_speakers", mock_diarize.assign_word_speakers):
+        yield mock_module
 
     # Cleanup
     if "whisperx" in sys.modules:
@@ -134,6 +145,45 @@ def mock_memory_and_duration():
         yield
 
 
+class TestLoadDiarizationAudio:
+    """Test the single-pass decode used by podx run and podx diarize."""
+
+    def test_denoise_filter_in_same_decode(self, tmp_path):
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_text("fake audio")
+        samples = np.arange(4, dtype=np.float32)
+
+        with patch("podx.core.diarize.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(stdout=samples.tobytes())
+            audio = load_diarization_audio(audio_file)
+
+        np.testing.assert_array_equal(audio, samples)
+        cmd = mock_run.call_args[0][0]
+        assert mock_run.call_count == 1
+        assert "-af" in cmd and cmd[-3:] == ["-f", "f32le", "-"]
+
+    def test_falls_back_to_unfiltered_decode(self, tmp_path):
+        import subprocess
+
+        audio_file = tmp_path / "test.mp3"
+        audio_file.write_text("fake audio")
+        samples = np.ones(3, dtype=np.float32)
+
+        with patch("podx.core.diarize.subprocess.run") as mock_run:
+            mock_run.side_effect = [
+                subprocess.CalledProcessError(1, "ffmpeg", stderr=b"no afftdn"),
+                MagicMock(stdout=samples.tobytes()),
+            ]
+            audio = load_diarization_audio(audio_file)
+
+        np.testing.assert_array_equal(audio, samples)
+        assert "-af" not in mock_run.call_args[0][0]
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(DiarizationError, match="Audio file not found"):
+            load_diarization_audio(tmp_path / "missing.wav")
+
+
 class TestDiarizationEngineInit:
     """Test DiarizationEngine initialization."""
 
@@ -216,6 +266,61 @@ class TestDiarizationEngineDiarize:
         mock_whisperx.diarize.DiarizationPipeline.assert_called_once()
         mock_whisperx.diarize.assign_word_speakers.assert_called_once()
 
+    def test_models_reused_across_episodes(
+        self,
+        mock_whisperx,
+        sample_transcript_segments,
+        sample_aligned_result,
+        sample_diarized_result,
+        tmp_path,
+    ):
+        """Test that back-to-back diarizations share the alignment model and pipeline."""
+        audio_file = tmp_path / "test.wav"
+        audio_file.write_text("fake audio")
+
+        mock_whisperx.load_align_model.return_value = (MagicMock(), MagicMock())
+        mock_whisperx.load_audio.return_value = MagicMock()
+        mock_whisperx.align.return_value = sample_aligned_result
+        mock_whisperx.diarize.DiarizationPipeline.return_value = MagicMock()
+        mock_whisperx.diarize.assign_word_speakers.return_value = sample_diarized_result
+
+        for _ in range(2):
+            DiarizationEngine(language="en", device="cpu").diarize(
+                audio_file, sample_transcript_segments
+            )
+
+        mock_whisperx.load_align_model.assert_called_once_with(language_code="en", device="cpu")
+        mock_whisperx.diarize.DiarizationPipeline.assert_called_once()
+
+    def test_decoded_audio_feeds_alignment_and_diarization(
+        self,
+        mock_whisperx,
+        sample_transcript_segments,
+        sample_aligned_result,
+        sample_diarized_result,
+        tmp_path,
+    ):
+        """Test that a pre-decoded buffer skips probing and re-reading the file."""
+        audio_file = tmp_path / "test.wav"
+        audio_file.write_text("fake audio")
+        audio_data = np.zeros(16000 * 90, dtype=np.float32)
+
+        mock_whisperx.load_align_model.return_value = (MagicMock(), MagicMock())
+        mock_whisperx.align.return_value = sample_aligned_result
+        mock_pipeline = MagicMock(return_value=MagicMock())
+        mock_whisperx.diarize.DiarizationPipeline.return_value = mock_pipeline
+        mock_whisperx.diarize.assign_word_speakers.return_value = sample_diarized_result
+
+        engine = DiarizationEngine(language="en", device="cpu")
+        with patch("podx.core.diarize.get_audio_duration") as mock_duration:
+            engine.diarize(audio_file, sample_transcript_segments, audio_data=audio_data)
+
+        mock_duration.assert_not_called()
+        mock_whisperx.load_audio.assert_not_called()
+        assert mock_whisperx.align.call_args[0][3] is audio_data
+        assert mock_pipeline.call_args[0][0] is audio_data
+        assert engine._chunking_info["audio_duration_minutes"] == pytest.approx(1.5)
+
     def test_diarize_missing_audio_file(self, mock_whisperx, sample_transcript_segments, tmp_path):
         """Test that missing audio file raises error."""
         audio_file = tmp_path / "nonexistent.wav"
@@ -872,99 +977,306 @@ class TestMatchSpeakersAcrossChunks:
         # Distance should be high (cosine distance of opposite vectors is 2.0)
         assert distances["SPEAKER_00"] > 0.4
 
-
-class TestMergeChunkSegments:
-    """Test segment merging across chunks."""
-
-    def test_simple_merge(self):
-        """Test basic segment merging."""
-        chunk1_result = {
-            "segments": [{"text": "Hello", "start": 0.0, "end": 1.0, "speaker": "SPEAKER_00"}]
+    def test_optimal_assignment_beats_greedy(self):
+        """Test that an early speaker cannot steal a better match from a later one."""
+        embeddings_prev = {
+            "SPEAKER_00": np.array([1.0, 0.0]),
+            "SPEAKER_01": np.array([0.8, 0.6]),
         }
-        chunk2_result = {
-            "segments": [{"text": "World", "start": 0.0, "end": 1.0, "speaker": "SPEAKER_00"}]
+        embeddings_curr = {
+            # Close to both, slightly closer to prev SPEAKER_00
+            "SPEAKER_00": np.array([0.95, 0.31]),
+            # Only close to prev SPEAKER_00
+            "SPEAKER_01": np.array([1.0, 0.02]),
         }
+        mapping, distances = match_speakers_across_chunks(
+            embeddings_prev, embeddings_curr, threshold=0.1
+        )
+
+        # Greedy matching would give SPEAKER_00 -> SPEAKER_00 and leave SPEAKER_01 new
+        assert mapping == {"SPEAKER_00": "SPEAKER_01", "SPEAKER_01": "SPEAKER_00"}
+        assert all(d < 0.1 for d in distances.values())
+
+
+class TestSliceAudioIntoChunks:
+    """Test in-memory audio chunking."""
+
+    def test_chunks_are_overlapping_views(self):
+        sample_rate = 100
+        audio = np.arange(45 * 60 * sample_rate, dtype=np.float32)
 
-        chunk_times = [(0.0, 60.0), (55.0, 120.0)]  # 5 sec overlap
-        speaker_mappings = [
-            {"SPEAKER_00": "SPEAKER_00"},
-            {"SPEAKER_00": "SPEAKER_00"},
+        chunks = slice_audio_into_chunks(audio, 20.0, overlap_seconds=30.0, sample_rate=sample_rate)
+
+        assert [(start, end) for _, start, end in chunks] == [
+            (0.0, 1200.0),
+            (1170.0, 2370.0),
+            (2340.0, 2700.0),
         ]
+        for chunk_audio, start, end in chunks:
+            assert np.shares_memory(chunk_audio, audio)
+            assert chunk_audio[0] == start * sample_rate
+            assert len(chunk_audio) == (end - start) * sample_rate
 
-        merged = merge_chunk_segments([chunk1_result, chunk2_result], chunk_times, speaker_mappings)
 
-        assert len(merged) >= 1
-        # First segment should have absolute timestamp
-        assert merged[0]["start"] == pytest.approx(0.0, rel=0.01)
+class TestCalculateChunkWorkers:
+    """Test parallel chunk worker sizing."""
 
-    def test_speaker_remapping(self):
-        """Test that speakers are correctly remapped."""
-        chunk1_result = {
-            "segments": [{"text": "Hi", "start": 0.0, "end": 1.0, "speaker": "SPEAKER_00"}]
-        }
-        chunk2_result = {
+    def test_sized_by_memory(self):
+        # 30-min chunks need 2.0 + 30 * 0.15 = 6.5 GB; 32 * 0.8 = 25.6 GB fits 3
+        assert calculate_chunk_workers(32.0, 30.0, num_chunks=8, cpu_count=64) == 3
+
+    def test_capped_by_cpu_chunks_and_max(self):
+        assert calculate_chunk_workers(256.0, 10.0, num_chunks=8, cpu_count=8) == 4
+        assert calculate_chunk_workers(256.0, 10.0, num_chunks=2, cpu_count=64) == 2
+        assert calculate_chunk_workers(256.0, 10.0, 8, max_workers=3, cpu_count=64) == 3
+
+    def test_never_below_one(self):
+        assert calculate_chunk_workers(2.0, 30.0, num_chunks=8, cpu_count=1) == 1
+
+
+class _Turns:
+    """Minimal stand-in for a diarization DataFrame."""
+
+    def __init__(self, idx, offset=0.0):
+        self.idx = idx
+        self.offset = offset
+
+    def __getitem__(self, column):
+        return self.offset
+
+    def assign(self, start, end):
+        return _Turns(self.idx, start)
+
+
+class _Frame(dict):
+    """Column mapping standing in for a pyannote turns DataFrame."""
+
+
+def _turns(*rows):
+    return _Frame(
+        start=[r[0] for r in rows], end=[r[1] for r in rows], speaker=[r[2] for r in rows]
+    )
+
+
+class TestAssignWordSpeakers:
+    """Test vectorized word/segment speaker assignment."""
+
+    def test_words_take_largest_overlap(self):
+        turns = _turns((0.0, 2.0, "SPEAKER_00"), (1.5, 4.0, "SPEAKER_01"))
+        result = {
             "segments": [
                 {
-                    "text": "Hey",
                     "start": 0.0,
-                    "end": 1.0,
-                    "speaker": "SPEAKER_01",  # Different ID
+                    "end": 4.0,
+                    "words": [
+                        {"word": "a", "start": 0.0, "end": 1.0},
+                        {"word": "b", "start": 1.4, "end": 2.0},
+                        {"word": "c", "start": 1.8, "end": 3.0},
+                        {"word": "42"},  # untimed words stay unlabeled
+                        {"word": "d", "start": 5.0, "end": 6.0},
+                    ],
                 }
             ]
         }
 
-        chunk_times = [(0.0, 60.0), (55.0, 120.0)]
-        # Mapping says chunk2's SPEAKER_01 is actually chunk1's SPEAKER_00
-        speaker_mappings = [
-            {"SPEAKER_00": "SPEAKER_00"},
-            {"SPEAKER_01": "SPEAKER_00"},  # Remap
+        assert assign_word_speakers(turns, result) is result
+        words = result["segments"][0]["words"]
+        assert [w.get("speaker") for w in words] == [
+            "SPEAKER_00",
+            "SPEAKER_00",
+            "SPEAKER_01",
+            None,
+            None,
         ]
 
-        merged = merge_chunk_segments([chunk1_result, chunk2_result], chunk_times, speaker_mappings)
+    def test_segment_speaker_is_word_majority(self):
+        turns = _turns((0.0, 1.0, "SPEAKER_00"), (1.0, 10.0, "SPEAKER_01"))
+        seg = {
+            "start": 0.0,
+            "end": 10.0,
+            "words": [
+                {"word": "a", "start": 0.1, "end": 0.3},
+                {"word": "b", "start": 0.4, "end": 0.6},
+                {"word": "c", "start": 5.0, "end": 9.0},
+            ],
+        }
+        assign_word_speakers(turns, {"segments": [seg]})
+        # Two short words outvote one long one
+        assert seg["speaker"] == "SPEAKER_00"
+
+    def test_segment_without_timed_words_uses_overlap(self):
+        turns = _turns((0.0, 1.0, "SPEAKER_00"), (1.0, 10.0, "SPEAKER_01"))
+        seg = {"start": 0.5, "end": 4.0, "words": [{"word": "42"}]}
+        assign_word_speakers(turns, {"segments": [seg]})
+        assert seg["speaker"] == "SPEAKER_01"
+
+    def test_overlapping_turns_of_one_speaker_count_once(self):
+        starts, ends = np.array([0.0]), np.array([4.0])
+        codes, names = speaker_overlaps(
+            starts,
+            ends,
+            np.array([0.0, 0.5, 0.0]),
+            np.array([2.0, 2.5, 2.4]),
+            np.array(["SPEAKER_00", "SPEAKER_00", "SPEAKER_01"]),
+        )
+        # SPEAKER_00 covers 2.5s as a union, not 4s as a sum
+        assert names[codes[0]] == "SPEAKER_00"
+
+    def test_matches_pairwise_reference(self):
+        rng = np.random.default_rng(7)
+        turn_starts = np.sort(rng.uniform(0, 100, 40))
+        turn_ends = turn_starts + rng.uniform(0.5, 6.0, 40)
+        turn_speakers = rng.choice(["SPEAKER_00", "SPEAKER_01", "SPEAKER_02"], 40)
+        word_starts = rng.uniform(0, 105, 300)
+        word_ends = word_starts + rng.uniform(0.05, 1.0, 300)
+
+        codes, names = speaker_overlaps(
+            word_starts, word_ends, turn_starts, turn_ends, turn_speakers
+        )
+
+        # Brute force: per word and speaker, the length of the union of clipped turns
+        grid = np.linspace(0, 106, 106_001)
+        step = grid[1] - grid[0]
+        for i in range(0, len(word_starts), 10):
+            in_word = (grid >= word_starts[i]) & (grid < word_ends[i])
+            expected = {}
+            for spk in set(turn_speakers):
+                mine = turn_speakers == spk
+                covered = np.zeros_like(grid, dtype=bool)
+                for s, e in zip(turn_starts[mine], turn_ends[mine]):
+                    covered |= (grid >= s) & (grid < e)
+                expected[spk] = (covered & in_word).sum() * step
+            if max(expected.values()) == 0:
+                assert codes[i] == -1
+            else:
+                assert expected[names[codes[i]]] == pytest.approx(
+                    max(expected.values()), abs=3 * step
+                )
+
+    def test_word_table_skips_untimed_words(self):
+        table = WordTable(
+            [
+                {"words": [{"word": "a", "start": 0.0, "end": 1.0}, {"word": "1"}]},
+                {"words": [{"word": "b", "start": 2.0, "end": 3.0}]},
+            ]
+        )
+        assert table.segment.tolist() == [0, 1]
+        np.testing.assert_allclose(table.start, [0.0, 2.0])
+
+
+class TestAlignedSegmentIndex:
+    """Test chunk lookups over aligned segments."""
+
+    def test_starting_between_uses_half_open_range(self):
+        segments = [{"start": float(s), "end": s + 5.0} for s in (20, 0, 10, 30)]
+        index = AlignedSegmentIndex(segments)
+
+        found = index.starting_between(10.0, 30.0)
+
+        assert [seg["start"] for seg in found] == [10.0, 20.0]
+        # Lookups return the original dicts, not copies
+        assert found[0] is segments[2]
+
+
+class TestParallelChunkDiarization:
+    """Test that parallel chunk diarization matches sequential output."""
+
+    CHUNKS = [
+        (np.full(4, 0.0), 0.0, 600.0),
+        (np.full(4, 1.0), 570.0, 1170.0),
+        (np.full(4, 2.0), 1140.0, 1740.0),
+    ]
 
-        # Second segment should be remapped to SPEAKER_00
-        if len(merged) > 1:
-            assert merged[1]["speaker"] == "SPEAKER_00"
+    @staticmethod
+    def _pipeline(chunk_audio, return_embeddings=False, **kwargs):
+        # Chunk 0 finishes last; chunk 2 introduces a new speaker
+        idx = int(chunk_audio[0])
+        time.sleep(0.02 * (2 - idx))
+        embeddings = {
+            "SPEAKER_00": np.array([1.0, 0.0, 0.0]),
+            "SPEAKER_01": np.array([0.0, 1.0, 0.0]) if idx != 2 else np.array([0.0, 0.0, 1.0]),
+        }
+        return _Turns(idx), embeddings
 
-    def test_overlap_handling(self):
-        """Test that overlap regions are handled correctly."""
-        # Segment at 58 seconds in chunk1
-        chunk1_result = {
+    @staticmethod
+    def _assign(diarized, chunk_aligned):
+        speaker = "SPEAKER_01" if diarized.idx == 2 else "SPEAKER_00"
+        return {
             "segments": [
-                {
-                    "text": "End of first",
-                    "start": 58.0,
-                    "end": 59.0,
-                    "speaker": "SPEAKER_00",
-                }
+                {**seg, "speaker": speaker, "words": []} for seg in chunk_aligned["segments"]
             ]
         }
-        # Same segment appears at 3 seconds in chunk2 (due to overlap)
-        chunk2_result = {
+
+    def _run(self, mock_whisperx, chunk_workers):
+        mock_whisperx.diarize.DiarizationPipeline.return_value = MagicMock(
+            side_effect=self._pipeline
+        )
+        aligned = {
             "segments": [
-                {
-                    "text": "End of first",
-                    "start": 3.0,
-                    "end": 4.0,
-                    "speaker": "SPEAKER_00",
-                },
-                {
-                    "text": "Start of second",
-                    "start": 10.0,
-                    "end": 11.0,
-                    "speaker": "SPEAKER_00",
-                },
+                {"text": f"seg {i}", "start": i * 300.0, "end": i * 300.0 + 10, "words": []}
+                for i in range(6)
             ]
         }
 
-        chunk_times = [(0.0, 60.0), (55.0, 120.0)]  # 5 sec overlap
-        speaker_mappings = [
-            {"SPEAKER_00": "SPEAKER_00"},
-            {"SPEAKER_00": "SPEAKER_00"},
-        ]
+        def thread_pool(max_workers, mp_context, initializer, initargs):
+            return ThreadPoolExecutor(max_workers, initializer=initializer, initargs=initargs)
+
+        engine = DiarizationEngine(device="cpu", chunk_workers=chunk_workers)
+        with (
+            patch("podx.core.diarize.slice_audio_into_chunks", return_value=self.CHUNKS),
+            patch("podx.core.diarize.os.cpu_count", return_value=16),
+            patch("podx.core.diarize.ProcessPoolExecutor", side_effect=thread_pool) as pool,
+        ):
+            result = engine._diarize_chunked(
+                np.zeros(4), aligned, 10.0, self._assign, available_gb=64.0
+            )
+        return result, engine._chunk_info, pool, engine._memory_samples
+
+    def test_parallel_matches_sequential(self, mock_whisperx):
+        sequential, seq_info, seq_pool, seq_memory = self._run(mock_whisperx, chunk_workers=1)
+        parallel, par_info, par_pool, par_memory = self._run(mock_whisperx, chunk_workers=3)
+
+        seq_pool.assert_not_called()
+        assert par_pool.call_args.kwargs["max_workers"] == 3
+        assert parallel == sequential
+        assert [c["mapping"] for c in par_info] == [c["mapping"] for c in seq_info]
+        assert par_info[2]["mapping"]["SPEAKER_01"] == "SPEAKER_02"
+        # Each aligned segment is labeled once, by the first chunk it overlaps
+        assert [seg["start"] for seg in parallel["segments"]] == [i * 300.0 for i in range(6)]
+        assert parallel["segments"][-1]["speaker"] == "SPEAKER_02"
+        # Memory is sampled per chunk, and only when chunks run one at a time
+        assert [minutes for minutes, _ in seq_memory] == [10.0, 10.0, 10.0]
+        assert par_memory == []
+
+    def test_speaker_embeddings_use_global_ids(self, mock_whisperx):
+        engine = DiarizationEngine(device="cpu")
+        assert engine.speaker_embeddings == {}
+
+        mock_whisperx.diarize.DiarizationPipeline.return_value = MagicMock(
+            side_effect=self._pipeline
+        )
+        with patch("podx.core.diarize.slice_audio_into_chunks", return_value=self.CHUNKS):
+            engine._diarize_chunked(
+                np.zeros(4), {"segments": []}, 10.0, self._assign, available_gb=64.0
+            )
+
+        assert sorted(engine.speaker_embeddings) == ["SPEAKER_00", "SPEAKER_01", "SPEAKER_02"]
 
-        merged = merge_chunk_segments([chunk1_result, chunk2_result], chunk_times, speaker_mappings)
+    def test_chunk_failure_raises_diarization_error(self, mock_whisperx):
+        mock_whisperx.diarize.DiarizationPipeline.return_value = MagicMock(
+            side_effect=RuntimeError("OOM")
+        )
 
-        # Should not have duplicate segments from overlap
-        texts = [seg["text"] for seg in merged]
-        assert texts.count("End of first") <= 1
+        def thread_pool(max_workers, mp_context, initializer, initargs):
+            return ThreadPoolExecutor(max_workers, initializer=initializer, initargs=initargs)
+
+        engine = DiarizationEngine(device="cpu", chunk_workers=0)
+        with (
+            patch("podx.core.diarize.slice_audio_into_chunks", return_value=self.CHUNKS),
+            patch("podx.core.diarize.os.cpu_count", return_value=16),
+            patch("podx.core.diarize.ProcessPoolExecutor", side_effect=thread_pool),
+        ):
+            with pytest.raises(DiarizationError, match="Diarization failed on chunk"):
+                engine._diarize_chunked(
+                    np.zeros(4), {"segments": []}, 10.0, self._assign, available_gb=64.0
+                )
@@ -0,0 +1,170 @@
+"""Unit tests for podx.core.diarize_memory module."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from podx.core.diarize import (
+    DEFAULT_MEMORY_MODEL,
+    DiarizationError,
+    calculate_chunk_duration,
+    calibrate_memory_model,
+)
+from podx.core.diarize_memory import (
+    MAX_SAMPLES_PER_DEVICE,
+    MIN_PER_MINUTE_GB,
+    MemoryModel,
+    MemoryProfile,
+    PeakMemorySampler,
+    fit_memory_model,
+)
+
+
+class TestFitMemoryModel:
+    def test_no_samples_returns_default(self):
+        assert fit_memory_model([], DEFAULT_MEMORY_MODEL) is DEFAULT_MEMORY_MODEL
+
+    def test_linear_fit(self):
+        samples = [(10.0, 3.0), (20.0, 4.0), (40.0, 6.0)]
+        model = fit_memory_model(samples, DEFAULT_MEMORY_MODEL)
+
+        assert model.per_minute_gb == pytest.approx(0.1)
+        assert model.base_gb == pytest.approx(2.0)
+        assert model.samples == 3
+
+    def test_base_covers_every_sample(self):
+        samples = [(10.0, 3.5), (20.0, 4.0), (40.0, 6.0)]
+        model = fit_memory_model(samples, DEFAULT_MEMORY_MODEL)
+
+        assert all(model.estimate(m) >= p - 1e-9 for m, p in samples)
+
+    def test_single_duration_keeps_default_slope(self):
+        model = fit_memory_model([(10.0, 2.5)], DEFAULT_MEMORY_MODEL)
+
+        assert model.per_minute_gb == DEFAULT_MEMORY_MODEL.per_minute_gb
+        assert model.base_gb == pytest.approx(1.0)
+
+    def test_never_grows_slower_than_default_past_samples(self):
+        # Short runs fit a shallow line; long episodes must not inherit it
+        model = fit_memory_model([(2.0, 0.4), (5.0, 0.6), (10.0, 0.9)], DEFAULT_MEMORY_MODEL)
+
+        assert model.per_minute_gb < DEFAULT_MEMORY_MODEL.per_minute_gb
+        assert model.estimate(10.0) == pytest.approx(0.9, abs=0.05)
+        growth = model.estimate(200.0) - model.estimate(100.0)
+        assert growth == pytest.approx(100 * DEFAULT_MEMORY_MODEL.per_minute_gb)
+        assert model.estimate(model.minutes_within(6.0)) == pytest.approx(6.0)
+
+    def test_slope_is_floored(self):
+        model = fit_memory_model([(10.0, 5.0), (20.0, 4.0)], DEFAULT_MEMORY_MODEL)
+        assert model.per_minute_gb == MIN_PER_MINUTE_GB
+
+
+class TestMemoryProfile:
+    def test_record_persists_per_device(self, tmp_path):
+        path = tmp_path / "profile.json"
+        profile = MemoryProfile(path)
+        profile.record("cpu", 10.0, 3.0, DEFAULT_MEMORY_MODEL)
+        model = profile.record("cpu", 20.0, 4.0, DEFAULT_MEMORY_MODEL)
+
+        reloaded = MemoryProfile(path)
+        assert reloaded.samples("cpu") == [(10.0, 3.0), (20.0, 4.0)]
+        assert reloaded.model("cpu", DEFAULT_MEMORY_MODEL) == model
+        assert reloaded.model("mps", DEFAULT_MEMORY_MODEL) is DEFAULT_MEMORY_MODEL
+
+    def test_keeps_most_recent_samples(self, tmp_path):
+        profile = MemoryProfile(tmp_path / "profile.json")
+        for i in range(MAX_SAMPLES_PER_DEVICE + 5):
+            profile.record("cpu", float(i + 1), 3.0, DEFAULT_MEMORY_MODEL)
+
+        samples = profile.samples("cpu")
+        assert len(samples) == MAX_SAMPLES_PER_DEVICE
+        assert samples[-1][0] == MAX_SAMPLES_PER_DEVICE + 5
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        path = tmp_path / "profile.json"
+        path.write_text("{not json", encoding="utf-8")
+        profile = MemoryProfile(path)
+
+        assert profile.samples("cpu") == []
+        profile.record("cpu", 10.0, 3.0, DEFAULT_MEMORY_MODEL)
+        assert json.loads(path.read_text())["devices"]["cpu"]["samples"] == [[10.0, 3.0]]
+
+    def test_old_format_is_discarded(self, tmp_path):
+        # Version 1 profiles recorded absolute RSS, which overstates growth
+        path = tmp_path / "profile.json"
+        path.write_text(json.dumps({"devices": {"cpu": {"samples": [[10.0, 9.0]]}}}))
+
+        assert MemoryProfile(path).samples("cpu") == []
+
+    def test_reset(self, tmp_path):
+        profile = MemoryProfile(tmp_path / "profile.json")
+        profile.record("cpu", 10.0, 3.0, DEFAULT_MEMORY_MODEL)
+        profile.reset("cpu")
+        assert profile.samples("cpu") == []
+
+    def test_default_path_is_isolated(self, isolated_memory_profile):
+        MemoryProfile().record("cpu", 10.0, 3.0, DEFAULT_MEMORY_MODEL)
+        assert isolated_memory_profile.exists()
+
+
+class TestCalibratedChunkSizing:
+    def test_lean_model_avoids_chunking(self):
+        # Defaults: 2 + 120 * 0.15 = 20 GB > 16 * 0.8, so 120 min would be chunked
+        _, needs_chunking = calculate_chunk_duration(16.0, 120.0)
+        assert needs_chunking
+
+        lean = MemoryModel(base_gb=1.5, per_minute_gb=0.05)
+        _, needs_chunking = calculate_chunk_duration(16.0, 120.0, lean)
+        assert not needs_chunking
+
+    def test_single_short_sample_still_chunks_long_episode(self):
+        # A warm-pool 10 min run that grew less than the default base
+        model = fit_memory_model([(10.0, 1.0)], DEFAULT_MEMORY_MODEL)
+
+        assert calculate_chunk_duration(8.0, 300.0, model)[1]
+        assert calculate_chunk_duration(8.0, 300.0)[1]
+
+
+class TestCalibrateMemoryModel:
+    def _calibrate(self, profile, pipeline):
+        with (
+            patch("podx.core.diarize.load_diarization_pipeline", return_value=pipeline),
+            patch("podx.core.diarize.synthesize_conversation", return_value=MagicMock()),
+        ):
+            return calibrate_memory_model(
+                device="cpu", durations_minutes=(1.0, 2.0), memory_profile=profile
+            )
+
+    def test_replaces_existing_samples(self, tmp_path):
+        profile = MemoryProfile(tmp_path / "profile.json")
+        profile.record("cpu", 10.0, 9.0, DEFAULT_MEMORY_MODEL)
+
+        self._calibrate(profile, MagicMock())
+        assert [m for m, _ in profile.samples("cpu")] == [1.0, 2.0]
+
+    def test_failed_run_keeps_existing_samples(self, tmp_path):
+        profile = MemoryProfile(tmp_path / "profile.json")
+        profile.record("cpu", 10.0, 3.0, DEFAULT_MEMORY_MODEL)
+        pipeline = MagicMock(side_effect=[None, RuntimeError("out of memory")])
+
+        with pytest.raises(DiarizationError, match="Calibration run failed"):
+            self._calibrate(profile, pipeline)
+        assert profile.samples("cpu") == [(10.0, 3.0)]
+
+
+class TestPeakMemorySampler:
+    def test_reports_rss(self):
+        with PeakMemorySampler(interval=0.01) as sampler:
+            buffer = bytearray(32 * 1024 * 1024)
+        del buffer
+        assert sampler.peak_gb > 0.03
+
+    def test_growth_excludes_memory_held_before_entry(self):
+        held = b"\x01" * (64 * 1024 * 1024)
+        with PeakMemorySampler(interval=0.01) as sampler:
+            buffer = bytearray(16 * 1024 * 1024)
+        del buffer, held
+
+        assert sampler.growth_gb < sampler.peak_gb - 0.05
+        assert sampler.growth_gb < 0.05
@@ -0,0 +1,207 @@
+"""Unit tests for the chunked OpenAI Whisper upload path."""
+
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from podx.core.transcription import ProviderConfig
+from podx.core.transcription.openai_provider import (
+    OpenAIProvider,
+    detect_silences,
+    parse_verbose_language,
+    parse_verbose_segments,
+    plan_upload_chunks,
+    transcribe_chunked,
+)
+
+MODULE = "podx.core.transcription.openai_provider"
+
+SILENCEDETECT_STDERR = """
+[silencedetect @ 0x1] silence_start: 598.2
+[silencedetect @ 0x1] silence_end: 599.0 | silence_duration: 0.8
+[silencedetect @ 0x1] silence_start: 1205.5
+[silencedetect @ 0x1] silence_end: 1206.5 | silence_duration: 1.0
+"""
+
+
+class TestPlanUploadChunks:
+    """Test silence-aware piece planning."""
+
+    def test_short_audio_is_one_piece(self):
+        assert plan_upload_chunks(300.0, [], chunk_seconds=600) == [(0.0, 300.0)]
+
+    def test_cuts_at_nearest_silence_midpoint(self):
+        pieces = plan_upload_chunks(
+            1800.0, [(598.2, 599.0), (1205.5, 1206.5)], chunk_seconds=600, search_seconds=30
+        )
+
+        assert pieces[0] == (0.0, pytest.approx(598.6))
+        assert pieces[1] == (pytest.approx(598.6), 1206.0)
+        assert pieces[-1][1] == 1800.0
+
+    def test_hard_cut_without_nearby_silence(self):
+        pieces = plan_upload_chunks(1000.0, [(100.0, 101.0)], chunk_seconds=600, search_seconds=30)
+
+        assert pieces == [(0.0, 600.0), (600.0, 1000.0)]
+
+    def test_pieces_are_contiguous(self):
+        pieces = plan_upload_chunks(7200.0, [], chunk_seconds=600)
+
+        assert pieces[0][0] == 0.0
+        assert pieces[-1][1] == 7200.0
+        assert all(a[1] == b[0] for a, b in zip(pieces, pieces[1:]))
+
+
+class TestDetectSilences:
+    """Test ffmpeg silencedetect parsing."""
+
+    @patch(MODULE + ".subprocess.run")
+    def test_parses_stderr(self, mock_run):
+        mock_run.return_value = MagicMock(stderr=SILENCEDETECT_STDERR)
+
+        assert detect_silences(Path("/ep/audio.mp3")) == [(598.2, 599.0), (1205.5, 1206.5)]
+
+    @patch(MODULE + ".subprocess.run")
+    def test_missing_ffmpeg_returns_empty(self, mock_run):
+        mock_run.side_effect = FileNotFoundError("ffmpeg")
+
+        assert detect_silences(Path("/ep/audio.mp3")) == []
+
+
+class TestParseVerboseSegments:
+    """Test response parsing."""
+
+    def test_offsets_timestamps(self):
+        resp = {"text": "hi", "segments": [{"start": 1.0, "end": 2.0, "text": "hi"}]}
+
+        segments, text = parse_verbose_segments(resp, offset=600.0)
+
+        assert segments == [{"start": 601.0, "end": 602.0, "text": "hi"}]
+        assert text == "hi"
+
+    @pytest.mark.parametrize(
+        "language, expected",
+        [("english", "en"), ("Spanish", "es"), ("de", "de"), ("klingon", None), (None, None)],
+    )
+    def test_language_maps_to_iso_code(self, language, expected):
+        assert parse_verbose_language({"text": "", "language": language}) == expected
+
+
+class TestTranscribeChunked:
+    """Test concurrent piece upload and merge."""
+
+    @pytest.fixture(autouse=True)
+    def fake_ffmpeg(self, monkeypatch):
+        """Skip silence detection and write placeholder pieces."""
+
+        def encode(audio_path, start, end, output_path):
+            output_path.write_bytes(b"opus")
+            return output_path
+
+        monkeypatch.setattr(MODULE + ".detect_silences", lambda audio_path: [])
+        monkeypatch.setattr(MODULE + ".encode_chunk", encode)
+
+    def test_merges_pieces_in_order_with_offsets(self):
+        client = MagicMock()
+        calls = iter([0.05, 0.0, 0.02])
+
+        def create(model, file, response_format):
+            # Finish out of order; merge must still follow piece order
+            time.sleep(next(calls))
+            index = int(Path(file.name).stem.split("_")[1])
+            return {
+                "text": f"piece {index}",
+                "language": "german" if index == 1 else "english",
+                "segments": [{"start": 0.5, "end": 1.5, "text": f"piece {index}"}],
+            }
+
+        client.audio.transcriptions.create.side_effect = create
+        progress = []
+
+        with patch(MODULE + ".probe_duration", return_value=1500.0):
+            segments, text, language = transcribe_chunked(
+                client,
+                Path("/ep/audio.mp3"),
+                "whisper-1",
+                chunk_seconds=500,
+                max_concurrency=3,
+                progress_callback=progress.append,
+            )
+
+        assert [s["text"] for s in segments] == ["piece 0", "piece 1", "piece 2"]
+        assert [s["start"] for s in segments] == [0.5, 500.5, 1000.5]
+        assert text == "piece 0 piece 1 piece 2"
+        assert language == "en"
+        assert client.audio.transcriptions.create.call_count == 3
+        assert progress[1:] == [f"Transcribed piece {n}/3" for n in (1, 2, 3)]
+
+    def test_concurrency_is_bounded(self):
+        client = MagicMock()
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def create(model, file, response_format):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return {"text": "", "segments": []}
+
+        client.audio.transcriptions.create.side_effect = create
+
+        with patch(MODULE + ".probe_duration", return_value=6000.0):
+            transcribe_chunked(
+                client, Path("/ep/audio.mp3"), "whisper-1", chunk_seconds=600, max_concurrency=2
+            )
+
+        assert client.audio.transcriptions.create.call_count == 10
+        assert peak == 2
+
+
+class TestOpenAIProviderChunking:
+    """Test provider mode selection."""
+
+    @patch("openai.OpenAI")
+    def test_explicit_chunked_option(self, mock_openai_class, tmp_path):
+        audio = tmp_path / "audio.mp3"
+        audio.write_bytes(b"x")
+        provider = OpenAIProvider(
+            ProviderConfig(model="whisper-1", extra_options={"chunked": True})
+        )
+
+        with patch(
+            MODULE + ".transcribe_chunked",
+            return_value=([{"start": 0.0, "end": 1.0, "text": "hi"}], "hi", "fr"),
+        ) as mock_chunked:
+            result = provider.transcribe(audio)
+
+        mock_chunked.assert_called_once()
+        assert result.text == "hi"
+        assert result.language == "fr"
+        assert result.decoder_options == {"chunked": True}
+        mock_openai_class.return_value.audio.transcriptions.create.assert_not_called()
+
+    @patch("openai.OpenAI")
+    def test_short_file_uses_single_upload(self, mock_openai_class, tmp_path):
+        audio = tmp_path / "audio.mp3"
+        audio.write_bytes(b"x")
+        mock_openai_class.return_value.audio.transcriptions.create.return_value = {
+            "text": "short",
+            "language": "english",
+            "segments": [{"start": 0.0, "end": 2.0, "text": "short"}],
+        }
+        provider = OpenAIProvider(ProviderConfig(model="whisper-1"))
+
+        with patch(MODULE + ".probe_duration", return_value=120.0):
+            result = provider.transcribe(audio)
+
+        assert result.segments == [{"start": 0.0, "end": 2.0, "text": "short"}]
+        assert result.language == "en"
+        mock_openai_class.return_value.audio.transcriptions.create.assert_called_once()
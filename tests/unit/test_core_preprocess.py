@@ -4,17 +4,22 @@ Tests pure business logic without UI dependencies.
 Uses mocking to avoid actual LLM API calls.
 """
 
+import asyncio
+import json
 from unittest import mock
 
 import pytest
 
 from podx.core.preprocess import (
+    DEFAULT_AD_BATCH_SIZE,
+    DEFAULT_RESTORE_BATCH_SIZE,
     TranscriptPreprocessor,
     merge_segments,
     normalize_segments,
     normalize_text,
     preprocess_transcript,
 )
+from podx.llm.tokens import count_tokens, token_budget
 
 
 class TestTranscriptPreprocessor:
@@ -29,7 +34,7 @@ class TestTranscriptPreprocessor:
         assert preprocessor.max_gap == 1.0
         assert preprocessor.max_len == 800
         assert preprocessor.restore_model == "gpt-4o-mini"
-        assert preprocessor.restore_batch_size == 20
+        assert preprocessor.restore_batch_size == DEFAULT_RESTORE_BATCH_SIZE
 
     @mock.patch("podx.core.preprocess.get_provider")
     def test_init_custom_options(self, mock_get_provider):
@@ -324,7 +329,7 @@ class TestAdFiltering:
         mock_provider = mock.Mock()
         mock_response = mock.Mock()
         mock_response.content = "CONTENT\nCONTENT\nCONTENT"
-        mock_provider.complete.return_value = mock_response
+        mock_provider.complete_async = mock.AsyncMock(return_value=mock_response)
         mock_get_provider.return_value = mock_provider
 
         preprocessor = TranscriptPreprocessor(skip_ads=True)
@@ -344,7 +349,7 @@ class TestAdFiltering:
         mock_provider = mock.Mock()
         mock_response = mock.Mock()
         mock_response.content = "CONTENT\nAD\nCONTENT"
-        mock_provider.complete.return_value = mock_response
+        mock_provider.complete_async = mock.AsyncMock(return_value=mock_response)
         mock_get_provider.return_value = mock_provider
 
         preprocessor = TranscriptPreprocessor(skip_ads=True)
@@ -368,7 +373,7 @@ class TestAdFiltering:
         mock_provider = mock.Mock()
         mock_response = mock.Mock()
         mock_response.content = "CONTENT\nAD\nCONTENT"
-        mock_provider.complete.return_value = mock_response
+        mock_provider.complete_async = mock.AsyncMock(return_value=mock_response)
         mock_get_provider.return_value = mock_provider
 
         preprocessor = TranscriptPreprocessor(skip_ads=True)
@@ -395,7 +400,7 @@ class TestAdFiltering:
         mock_provider = mock.Mock()
         mock_response = mock.Mock()
         mock_response.content = "CONTENT\nAD\nCONTENT"
-        mock_provider.complete.return_value = mock_response
+        mock_provider.complete_async = mock.AsyncMock(return_value=mock_response)
         mock_get_provider.return_value = mock_provider
 
         preprocessor = TranscriptPreprocessor(skip_ads=True, merge=True, normalize=True)
@@ -437,7 +442,7 @@ class TestAdFiltering:
         mock_response = mock.Mock()
         # LLM returns unexpected format
         mock_response.content = "MAYBE\nUNKNOWN\nPOSSIBLY_AD"
-        mock_provider.complete.return_value = mock_response
+        mock_provider.complete_async = mock.AsyncMock(return_value=mock_response)
         mock_get_provider.return_value = mock_provider
 
         preprocessor = TranscriptPreprocessor(skip_ads=True)
@@ -459,3 +464,277 @@ class TestAdFiltering:
 
         assert filtered == []
         assert ads_removed == 0
+
+
+class _SlowProvider:
+    """Async LLM stand-in: upper-cases restore batches, flags "code" segments as ads.
+
+    Later batches answer first, so results only line up if reassembly keeps order.
+    """
+
+    DELIMITER = "\n---SEGMENT---\n"
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.prompts = []
+
+    async def complete_async(self, messages, model, **kwargs):
+        prompt = messages[1].content
+        self.prompts.append(prompt)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.05 / len(self.prompts))
+        self.in_flight -= 1
+
+        parts = prompt.split("\n\n", 1)[1].split(self.DELIMITER)
+        if prompt.startswith("Classify"):
+            content = "\n".join("AD" if "code" in p else "CONTENT" for p in parts)
+        else:
+            content = self.DELIMITER.join(p.upper() for p in parts)
+        return mock.Mock(content=content)
+
+
+class TestConcurrentLLMBatches:
+    """Test bounded, order-preserving concurrent LLM batches."""
+
+    def test_restore_batches_run_concurrently_in_order(self):
+        provider = _SlowProvider()
+        preprocessor = TranscriptPreprocessor(
+            restore=True, restore_batch_size=5, max_concurrent_requests=3, llm_provider=provider
+        )
+        texts = [f"segment {i}" for i in range(40)]
+
+        result = preprocessor.semantic_restore(texts)
+
+        assert result == [t.upper() for t in texts]
+        assert len(provider.prompts) == 8
+        assert 1 < provider.peak <= 3
+
+    def test_ad_classification_keeps_batch_order(self):
+        provider = _SlowProvider()
+        preprocessor = TranscriptPreprocessor(
+            skip_ads=True, ad_batch_size=2, llm_provider=provider, ad_prefilter=False
+        )
+        segments = [{"text": t} for t in ["a", "b", "use code X", "c", "d", "code Y", "e"]]
+
+        assert preprocessor.classify_ad_segments(segments) == [
+            False,
+            False,
+            True,
+            False,
+            False,
+            True,
+            False,
+        ]
+
+    def test_concurrent_ads_and_restore_match_sequential(self):
+        segments = [
+            {"text": "hello there", "start": 0.0, "end": 1.0},
+            {"text": "use code PODX", "start": 1.2, "end": 2.0},
+            {"text": "welcome back", "start": 2.2, "end": 3.0},
+            {"text": "and more", "start": 3.1, "end": 4.0},
+            {"text": "later on", "start": 10.0, "end": 11.0},
+        ]
+        options = dict(merge=True, normalize=True, max_gap=1.0)
+
+        options = dict(options, cache_responses=False)
+
+        filtered = TranscriptPreprocessor(
+            skip_ads=True, llm_provider=_SlowProvider(), **options
+        ).preprocess({"segments": [dict(s) for s in segments]})
+
+        provider = _SlowProvider()
+        result = TranscriptPreprocessor(
+            skip_ads=True, restore=True, llm_provider=provider, **options
+        ).preprocess({"segments": [dict(s) for s in segments]})
+
+        assert result["ads_removed"] == 1
+        assert [s["text"] for s in result["segments"]] == [
+            s["text"].upper() for s in filtered["segments"]
+        ]
+        # Classification and speculative restore overlap, then one follow-up
+        # restore for the segments whose merge changed when the ad was removed
+        assert provider.peak == 2
+        assert len(provider.prompts) == 3
+
+    def test_concurrent_ads_and_restore_share_request_slots(self):
+        segments = [{"text": f"segment {i}", "start": float(i), "end": i + 0.5} for i in range(40)]
+        provider = _SlowProvider()
+        TranscriptPreprocessor(
+            skip_ads=True,
+            restore=True,
+            ad_batch_size=5,
+            restore_batch_size=5,
+            max_concurrent_requests=3,
+            llm_provider=provider,
+            cache_responses=False,
+            ad_prefilter=False,
+        ).preprocess({"segments": segments})
+
+        assert len(provider.prompts) == 16
+        assert provider.peak == 3
+
+    def test_rerun_is_answered_from_response_cache(self):
+        segments = [{"text": f"segment {i}", "start": float(i), "end": i + 0.5} for i in range(9)]
+        provider = _SlowProvider()
+
+        def run():
+            return TranscriptPreprocessor(
+                skip_ads=True, restore=True, restore_batch_size=4, llm_provider=provider
+            ).preprocess({"segments": [dict(s) for s in segments]})
+
+        first = run()
+        calls = len(provider.prompts)
+        second = run()
+
+        assert second["segments"] == first["segments"]
+        assert len(provider.prompts) == calls
+
+
+class TestTokenBudgetBatching:
+    """Test batches packed by token budget rather than segment count."""
+
+    def test_short_segments_share_one_restore_request(self):
+        provider = _SlowProvider()
+        preprocessor = TranscriptPreprocessor(
+            restore=True, restore_batch_size=None, llm_provider=provider, cache_responses=False
+        )
+        texts = [f"segment {i}" for i in range(200)]
+
+        assert preprocessor.semantic_restore(texts) == [t.upper() for t in texts]
+        assert len(provider.prompts) == 1
+
+    def test_restore_batches_are_capped_by_default(self):
+        provider = _SlowProvider()
+        preprocessor = TranscriptPreprocessor(
+            restore=True, llm_provider=provider, cache_responses=False
+        )
+        texts = [f"segment {i}" for i in range(100)]
+
+        assert preprocessor.semantic_restore(texts) == [t.upper() for t in texts]
+        assert len(provider.prompts) == 100 // DEFAULT_RESTORE_BATCH_SIZE
+
+    def test_long_segments_are_split_to_fit_context(self):
+        provider = _SlowProvider()
+        # Unknown model: the conservative default context window applies
+        preprocessor = TranscriptPreprocessor(
+            restore=True, restore_model="local-llm", llm_provider=provider, cache_responses=False
+        )
+        texts = [f"{i}" + " word" * 400 for i in range(12)]
+
+        assert preprocessor.semantic_restore(texts) == [t.upper() for t in texts]
+        assert len(provider.prompts) > 1
+        budget = token_budget("local-llm", output_ratio=1.0)
+        for prompt in provider.prompts:
+            body = prompt.split("\n\n", 1)[1]
+            assert count_tokens(body, "local-llm") <= budget
+
+    def test_ad_batch_size_caps_segments(self):
+        provider = _SlowProvider()
+        preprocessor = TranscriptPreprocessor(
+            skip_ads=True,
+            ad_batch_size=10,
+            llm_provider=provider,
+            cache_responses=False,
+            ad_prefilter=False,
+        )
+        preprocessor.classify_ad_segments([{"text": f"s{i}"} for i in range(25)])
+
+        assert len(provider.prompts) == 3
+
+    def test_ad_batches_are_capped_by_default(self):
+        provider = _SlowProvider()
+        preprocessor = TranscriptPreprocessor(
+            skip_ads=True, llm_provider=provider, cache_responses=False, ad_prefilter=False
+        )
+        preprocessor.classify_ad_segments([{"text": f"s{i}"} for i in range(100)])
+
+        assert len(provider.prompts) == 3
+        assert provider.prompts[0].startswith(
+            f"Classify these {DEFAULT_AD_BATCH_SIZE} transcript segments"
+        )
+
+
+class TestAdPrefilter:
+    """Test that only windows around likely ads reach the LLM."""
+
+    def test_only_windows_around_hits_are_escalated(self):
+        provider = _SlowProvider()
+        segments = [{"text": f"we talk about topic {i}"} for i in range(100)]
+        segments[40] = {"text": "This episode is brought to you by Acme, use code X"}
+        segments[41] = {"text": "Acme makes the best widgets"}
+        preprocessor = TranscriptPreprocessor(
+            skip_ads=True, llm_provider=provider, cache_responses=False, ad_prefilter=True
+        )
+
+        is_ad = preprocessor.classify_ad_segments(segments)
+
+        assert [i for i, ad in enumerate(is_ad) if ad] == [40]
+        # Segment 40 is decided locally; its neighbours go to the LLM
+        assert len(provider.prompts) == 1
+        assert provider.prompts[0].startswith("Classify these 4 transcript segments")
+
+    def test_no_hits_skip_the_llm(self):
+        provider = _SlowProvider()
+        preprocessor = TranscriptPreprocessor(
+            skip_ads=True, llm_provider=provider, cache_responses=False, ad_prefilter=True
+        )
+
+        is_ad = preprocessor.classify_ad_segments([{"text": "plain talk"}] * 50)
+
+        assert is_ad == [False] * 50
+        assert provider.prompts == []
+
+    def test_llm_answers_train_the_scorer(self, isolated_ad_classifier):
+        provider = _SlowProvider()
+        preprocessor = TranscriptPreprocessor(
+            skip_ads=True, llm_provider=provider, cache_responses=False, ad_prefilter=True
+        )
+        preprocessor.classify_ad_segments(
+            [{"text": "hello"}, {"text": "use code PODX for a discount"}, {"text": "bye"}]
+        )
+
+        saved = json.loads(isolated_ad_classifier.read_text())
+        assert saved["segments"] == {"ad": 1, "content": 2}
+        assert saved["words"]["ad"]["podx"] == 1
+
+    def test_disabled_by_default(self):
+        preprocessor = TranscriptPreprocessor(skip_ads=True, llm_provider=_SlowProvider())
+        assert preprocessor.ad_scorer is None
+
+    def test_window_widens_across_long_sponsor_read(self):
+        read = [
+            "This episode is brought to you by Athletic Greens.",
+            "AG1 is a daily drink with seventy five vitamins and minerals.",
+            "I have been drinking it every morning for two years.",
+            "It replaces a whole cabinet of supplements.",
+            "It tastes great and it is easy to travel with.",
+            "Just visit athleticgreens.com slash podcast",
+            "to get a year of vitamin D with your first purchase.",
+        ]
+        segments = [{"text": f"we talk about topic {i}"} for i in range(20)]
+        segments += [{"text": text} for text in read]
+        segments += [{"text": f"back to topic {i}"} for i in range(20)]
+        ads = set(read)
+
+        class _SponsorProvider:
+            def __init__(self):
+                self.prompts = []
+
+            async def complete_async(self, messages, model, **kwargs):
+                prompt = messages[1].content
+                self.prompts.append(prompt)
+                parts = prompt.split("\n\n", 1)[1].split(_SlowProvider.DELIMITER)
+                labels = ["AD" if p in ads else "CONTENT" for p in parts]
+                return mock.Mock(content="\n".join(labels))
+
+        provider = _SponsorProvider()
+        preprocessor = TranscriptPreprocessor(
+            skip_ads=True, llm_provider=provider, cache_responses=False, ad_prefilter=True
+        )
+
+        is_ad = preprocessor.classify_ad_segments(segments)
+
+        assert [i for i, ad in enumerate(is_ad) if ad] == list(range(20, 27))
+        assert len(provider.prompts) > 1  # Widened after the LLM confirmed the read
@@ -4,6 +4,7 @@ Tests pure business logic without UI dependencies.
 Uses mocking to avoid actual ASR model loading and API calls.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, patch
 
@@ -14,6 +15,7 @@ from podx.core.transcribe import (
     TranscriptionEngine,
     TranscriptionError,
     parse_model_and_provider,
+    plan_vad_windows,
     transcribe_audio,
 )
 
@@ -252,6 +254,21 @@ class TestTranscriptionEngineLocal:
         assert call_args[1]["beam_size"] == 5
         assert call_args[1]["best_of"] == 3
 
+    @patch("faster_whisper.WhisperModel")
+    def test_transcribe_local_reuses_pooled_model(self, mock_whisper_model_class):
+        """Test that repeated transcriptions reuse the loaded model."""
+        mock_model = MagicMock()
+        mock_whisper_model_class.return_value = mock_model
+        mock_model.transcribe.return_value = ([], MagicMock(language="en"))
+
+        audio_path = Path("/fake/audio.wav")
+        with patch.object(Path, "exists", return_value=True):
+            TranscriptionEngine(model="small", compute_type="int8").transcribe(audio_path)
+            TranscriptionEngine(model="small", compute_type="int8").transcribe(audio_path)
+
+        mock_whisper_model_class.assert_called_once_with("small", device="cpu", compute_type="int8")
+        assert mock_model.transcribe.call_count == 2
+
     def test_transcribe_local_missing_file(self):
         """Test error when audio file doesn't exist."""
         engine = TranscriptionEngine()
@@ -306,6 +323,218 @@ class TestTranscriptionEngineLocal:
         callback.assert_any_call("Transcribing audio")
 
 
+@pytest.mark.skipif(not HAS_FASTER_WHISPER, reason="faster-whisper not installed")
+class TestTranscriptionEngineCheckpoint:
+    """Test JSONL checkpointing and resume for local transcription."""
+
+    @patch("faster_whisper.WhisperModel")
+    def test_segments_are_checkpointed(self, mock_whisper_model_class, tmp_path):
+        """Every decoded segment lands in the checkpoint, then a complete marker."""
+        from podx.core.checkpoint import read_partial_transcript
+
+        mock_model = MagicMock()
+        mock_whisper_model_class.return_value = mock_model
+        segs = [MagicMock(start=0.0, end=2.0, text="a"), MagicMock(start=2.0, end=4.0, text="b")]
+        mock_model.transcribe.return_value = (segs, MagicMock(language="en"))
+
+        audio_path = tmp_path / "audio.wav"
+        audio_path.write_bytes(b"")
+        checkpoint = tmp_path / "transcript.partial.jsonl"
+
+        TranscriptionEngine(model="small", checkpoint_path=checkpoint).transcribe(audio_path)
+
+        partial = read_partial_transcript(checkpoint)
+        assert partial is not None
+        assert partial.header["asr_model"] == "small"
+        assert [s["text"] for s in partial.segments] == ["a", "b"]
+        assert partial.complete == {"language": "en", "segments_count": 2}
+
+    @patch("faster_whisper.audio.decode_audio")
+    @patch("faster_whisper.WhisperModel")
+    def test_resume_skips_transcribed_audio(self, mock_whisper_model_class, mock_decode, tmp_path):
+        """Resume decodes only audio after the last checkpointed segment."""
+        import numpy as np
+
+        from podx.core.checkpoint import PartialTranscriptWriter
+
+        audio_path = tmp_path / "audio.wav"
+        audio_path.write_bytes(b"")
+        checkpoint = tmp_path / "transcript.partial.jsonl"
+        with PartialTranscriptWriter(
+            checkpoint,
+            header={"audio_path": str(audio_path.resolve()), "asr_model": "small"},
+        ) as writer:
+            writer.write_segment({"start": 0.0, "end": 10.0, "text": "before crash"})
+
+        mock_decode.return_value = np.zeros(16000 * 30, dtype=np.float32)
+        mock_model = MagicMock()
+        mock_whisper_model_class.return_value = mock_model
+        mock_model.transcribe.return_value = (
+            [MagicMock(start=1.0, end=5.0, text="after")],
+            MagicMock(language="en"),
+        )
+
+        engine = TranscriptionEngine(model="small", checkpoint_path=checkpoint, resume=True)
+        result = engine.transcribe(audio_path)
+
+        audio_arg = mock_model.transcribe.call_args[0][0]
+        assert len(audio_arg) == 16000 * 20
+        assert [s["text"] for s in result["segments"]] == ["before crash", "after"]
+        assert result["segments"][1]["start"] == 11.0
+        assert result["segments"][1]["end"] == 15.0
+
+    @patch("faster_whisper.WhisperModel")
+    def test_resume_of_complete_checkpoint_skips_model(self, mock_whisper_model_class, tmp_path):
+        """A finished checkpoint is returned without loading a model."""
+        from podx.core.checkpoint import PartialTranscriptWriter
+
+        audio_path = tmp_path / "audio.wav"
+        audio_path.write_bytes(b"")
+        checkpoint = tmp_path / "transcript.partial.jsonl"
+        with PartialTranscriptWriter(
+            checkpoint,
+            header={"audio_path": str(audio_path.resolve()), "asr_model": "small"},
+        ) as writer:
+            writer.write_segment({"start": 0.0, "end": 1.0, "text": "done"})
+            writer.write_complete(language="de", segments_count=1)
+
+        engine = TranscriptionEngine(model="small", checkpoint_path=checkpoint, resume=True)
+        result = engine.transcribe(audio_path)
+
+        mock_whisper_model_class.assert_not_called()
+        assert result["language"] == "de"
+        assert result["text"] == "done"
+
+    @patch("faster_whisper.WhisperModel")
+    def test_mismatched_checkpoint_starts_over(self, mock_whisper_model_class, tmp_path):
+        """A checkpoint from another model is discarded."""
+        from podx.core.checkpoint import PartialTranscriptWriter, read_partial_transcript
+
+        audio_path = tmp_path / "audio.wav"
+        audio_path.write_bytes(b"")
+        checkpoint = tmp_path / "transcript.partial.jsonl"
+        with PartialTranscriptWriter(
+            checkpoint,
+            header={"audio_path": str(audio_path.resolve()), "asr_model": "large-v3"},
+        ) as writer:
+            writer.write_segment({"start": 0.0, "end": 1.0, "text": "other model"})
+
+        mock_model = MagicMock()
+        mock_whisper_model_class.return_value = mock_model
+        mock_model.transcribe.return_value = ([], MagicMock(language="en"))
+
+        engine = TranscriptionEngine(model="small", checkpoint_path=checkpoint, resume=True)
+        result = engine.transcribe(audio_path)
+
+        assert mock_model.transcribe.call_args[0][0] == str(audio_path)
+        assert result["segments"] == []
+        partial = read_partial_transcript(checkpoint)
+        assert partial is not None
+        assert partial.header["asr_model"] == "small"
+
+
+class TestPlanVadWindows:
+    """Test grouping of VAD speech regions into transcription windows."""
+
+    def test_no_speech(self):
+        """No speech regions produce no windows."""
+        assert plan_vad_windows([], 100.0, 30.0) == []
+
+    def test_cuts_in_middle_of_silence(self):
+        """Windows close at the midpoint of the gap after the target length."""
+        regions = [(1.0, 20.0), (22.0, 40.0), (44.0, 60.0), (62.0, 80.0)]
+        windows = plan_vad_windows(regions, 90.0, 35.0)
+
+        assert windows == [(0.8, 42.0), (42.0, 80.2)]
+
+    def test_windows_are_contiguous_and_cover_speech(self):
+        """Every speech region falls entirely inside exactly one window."""
+        regions = [(float(i * 10), float(i * 10 + 8)) for i in range(30)]
+        windows = plan_vad_windows(regions, 300.0, 45.0)
+
+        for prev, nxt in zip(windows, windows[1:]):
+            assert prev[1] == nxt[0]
+        for start, end in regions:
+            assert sum(1 for ws, we in windows if ws <= start and end <= we) == 1
+
+    def test_last_window_clamped_to_duration(self):
+        """Padding never extends past the end of the audio."""
+        windows = plan_vad_windows([(0.0, 10.0)], 10.05, 60.0)
+        assert windows == [(0.0, 10.05)]
+
+
+class _InlineProcessPool(ThreadPoolExecutor):
+    """Stand-in for ProcessPoolExecutor that runs workers as threads."""
+
+    def __init__(self, max_workers=None, mp_context=None, initializer=None, initargs=()):
+        super().__init__(max_workers=max_workers, initializer=initializer, initargs=initargs)
+
+
+@pytest.mark.skipif(not HAS_FASTER_WHISPER, reason="faster-whisper not installed")
+class TestTranscriptionEngineLocalParallel:
+    """Test VAD-split parallel local transcription."""
+
+    @patch("podx.core.transcribe.ProcessPoolExecutor", _InlineProcessPool)
+    @patch("faster_whisper.vad.get_speech_timestamps")
+    @patch("faster_whisper.audio.decode_audio")
+    @patch("faster_whisper.WhisperModel")
+    def test_parallel_stitches_absolute_timestamps(
+        self, mock_whisper_model_class, mock_decode, mock_vad
+    ):
+        """Window-relative segments are shifted to absolute time and ordered."""
+        import numpy as np
+
+        sr = 16000
+        mock_decode.return_value = np.zeros(sr * 200, dtype=np.float32)
+        # Two speech blocks separated by silence at 100-110s
+        mock_vad.return_value = [
+            {"start": 0, "end": 100 * sr},
+            {"start": 110 * sr, "end": 200 * sr},
+        ]
+
+        mock_model = MagicMock()
+        mock_whisper_model_class.return_value = mock_model
+
+        def fake_transcribe(audio, **kwargs):
+            seconds = len(audio) / sr
+            segs = [MagicMock(start=0.0, end=seconds / 2, text=f"len {seconds:.1f}")]
+            # Auto-detection would pick a different language for every window
+            language = kwargs.get("language") or f"auto-{seconds:.0f}"
+            return segs, MagicMock(language=language)
+
+        mock_model.transcribe.side_effect = fake_transcribe
+
+        engine = TranscriptionEngine(model="small", device="cpu", parallel_workers=2)
+        with patch.object(Path, "exists", return_value=True):
+            result = engine.transcribe(Path("/fake/audio.wav"))
+
+        assert [s["start"] for s in result["segments"]] == [0.0, 105.0]
+        assert result["segments"][0]["text"] == "len 105.0"
+        assert result["decoder_options"]["parallel_workers"] == 2
+
+        # Language is detected once from the first 30 s of speech and then
+        # passed to every window
+        detect_call, *window_calls = mock_model.transcribe.call_args_list
+        assert len(detect_call.args[0]) == 30 * sr
+        assert result["language"] == "auto-30"
+        assert len(window_calls) == 2
+        assert all(call.kwargs["language"] == "auto-30" for call in window_calls)
+
+    @patch("faster_whisper.WhisperModel")
+    def test_parallel_falls_back_on_gpu(self, mock_whisper_model_class):
+        """Non-CPU devices use the sequential decode path."""
+        mock_model = MagicMock()
+        mock_whisper_model_class.return_value = mock_model
+        mock_model.transcribe.return_value = ([], MagicMock(language="en"))
+
+        engine = TranscriptionEngine(model="small", device="cuda", parallel_workers=4)
+        with patch.object(Path, "exists", return_value=True):
+            result = engine.transcribe(Path("/fake/audio.wav"))
+
+        mock_model.transcribe.assert_called_once()
+        assert "parallel_workers" not in result["decoder_options"]
+
+
 @pytest.mark.skipif(not HAS_OPENAI, reason="openai not installed")
 class TestTranscriptionEngineOpenAI:
     """Test TranscriptionEngine with OpenAI provider."""
@@ -346,6 +575,7 @@ class TestTranscriptionEngineOpenAI:
         # Mock dict-style response
         mock_response = {
             "text": "Test audio",
+            "language": "french",
             "segments": [{"start": 0.0, "end": 3.0, "text": "Test audio"}],
         }
         mock_client.audio.transcriptions.create.return_value = mock_response
@@ -358,6 +588,7 @@ class TestTranscriptionEngineOpenAI:
                 result = engine.transcribe(audio_path)
 
         assert result["text"] == "Test audio"
+        assert result["language"] == "fr"
         assert len(result["segments"]) == 1
 
     @pytest.mark.skip("Complex OpenAI SDK mocking - integration test instead")
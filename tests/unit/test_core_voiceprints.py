@@ -0,0 +1,124 @@
+"""Unit tests for podx.core.voiceprints module."""
+
+import json
+
+import numpy as np
+import pytest
+
+from podx.core import voiceprints
+from podx.core.speakers import identify_speaker_map, load_speaker_map, save_speaker_map
+from podx.core.voiceprints import (
+    VoiceprintStore,
+    enroll_episode_speakers,
+    identify_known_speakers,
+    load_speaker_embeddings,
+    save_speaker_embeddings,
+)
+
+HOST = np.array([1.0, 0.0, 0.0])
+COHOST = np.array([0.0, 1.0, 0.0])
+GUEST = np.array([0.0, 0.0, 1.0])
+
+
+@pytest.fixture(autouse=True)
+def store_dir(tmp_path, monkeypatch):
+    """Keep voiceprint stores out of the real home directory."""
+    path = tmp_path / "voiceprints"
+    monkeypatch.setattr(voiceprints, "DEFAULT_VOICEPRINT_DIR", path)
+    return path
+
+
+def make_episode(root, name, embeddings, show="The Show"):
+    episode_dir = root / name
+    episode_dir.mkdir()
+    (episode_dir / "episode-meta.json").write_text(json.dumps({"show": show}), encoding="utf-8")
+    save_speaker_embeddings(episode_dir, embeddings)
+    return episode_dir
+
+
+class TestSpeakerEmbeddings:
+    def test_round_trip(self, tmp_path):
+        save_speaker_embeddings(tmp_path, {"SPEAKER_00": HOST})
+        loaded = load_speaker_embeddings(tmp_path)
+        assert list(loaded) == ["SPEAKER_00"]
+        np.testing.assert_allclose(loaded["SPEAKER_00"], HOST)
+
+    def test_missing_file_returns_none(self, tmp_path):
+        assert load_speaker_embeddings(tmp_path) is None
+
+
+class TestVoiceprintStore:
+    def test_enroll_keeps_running_mean(self, store_dir):
+        store = VoiceprintStore("The Show", store_dir)
+        store.enroll("Alice", np.array([1.0, 0.0]))
+        store.enroll("Alice", np.array([0.0, 1.0]))
+        store.save()
+
+        reloaded = VoiceprintStore("The Show", store_dir)
+        assert reloaded.speakers["Alice"]["episodes"] == 2
+        np.testing.assert_allclose(reloaded.speakers["Alice"]["embedding"], [2**-0.5, 2**-0.5])
+
+    def test_enroll_skips_repeated_episode(self, store_dir):
+        store = VoiceprintStore("The Show", store_dir)
+        assert store.enroll("Alice", np.array([1.0, 0.0]), episode="ep1")
+        assert not store.enroll("Alice", np.array([0.0, 1.0]), episode="ep1")
+
+        assert store.speakers["Alice"]["episodes"] == 1
+        np.testing.assert_allclose(store.speakers["Alice"]["embedding"], [1.0, 0.0])
+
+    def test_match_respects_threshold_and_uniqueness(self, store_dir):
+        store = VoiceprintStore("The Show", store_dir)
+        store.enroll("Alice", HOST)
+
+        mapping = store.match(
+            {"SPEAKER_00": HOST * 3, "SPEAKER_01": HOST + 0.05, "SPEAKER_02": GUEST}
+        )
+
+        # Closest speaker takes the name; nobody else can reuse it
+        assert mapping == {"SPEAKER_00": "Alice"}
+
+
+class TestEnrollAndIdentify:
+    def test_confirmed_map_labels_next_episode(self, tmp_path):
+        first = make_episode(tmp_path, "ep1", {"SPEAKER_00": HOST, "SPEAKER_01": GUEST})
+        save_speaker_map(first, {"SPEAKER_00": "Alice", "SPEAKER_01": "SPEAKER_01"})
+
+        # Speaker order differs in the next episode
+        second = make_episode(tmp_path, "ep2", {"SPEAKER_00": COHOST, "SPEAKER_01": HOST})
+        assert identify_known_speakers(second) == {"SPEAKER_01": "Alice"}
+
+    def test_resaving_map_does_not_reenroll(self, tmp_path, store_dir):
+        episode = make_episode(tmp_path, "ep1", {"SPEAKER_00": HOST})
+        save_speaker_map(episode, {"SPEAKER_00": "Alice"})
+        save_speaker_map(episode, {"SPEAKER_00": "Alice"})
+
+        assert VoiceprintStore("The Show", store_dir).speakers["Alice"]["episodes"] == 1
+
+    def test_shows_are_kept_apart(self, tmp_path):
+        first = make_episode(tmp_path, "ep1", {"SPEAKER_00": HOST})
+        enroll_episode_speakers(first, {"SPEAKER_00": "Alice"})
+
+        other = make_episode(tmp_path, "ep2", {"SPEAKER_00": HOST}, show="Other Show")
+        assert identify_known_speakers(other) == {}
+
+    def test_identify_speaker_map_requires_all_by_default(self, tmp_path):
+        first = make_episode(tmp_path, "ep1", {"SPEAKER_00": HOST})
+        enroll_episode_speakers(first, {"SPEAKER_00": "Alice"})
+        second = make_episode(tmp_path, "ep2", {"SPEAKER_00": HOST, "SPEAKER_01": GUEST})
+        segments = [{"speaker": "SPEAKER_00"}, {"speaker": "SPEAKER_01"}]
+
+        assert identify_speaker_map(second, segments) is None
+        assert load_speaker_map(second) is None
+
+        # A partial match is returned but not saved as a confirmed map
+        partial = identify_speaker_map(second, segments, require_all=False)
+        assert partial == {"SPEAKER_00": "Alice"}
+        assert load_speaker_map(second) is None
+
+    def test_identify_speaker_map_saves_complete_match(self, tmp_path):
+        first = make_episode(tmp_path, "ep1", {"SPEAKER_00": HOST})
+        enroll_episode_speakers(first, {"SPEAKER_00": "Alice"})
+        second = make_episode(tmp_path, "ep2", {"SPEAKER_00": HOST})
+
+        speaker_map = identify_speaker_map(second, [{"speaker": "SPEAKER_00"}], require_all=False)
+        assert load_speaker_map(second) == speaker_map == {"SPEAKER_00": "Alice"}
@@ -0,0 +1,78 @@
+"""Unit tests for podx.llm.cache module."""
+
+import asyncio
+
+from podx.llm import LLMMessage, LLMResponse, MockLLMProvider
+from podx.llm.cache import CachedLLMProvider, LLMResponseCache, cache_key
+
+MESSAGES = [LLMMessage.system("Be brief."), LLMMessage.user("Hello")]
+
+
+def test_cache_key_covers_request_inputs():
+    base = cache_key("OpenAIProvider", "gpt-4o-mini", MESSAGES, 0.7)
+
+    assert base == cache_key("OpenAIProvider", "gpt-4o-mini", list(MESSAGES), 0.7)
+    assert base != cache_key("OpenAIProvider", "gpt-4o", MESSAGES, 0.7)
+    assert base != cache_key("OpenAIProvider", "gpt-4o-mini", MESSAGES, 0.2)
+    assert base != cache_key("AnthropicProvider", "gpt-4o-mini", MESSAGES, 0.7)
+    assert base != cache_key("OpenAIProvider", "gpt-4o-mini", MESSAGES[1:], 0.7)
+
+
+class TestLLMResponseCache:
+    def test_round_trip_and_counters(self, tmp_path):
+        cache = LLMResponseCache(tmp_path / "cache.sqlite3", max_mb=1)
+        assert cache.get("k") is None
+
+        cache.put("k", LLMResponse(content="hi", model="m", usage={"total_tokens": 5}))
+        hit = cache.get("k")
+
+        assert (hit.content, hit.model, hit.usage) == ("hi", "m", {"total_tokens": 5})
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "cache.sqlite3"
+        LLMResponseCache(path).put("k", LLMResponse(content="hi", model="m"))
+        assert LLMResponseCache(path).get("k").content == "hi"
+
+    def test_evicts_least_recently_used_by_size(self, tmp_path):
+        # Room for two 400 KB responses
+        cache = LLMResponseCache(tmp_path / "cache.sqlite3", max_mb=1)
+        body = "x" * 400 * 1024
+        cache.put("a", LLMResponse(content=body, model="m"))
+        cache.put("b", LLMResponse(content=body, model="m"))
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", LLMResponse(content=body, model="m"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats()["evictions"] == 1
+
+
+class TestCachedLLMProvider:
+    def test_repeat_requests_skip_provider(self, tmp_path):
+        mock = MockLLMProvider(responses=["first", "second"])
+        provider = CachedLLMProvider(mock, LLMResponseCache(tmp_path / "cache.sqlite3"))
+
+        first = provider.complete(MESSAGES, model="mock-model-1")
+        again = provider.complete(MESSAGES, model="mock-model-1")
+        other = provider.complete(MESSAGES, model="mock-model-1", temperature=0.0)
+
+        assert (first.content, again.content, other.content) == ("first", "first", "second")
+        assert again.usage["total_tokens"] == 0
+        assert mock.call_count == 2
+
+    def test_async_shares_entries_with_sync(self, tmp_path):
+        mock = MockLLMProvider(responses=["only"])
+        provider = CachedLLMProvider(mock, LLMResponseCache(tmp_path / "cache.sqlite3"))
+
+        provider.complete(MESSAGES, model="mock-model-1")
+        response = asyncio.run(provider.complete_async(MESSAGES, model="mock-model-1"))
+
+        assert response.content == "only"
+        assert mock.call_count == 1
+
+    def test_default_cache_is_isolated(self, isolated_llm_cache):
+        CachedLLMProvider(MockLLMProvider()).complete(MESSAGES, model="mock-model-1")
+        assert isolated_llm_cache.exists()
@@ -2,7 +2,16 @@
 
 import pytest
 
-from podx.llm import LLMMessage, LLMProviderError, LLMResponse, MockLLMProvider, get_provider
+from podx.llm import (
+    CachedLLMProvider,
+    LLMMessage,
+    LLMProviderError,
+    LLMResponse,
+    MockLLMProvider,
+    OpenAIProvider,
+    get_provider,
+    get_provider_name,
+)
 
 
 class TestLLMMessage:
@@ -182,6 +191,14 @@ class TestProviderFactory:
             if old_key:
                 os.environ["OPENAI_API_KEY"] = old_key
 
+    def test_get_provider_name(self):
+        """Instances report the name they are registered under."""
+        openai = OpenAIProvider(api_key="sk-test")
+
+        assert get_provider_name(openai) == "openai"
+        assert get_provider_name(CachedLLMProvider(openai)) == "openai"
+        assert get_provider_name(MockLLMProvider()) == "mockllm"
+
 
 class TestDeepcastEngineWithMock:
     """Test AnalyzeEngine with mock LLM provider."""
@@ -254,3 +271,122 @@ class TestPreprocessEngineWithMock:
         assert restored[0] == "Cleaned segment one."
         assert restored[1] == "Cleaned segment two."
         assert mock.call_count == 1
+
+
+class TestPromptCaching:
+    """Test prompt-prefix cache hints in the provider layer."""
+
+    MESSAGES = [
+        LLMMessage.system("You are a podcast analyst.", cache=True),
+        LLMMessage.user("TRANSCRIPT: ...", cache=True),
+        LLMMessage.user("QUESTION: who spoke first?"),
+    ]
+
+    def test_cache_hint_defaults_off_and_is_not_sent(self):
+        assert LLMMessage.user("hi").cache is False
+        assert LLMMessage.user("hi", cache=True).to_dict() == {"role": "user", "content": "hi"}
+
+    def _anthropic(self):
+        from podx.llm.anthropic_provider import AnthropicProvider
+
+        # Skip __init__: the anthropic SDK is optional
+        return AnthropicProvider.__new__(AnthropicProvider)
+
+    def test_anthropic_breakpoints(self):
+        request = self._anthropic()._build_messages(self.MESSAGES)
+
+        assert request["system"] == [
+            {
+                "type": "text",
+                "text": "You are a podcast analyst.",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        # Transcript and question share one user turn, breakpoint after the transcript
+        [turn] = request["messages"]
+        assert turn["role"] == "user"
+        assert [block["text"] for block in turn["content"]] == [
+            "TRANSCRIPT: ...",
+            "QUESTION: who spoke first?",
+        ]
+        assert "cache_control" in turn["content"][0]
+        assert "cache_control" not in turn["content"][1]
+
+    def test_anthropic_without_hints_sends_plain_strings(self):
+        messages = [LLMMessage.system("sys"), LLMMessage.user("hi")]
+        request = self._anthropic()._build_messages(messages)
+
+        assert request == {"system": "sys", "messages": [{"role": "user", "content": "hi"}]}
+
+    def test_anthropic_usage_counts_cached_tokens(self):
+        from types import SimpleNamespace
+
+        response = SimpleNamespace(
+            content=[SimpleNamespace(text="answer")],
+            model="claude-sonnet-4-5",
+            usage=SimpleNamespace(
+                input_tokens=20,
+                output_tokens=10,
+                cache_read_input_tokens=3000,
+                cache_creation_input_tokens=0,
+            ),
+        )
+
+        usage = self._anthropic()._parse_response(response).usage
+
+        assert usage["prompt_tokens"] == 3020
+        assert usage["total_tokens"] == 3030
+        assert usage["cached_tokens"] == 3000
+
+    def _openai(self, base_url=None):
+        from unittest.mock import MagicMock
+
+        from podx.llm.openai_provider import OpenAIProvider
+
+        provider = OpenAIProvider(api_key="sk-test", base_url=base_url)
+        provider._sync_client = MagicMock()
+        usage = MagicMock(prompt_tokens=3020, completion_tokens=10, total_tokens=3030)
+        usage.prompt_tokens_details.cached_tokens = 2944
+        provider._sync_client.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content="answer"))], model="gpt-4o", usage=usage
+        )
+        return provider
+
+    def test_openai_prompt_cache_key_follows_prefix(self):
+        provider = self._openai()
+        create = provider._sync_client.chat.completions.create
+
+        response = provider.complete(self.MESSAGES, model="gpt-4o")
+        other_question = self.MESSAGES[:2] + [LLMMessage.user("QUESTION: any ads?")]
+        provider.complete(other_question, model="gpt-4o")
+        provider.complete([LLMMessage.user("no hint")], model="gpt-4o")
+
+        keys = [c.kwargs.get("prompt_cache_key") for c in create.call_args_list]
+        assert keys[0] is not None and keys[0] == keys[1]
+        assert keys[2] is None
+        assert response.usage["cached_tokens"] == 2944
+
+    def test_openai_compatible_servers_get_no_cache_key(self):
+        provider = self._openai(base_url="http://localhost:8000/v1")
+
+        provider.complete(self.MESSAGES, model="gpt-4o")
+
+        create = provider._sync_client.chat.completions.create
+        assert "prompt_cache_key" not in create.call_args.kwargs
+
+    def test_ask_puts_transcript_before_question(self):
+        from unittest.mock import patch
+
+        from podx.core.ask import ask_transcript
+
+        mock = MockLLMProvider(responses=["answer"])
+        transcript = {"segments": [{"start": 0.0, "text": "Hello", "speaker": "A"}]}
+        with patch("podx.core.ask.get_provider", return_value=mock):
+            ask_transcript(transcript, "Who said hello?")
+            ask_transcript(transcript, "What was said?")
+
+        first, second = (call[0] for call in mock.calls)
+        assert first[:2] == second[:2]
+        assert [m.cache for m in first] == [True, True, False]
+        assert "[0:00] A: Hello" in first[1].content
+        assert first[2].content == "QUESTION: Who said hello?"
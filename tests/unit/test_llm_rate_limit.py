@@ -0,0 +1,125 @@
+"""Unit tests for podx.llm.rate_limit and podx.llm.loop modules."""
+
+import asyncio
+
+import pytest
+
+from podx.config import reset_config
+from podx.llm.loop import run_coroutine
+from podx.llm.rate_limit import UTILIZATION, WINDOW_SECONDS, RateLimiter, get_rate_limiter
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _limiter(rpm=0, tpm=0):
+    clock = _Clock()
+    # Undo the utilization margin so tests can reason in round numbers
+    return RateLimiter(rpm / UTILIZATION + 0.5, tpm / UTILIZATION + 0.5, clock=clock), clock
+
+
+class TestRateLimiter:
+    def test_unlimited_never_waits(self):
+        limiter, _ = _limiter()
+        for _ in range(100):
+            assert limiter._reserve(10_000)[1] == 0.0
+
+    def test_requests_per_minute(self):
+        limiter, clock = _limiter(rpm=2)
+        limiter._reserve(0)
+        clock.now += 10
+        limiter._reserve(0)
+
+        reservation, wait = limiter._reserve(0)
+        assert reservation is None
+        assert wait == pytest.approx(WINDOW_SECONDS - 10)
+
+        clock.now += wait
+        assert limiter._reserve(0)[0] is not None
+
+    def test_tokens_per_minute_waits_for_enough_expiry(self):
+        limiter, clock = _limiter(tpm=1000)
+        limiter._reserve(400)
+        clock.now += 5
+        limiter._reserve(400)
+        clock.now += 5
+
+        # 900 more tokens only fit once both earlier requests have expired
+        reservation, wait = limiter._reserve(900)
+        assert reservation is None
+        assert wait == pytest.approx(WINDOW_SECONDS - 5)
+
+    def test_oversized_request_goes_alone(self):
+        limiter, _ = _limiter(tpm=1000)
+        assert limiter._reserve(5000)[0] is not None
+
+    def test_settle_corrects_estimate(self):
+        limiter, _ = _limiter(tpm=1000)
+        reservation, _ = limiter._reserve(900)
+        assert limiter._reserve(500)[0] is None
+
+        limiter.settle(reservation, 100)
+        assert limiter._reserve(500)[0] is not None
+
+    def test_pause_holds_every_request(self):
+        limiter, clock = _limiter()
+        limiter.pause(15)
+
+        assert limiter._reserve(0) == (None, pytest.approx(15))
+        clock.now += 15
+        assert limiter._reserve(0)[0] is not None
+
+    def test_acquire_waits_and_counts(self, monkeypatch):
+        limiter, clock = _limiter(rpm=1)
+        limiter.acquire_sync()
+
+        def sleep(seconds):
+            clock.now += seconds
+
+        monkeypatch.setattr("podx.llm.rate_limit.time.sleep", sleep)
+        limiter.acquire_sync()
+        assert limiter.waits == 1
+        assert clock.now == pytest.approx(1000 + WINDOW_SECONDS)
+
+
+class TestRegistry:
+    def test_shared_per_provider_and_model(self):
+        limiter = get_rate_limiter("openai", "gpt-4o")
+
+        assert get_rate_limiter("openai", "gpt-4o") is limiter
+        assert get_rate_limiter("openai", "gpt-4o-mini") is not limiter
+        assert get_rate_limiter("anthropic", "gpt-4o") is not limiter
+
+    def test_sized_from_config(self, monkeypatch):
+        monkeypatch.setenv("PODX_LLM_REQUESTS_PER_MINUTE", "100")
+        monkeypatch.setenv("PODX_LLM_TOKENS_PER_MINUTE", "0")
+        reset_config()
+        try:
+            limiter = get_rate_limiter("openai", "gpt-4o")
+        finally:
+            reset_config()
+
+        assert limiter.requests_per_minute == int(100 * UTILIZATION)
+        assert limiter.tokens_per_minute == 0
+
+
+class TestRunCoroutine:
+    def test_runs_on_one_persistent_loop(self):
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = run_coroutine(current_loop())
+        assert run_coroutine(current_loop()) is first
+        assert not first.is_closed()
+
+    def test_propagates_exceptions(self):
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            run_coroutine(fail())
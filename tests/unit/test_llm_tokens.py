@@ -0,0 +1,124 @@
+"""Unit tests for podx.llm.tokens module."""
+
+import pytest
+
+from podx.llm import tokens
+from podx.llm.tokens import (
+    DEFAULT_CONTEXT_WINDOW,
+    context_window,
+    count_tokens,
+    pack_by_tokens,
+    split_text_by_tokens,
+    token_budget,
+)
+
+
+class _WordEncoding:
+    """tiktoken stand-in with one token per word."""
+
+    def encode_ordinary(self, text):
+        return text.split()
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+@pytest.fixture
+def word_tokens(monkeypatch):
+    monkeypatch.setattr(tokens, "get_encoding", lambda model: _WordEncoding())
+
+
+@pytest.fixture
+def no_tokenizer(monkeypatch):
+    monkeypatch.setattr(tokens, "get_encoding", lambda model: None)
+
+
+class TestCountTokens:
+    def test_uses_encoding(self, word_tokens):
+        assert count_tokens("one two three", "gpt-4o") == 3
+
+    def test_estimates_without_tokenizer(self, no_tokenizer):
+        assert count_tokens("x" * 9, "gpt-4o") == 3
+        assert count_tokens("", "gpt-4o") == 0
+
+    def test_encoding_is_cached(self):
+        assert tokens.get_encoding("gpt-4o") is tokens.get_encoding("gpt-4o")
+
+
+class TestContextWindow:
+    def test_catalog_model_and_alias(self):
+        assert context_window("gpt-4o-mini") == 128000
+        assert context_window("claude-4.5-sonnet") == 200000
+
+    def test_provider_prefix_is_ignored(self):
+        assert context_window("openrouter/deepseek-chat") == 64000
+        assert context_window("anthropic:claude-sonnet-4.5") == 200000
+
+    def test_version_separators_and_dates_are_normalised(self):
+        assert context_window("anthropic:claude-sonnet-4-5") == 200000
+        assert context_window("claude-sonnet-4-5-20250929") == 200000
+        assert context_window("claude-3.5-sonnet") == 200000
+
+    def test_unknown_model_uses_default(self, monkeypatch):
+        warnings = []
+        monkeypatch.setattr(tokens.logger, "warning", lambda msg, **kw: warnings.append(kw))
+        context_window.cache_clear()
+
+        assert context_window("llama2") == DEFAULT_CONTEXT_WINDOW
+        assert context_window("llama2") == DEFAULT_CONTEXT_WINDOW
+        assert warnings == [{"model": "llama2", "context_window": DEFAULT_CONTEXT_WINDOW}]
+
+
+class TestTokenBudget:
+    def test_scales_with_context_window(self):
+        assert token_budget("gpt-4o") > token_budget("command") > 0
+
+    def test_reserved_tokens_are_subtracted(self):
+        assert token_budget("gpt-4o", reserved_tokens=1000) == token_budget("gpt-4o") - 1000
+
+    def test_output_ratio_respects_completion_limit(self):
+        assert token_budget("gpt-4o", output_ratio=1.0, max_output_tokens=4000) == 4000
+        # Small windows split what is left between input and output
+        assert token_budget("command", output_ratio=1.0) < 4096 / 2
+
+
+class TestPackByTokens:
+    def test_fills_batches_in_order(self, word_tokens):
+        texts = ["a b", "c d e", "f", "g h i j", "k"]
+        assert pack_by_tokens(texts, 5, "gpt-4o") == [["a b", "c d e"], ["f", "g h i j"], ["k"]]
+
+    def test_item_overhead_and_cap(self, word_tokens):
+        texts = ["a", "b", "c", "d", "e"]
+        assert pack_by_tokens(texts, 4, "gpt-4o", item_overhead=1) == [
+            ["a", "b"],
+            ["c", "d"],
+            ["e"],
+        ]
+        assert pack_by_tokens(texts, 100, "gpt-4o", max_items=3) == [["a", "b", "c"], ["d", "e"]]
+
+    def test_oversized_item_gets_own_batch(self, word_tokens):
+        texts = ["a", "b c d e f g", "h"]
+        assert pack_by_tokens(texts, 3, "gpt-4o") == [["a"], ["b c d e f g"], ["h"]]
+
+    def test_text_accessor(self, word_tokens):
+        segs = [{"text": "a b c"}, {"text": "d e"}, {"text": "f"}]
+        batches = pack_by_tokens(segs, 3, "gpt-4o", text=lambda s: s["text"])
+        assert batches == [[segs[0]], [segs[1], segs[2]]]
+
+
+class TestSplitTextByTokens:
+    def test_short_text_is_one_chunk(self, word_tokens):
+        assert split_text_by_tokens("a b\nc", 10, "gpt-4o") == ["a b\nc"]
+
+    def test_keeps_lines_together(self, word_tokens):
+        text = "a b c\nd e\nf g h i"
+        # Each line costs its tokens plus one for the newline
+        assert split_text_by_tokens(text, 7, "gpt-4o") == ["a b c\nd e", "f g h i"]
+
+    def test_cuts_long_line_on_token_boundaries(self, word_tokens):
+        assert split_text_by_tokens("a b c d e f g", 3, "gpt-4o") == ["a b c", "d e f", "g"]
+
+    def test_cuts_long_line_without_tokenizer(self, no_tokenizer):
+        chunks = split_text_by_tokens("x" * 50, 5, "gpt-4o")
+        assert "".join(chunks) == "x" * 50
+        assert all(count_tokens(c, "gpt-4o") <= 5 for c in chunks)
@@ -0,0 +1,126 @@
+"""Tests for performance utilities (model pool)."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from podx.performance import ModelCache
+
+
+class TestModelCache:
+    """Test the process-wide model pool."""
+
+    def test_hit_and_miss_counters(self):
+        """Second lookup of the same key is a hit and skips the loader."""
+        cache = ModelCache(max_size=2, memory_pressure_percent=100.0)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return object()
+
+        first = cache.get(("m", "cpu", "int8"), loader)
+        second = cache.get(("m", "cpu", "int8"), loader)
+
+        assert first is second
+        assert len(calls) == 1
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_lru_eviction_by_size(self):
+        """Least recently used model is evicted when the pool is full."""
+        cache = ModelCache(max_size=2, memory_pressure_percent=100.0)
+        cache.get("a", lambda: "A")
+        cache.get("b", lambda: "B")
+        cache.get("a", lambda: "A")  # "b" is now least recently used
+        cache.get("c", lambda: "C")
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.stats()["evictions"] == 1
+
+    def test_eviction_by_memory_limit(self):
+        """Models are evicted once the estimated footprint exceeds the limit."""
+        cache = ModelCache(max_size=10, max_memory_mb=150.0, memory_pressure_percent=100.0)
+        rss = iter([0.0, 100.0, 100.0, 200.0])
+
+        with patch("podx.performance._process_rss_mb", side_effect=lambda: next(rss)):
+            cache.get("a", lambda: "A")
+            cache.get("b", lambda: "B")
+
+        assert "a" not in cache
+        assert "b" in cache
+
+    def test_newly_loaded_model_is_never_evicted(self):
+        """Memory pressure evicts other models but keeps the one just loaded."""
+        cache = ModelCache(max_size=10, memory_pressure_percent=0.0)
+        cache.get("a", lambda: "A")
+        cache.get("b", lambda: "B")
+
+        assert len(cache) == 1
+        assert "b" in cache
+
+    def test_memory_pressure_evicts_one_model_per_load(self):
+        """Pressure that persists after an eviction must not empty the cache."""
+        cache = ModelCache(max_size=10, memory_pressure_percent=100.0)
+        for key in "abc":
+            cache.get(key, lambda: key.upper())
+
+        cache._memory_pressure_percent = 0.0
+        cache.get("d", lambda: "D")
+
+        assert len(cache) == 3
+        assert "a" not in cache
+
+    def test_failed_load_is_not_cached(self):
+        """Loader errors propagate and the key stays absent."""
+        cache = ModelCache(memory_pressure_percent=100.0)
+
+        def loader():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            cache.get("a", loader)
+
+        assert "a" not in cache
+        assert cache.get("a", lambda: "A") == "A"
+
+    def test_concurrent_requests_share_one_load(self):
+        """Parallel workers asking for the same model trigger a single load."""
+        cache = ModelCache(memory_pressure_percent=100.0)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get("m", loader)))
+            for _ in range(5)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert len({id(r) for r in results}) == 1
+        assert cache.stats()["hits"] == 4
+
+    def test_clear_resets_counters(self):
+        """Clearing the cache drops models and counters."""
+        cache = ModelCache(memory_pressure_percent=100.0)
+        cache.get("a", lambda: "A")
+        cache.get("a", lambda: "A")
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.stats()["hits"] == 0
+        assert cache.stats()["misses"] == 0
@@ -0,0 +1,196 @@
+"""Tests for the S3 multipart transfer engine."""
+
+import hashlib
+
+import pytest
+
+from podx.config import reset_config
+from podx.storage import (
+    MultipartTransfer,
+    StorageBackend,
+    StorageManager,
+    TransferConfig,
+    TransferError,
+)
+from podx.storage.transfer import etag_is_md5
+
+PART = 1024
+
+
+@pytest.fixture
+def config(tmp_path):
+    return TransferConfig(
+        part_size=PART,
+        multipart_threshold=4 * PART,
+        max_concurrency=4,
+        state_dir=tmp_path / "state",
+    )
+
+
+@pytest.fixture
+def big_file(tmp_path):
+    path = tmp_path / "episode.mp3"
+    path.write_bytes(bytes(range(256)) * 40)  # 10 KiB -> 10 parts
+    return path
+
+
+class TestUpload:
+    """Test multipart and single-part uploads."""
+
+    def test_multipart_upload_roundtrip(self, s3_stub, config, big_file):
+        stats = MultipartTransfer(s3_stub, config).upload(big_file, "b", "ep.mp3")
+
+        assert stats.parts == 10
+        assert not stats.skipped
+        assert s3_stub.objects[("b", "ep.mp3")]["body"] == big_file.read_bytes()
+        assert s3_stub.objects[("b", "ep.mp3")]["etag"].endswith("-10")
+        assert s3_stub.calls["upload_part"] == 10
+
+    def test_small_file_uses_single_put(self, s3_stub, config, tmp_path):
+        small = tmp_path / "small.json"
+        small.write_bytes(b"{}")
+
+        stats = MultipartTransfer(s3_stub, config).upload(
+            small, "b", "small.json", extra_args={"Metadata": {"episode": "1"}}
+        )
+
+        assert stats.parts == 1
+        assert s3_stub.calls["put_object"] == 1
+        assert s3_stub.objects[("b", "small.json")]["metadata"] == {"episode": "1"}
+
+    def test_skips_when_remote_etag_matches(self, s3_stub, config, big_file):
+        transfer = MultipartTransfer(s3_stub, config)
+        transfer.upload(big_file, "b", "ep.mp3")
+        uploaded = s3_stub.uploaded_bytes
+
+        stats = transfer.upload(big_file, "b", "ep.mp3")
+
+        assert stats.skipped
+        assert s3_stub.uploaded_bytes == uploaded
+
+    def test_resumes_interrupted_upload(self, s3_stub, config, big_file):
+        transfer = MultipartTransfer(s3_stub, config)
+        s3_stub.fail_parts = {7}
+
+        with pytest.raises(TransferError):
+            transfer.upload(big_file, "b", "ep.mp3")
+
+        before = s3_stub.calls["upload_part"]
+        stats = transfer.upload(big_file, "b", "ep.mp3")
+
+        assert stats.resumed_parts == 9
+        assert s3_stub.calls["upload_part"] - before == 1
+        assert s3_stub.calls["create_multipart_upload"] == 1
+        assert s3_stub.objects[("b", "ep.mp3")]["body"] == big_file.read_bytes()
+        assert not list((config.state_dir).iterdir())
+
+    def test_checksum_mismatch_raises(self, s3_stub, config, big_file):
+        original = s3_stub.upload_part
+
+        def corrupting_upload_part(**kwargs):
+            original(**kwargs)
+            return {"ETag": '"' + "0" * 32 + '"'}
+
+        s3_stub.upload_part = corrupting_upload_part
+
+        with pytest.raises(TransferError, match="Checksum mismatch"):
+            MultipartTransfer(s3_stub, config).upload(big_file, "b", "ep.mp3")
+
+
+def _encrypt_with_kms(s3_stub):
+    """Make every response look like an SSE-KMS object with an opaque ETag."""
+    for name in ("put_object", "upload_part", "complete_multipart_upload", "head_object"):
+        original = getattr(s3_stub, name)
+
+        def kms(*args, _original=original, **kwargs):
+            resp = dict(_original(*args, **kwargs))
+            resp["ETag"] = '"' + "f" * 32 + '"'
+            resp["ServerSideEncryption"] = "aws:kms"
+            return resp
+
+        setattr(s3_stub, name, kms)
+
+
+class TestEncryptedObjects:
+    """Test that SSE-KMS/SSE-C ETags are not compared against MD5s."""
+
+    def test_upload_checks_size_instead_of_etag(self, s3_stub, config, big_file):
+        _encrypt_with_kms(s3_stub)
+
+        stats = MultipartTransfer(s3_stub, config).upload(big_file, "b", "ep.mp3")
+
+        assert stats.parts == 10
+        assert s3_stub.objects[("b", "ep.mp3")]["body"] == big_file.read_bytes()
+
+    def test_download_checks_size_instead_of_etag(self, s3_stub, config, big_file, tmp_path):
+        transfer = MultipartTransfer(s3_stub, config)
+        transfer.upload(big_file, "b", "ep.mp3")
+        _encrypt_with_kms(s3_stub)
+
+        transfer.download("b", "ep.mp3", tmp_path / "ep.mp3")
+
+        assert (tmp_path / "ep.mp3").read_bytes() == big_file.read_bytes()
+
+    def test_sse_c_etag_is_opaque(self):
+        assert etag_is_md5({"ETag": '"abc"', "ServerSideEncryption": "AES256"})
+        assert not etag_is_md5({"ETag": '"abc"', "SSECustomerAlgorithm": "AES256"})
+        assert not etag_is_md5({"ETag": '"abc"', "ServerSideEncryption": "aws:kms:dsse"})
+
+
+class TestTransferConfig:
+    def test_verify_checksum_from_settings(self, monkeypatch):
+        monkeypatch.setenv("PODX_TRANSFER_VERIFY_CHECKSUM", "false")
+        reset_config()
+        try:
+            assert TransferConfig.from_podx_config().verify_checksum is False
+        finally:
+            reset_config()
+
+
+class TestDownload:
+    """Test ranged downloads."""
+
+    def test_ranged_download_roundtrip(self, s3_stub, config, big_file, tmp_path):
+        transfer = MultipartTransfer(s3_stub, config)
+        transfer.upload(big_file, "b", "ep.mp3")
+        dest = tmp_path / "out" / "ep.mp3"
+        dest.parent.mkdir()
+
+        stats = transfer.download("b", "ep.mp3", dest)
+
+        assert dest.read_bytes() == big_file.read_bytes()
+        assert stats.parts == 10
+        assert s3_stub.calls["get_object"] == 10
+        assert not dest.with_name("ep.mp3.part").exists()
+
+    def test_skips_identical_local_file(self, s3_stub, config, big_file):
+        transfer = MultipartTransfer(s3_stub, config)
+        transfer.upload(big_file, "b", "ep.mp3")
+
+        stats = transfer.download("b", "ep.mp3", big_file)
+
+        assert stats.skipped
+        assert s3_stub.calls["get_object"] == 0
+
+    def test_corrupt_download_is_rejected(self, s3_stub, config, tmp_path):
+        body = b"x" * (5 * PART)
+        s3_stub.objects[("b", "k")] = {"body": body, "etag": hashlib.md5(b"other").hexdigest()}
+
+        with pytest.raises(TransferError, match="Checksum mismatch"):
+            MultipartTransfer(s3_stub, config).download("b", "k", tmp_path / "k")
+
+        assert not (tmp_path / "k").exists()
+
+
+class TestStorageManagerS3:
+    """Test StorageManager routes S3 through the transfer engine."""
+
+    def test_upload_and_download(self, s3_stub, config, big_file, tmp_path, monkeypatch):
+        manager = StorageManager(backend=StorageBackend.S3, bucket="b", transfer_config=config)
+        monkeypatch.setattr(manager, "_get_s3_client", lambda: s3_stub)
+
+        url = manager.upload(big_file, "episodes/ep.mp3")
+        dest = manager.download("s3://b/episodes/ep.mp3", tmp_path / "dl" / "ep.mp3")
+
+        assert url == "s3://b/episodes/ep.mp3"
+        assert dest.read_bytes() == big_file.read_bytes()